@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark do chunker de `src.utils.string` sobre os CSVs de dataset/corpus.
+Mede, para cada tamanho de chunk e fronteira de corte, a vazão (MB/s) da localização dos
+intervalos (`chunk_spans`) e da materialização do texto (`split_to_chunks`), além de um caso
+patológico com sobreposição, em que a versão anterior recuava o início dos chunks.
+
+Uso:
+    python benchmark_chunks.py
+    python benchmark_chunks.py --sizes 500 2000 --repeat 5
+"""
+
+import argparse
+import csv
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from src.utils import string as String
+
+CORPUS_DIR = Path(__file__).resolve().parent / 'dataset' / 'corpus'
+
+
+def load(directory: str) -> str:
+    """junta a coluna 'text' de todos os CSVs do diretório num texto só, separado em parágrafos"""
+    csv.field_size_limit(sys.maxsize)
+    texts = []
+    for path in sorted(Path(directory).glob('*.csv')):
+        with open(path, newline='', encoding='utf-8') as file:
+            texts.extend(row.get('text') or "" for row in csv.DictReader(file))
+    return "\n\n".join(texts)
+
+
+def measure(function, repeat: int):
+    """executa a função `repeat` vezes e retorna (melhor tempo, resultado)"""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dir', default=str(CORPUS_DIR), help='diretório com os CSVs do corpus')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[200, 1000, 2000], help='tamanhos de chunk')
+    parser.add_argument('--repeat', type=int, default=3, help='repetições (vale o melhor tempo)')
+    args = parser.parse_args()
+
+    content = load(args.dir)
+    if not content:
+        print(f"Nenhum CSV encontrado em {args.dir}")
+        return 1
+
+    megabytes = len(content.encode('utf-8')) / (1024 * 1024)
+    print(f"corpus: {megabytes:.2f} MB, {len(content)} caracteres")
+    print(f"{'size':>6} {'fronteira':<10} {'chunks':>8} {'spans MB/s':>11} {'texto MB/s':>11}")
+
+    for size in args.sizes:
+        for boundary in (String.BOUNDARY_PERIOD, String.BOUNDARY_SENTENCE, String.BOUNDARY_NONE):
+            spans_time, spans = measure(lambda: String.chunk_spans(content, size, boundary=boundary), args.repeat)
+            text_time, _ = measure(lambda: [String.chunk_from_span(content, span) for span in String.chunk_spans(content, size, boundary=boundary)], args.repeat)
+            print(f"{size:>6} {boundary:<10} {len(spans):>8} {megabytes / spans_time:>11.1f} {megabytes / text_time:>11.1f}")
+
+    # sobreposição com pontos logo no início de cada janela: o início do chunk não pode recuar
+    pathological = ("a." + "b" * 1998) * 500
+    elapsed, chunks = measure(lambda: String.split_to_chunks_raw(pathological, 1000, 300), args.repeat)
+    print(f"patológico (overlap=300): {len(chunks)} chunks em {elapsed * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark da normalização de linhas (`clean_lines`) sobre os CSVs de dataset/corpus.
+Compara, em linhas por segundo, o pipeline anterior (recompilava as expressões a cada chamada),
+o pipeline compilado (`clean_lines`) e o lote com memo (`clean_lines_many`), e confere que os
+três produzem o mesmo resultado.
+
+Uso:
+    python benchmark_clean_lines.py
+    python benchmark_clean_lines.py --repeat 5
+"""
+
+import argparse
+import csv
+import re
+import string
+import sys
+import time
+import unicodedata
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from src.utils import string as String
+
+CORPUS_DIR = Path(__file__).resolve().parent / 'dataset' / 'corpus'
+
+
+def clean_lines_before(line: str = "") -> str:
+    """pipeline anterior de `clean_lines`, mantido aqui como referência"""
+    line = unicodedata.normalize('NFKC', line)
+    line = ''.join(ch for ch in line if unicodedata.category(ch)[0] != 'C')
+    line = re.sub(r'\s+', ' ', line).strip()
+    line = re.sub(r'\s+([{}])'.format(re.escape(string.punctuation)), r'\1', line)
+    line = re.sub(r'([{}])\1+'.format(re.escape(string.punctuation)), r'\1', line)
+    line = re.sub(r' +|\n+', ' ', line.encode('utf-8').decode('utf-8')).strip()
+    return line.strip(string.punctuation)
+
+
+def load(directory: str) -> list:
+    """lê as linhas não vazias de todas as colunas dos CSVs do diretório"""
+    csv.field_size_limit(sys.maxsize)
+    lines = []
+    for path in sorted(Path(directory).glob('*.csv')):
+        with open(path, newline='', encoding='utf-8') as file:
+            for row in csv.DictReader(file):
+                for value in row.values():
+                    lines.extend(line for line in String.split_to_lines(value or "") if line)
+    return lines
+
+
+def measure(function, repeat: int):
+    """executa a função `repeat` vezes e retorna (melhor tempo, resultado)"""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dir', default=str(CORPUS_DIR), help='diretório com os CSVs do corpus')
+    parser.add_argument('--repeat', type=int, default=3, help='repetições (vale o melhor tempo)')
+    args = parser.parse_args()
+
+    lines = load(args.dir)
+    if not lines:
+        print(f"Nenhum CSV encontrado em {args.dir}")
+        return 1
+
+    print(f"linhas: {len(lines)} ({len(set(lines))} distintas)")
+    before, expected = measure(lambda: [clean_lines_before(line) for line in lines], args.repeat)
+    after, compiled = measure(lambda: [String.clean_lines(line) for line in lines], args.repeat)
+    many, batched = measure(lambda: String.clean_lines_many(lines), args.repeat)
+
+    if not expected == compiled == batched:
+        print("! os resultados divergem do pipeline anterior")
+
+    print(f"{'pipeline':<28} {'linhas/s':>12} {'ganho':>7}")
+    for name, elapsed in (('anterior', before), ('clean_lines', after), ('clean_lines_many (memo)', many)):
+        print(f"{name:<28} {len(lines) / elapsed:>12.0f} {before / elapsed:>6.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark da extração de páginas com pdfplumber: sequencial vs. pool de processos.
+Mede o tempo de parede de `reader_pages` nos PDFs de dataset/library/legislation.
+
+Uso:
+    python benchmark_pdf_pages.py
+    python benchmark_pdf_pages.py --workers 4 --chunk-size 8
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from src.modules.document import reader as PDFReader
+from src.utils import string as String
+
+LEGISLATION_DIR = Path(__file__).resolve().parent / 'dataset' / 'library' / 'legislation'
+
+
+def measure(path: str, workers: int, chunk_size: int):
+    """executa a extração e retorna (segundos, páginas, caracteres)"""
+    start = time.perf_counter()
+    pages = PDFReader.reader_pages(path, 1, -1, workers=workers, chunk_size=chunk_size)
+    elapsed = time.perf_counter() - start
+    return elapsed, len(pages), sum(len(page) for page in pages)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=0, help='processos no modo paralelo (0 = todos os núcleos)')
+    parser.add_argument('--chunk-size', type=int, default=16, help='páginas por tarefa no modo paralelo')
+    parser.add_argument('--dir', default=str(LEGISLATION_DIR), help='diretório com os PDFs')
+    args = parser.parse_args()
+
+    paths = sorted(Path(args.dir).glob('*.pdf'))
+    if not paths:
+        print(f"Nenhum PDF encontrado em {args.dir}")
+        return 1
+
+    print(f"{'documento':<48} {'tamanho':>10} {'páginas':>8} {'sequencial':>11} {'paralelo':>10} {'ganho':>7}")
+    total_seq = total_par = 0.0
+    for path in paths:
+        seq, pages, letters = measure(str(path), 1, args.chunk_size)
+        par, pages_par, letters_par = measure(str(path), args.workers, args.chunk_size)
+
+        if (pages, letters) != (pages_par, letters_par):
+            print(f"! {path.name}: resultado paralelo diverge do sequencial")
+
+        total_seq += seq
+        total_par += par
+        size = String.size_to_label(path.stat().st_size)
+        print(f"{path.name[:48]:<48} {size:>10} {pages:>8} {seq:>10.2f}s {par:>9.2f}s {seq / par:>6.2f}x")
+
+    print(f"{'total':<48} {'':>10} {'':>8} {total_seq:>10.2f}s {total_par:>9.2f}s {total_seq / total_par:>6.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,9 +1,12 @@
 # flake8: noqa: E501
 
+import os
 import sys
 import logging
 
+from src.modules.document import docling_converters as DoclingConverters
 from src.routines import migrate
+from src.routines import tfidf as TfidfRoutine
 from src.server import app
 
 # Configure logging for startup
@@ -27,6 +30,19 @@ if __name__ == "__main__":
     
     # Parse command line arguments
     no_reload = '--no-reload' in sys.argv
+
+    # Carrega os modelos do Docling e constrói o modelo TF-IDF do corpus (se ainda não existir) em segundo
+    # plano, e os classificadores (treinando os que faltam) antes da primeira requisição, apenas no
+    # processo que atende as requisições
+    if no_reload or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        DoclingConverters.warmup()
+        TfidfRoutine.build_on_startup()
+        try:
+            from src.modules.nlp.enhanced_classifier import get_classifier
+            get_classifier()
+            logging.info("✓ Classificadores carregados")
+        except Exception as e:
+            logging.warning(f"⚠ Classificadores não carregados na inicialização: {e}")
     
     logging.info("🌐 Starting Flask server...")
     logging.info("📍 Server will be available at: http://0.0.0.0:3000")
@@ -6,3 +6,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 OLLAMA_PROXY_URL = os.getenv("OLLAMA_PROXY_URL")
+
+# conexões mantidas abertas (keep-alive) por cliente e tempo limite das requisições, em segundos
+OLLAMA_MAX_CONNECTIONS = int(os.getenv("OLLAMA_MAX_CONNECTIONS", "16"))
+OLLAMA_TIMEOUT = float(os.getenv("OLLAMA_TIMEOUT", "300"))
@@ -0,0 +1,48 @@
+# flake8: noqa: E501
+
+"""
+Migration 002: Ingestion manifest
+Creates the ingestion_manifest table used by the batch ingestion engine to resume interrupted runs.
+"""
+
+from src.migrations.migration_base import Migration
+
+
+class Migration002(Migration):
+    """Ingestion manifest migration"""
+
+    def __init__(self):
+        super().__init__("002", "Ingestion manifest: create ingestion_manifest table")
+
+    def up(self, conn) -> bool:
+        """Create the ingestion manifest table"""
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS ingestion_manifest (
+                    path TEXT PRIMARY KEY,
+                    mtime REAL,
+                    size INTEGER,
+                    pages INTEGER,
+                    letters INTEGER,
+                    status TEXT,
+                    seconds REAL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            conn.commit()
+            return True
+
+        except Exception as e:
+            print(f"Error in Migration002.up(): {e}")
+            return False
+
+    def down(self, conn) -> bool:
+        """Drop the ingestion manifest table"""
+        try:
+            conn.execute("DROP TABLE IF EXISTS ingestion_manifest")
+            conn.commit()
+            return True
+
+        except Exception as e:
+            print(f"Error in Migration002.down(): {e}")
+            return False
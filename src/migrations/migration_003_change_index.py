@@ -0,0 +1,57 @@
+# flake8: noqa: E501
+
+"""
+Migration 003: Change index
+Creates the documents_index and pages_index tables used for incremental re-indexing.
+"""
+
+from src.migrations.migration_base import Migration
+
+
+class Migration003(Migration):
+    """Change index migration"""
+
+    def __init__(self):
+        super().__init__("003", "Change index: create documents_index and pages_index tables")
+
+    def up(self, conn) -> bool:
+        """Create the change index tables"""
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS documents_index (
+                    pipeline TEXT,
+                    path TEXT,
+                    size INTEGER,
+                    mtime REAL,
+                    hash TEXT,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (pipeline, path)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS pages_index (
+                    pipeline TEXT,
+                    path TEXT,
+                    page INTEGER,
+                    hash TEXT,
+                    PRIMARY KEY (pipeline, path, page)
+                )
+            """)
+            conn.commit()
+            return True
+
+        except Exception as e:
+            print(f"Error in Migration003.up(): {e}")
+            return False
+
+    def down(self, conn) -> bool:
+        """Drop the change index tables"""
+        try:
+            conn.execute("DROP TABLE IF EXISTS pages_index")
+            conn.execute("DROP TABLE IF EXISTS documents_index")
+            conn.commit()
+            return True
+
+        except Exception as e:
+            print(f"Error in Migration003.down(): {e}")
+            return False
@@ -0,0 +1,41 @@
+# flake8: noqa: E501
+
+"""
+Migration 004: Documents info mtime
+Adds the mtime column to documents_info so cached document info can be invalidated when the file changes.
+"""
+
+from src.migrations.migration_base import Migration
+
+
+class Migration004(Migration):
+    """Documents info mtime migration"""
+
+    def __init__(self):
+        super().__init__("004", "Documents info mtime: add mtime column to documents_info")
+
+    def up(self, conn) -> bool:
+        """Add the mtime column to documents_info"""
+        try:
+            columns = [column[1] for column in conn.execute("PRAGMA table_info(documents_info)")]
+            if "mtime" not in columns:
+                conn.execute("ALTER TABLE documents_info ADD COLUMN mtime REAL")
+            conn.commit()
+            return True
+
+        except Exception as e:
+            print(f"Error in Migration004.up(): {e}")
+            return False
+
+    def down(self, conn) -> bool:
+        """Drop the mtime column from documents_info"""
+        try:
+            columns = [column[1] for column in conn.execute("PRAGMA table_info(documents_info)")]
+            if "mtime" in columns:
+                conn.execute("ALTER TABLE documents_info DROP COLUMN mtime")
+            conn.commit()
+            return True
+
+        except Exception as e:
+            print(f"Error in Migration004.down(): {e}")
+            return False
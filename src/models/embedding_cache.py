@@ -0,0 +1,250 @@
+# flake8: noqa: E501
+"""
+Embedding Cache Module
+Cache persistente de embeddings, endereçado pelo espaço vetorial (modelo e endpoint, por exemplo
+"sibila:embed") e pelo hash sha3 do texto.
+
+Textos repetidos (trechos padronizados, documentos reingeridos, perguntas repetidas) são embutidos
+uma única vez por modelo. Os vetores ficam num banco SQLite próprio, como blocos float32, e o número
+de entradas é limitado por uma política LRU baseada no horário do último acesso de cada entrada.
+
+Funções:
+    - key(text: str) -> str: Gera a chave (hash sha3) de um texto.
+    - get_many(model: str, texts: List[str]) -> List[Optional[np.ndarray]]: Recupera os embeddings de vários textos.
+    - put_many(model: str, texts: List[str], vectors) -> int: Grava os embeddings de vários textos.
+    - get(model: str, text: str) -> Optional[np.ndarray]: Recupera o embedding de um texto.
+    - put(model: str, text: str, vector) -> bool: Grava o embedding de um texto.
+    - evict(limit: int = None) -> int: Aplica a política LRU de tamanho.
+    - clear() -> int: Remove todas as entradas.
+    - stats() -> dict: Retorna estatísticas do cache (entradas, acertos, faltas, gravações, remoções).
+"""
+
+from typing import List, Optional
+import threading
+import traceback
+import logging
+import time
+
+import numpy as np
+
+from src.modules.database import sqlitedb
+from src.utils import string as String
+
+# diretório do banco de embeddings
+directory = './data/.cache/embeddings'
+
+# quantidade máxima de embeddings mantidos (LRU)
+max_entries = 500000
+
+# se o cache está ativo
+enabled = True
+
+TABLE = "embeddings"
+
+_lock = threading.Lock()
+_counters = {'hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0}
+
+
+def _connection() -> object:
+    """abre o banco do cache, criando a tabela na primeira vez"""
+    conn = sqlitedb.client(directory)
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {TABLE} (
+            model TEXT,
+            hash TEXT,
+            vector BLOB,
+            accessed REAL,
+            PRIMARY KEY (model, hash)
+        ) WITHOUT ROWID
+    """)
+    conn.execute(f"CREATE INDEX IF NOT EXISTS {TABLE}_accessed ON {TABLE} (accessed)")
+    return conn
+
+
+def key(text: str) -> str:
+    """
+    Gera a chave de um texto no cache.
+
+    Args:
+        text (str): O texto.
+
+    Returns:
+        str: Hash sha3 do texto.
+    """
+    return String.hash(text)
+
+
+def get_many(model: str, texts: List[str]) -> List[Optional[np.ndarray]]:
+    """
+    Recupera os embeddings de vários textos numa única consulta.
+
+    Args:
+        model (str): Espaço vetorial dos embeddings (modelo e endpoint, veja `ModelOllama.embedding_space`).
+        texts (List[str]): Os textos.
+
+    Returns:
+        List[Optional[np.ndarray]]: O embedding (float32) de cada texto, ou None se não estiver no cache.
+    """
+    if not enabled or not texts:
+        return [None] * len(texts)
+
+    hashes = [key(text) for text in texts]
+    found = {}
+    try:
+        conn = _connection()
+        unique = list(dict.fromkeys(hashes))
+        # consulta em blocos, abaixo do limite de parâmetros do SQLite
+        for i in range(0, len(unique), 500):
+            block = unique[i:i + 500]
+            marks = ",".join("?" * len(block))
+            for digest, vector in conn.execute(f"select hash, vector from {TABLE} where model=? and hash in ({marks})", (model, *block)):
+                found[digest] = np.frombuffer(vector, dtype=np.float32)
+
+        if found:
+            # marca o acesso para a política LRU
+            now = time.time()
+            conn.executemany(f"update {TABLE} set accessed=? where model=? and hash=?", [(now, model, digest) for digest in found])
+            conn.commit()
+        conn.close()
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+
+    vectors = [found.get(digest) for digest in hashes]
+    hits = sum(1 for vector in vectors if vector is not None)
+    with _lock:
+        _counters['hits'] += hits
+        _counters['misses'] += len(vectors) - hits
+    return vectors
+
+
+def put_many(model: str, texts: List[str], vectors) -> int:
+    """
+    Grava os embeddings de vários textos numa única transação e aplica a política de tamanho.
+
+    Args:
+        model (str): Espaço vetorial dos embeddings (modelo e endpoint, veja `ModelOllama.embedding_space`).
+        texts (List[str]): Os textos.
+        vectors: Um embedding por texto (listas ou matriz NumPy).
+
+    Returns:
+        int: Quantidade de embeddings gravados.
+    """
+    if not enabled or not texts:
+        return 0
+
+    try:
+        now = time.time()
+        rows = [(model, key(text), np.asarray(vector, dtype=np.float32).tobytes(), now) for text, vector in zip(texts, vectors)]
+        conn = _connection()
+        conn.executemany(f"insert or replace into {TABLE} (model, hash, vector, accessed) values (?, ?, ?, ?)", rows)
+        conn.commit()
+        conn.close()
+
+        with _lock:
+            _counters['writes'] += len(rows)
+        evict()
+        return len(rows)
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return 0
+
+
+def get(model: str, text: str) -> Optional[np.ndarray]:
+    """
+    Recupera o embedding de um texto.
+
+    Args:
+        model (str): Espaço vetorial dos embeddings (modelo e endpoint, veja `ModelOllama.embedding_space`).
+        text (str): O texto.
+
+    Returns:
+        Optional[np.ndarray]: O embedding (float32), ou None se não estiver no cache.
+    """
+    return get_many(model, [text])[0]
+
+
+def put(model: str, text: str, vector) -> bool:
+    """
+    Grava o embedding de um texto.
+
+    Args:
+        model (str): Espaço vetorial dos embeddings (modelo e endpoint, veja `ModelOllama.embedding_space`).
+        text (str): O texto.
+        vector: O embedding.
+
+    Returns:
+        bool: True se o embedding foi gravado, False caso contrário.
+    """
+    return put_many(model, [text], [vector]) == 1
+
+
+def evict(limit: Optional[int] = None) -> int:
+    """
+    Remove as entradas acessadas há mais tempo até que o cache tenha no máximo `limit` entradas.
+
+    Args:
+        limit (Optional[int]): Quantidade máxima de entradas. Padrão é None (usa `max_entries`).
+
+    Returns:
+        int: Quantidade de entradas removidas.
+    """
+    limit = max_entries if limit is None else limit
+    try:
+        conn = _connection()
+        total = conn.execute(f"select count(*) from {TABLE}").fetchone()[0]
+        removed = 0
+        if total > limit:
+            cursor = conn.execute(f"delete from {TABLE} where (model, hash) in (select model, hash from {TABLE} order by accessed limit ?)", (total - limit,))
+            removed = cursor.rowcount
+            conn.commit()
+        conn.close()
+
+        with _lock:
+            _counters['evictions'] += removed
+        return removed
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return 0
+
+
+def clear() -> int:
+    """
+    Remove todas as entradas do cache.
+
+    Returns:
+        int: Quantidade de entradas removidas.
+    """
+    try:
+        conn = _connection()
+        removed = conn.execute(f"delete from {TABLE}").rowcount
+        conn.commit()
+        conn.close()
+        return removed
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return 0
+
+
+def stats() -> dict:
+    """
+    Retorna estatísticas do cache.
+
+    Returns:
+        dict: Entradas, acertos, faltas, gravações, remoções e taxa de acertos.
+    """
+    try:
+        conn = _connection()
+        entries = conn.execute(f"select count(*) from {TABLE}").fetchone()[0]
+        conn.close()
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        entries = 0
+
+    with _lock:
+        counters = dict(_counters)
+    lookups = counters['hits'] + counters['misses']
+    return {
+        'entries': entries,
+        **counters,
+        'hit_rate': counters['hits'] / lookups if lookups else 0.0,
+    }
@@ -1,31 +1,145 @@
 # flake8: noqa: E501
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+import logging
+import time
 
+import numpy as np
+
+from src.models import embedding_cache as EmbeddingCache
 from src.models.llm_model import ModelLLM
 
-def generate_embeddings(ollama: ModelLLM, chunks = []):
+EMBED_MAX_TOKENS = 2048     # orçamento de tokens (estimados) por requisição
+EMBED_MAX_INPUTS = 64       # máximo de textos por requisição
+EMBED_IN_FLIGHT = 4         # requisições simultâneas
+EMBED_RETRIES = 3           # novas tentativas por requisição
+EMBED_BACKOFF = 0.5         # espera inicial entre tentativas (dobra a cada tentativa), em segundos
+
+
+def estimate_tokens(text: str) -> int:
     """
-    Gera embeddings para os chunks fornecidos pelo objeto LLM.
+    Estima a quantidade de tokens de um texto (~4 caracteres por token).
     Args:
-        llm: Um objeto que contém os chunks de texto e métodos para gerar embeddings.
+        text (str): O texto.
     Returns:
-        Os dados do objeto LLM após a geração dos embeddings.
-    Exibe o progresso da geração dos embeddings no console.
+        int: Tokens estimados (no mínimo 1).
     """
-    
-    info = "- - - > Embedding"
+    return max(1, len(text) // 4)
 
-    step = (100 / len(ollama.chunks))
-    
-    embeddings = []
-    
+
+def batches(chunks: List[str], max_tokens: int = EMBED_MAX_TOKENS, max_inputs: int = EMBED_MAX_INPUTS) -> List[Tuple[int, int]]:
+    """
+    Agrupa chunks consecutivos em lotes que respeitam o orçamento de tokens e de textos por requisição.
+    Um chunk maior que o orçamento forma um lote sozinho.
+    Args:
+        chunks (List[str]): Os textos.
+        max_tokens (int): Tokens estimados por lote. Padrão é EMBED_MAX_TOKENS.
+        max_inputs (int): Textos por lote. Padrão é EMBED_MAX_INPUTS.
+    Returns:
+        List[Tuple[int, int]]: Intervalos [início, fim) de cada lote.
+    """
+    ranges = []
+    start, tokens = 0, 0
     for i, chunk in enumerate(chunks):
-        embeddings.append(ollama.embed(chunk))
-        print(f"{info} - {int(i*step)}%", end='\r', flush=True)
+        size = estimate_tokens(chunk)
+        if i > start and (tokens + size > max_tokens or i - start >= max_inputs):
+            ranges.append((start, i))
+            start, tokens = i, 0
+        tokens += size
+    if start < len(chunks):
+        ranges.append((start, len(chunks)))
+    return ranges
+
+
+def embed_batch(llm: ModelLLM, inputs: List[str], retries: int = EMBED_RETRIES, backoff: float = EMBED_BACKOFF) -> List[List[float]]:
+    """
+    Gera os embeddings de um lote numa única requisição (`embed_many`), ou texto a texto (`embed`)
+    se o modelo não aceitar várias entradas, tentando novamente com espera exponencial em caso de erro.
+    Args:
+        llm: O modelo.
+        inputs (List[str]): Os textos do lote.
+        retries (int): Novas tentativas após a primeira falha. Padrão é EMBED_RETRIES.
+        backoff (float): Espera inicial entre tentativas, em segundos. Padrão é EMBED_BACKOFF.
+    Returns:
+        List[List[float]]: Um embedding por texto.
+    Raises:
+        Exception: O erro da última tentativa.
+    """
+    for attempt in range(retries + 1):
+        try:
+            if hasattr(llm, "embed_many"):
+                embeddings = llm.embed_many(inputs)
+            else:
+                embeddings = [llm.embed(text) for text in inputs]
+            if len(embeddings) != len(inputs):
+                raise ValueError(f"Foram retornados {len(embeddings)} embeddings para {len(inputs)} textos.")
+            return embeddings
+        except Exception as e:
+            if attempt == retries:
+                raise
+            wait = backoff * (2 ** attempt)
+            logging.warning(f"Falha ao gerar embeddings ({e}). Nova tentativa em {wait:.1f}s ({attempt + 1}/{retries}).")
+            time.sleep(wait)
+
+
+def generate_embeddings(
+    llm: ModelLLM,
+    chunks: Optional[List[str]] = None,
+    max_tokens: int = EMBED_MAX_TOKENS,
+    max_inputs: int = EMBED_MAX_INPUTS,
+    in_flight: int = EMBED_IN_FLIGHT,
+    retries: int = EMBED_RETRIES,
+    backoff: float = EMBED_BACKOFF,
+) -> np.ndarray:
+    """
+    Gera os embeddings dos chunks em lotes, com várias requisições simultâneas.
+    Os chunks já embutidos pelo mesmo modelo vêm do cache persistente (`embedding_cache`); os demais,
+    sem repetições, são agrupados por orçamento de tokens (`batches`), cada lote é enviado numa única
+    requisição com várias entradas e até `in_flight` lotes ficam em andamento ao mesmo tempo.
+    Args:
+        llm: Um objeto com `embed_many(inputs)` ou `embed(text)`.
+        chunks (Optional[List[str]]): Os textos. Padrão é None (os chunks do objeto LLM).
+        max_tokens (int): Tokens estimados por requisição. Padrão é EMBED_MAX_TOKENS.
+        max_inputs (int): Textos por requisição. Padrão é EMBED_MAX_INPUTS.
+        in_flight (int): Requisições simultâneas. Padrão é EMBED_IN_FLIGHT.
+        retries (int): Novas tentativas por requisição. Padrão é EMBED_RETRIES.
+        backoff (float): Espera inicial entre tentativas, em segundos. Padrão é EMBED_BACKOFF.
+    Returns:
+        np.ndarray: Matriz contígua float32 (um embedding por linha, na ordem dos chunks).
+    """
+    chunks = list(llm.chunks if chunks is None else chunks)
+    if not chunks:
+        return np.zeros((0, 0), dtype=np.float32)
+
+    model = getattr(llm, "embedding_space", getattr(llm, "model", ""))
+    cached = EmbeddingCache.get_many(model, chunks)
+    missing = list(dict.fromkeys(chunk for chunk, vector in zip(chunks, cached) if vector is None))
+
+    ranges = batches(missing, max_tokens, max_inputs)
+    start = time.perf_counter()
+
+    def run(span: Tuple[int, int]) -> List[List[float]]:
+        return embed_batch(llm, missing[span[0]:span[1]], retries, backoff)
+
+    fresh = None
+    if ranges:
+        with ThreadPoolExecutor(max_workers=max(1, min(in_flight, len(ranges)))) as executor:
+            # `map` devolve os lotes na ordem de envio
+            for (first, last), vectors in zip(ranges, executor.map(run, ranges)):
+                vectors = np.asarray(vectors, dtype=np.float32)
+                if fresh is None:
+                    fresh = np.empty((len(missing), vectors.shape[1]), dtype=np.float32)
+                fresh[first:last] = vectors
+        EmbeddingCache.put_many(model, missing, fresh)
 
-    print(f"{info} - 100%", end='\r', flush=True)
-    print("\n", end='', flush=True)
+    rows = {chunk: i for i, chunk in enumerate(missing)}
+    dimension = fresh.shape[1] if fresh is not None else len(next(vector for vector in cached if vector is not None))
+    embeddings = np.empty((len(chunks), dimension), dtype=np.float32)
+    for i, (chunk, vector) in enumerate(zip(chunks, cached)):
+        embeddings[i] = vector if vector is not None else fresh[rows[chunk]]
 
+    logging.info(f"Embeddings: {len(chunks)} chunks, {sum(vector is not None for vector in cached)} do cache, {len(missing)} em {len(ranges)} requisições ({time.perf_counter() - start:.2f}s).")
     return embeddings
 
 
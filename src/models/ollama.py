@@ -1,26 +1,163 @@
 # flake8: noqa: E501
 
+import asyncio
+import threading
+import time
+import weakref
+from typing import Optional
+
+import httpx
 import ollama
 
+from src.config import ollama as config
 from src.models import handle
+from src.models import embedding_cache as EmbeddingCache
+from src.models import response_cache as ResponseCache
 from collections import deque
 
     
 HISTORY = deque(maxlen=5)
+
+# endpoint dos embeddings; o `/api/embed` devolve vetores normalizados, num espaço diferente do
+# antigo `/api/embeddings`, por isso ele faz parte da identificação do espaço vetorial
+EMBEDDING_ENDPOINT = "embed"
+
+_clients = {}
+_async_clients = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+_shared_loop = None
+
+
+def _pool_options() -> dict:
+    """
+    Opções do pool de conexões HTTP dos clientes compartilhados.
+
+    Retorna:
+        dict: Limites de conexões (keep-alive) e tempo limite das requisições.
+    """
+    return {
+        "limits": httpx.Limits(max_connections=config.OLLAMA_MAX_CONNECTIONS, max_keepalive_connections=config.OLLAMA_MAX_CONNECTIONS),
+        "timeout": httpx.Timeout(config.OLLAMA_TIMEOUT, connect=min(10.0, config.OLLAMA_TIMEOUT)),
+    }
+
+
+def client(host: str = None) -> ollama.Client:
+    """
+    Retorna o cliente síncrono compartilhado pelo processo para um servidor Ollama.
+    Todas as instâncias de `ModelOllama` do mesmo servidor reutilizam as mesmas conexões (keep-alive).
+
+    Args:
+        host (str, opcional): Endereço do servidor. O padrão é None (variável OLLAMA_HOST ou o endereço padrão).
+
+    Retorna:
+        ollama.Client: O cliente compartilhado.
+    """
+    with _clients_lock:
+        shared = _clients.get(host)
+        if shared is None:
+            shared = _clients[host] = ollama.Client(host=host, **_pool_options())
+        return shared
+
+
+def async_client(host: str = None) -> ollama.AsyncClient:
+    """
+    Retorna o cliente assíncrono compartilhado para um servidor Ollama no laço de eventos em execução.
+    As conexões de um cliente assíncrono pertencem ao laço em que foram abertas, por isso há um cliente por laço.
+
+    Args:
+        host (str, opcional): Endereço do servidor. O padrão é None (variável OLLAMA_HOST ou o endereço padrão).
+
+    Retorna:
+        ollama.AsyncClient: O cliente compartilhado pelo laço de eventos atual.
+    """
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        clients = _async_clients.setdefault(loop, {})
+        shared = clients.get(host)
+        if shared is None:
+            shared = clients[host] = ollama.AsyncClient(host=host, **_pool_options())
+        return shared
+
+
+def shared_loop() -> asyncio.AbstractEventLoop:
+    """
+    Retorna o laço de eventos de longa duração do processo, executado numa thread própria.
+    O Flask cria um laço por requisição; as chamadas feitas neste laço usam sempre o mesmo cliente
+    assíncrono e reaproveitam as conexões entre requisições.
+
+    Retorna:
+        asyncio.AbstractEventLoop: O laço compartilhado.
+    """
+    global _shared_loop
+    with _clients_lock:
+        if _shared_loop is None or _shared_loop.is_closed():
+            _shared_loop = asyncio.new_event_loop()
+            threading.Thread(target=_shared_loop.run_forever, name="ollama-loop", daemon=True).start()
+        return _shared_loop
+
+
+async def run_shared(coro):
+    """
+    Executa uma corrotina no laço compartilhado (veja `shared_loop`) e aguarda o resultado no laço atual.
+
+    Args:
+        coro: A corrotina, por exemplo `AsyncModelOllama().aquestion(...)`.
+
+    Retorna:
+        O resultado da corrotina.
+    """
+    loop = shared_loop()
+    if asyncio.get_running_loop() is loop:
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+
+async def aclose():
+    """
+    Fecha as conexões dos clientes assíncronos do laço de eventos em execução.
+    Deve ser chamado antes do fim de um laço de vida curta criado pela aplicação.
+    """
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        clients = _async_clients.pop(loop, {})
+    for shared in clients.values():
+        await shared.close()
+
+
+def close():
+    """
+    Fecha os clientes compartilhados e encerra o laço compartilhado. Chamado no encerramento da aplicação.
+    """
+    global _shared_loop
+    with _clients_lock:
+        sync_clients = list(_clients.values())
+        _clients.clear()
+        loop, _shared_loop = _shared_loop, None
+
+    for shared in sync_clients:
+        shared.close()
+
+    if loop is not None and not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+
+
 class ModelOllama:
-    def __init__(self, model: str = "sibila"):
+    def __init__(self, model: str = "sibila", host: str = None):
         """
         Inicializa uma instância da classe.
         Args:
             model (str): O nome do modelo a ser utilizado. O valor padrão é "sibila".
+            host (str, opcional): Endereço do servidor Ollama. O padrão é None (variável OLLAMA_HOST ou o endereço padrão).
         Atributos:
-            client: Cliente para interagir com o serviço Ollama.
-            embeddings (list): Lista para armazenar embeddings.
+            client: Cliente compartilhado (pool de conexões) para interagir com o serviço Ollama.
+            embeddings (np.ndarray): Matriz float32 com os embeddings (um por linha).
             model (str): Nome do modelo.
             chunks (list): Lista para armazenar chunks de dados.
         """
 
-        self.client = ollama
+        self.host = host
+        self.client = client(host)
         self.embeddings = []
         self.model = model
         self.chunks = []
@@ -58,7 +195,7 @@ class ModelOllama:
         Args:
             chunks (list, optional): Lista de chunks a serem processados. O padrão é uma lista vazia.
         Returns:
-            list: Embeddings gerados a partir dos chunks.
+            np.ndarray: Embeddings gerados a partir dos chunks (float32, um por linha).
         """
         self.set_chunks(chunks)
         self.generate()
@@ -76,7 +213,7 @@ class ModelOllama:
 
     def embed(self, prompt: str = ""):
         """
-        Gera uma incorporação (embedding) para o texto fornecido.
+        Gera uma incorporação (embedding) para o texto fornecido, consultando antes o cache de embeddings.
 
         Args:
             data (str): O texto para o qual a incorporação será gerada. Padrão é uma string vazia.
@@ -84,15 +221,44 @@ class ModelOllama:
         Returns:
             list: A incorporação gerada para o texto fornecido.
         """
-        embedding = self.client.embeddings(model=self.model, prompt=prompt)
-        return embedding["embedding"]
+        cached = EmbeddingCache.get(self.embedding_space, prompt)
+        if cached is not None:
+            return cached.tolist()
+
+        # mesmo endpoint de `embed_many`, para que consultas e chunks fiquem no mesmo espaço
+        embedding = self.embed_many([prompt])[0]
+        EmbeddingCache.put(self.embedding_space, prompt, embedding)
+        return embedding
+
+    @property
+    def embedding_space(self) -> str:
+        """
+        Identificação do espaço vetorial dos embeddings (modelo e endpoint), usada como chave do cache.
+
+        Retorna:
+            str: Por exemplo, "sibila:embed".
+        """
+        return f"{self.model}:{EMBEDDING_ENDPOINT}"
+
+    def embed_many(self, inputs: list) -> list:
+        """
+        Gera as incorporações de vários textos numa única requisição (`/api/embed`).
+
+        Args:
+            inputs (list): Os textos.
+
+        Returns:
+            list: Uma incorporação para cada texto, na mesma ordem.
+        """
+        response = self.client.embed(model=self.model, input=inputs)
+        return response["embeddings"]
 
     def generate(self):
         """
-        Gera embeddings utilizando a função handle.generate_embeddings.
+        Gera embeddings utilizando a função handle.generate_embeddings (em lotes, com requisições simultâneas).
 
         Retorna:
-            Embeddings gerados pela função handle.generate_embeddings.
+            tuple: Os chunks e a matriz float32 de embeddings.
         """
         self.embeddings = handle.generate_embeddings(self, self.chunks)
         return self.data
@@ -100,51 +266,118 @@ class ModelOllama:
     def question(self, prompt: str, question: str = "") -> str:
         """
         Gera uma resposta para uma pergunta baseada em um prompt fornecido.
+        Chamadas de baixa temperatura são respondidas pelo cache de respostas quando o mesmo modelo,
+        com as mesmas opções, já recebeu os mesmos prompts.
         Args:
             prompt (str): O texto base para gerar a resposta.
             question (str, opcional): A pergunta específica a ser respondida. Padrão é uma string vazia.
         Returns:
             str: A resposta gerada para a pergunta.
         """
-        chat = self.completion(prompt, question)
-        response = chat["message"]["content"]
+        digest = self.cache_key(prompt, question)
+
+        response = ResponseCache.get(digest) if digest else None
+        if response is None:
+            started = time.perf_counter()
+            chat = self.completion(prompt, question)
+            response = chat["message"]["content"]
+            if digest:
+                ResponseCache.put(digest, self.model, response, time.perf_counter() - started)
 
         # Armazena a resposta no deque (últimas 5 respostas)
         HISTORY.append(response)
         
         return response
 
-    def completion(self, prompt: str, question: str):
+    def cache_key(self, prompt: str, question: str) -> Optional[str]:
+        """
+        Retorna a chave da chamada no cache de respostas.
+        Args:
+            prompt (str): O prompt de sistema.
+            question (str): O prompt do usuário.
+        Returns:
+            Optional[str]: A chave, ou None se a resposta da chamada não deve ser reaproveitada (por exemplo, temperatura alta).
+        """
+        options = self.options()
+        if not ResponseCache.cacheable(options):
+            return None
+        return ResponseCache.key(self.model, options, prompt, question)
+
+    def stream(self, prompt: str, question: str = ""):
+        """
+        Versão de `question` que produz a resposta aos pedaços, à medida que o modelo gera os tokens.
+        A resposta completa é armazenada no histórico quando a geração termina.
+        Args:
+            prompt (str): O texto base para gerar a resposta.
+            question (str, opcional): A pergunta específica a ser respondida. Padrão é uma string vazia.
+        Yields:
+            str: Cada pedaço (um ou mais tokens) da resposta.
+        """
+        parts = []
+        for chunk in self.completion(prompt, question, stream=True):
+            content = chunk["message"]["content"]
+            if content:
+                parts.append(content)
+                yield content
+
+        HISTORY.append("".join(parts))
+
+    def completion(self, prompt: str, question: str, stream: bool = False):
         """
         Gera uma resposta baseada no prompt e na pergunta fornecidos.
 
         Args:
             prompt (str): O prompt inicial que define o contexto da conversa.
             question (str): A pergunta feita pelo usuário que precisa de uma resposta.
+            stream (bool, opcional): Se deve retornar um iterador com os pedaços da resposta. Padrão é False.
 
         Returns:
-            dict: A resposta gerada pelo modelo de chat.
+            dict: A resposta gerada pelo modelo de chat (ou um iterador de pedaços, com `stream`).
         """
         return self.client.chat(
             model=self.model,
-            messages=[
-                {"role": "system", "content": f"{prompt}"},
-                {"role": "user", "content": f"{question}"}
-            ],
-            options={
-                "top_p": self.diffusion_of_hallucination,
-                "presence_penalty": self.penalty_rate,
-                "min_p": self.diversification_rate,
-                "top_k": self.hallucination_rate,
-                "tfs_z": self.out_reduction_rate,
-                "temperature": self.temperature,
-                "mirostat_tau": self.out_focus,
-                "max_tokens": self.max_tokens,
-                "num_ctx": self.context,
-                "stop": ['\n'],
-            },
+            messages=self.messages(prompt, question),
+            options=self.options(),
+            stream=stream,
         )
 
+    @staticmethod
+    def messages(prompt: str, question: str) -> list:
+        """
+        Monta as mensagens da conversa (sistema e usuário).
+
+        Args:
+            prompt (str): O prompt inicial que define o contexto da conversa.
+            question (str): A pergunta feita pelo usuário.
+
+        Returns:
+            list: As mensagens no formato da API de chat.
+        """
+        return [
+            {"role": "system", "content": f"{prompt}"},
+            {"role": "user", "content": f"{question}"}
+        ]
+
+    def options(self) -> dict:
+        """
+        Retorna as opções de geração do modelo a partir dos parâmetros da instância.
+
+        Returns:
+            dict: As opções no formato da API do Ollama.
+        """
+        return {
+            "top_p": self.diffusion_of_hallucination,
+            "presence_penalty": self.penalty_rate,
+            "min_p": self.diversification_rate,
+            "top_k": self.hallucination_rate,
+            "tfs_z": self.out_reduction_rate,
+            "temperature": self.temperature,
+            "mirostat_tau": self.out_focus,
+            "max_tokens": self.max_tokens,
+            "num_ctx": self.context,
+            "stop": ['\n'],
+        }
+
     @staticmethod
     def history():
         """
@@ -157,5 +390,119 @@ class ModelOllama:
         """
         # Converte o deque para uma lista para serialização JSON
         return list(HISTORY)
-    
-    
+
+
+class AsyncModelOllama(ModelOllama):
+    def __init__(self, model: str = "sibila", host: str = None):
+        """
+        Versão assíncrona de `ModelOllama`, com os mesmos parâmetros de geração.
+        As corrotinas usam o cliente assíncrono compartilhado pelo laço de eventos (pool de conexões
+        keep-alive, com limite de conexões e tempo limite definidos em `src.config.ollama`), de modo que
+        várias chamadas ao LLM podem ficar em andamento ao mesmo tempo sem bloquear o laço.
+        Args:
+            model (str): O nome do modelo a ser utilizado. O valor padrão é "sibila".
+            host (str, opcional): Endereço do servidor Ollama. O padrão é None (variável OLLAMA_HOST ou o endereço padrão).
+        """
+        super().__init__(model, host)
+
+    @property
+    def async_client(self) -> ollama.AsyncClient:
+        """cliente assíncrono compartilhado pelo laço de eventos em execução"""
+        return async_client(self.host)
+
+    async def aembed_many(self, inputs: list) -> list:
+        """
+        Versão assíncrona de `embed_many`.
+
+        Args:
+            inputs (list): Os textos.
+
+        Returns:
+            list: Uma incorporação para cada texto, na mesma ordem.
+        """
+        response = await self.async_client.embed(model=self.model, input=inputs)
+        return response["embeddings"]
+
+    async def aembed(self, prompt: str = ""):
+        """
+        Versão assíncrona de `embed`, consultando antes o cache de embeddings.
+
+        Args:
+            prompt (str): O texto para o qual a incorporação será gerada. Padrão é uma string vazia.
+
+        Returns:
+            list: A incorporação gerada para o texto fornecido.
+        """
+        cached = EmbeddingCache.get(self.embedding_space, prompt)
+        if cached is not None:
+            return cached.tolist()
+
+        embedding = (await self.aembed_many([prompt]))[0]
+        EmbeddingCache.put(self.embedding_space, prompt, embedding)
+        return embedding
+
+    async def acompletion(self, prompt: str, question: str, stream: bool = False):
+        """
+        Versão assíncrona de `completion`.
+
+        Args:
+            prompt (str): O prompt inicial que define o contexto da conversa.
+            question (str): A pergunta feita pelo usuário que precisa de uma resposta.
+            stream (bool, opcional): Se deve retornar um iterador assíncrono com os pedaços da resposta. Padrão é False.
+
+        Returns:
+            dict: A resposta gerada pelo modelo de chat (ou um iterador assíncrono de pedaços, com `stream`).
+        """
+        return await self.async_client.chat(
+            model=self.model,
+            messages=self.messages(prompt, question),
+            options=self.options(),
+            stream=stream,
+        )
+
+    async def astream(self, prompt: str, question: str = ""):
+        """
+        Versão assíncrona de `stream`.
+
+        Args:
+            prompt (str): O texto base para gerar a resposta.
+            question (str, opcional): A pergunta específica a ser respondida. Padrão é uma string vazia.
+
+        Yields:
+            str: Cada pedaço (um ou mais tokens) da resposta.
+        """
+        parts = []
+        async for chunk in await self.acompletion(prompt, question, stream=True):
+            content = chunk["message"]["content"]
+            if content:
+                parts.append(content)
+                yield content
+
+        HISTORY.append("".join(parts))
+
+    async def aquestion(self, prompt: str, question: str = "") -> str:
+        """
+        Versão assíncrona de `question`, com o mesmo cache de respostas (consultado numa thread,
+        para não bloquear o laço de eventos).
+
+        Args:
+            prompt (str): O texto base para gerar a resposta.
+            question (str, opcional): A pergunta específica a ser respondida. Padrão é uma string vazia.
+
+        Returns:
+            str: A resposta gerada para a pergunta.
+        """
+        digest = self.cache_key(prompt, question)
+
+        response = await asyncio.to_thread(ResponseCache.get, digest) if digest else None
+        if response is None:
+            started = time.perf_counter()
+            chat = await self.acompletion(prompt, question)
+            response = chat["message"]["content"]
+            if digest:
+                await asyncio.to_thread(ResponseCache.put, digest, self.model, response, time.perf_counter() - started)
+
+        # Armazena a resposta no deque (últimas 5 respostas)
+        HISTORY.append(response)
+
+        return response
@@ -3,6 +3,7 @@
 from openai import OpenAI
 from src.config import open_ai as config
 from src.models import handle
+from src.models import embedding_cache as EmbeddingCache
 
 
 class ModelOpenAI:
@@ -12,6 +13,7 @@ class ModelOpenAI:
         self.client = OpenAI(api_key=config.OPENAI_API_KEY)
         self.embeddings = []
         self.model = model
+        self.embedding_model = "text-embedding-ada-002"
         self.chunks = []
 
     def set_chunks(self, chunks=None):
@@ -27,12 +29,26 @@ class ModelOpenAI:
     def data(self):
         return self.chunks, self.embeddings
 
+    @property
+    def embedding_space(self) -> str:
+        return self.embedding_model
+
     def embed(self, data: str = ""):
-        embedding = self.client.embeddings.create(input=data, model="text-embedding-ada-002")  # noqa: E501
-        return embedding.data[0].embedding
+        cached = EmbeddingCache.get(self.embedding_space, data)
+        if cached is not None:
+            return cached.tolist()
+
+        embedding = self.embed_many([data])[0]
+        EmbeddingCache.put(self.embedding_space, data, embedding)
+        return embedding
+
+    def embed_many(self, inputs: list) -> list:
+        response = self.client.embeddings.create(input=inputs, model=self.embedding_model)  # noqa: E501
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
 
     def generate(self):
-        return handle.generate_embeddings(self)
+        self.embeddings = handle.generate_embeddings(self, self.chunks)
+        return self.data
 
     def question(self, prompt: str, question: str = "") -> str:
         chat = self.completion(prompt, question)
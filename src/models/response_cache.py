@@ -0,0 +1,241 @@
+# flake8: noqa: E501
+"""
+Response Cache Module
+Cache persistente das respostas do LLM, endereçado pelo hash sha3 de (modelo, opções, prompt de sistema, prompt do usuário).
+
+As chamadas de baixa temperatura (títulos, categorias, tipo normativo, resumos, perguntas de banca,
+contexto jurídico) repetem os mesmos prompts para o mesmo artigo a cada regeneração do corpus. A
+resposta é gravada num banco SQLite próprio junto com a latência da chamada original; um acerto
+devolve a resposta sem chamar o modelo e contabiliza o tempo economizado. As entradas expiram após
+`ttl` segundos e o número de entradas é limitado por uma política LRU (horário do último acesso).
+
+Funções:
+    - key(model: str, options: dict, prompt: str, question: str) -> str: Gera a chave (hash sha3) de uma chamada.
+    - cacheable(options: dict) -> bool: Verifica se as opções da chamada permitem reaproveitar a resposta.
+    - get(digest: str) -> Optional[str]: Recupera uma resposta válida (não expirada).
+    - put(digest: str, model: str, response: str, latency: float = 0.0) -> bool: Grava uma resposta.
+    - evict(limit: int = None) -> int: Remove as entradas expiradas e aplica a política LRU de tamanho.
+    - clear() -> int: Remove todas as entradas.
+    - stats() -> dict: Retorna estatísticas do cache (entradas, acertos, faltas, gravações, remoções, tempo economizado).
+"""
+
+from typing import Optional
+import threading
+import traceback
+import logging
+import json
+import time
+
+from src.modules.database import sqlitedb
+from src.utils import string as String
+
+# diretório do banco de respostas
+directory = './data/.cache/responses'
+
+# quantidade máxima de respostas mantidas (LRU)
+max_entries = 100000
+
+# validade de uma resposta, em segundos (None para não expirar)
+ttl = 30 * 24 * 60 * 60
+
+# as respostas só são reaproveitadas para temperaturas abaixo deste valor (o padrão de ModelOllama é 0.5)
+max_temperature = 0.5
+
+# se o cache está ativo
+enabled = True
+
+TABLE = "responses"
+
+_lock = threading.Lock()
+_counters = {'hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0, 'saved_seconds': 0.0}
+
+
+def _connection() -> object:
+    """abre o banco do cache, criando a tabela na primeira vez"""
+    conn = sqlitedb.client(directory)
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {TABLE} (
+            hash TEXT PRIMARY KEY,
+            model TEXT,
+            response TEXT,
+            latency REAL,
+            created REAL,
+            accessed REAL
+        ) WITHOUT ROWID
+    """)
+    conn.execute(f"CREATE INDEX IF NOT EXISTS {TABLE}_accessed ON {TABLE} (accessed)")
+    return conn
+
+
+def _expired_before() -> float:
+    """horário de criação a partir do qual uma entrada ainda é válida"""
+    return time.time() - ttl if ttl is not None else float('-inf')
+
+
+def key(model: str, options: dict, prompt: str, question: str) -> str:
+    """
+    Gera a chave de uma chamada ao modelo no cache.
+
+    Args:
+        model (str): Nome do modelo.
+        options (dict): Opções de geração (temperatura, top_k, max_tokens...).
+        prompt (str): O prompt de sistema.
+        question (str): O prompt do usuário.
+
+    Returns:
+        str: Hash sha3 da chamada.
+    """
+    return String.hash(json.dumps([model, options, prompt, question], sort_keys=True, ensure_ascii=False))
+
+
+def cacheable(options: dict) -> bool:
+    """
+    Verifica se a resposta de uma chamada pode ser reaproveitada: o cache precisa estar ativo e a
+    temperatura precisa estar definida e abaixo de `max_temperature`. Sem temperatura, o servidor
+    usa a do modelo, que não é conhecida aqui.
+
+    Args:
+        options (dict): Opções de geração da chamada.
+
+    Returns:
+        bool: True se a resposta pode ser lida e gravada no cache.
+    """
+    temperature = options.get("temperature")
+    return enabled and temperature is not None and temperature < max_temperature
+
+
+def get(digest: str) -> Optional[str]:
+    """
+    Recupera a resposta de uma chamada, se estiver no cache e não tiver expirado.
+
+    Args:
+        digest (str): A chave da chamada (veja `key`).
+
+    Returns:
+        Optional[str]: A resposta, ou None se não estiver no cache.
+    """
+    if not enabled:
+        return None
+
+    found = None
+    try:
+        conn = _connection()
+        found = conn.execute(f"select response, latency from {TABLE} where hash=? and created>=?", (digest, _expired_before())).fetchone()
+        if found:
+            # marca o acesso para a política LRU
+            conn.execute(f"update {TABLE} set accessed=? where hash=?", (time.time(), digest))
+            conn.commit()
+        conn.close()
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+
+    with _lock:
+        if found:
+            _counters['hits'] += 1
+            _counters['saved_seconds'] += found[1] or 0.0
+        else:
+            _counters['misses'] += 1
+    return found[0] if found else None
+
+
+def put(digest: str, model: str, response: str, latency: float = 0.0) -> bool:
+    """
+    Grava a resposta de uma chamada e aplica a política de tamanho.
+
+    Args:
+        digest (str): A chave da chamada (veja `key`).
+        model (str): Nome do modelo.
+        response (str): A resposta do modelo.
+        latency (float): Duração da chamada, em segundos (tempo economizado a cada acerto). Padrão é 0.0.
+
+    Returns:
+        bool: True se a resposta foi gravada, False caso contrário.
+    """
+    if not enabled:
+        return False
+
+    try:
+        now = time.time()
+        conn = _connection()
+        conn.execute(f"insert or replace into {TABLE} (hash, model, response, latency, created, accessed) values (?, ?, ?, ?, ?, ?)", (digest, model, response, latency, now, now))
+        conn.commit()
+        conn.close()
+
+        with _lock:
+            _counters['writes'] += 1
+        evict()
+        return True
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return False
+
+
+def evict(limit: Optional[int] = None) -> int:
+    """
+    Remove as entradas expiradas e, em seguida, as acessadas há mais tempo até que o cache tenha no máximo `limit` entradas.
+
+    Args:
+        limit (Optional[int]): Quantidade máxima de entradas. Padrão é None (usa `max_entries`).
+
+    Returns:
+        int: Quantidade de entradas removidas.
+    """
+    limit = max_entries if limit is None else limit
+    try:
+        conn = _connection()
+        removed = conn.execute(f"delete from {TABLE} where created<?", (_expired_before(),)).rowcount
+        total = conn.execute(f"select count(*) from {TABLE}").fetchone()[0]
+        if total > limit:
+            removed += conn.execute(f"delete from {TABLE} where hash in (select hash from {TABLE} order by accessed limit ?)", (total - limit,)).rowcount
+        conn.commit()
+        conn.close()
+
+        with _lock:
+            _counters['evictions'] += removed
+        return removed
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return 0
+
+
+def clear() -> int:
+    """
+    Remove todas as entradas do cache.
+
+    Returns:
+        int: Quantidade de entradas removidas.
+    """
+    try:
+        conn = _connection()
+        removed = conn.execute(f"delete from {TABLE}").rowcount
+        conn.commit()
+        conn.close()
+        return removed
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return 0
+
+
+def stats() -> dict:
+    """
+    Retorna estatísticas do cache.
+
+    Returns:
+        dict: Entradas, acertos, faltas, gravações, remoções, taxa de acertos e tempo de LLM economizado (segundos).
+    """
+    try:
+        conn = _connection()
+        entries = conn.execute(f"select count(*) from {TABLE}").fetchone()[0]
+        conn.close()
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        entries = 0
+
+    with _lock:
+        counters = dict(_counters)
+    lookups = counters['hits'] + counters['misses']
+    return {
+        'entries': entries,
+        **counters,
+        'hit_rate': counters['hits'] / lookups if lookups else 0.0,
+    }
@@ -2,20 +2,23 @@
 
 import logging
 import traceback
-from typing import List
+from typing import List, Optional
 
 from src.modules.database import chromadbvector
-from src.modules.nlp.bow import relevant_words
+from src.modules.nlp.bow import relevant_words, relevant_words_many
 from src.utils import string as String
 
 COLLECTION = "federal_conctitution"
 
+# campos de um artigo catalogados em cada dimensão
+ARTICLE_FIELDS = ['text', 'dates', 'subject', 'sumamry', 'entities', 'penalties', 'categories', 'definition', 'normativeTipe']
+
 #################################################################
 # COLEÇÂO: FEDERAL CONSTITUTION
 #################################################################
 
 
-def save_by_constellation(content: str, metadata: str) -> bool:
+def save_by_constellation(content: str, metadata: str, keys: Optional[str] = None) -> bool:
     """
     Salva uma constelação de palavras usando BoW (bag of words) com relevâcia >= a 3. 
     O texto completo fica salvo no meta data junto com a fonte de infromação
@@ -35,7 +38,7 @@ def save_by_constellation(content: str, metadata: str) -> bool:
         if chromadbvector.conflict_id(collection, hash_id):
             return True
 
-        keys = relevant_words(content)
+        keys = relevant_words(content) if keys is None else keys
         meta = {"content": content, 'metadata': metadata}
         collection.add(ids=[hash_id], documents=[keys], metadatas=[meta])
         return True
@@ -114,9 +117,9 @@ def query(query: str = "", results: int = 5, threshold: float = 0.5) -> List[dic
         return []
 
 
-def save_in_dimensions(content: str, metadata: str) -> bool:
+def save_in_dimensions(content: str, metadata: str, keys: Optional[str] = None) -> bool:
     save(content, metadata)
-    save_by_constellation(content, metadata)
+    save_by_constellation(content, metadata, keys)
 
 
 def query_in_dimencions(question: str) -> List[dict]:
@@ -127,19 +130,20 @@ def query_in_dimencions(question: str) -> List[dict]:
     return docs
 
 
-def catalog_article(article: dict):
+def catalog_article(article: dict, keys: Optional[List[str]] = None):
     text = article['text']
-    save_in_dimensions(text, text)
-    save_in_dimensions(article['dates'], text)
-    save_in_dimensions(article['subject'], text)
-    save_in_dimensions(article['sumamry'], text)
-    save_in_dimensions(article['entities'], text)
-    save_in_dimensions(article['penalties'], text)
-    save_in_dimensions(article['categories'], text)
-    save_in_dimensions(article['definition'], text)
-    save_in_dimensions(article['normativeTipe'], text)
+    contents = [article[field] for field in ARTICLE_FIELDS]
+
+    # as palavras relevantes de todos os campos saem de uma única matriz BoW
+    keys = keys or relevant_words_many(contents)
+    for content, key in zip(contents, keys):
+        save_in_dimensions(content, text, key)
 
 
 def catalog_articles(articles: List[dict]):
-    for article in articles:
-        catalog_article(article)
+    contents = [article[field] for article in articles for field in ARTICLE_FIELDS]
+    keys = relevant_words_many(contents)
+
+    fields = len(ARTICLE_FIELDS)
+    for index, article in enumerate(articles):
+        catalog_article(article, keys[index * fields:(index + 1) * fields])
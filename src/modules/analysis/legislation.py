@@ -5,7 +5,7 @@ from typing import List, Dict, Tuple
 
 from src.models.ollama import ModelOllama
 from src.modules.nlp.featureextractor import FeatureExtractor
-from src.modules.nlp.sentiment import sentiment_analysis, sentiment_noun_phrases, sentiment_tags
+from src.modules.nlp.sentiment import analyze as sentiment_analyze, analyze_many as sentiment_analyze_many, sentiment_noun_phrases
 
 # Importação condicional do Docling
 try:
@@ -69,29 +69,35 @@ class LegislationAnalyzer:
         self.llm.penalty_rate = 5.0
         self.llm.max_tokens = 200
     
-    def analyze_text_structure(self, text: str) -> Dict:
+    def analyze_text_structure(self, text: str, analysis: Dict = None, sentiment: Dict = None) -> Dict:
         """
         Analisa a estrutura do texto usando NLP para extrair características.
         Versão simplificada que evita problemas de dependência.
         
         Args:
             text (str): Texto a ser analisado
+            analysis (dict, opcional): Análise sintática já calculada (ver `analyze_text_structure_many`)
+            sentiment (dict, opcional): Resultado de `sentiment.analyze` já calculado
             
         Returns:
             dict: Análise estrutural com entidades, tags e características
         """
         try:
             # Usar feature extractor para análise simples
-            analysis = self.feature_extractor.syntax_analisys(text)
+            if analysis is None:
+                analysis = self.feature_extractor.syntax_analisys(text)
         except Exception:
             # Fallback para análise básica se houver erro
             analysis = {'tokens': [], 'entities': [], 'tags': []}
         
-        # Análise de sentimento
+        # Análise de sentimento (sentimento, tags e frases nominais numa única leitura do texto)
         try:
-            sentiment = sentiment_analysis(text)
-            noun_phrases = sentiment_noun_phrases(text)
-            pos_tags = sentiment_tags(text)
+            if sentiment is None:
+                sentiment = sentiment_analyze(text)
+            result = sentiment or {}
+            sentiment = result.get('sentiment')
+            noun_phrases = result.get('noun_phrases')
+            pos_tags = result.get('tags')
         except Exception:
             sentiment = "Neutral"
             noun_phrases = []
@@ -109,6 +115,30 @@ class LegislationAnalyzer:
             'confidence_score': self._calculate_confidence(analysis, legislative_patterns)
         }
     
+    def analyze_text_structure_many(self, texts: List[str], batch_size: int = 64, n_process: int = 1, workers: int = 1) -> List[Dict]:
+        """
+        Versão em lote de `analyze_text_structure`: a análise sintática de todos os textos
+        é feita numa única passada do `nlp.pipe` e o sentimento é analisado em lote (num pool de processos, se `workers` pedir).
+        
+        Args:
+            texts (List[str]): Textos a serem analisados
+            batch_size (int): Textos por lote do spaCy
+            n_process (int): Processos do spaCy
+            workers (int): Processos da análise de sentimento (1 analisa no próprio processo, como nas requisições; 0 usa todos os núcleos)
+            
+        Returns:
+            List[dict]: Uma análise estrutural por texto, na ordem de entrada
+        """
+        try:
+            analyses = self.feature_extractor.syntax_analysis_many(texts, batch_size=batch_size, n_process=n_process)
+        except Exception:
+            analyses = [None] * len(texts)
+        try:
+            sentiments = sentiment_analyze_many(texts, workers=workers)
+        except Exception:
+            sentiments = [None] * len(texts)
+        return [self.analyze_text_structure(text, analysis, sentiment) for text, analysis, sentiment in zip(texts, analyses, sentiments)]
+    
     def _identify_legislative_patterns(self, text: str) -> Dict:
         """Identifica padrões específicos de textos legislativos."""
         patterns = {
@@ -219,7 +249,7 @@ class LegislationAnalyzer:
             # Filtrar entidades relevantes (substantivos, nomes próprios)
             if 'tags' in nlp_analysis:
                 for word, tag in nlp_analysis['tags']:
-                    if tag in ['NNP', 'NNPS', 'NN', 'NNS'] and len(word) > 2:
+                    if tag in ['NNP', 'NNPS', 'NN', 'NNS', 'PROPN', 'NOUN'] and len(word) > 2:
                         all_entities.append(word)
         except Exception:
             # Se análise NLP falhar, usar regex simples
@@ -502,13 +532,23 @@ def extract_article_components(article_text: str) -> dict:
     return components
 
 
-def set_a_title(text: str) -> str:
+def analyze_text_structure_many(texts: List[str], batch_size: int = 64) -> List[Dict]:
+    """
+    Análise estrutural de uma lista de artigos numa única passada do spaCy,
+    para ser repassada a `set_a_title` sem reanalisar cada artigo.
+    """
+    return _analyzer.analyze_text_structure_many(texts, batch_size=batch_size)
+
+
+def set_a_title(text: str, nlp_analysis: Dict = None) -> str:
     """
     Versão aprimorada que usa análise NLP para identificar palavras-chave
     e gerar títulos mais precisos.
+    A análise estrutural pode ser passada já calculada (ver `analyze_text_structure_many`).
     """
     # Análise NLP para extrair características importantes
-    nlp_analysis = _analyzer.analyze_text_structure(text)
+    if nlp_analysis is None:
+        nlp_analysis = _analyzer.analyze_text_structure(text)
     
     # Extrair palavras-chave do texto usando TF-IDF e entidades
     keywords = []
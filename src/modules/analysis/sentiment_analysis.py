@@ -181,14 +181,427 @@ def sentiment_verb(text: str = ""):
 # Enhanced Analysis Module for Sentiment Analysis
 # Provides enriched context for analysts with comprehensive sentiment insights
 
-from typing import Dict, List, Optional, Tuple, Any
-from collections import defaultdict, Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Any
+from collections import deque, Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice, repeat
 import json
+import os
 from datetime import datetime
 
 from ..nlp.enhanced_sentiment import EnhancedSentimentAnalyzer, SentimentFilter
 
 
+_worker_analyzer = None  # analyzer of a pool process, created once per process
+
+
+def _analyze_chunk(texts: List[str]) -> List[Dict]:
+    """Analyze a chunk of texts in a pool process, reusing the process analyzer"""
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = EnhancedSentimentAnalyzer()
+    return [_worker_analyzer.analyze_comprehensive(text) for text in texts]
+
+
+def _excerpt(text: str) -> str:
+    """First 100 characters of a text, as shown in alerts and outliers"""
+    return text[:100] + '...' if len(text) > 100 else text
+
+
+class SentimentReportBuilder:
+    """
+    Single-pass aggregation of sentiment results into a report
+    Every aggregate of the report and of the analyst context is updated as each result arrives,
+    so memory does not grow with the collection unless the individual results are kept
+    """
+    
+    def __init__(self, keep_results: bool = True, max_items: Optional[int] = None):
+        """
+        Args:
+            keep_results (bool): Keep every individual result in the report. Defaults to True.
+            max_items (Optional[int]): Maximum alerts and outliers kept as examples (the counts stay exact). Defaults to None (no limit).
+        """
+        self.keep_results = keep_results
+        self.max_items = max_items
+        self.individual_results: List[Dict] = []
+        
+        self.total = 0
+        self.sentiment_counts = Counter()
+        self.language_counts = Counter()
+        self.dominant_emotions = Counter()
+        self.confidence_sum = 0.0
+        self.confidence_levels = {'high': 0, 'medium': 0, 'low': 0}
+        self.intensity_sum = 0.0
+        self.polarity_sum = 0.0
+        self.polarity_max = float('-inf')
+        self.polarity_min = float('inf')
+        self.emotion_sums: Dict[str, float] = {}
+        self.emotion_counts = Counter()
+        
+        # Per aspect, in order of first mention
+        self.aspect_sentiments: Dict[str, Counter] = {}
+        self.aspect_polarity_sums: Dict[str, float] = {}
+        self.aspect_emotions: Dict[str, Counter] = {}
+        self.aspect_negatives = Counter()
+        
+        self.alert_counts = Counter()
+        self.alerts: Dict[str, List[Dict]] = {'high_priority': [], 'medium_priority': [], 'opportunities': []}
+        self.outlier_candidates: List[Dict] = []
+    
+    def _keep(self, items: List[Dict], item: Dict):
+        """Append an example item, up to max_items"""
+        if self.max_items is None or len(items) < self.max_items:
+            items.append(item)
+    
+    def add(self, text: str, sentiment: Dict, metadata: Optional[Dict] = None) -> Dict:
+        """
+        Add the analysis of one text to every aggregate
+        
+        Args:
+            text (str): The analyzed text
+            sentiment (Dict): Result of EnhancedSentimentAnalyzer.analyze_comprehensive
+            metadata (Optional[Dict]): Optional metadata of the text
+            
+        Returns:
+            Dict: The individual result (index, text, sentiment, metadata)
+        """
+        result = {
+            'index': self.total,
+            'text': text,
+            'sentiment': sentiment,
+            'metadata': metadata or {}
+        }
+        if self.keep_results:
+            self.individual_results.append(result)
+        self.total += 1
+        
+        basic = sentiment['basic_sentiment']
+        classification = basic['classification']
+        polarity = basic['polarity']
+        confidence = sentiment['overall_confidence']
+        intensity = sentiment['intensity']['intensity']
+        dominant_emotion = sentiment['emotions']['dominant_emotion']
+        
+        self.sentiment_counts[classification] += 1
+        self.language_counts[sentiment['language']] += 1
+        self.dominant_emotions[dominant_emotion] += 1
+        
+        self.confidence_sum += confidence
+        self.confidence_levels['high' if confidence > 0.7 else 'medium' if confidence >= 0.3 else 'low'] += 1
+        self.intensity_sum += intensity
+        self.polarity_sum += polarity
+        self.polarity_max = max(self.polarity_max, polarity)
+        self.polarity_min = min(self.polarity_min, polarity)
+        
+        for emotion, score in sentiment['emotions']['scores'].items():
+            self.emotion_sums[emotion] = self.emotion_sums.get(emotion, 0.0) + score
+            self.emotion_counts[emotion] += 1
+        
+        for aspect, details in sentiment['aspect_sentiment'].items():
+            self.aspect_sentiments.setdefault(aspect, Counter())[details['sentiment']] += 1
+            self.aspect_polarity_sums[aspect] = self.aspect_polarity_sums.get(aspect, 0.0) + details['polarity']
+            self.aspect_emotions.setdefault(aspect, Counter())[dominant_emotion] += 1
+            if details['sentiment'] == 'Negative':
+                self.aspect_negatives[aspect] += 1
+        
+        # Priority alerts: high confidence negative and positive sentiments
+        if confidence > 0.8 and classification in ('Negative', 'Positive'):
+            kind = 'high_priority' if classification == 'Negative' else 'opportunities'
+            self.alert_counts[kind] += 1
+            self._keep(self.alerts[kind], {
+                'text': _excerpt(text),
+                'reason': 'High confidence negative sentiment' if kind == 'high_priority' else 'Strong positive feedback opportunity',
+                'confidence': confidence,
+                'polarity': polarity
+            })
+        
+        # Outlier candidates against the running averages; confirmed against the final ones
+        if not self.keep_results and self._is_outlier(confidence, intensity):
+            self._keep(self.outlier_candidates, {
+                'text': _excerpt(text),
+                'reason': 'Low confidence with high intensity - conflicting signals',
+                'confidence': confidence,
+                'intensity': intensity
+            })
+        
+        return result
+    
+    def _is_outlier(self, confidence: float, intensity: float) -> bool:
+        """Low confidence with high intensity, relative to the averages so far"""
+        return confidence < self.average_confidence * 0.5 and intensity > self.average_intensity * 1.5
+    
+    @property
+    def average_confidence(self) -> float:
+        return self.confidence_sum / self.total if self.total else 0
+    
+    @property
+    def average_intensity(self) -> float:
+        return self.intensity_sum / self.total if self.total else 0
+    
+    @property
+    def average_polarity(self) -> float:
+        return self.polarity_sum / self.total if self.total else 0
+    
+    def summary(self) -> Dict:
+        """Overall summary statistics"""
+        if not self.total:
+            return {}
+        
+        return {
+            'total_texts': self.total,
+            'sentiment_counts': Counter(self.sentiment_counts),
+            'average_confidence': self.average_confidence,
+            'average_intensity': self.average_intensity,
+            'confidence_distribution': dict(self.confidence_levels)
+        }
+    
+    def sentiment_distribution(self) -> Dict:
+        """Sentiment distribution patterns"""
+        if not self.total:
+            return {}
+        
+        distribution = {}
+        for key, classification in (('positive', 'Positive'), ('negative', 'Negative'), ('neutral', 'Neutral')):
+            count = self.sentiment_counts.get(classification, 0)
+            distribution[key] = {'count': count, 'percentage': (count / self.total) * 100}
+        
+        return {
+            'distribution': distribution,
+            'polarity_stats': {
+                'average': self.average_polarity,
+                'max': self.polarity_max,
+                'min': self.polarity_min
+            }
+        }
+    
+    def emotion_analysis(self) -> Dict:
+        """Emotion patterns across texts"""
+        emotion_averages = {emotion: total / self.emotion_counts[emotion] for emotion, total in self.emotion_sums.items()}
+        
+        return {
+            'dominant_emotion_distribution': Counter(self.dominant_emotions),
+            'emotion_averages': emotion_averages,
+            'most_prevalent_emotion': max(emotion_averages.items(), key=lambda x: x[1]) if emotion_averages else ('neutral', 0)
+        }
+    
+    def aspect_insights(self) -> Dict:
+        """Aspect-based sentiment patterns"""
+        aspect_analysis = {}
+        for aspect, sentiment_counts in self.aspect_sentiments.items():
+            mentions = sum(sentiment_counts.values())
+            avg_polarity = self.aspect_polarity_sums[aspect] / mentions
+            
+            aspect_analysis[aspect] = {
+                'total_mentions': mentions,
+                'sentiment_distribution': Counter(sentiment_counts),
+                'average_polarity': avg_polarity,
+                'overall_sentiment': 'Positive' if avg_polarity > 0.1 else 'Negative' if avg_polarity < -0.1 else 'Neutral'
+            }
+        
+        return aspect_analysis
+    
+    def language_distribution(self) -> Dict:
+        """Language distribution"""
+        return {
+            'distribution': Counter(self.language_counts),
+            'total_languages': len(self.language_counts)
+        }
+    
+    def quality_metrics(self) -> Dict:
+        """Quality metrics for the analysis"""
+        return {
+            'data_quality_score': self.average_confidence,
+            'analysis_reliability': self.confidence_levels['high'] / self.total if self.total else 0,
+            'signal_strength': self.average_intensity
+        }
+    
+    def key_insights(self) -> List[str]:
+        """Key insights from the analysis"""
+        insights = []
+        
+        if self.total:
+            sentiment, count = self.sentiment_counts.most_common(1)[0]
+            insights.append(f"Dominant sentiment is {sentiment} ({(count / self.total) * 100:.1f}% of texts)")
+            
+            emotion, _ = self.dominant_emotions.most_common(1)[0]
+            if emotion != 'neutral':
+                insights.append(f"Primary emotion detected: {emotion}")
+        
+        if self.average_confidence > 0.8:
+            insights.append("High confidence in analysis results")
+        elif self.average_confidence < 0.5:
+            insights.append("Analysis confidence is below average - consider reviewing data quality")
+        
+        return insights
+    
+    def recommendations(self) -> List[str]:
+        """Actionable recommendations"""
+        recommendations = []
+        
+        if self.sentiment_counts.get('Negative', 0) > self.total * 0.3:  # More than 30% negative
+            recommendations.append("High negative sentiment detected - investigate root causes and implement improvement measures")
+        
+        for issue, count in self.aspect_negatives.most_common(3):
+            recommendations.append(f"Address {issue}-related concerns (mentioned negatively {count} times)")
+        
+        return recommendations
+    
+    def report(self) -> Dict:
+        """
+        The comprehensive analysis report (same structure as SentimentAnalysisReport.analyze_text_collection)
+        
+        Returns:
+            Dict: Comprehensive analysis report
+        """
+        return {
+            'summary': self.summary(),
+            'sentiment_distribution': self.sentiment_distribution(),
+            'emotion_analysis': self.emotion_analysis(),
+            'aspect_insights': self.aspect_insights(),
+            'language_distribution': self.language_distribution(),
+            'quality_metrics': self.quality_metrics(),
+            'key_insights': self.key_insights(),
+            'recommendations': self.recommendations(),
+            'individual_results': self.individual_results,
+            'generated_at': datetime.now().isoformat()
+        }
+    
+    def outliers(self) -> List[Dict]:
+        """Results with low confidence and high intensity relative to the collection averages"""
+        if not self.total:
+            return []
+        
+        if not self.keep_results:
+            return [o for o in self.outlier_candidates if self._is_outlier(o['confidence'], o['intensity'])]
+        
+        outliers = []
+        for result in self.individual_results:
+            confidence = result['sentiment']['overall_confidence']
+            intensity = result['sentiment']['intensity']['intensity']
+            if self._is_outlier(confidence, intensity):
+                self._keep(outliers, {
+                    'text': _excerpt(result['text']),
+                    'reason': 'Low confidence with high intensity - conflicting signals',
+                    'confidence': confidence,
+                    'intensity': intensity
+                })
+        return outliers
+    
+    def action_items(self) -> List[str]:
+        """Specific action items for analysts"""
+        action_items = []
+        
+        if self.alert_counts['high_priority']:
+            action_items.append(f"Address {self.alert_counts['high_priority']} high-priority negative sentiment items immediately")
+        
+        if self.alert_counts['opportunities']:
+            action_items.append(f"Leverage {self.alert_counts['opportunities']} positive feedback opportunities for improvement")
+        
+        for aspect, count in self.aspect_negatives.items():
+            if count > 1:
+                action_items.append(f"Investigate and improve {aspect} (negative mentions: {count})")
+        
+        return action_items
+    
+    def sentiment_patterns(self) -> List[str]:
+        """Patterns in sentiment data"""
+        patterns = []
+        
+        if self.dominant_emotions:
+            emotion, count = self.dominant_emotions.most_common(1)[0]
+            if count > self.total * 0.4:
+                patterns.append(f"Dominant emotion pattern: {emotion} appears in {count} texts")
+        
+        return patterns
+    
+    def emotional_drivers(self) -> List[str]:
+        """What drives the different emotions, by aspect"""
+        return [f"{aspect} primarily drives {emotions.most_common(1)[0][0]} emotion" for aspect, emotions in self.aspect_emotions.items()]
+    
+    def aspect_performance(self) -> Dict:
+        """Performance of the different aspects"""
+        aspect_performance = {}
+        for aspect, sentiment_counts in self.aspect_sentiments.items():
+            mentions = sum(sentiment_counts.values())
+            positive_ratio = sentiment_counts.get('Positive', 0) / mentions
+            
+            if positive_ratio > 0.6:
+                performance = "excellent"
+            elif positive_ratio > 0.4:
+                performance = "good"
+            elif sentiment_counts.get('Negative', 0) / mentions > 0.4:
+                performance = "poor"
+            else:
+                performance = "neutral"
+            
+            aspect_performance[aspect] = {
+                'performance': performance,
+                'sentiment_distribution': dict(sentiment_counts),
+                'total_mentions': mentions
+            }
+        
+        return aspect_performance
+    
+    def sentiment_health(self) -> str:
+        """Overall sentiment health score"""
+        if not self.total:
+            return "unknown"
+        
+        positive_ratio = self.sentiment_counts.get('Positive', 0) / self.total
+        negative_ratio = self.sentiment_counts.get('Negative', 0) / self.total
+        
+        if positive_ratio > 0.6:
+            return "excellent"
+        elif positive_ratio > 0.4:
+            return "good"
+        elif negative_ratio > 0.4:
+            return "concerning"
+        else:
+            return "neutral"
+    
+    def analyst_context(self) -> Dict:
+        """
+        Enriched context for analysts (same structure as SentimentAnalysisReport.generate_analyst_context)
+        
+        Returns:
+            Dict: Enriched analyst context
+        """
+        alerts = {kind: list(items) for kind, items in self.alerts.items()}
+        positive_count = self.sentiment_counts.get('Positive', 0)
+        negative_count = self.sentiment_counts.get('Negative', 0)
+        
+        return {
+            'analyst_summary': {
+                'total_texts_analyzed': self.total,
+                'overall_sentiment_health': self.sentiment_health(),
+                'confidence_level': self.average_confidence,
+                'key_concerns': alerts['high_priority'],
+                'opportunities': alerts['opportunities']
+            },
+            'priority_alerts': alerts,
+            'trend_analysis': {
+                'sentiment_trend': 'stable',  # Would need temporal data for real trends
+                'confidence_trend': 'stable',
+                'average_sentiment_polarity': self.average_polarity,
+                'average_confidence': self.average_confidence
+            },
+            'outlier_detection': self.outliers(),
+            'comparative_analysis': {
+                'positive_vs_negative': {
+                    'positive_count': positive_count,
+                    'negative_count': negative_count,
+                    'sentiment_ratio': 'positive_dominant' if positive_count > negative_count else 'negative_dominant'
+                }
+            },
+            'action_items': self.action_items(),
+            'context_enrichment': {
+                'sentiment_patterns': self.sentiment_patterns(),
+                'emotional_drivers': self.emotional_drivers(),
+                'aspect_performance': self.aspect_performance()
+            }
+        }
+
+
 class SentimentAnalysisReport:
     """
     Comprehensive sentiment analysis reporting for analysts
@@ -213,34 +626,71 @@ class SentimentAnalysisReport:
         if not texts:
             return self._empty_report()
         
-        # Analyze each text
-        individual_results = []
+        builder = SentimentReportBuilder()
         for i, text in enumerate(texts):
-            sentiment_result = self.sentiment_analyzer.analyze_comprehensive(text)
-            
-            combined_result = {
-                'index': i,
-                'text': text,
-                'sentiment': sentiment_result,
-                'metadata': metadata[i] if metadata and i < len(metadata) else {}
-            }
-            individual_results.append(combined_result)
-        
-        # Generate comprehensive report
-        report = {
-            'summary': self._generate_summary(individual_results),
-            'sentiment_distribution': self._analyze_sentiment_distribution(individual_results),
-            'emotion_analysis': self._analyze_emotions(individual_results),
-            'aspect_insights': self._analyze_aspects(individual_results),
-            'language_distribution': self._analyze_languages(individual_results),
-            'quality_metrics': self._calculate_quality_metrics(individual_results),
-            'key_insights': self._extract_key_insights(individual_results),
-            'recommendations': self._generate_recommendations(individual_results),
-            'individual_results': individual_results,
-            'generated_at': datetime.now().isoformat()
-        }
+            builder.add(text, self.sentiment_analyzer.analyze_comprehensive(text), metadata[i] if metadata and i < len(metadata) else {})
+        
+        return builder.report()
+    
+    def analyze_text_stream(
+        self,
+        texts: Iterable[str],
+        metadata: Optional[Iterable[Dict]] = None,
+        workers: int = 0,
+        chunksize: int = 64,
+        in_flight: int = 0,
+        keep_results: bool = False,
+        max_items: Optional[int] = 100,
+    ) -> Dict:
+        """
+        Analyze a stream of texts (e.g. tens of thousands of paragraphs) in a process pool and build the
+        report and the analyst context in a single pass, without keeping the individual results
         
-        return report
+        Args:
+            texts (Iterable[str]): Texts to analyze, consumed lazily
+            metadata (Optional[Iterable[Dict]]): Optional metadata for each text, consumed alongside the texts
+            workers (int): Pool processes. 0 uses every core; 1 analyzes in this process. Defaults to 0.
+            chunksize (int): Texts sent at once to a process. Defaults to 64.
+            in_flight (int): Maximum chunks scheduled at the same time. 0 uses twice the workers. Defaults to 0.
+            keep_results (bool): Keep every individual result in the report. Defaults to False.
+            max_items (Optional[int]): Maximum alerts and outliers kept as examples. Defaults to 100.
+            
+        Returns:
+            Dict: Comprehensive analysis report, with the analyst context under 'analyst_context'
+        """
+        builder = SentimentReportBuilder(keep_results=keep_results, max_items=max_items)
+        pairs = zip(texts, chain(metadata or (), repeat({})))
+        
+        for chunk, sentiments in self._analyze_chunks(pairs, workers, max(chunksize, 1), in_flight):
+            for (text, meta), sentiment in zip(chunk, sentiments):
+                builder.add(text, sentiment, meta)
+        
+        if not builder.total:
+            return {**self._empty_report(), 'analyst_context': builder.analyst_context()}
+        return {**builder.report(), 'analyst_context': builder.analyst_context()}
+    
+    def _analyze_chunks(self, pairs: Iterator[Tuple[str, Dict]], workers: int, chunksize: int, in_flight: int) -> Iterator[Tuple[List, List[Dict]]]:
+        """Analyze (text, metadata) pairs chunk by chunk, in order, with at most in_flight chunks scheduled"""
+        chunks = iter(lambda: list(islice(pairs, chunksize)), [])
+        
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1:
+            for chunk in chunks:
+                yield chunk, [self.sentiment_analyzer.analyze_comprehensive(text) for text, _ in chunk]
+            return
+        
+        in_flight = max(in_flight or workers * 2, workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            running = deque()
+            for chunk in chunks:
+                running.append((chunk, executor.submit(_analyze_chunk, [text for text, _ in chunk])))
+                # keeps at most `in_flight` chunks scheduled, consumed in order
+                if len(running) >= in_flight:
+                    chunk, future = running.popleft()
+                    yield chunk, future.result()
+            while running:
+                chunk, future = running.popleft()
+                yield chunk, future.result()
     
     def filter_and_classify(self, analysis_results: List[Dict], criteria: Dict) -> Dict:
         """
@@ -307,211 +757,15 @@ class SentimentAnalysisReport:
         Returns:
             Dict: Enriched analyst context
         """
-        summary = analysis_report.get('summary', {})
-        individual_results = analysis_report.get('individual_results', [])
-        
-        # Priority alerts
-        alerts = self._generate_priority_alerts(individual_results)
-        
-        # Trend analysis
-        trends = self._analyze_trends(individual_results)
-        
-        # Outlier detection
-        outliers = self._detect_outliers(individual_results)
+        if 'analyst_context' in analysis_report:
+            # Already built in the same pass as the report (analyze_text_stream)
+            return analysis_report['analyst_context']
         
-        # Comparative analysis
-        comparative = self._generate_comparative_analysis(individual_results)
+        builder = SentimentReportBuilder()
+        for result in analysis_report.get('individual_results', []):
+            builder.add(result['text'], result['sentiment'], result.get('metadata'))
         
-        # Action items
-        action_items = self._generate_action_items(individual_results, alerts)
-        
-        return {
-            'analyst_summary': {
-                'total_texts_analyzed': len(individual_results),
-                'overall_sentiment_health': self._calculate_sentiment_health(summary),
-                'confidence_level': summary.get('average_confidence', 0),
-                'key_concerns': alerts.get('high_priority', []),
-                'opportunities': alerts.get('opportunities', [])
-            },
-            'priority_alerts': alerts,
-            'trend_analysis': trends,
-            'outlier_detection': outliers,
-            'comparative_analysis': comparative,
-            'action_items': action_items,
-            'context_enrichment': {
-                'sentiment_patterns': self._identify_sentiment_patterns(individual_results),
-                'emotional_drivers': self._identify_emotional_drivers(individual_results),
-                'aspect_performance': self._analyze_aspect_performance(individual_results)
-            }
-        }
-    
-    def _generate_summary(self, results: List[Dict]) -> Dict:
-        """Generate overall summary statistics"""
-        if not results:
-            return {}
-        
-        sentiments = [r['sentiment']['basic_sentiment']['classification'] for r in results]
-        confidences = [r['sentiment']['overall_confidence'] for r in results]
-        intensities = [r['sentiment']['intensity']['intensity'] for r in results]
-        
-        return {
-            'total_texts': len(results),
-            'sentiment_counts': Counter(sentiments),
-            'average_confidence': sum(confidences) / len(confidences),
-            'average_intensity': sum(intensities) / len(intensities),
-            'confidence_distribution': {
-                'high': len([c for c in confidences if c > 0.7]),
-                'medium': len([c for c in confidences if 0.3 <= c <= 0.7]),
-                'low': len([c for c in confidences if c < 0.3])
-            }
-        }
-    
-    def _analyze_sentiment_distribution(self, results: List[Dict]) -> Dict:
-        """Analyze sentiment distribution patterns"""
-        sentiments = [r['sentiment']['basic_sentiment'] for r in results]
-        
-        positive_count = len([s for s in sentiments if s['classification'] == 'Positive'])
-        negative_count = len([s for s in sentiments if s['classification'] == 'Negative'])
-        neutral_count = len([s for s in sentiments if s['classification'] == 'Neutral'])
-        total = len(sentiments)
-        
-        if total == 0:
-            return {}
-        
-        return {
-            'distribution': {
-                'positive': {'count': positive_count, 'percentage': (positive_count / total) * 100},
-                'negative': {'count': negative_count, 'percentage': (negative_count / total) * 100},
-                'neutral': {'count': neutral_count, 'percentage': (neutral_count / total) * 100}
-            },
-            'polarity_stats': {
-                'average': sum([s['polarity'] for s in sentiments]) / total,
-                'max': max([s['polarity'] for s in sentiments]),
-                'min': min([s['polarity'] for s in sentiments])
-            }
-        }
-    
-    def _analyze_emotions(self, results: List[Dict]) -> Dict:
-        """Analyze emotion patterns across texts"""
-        all_emotions = defaultdict(list)
-        dominant_emotions = []
-        
-        for result in results:
-            emotions = result['sentiment']['emotions']
-            dominant_emotions.append(emotions['dominant_emotion'])
-            
-            for emotion, score in emotions['scores'].items():
-                all_emotions[emotion].append(score)
-        
-        # Calculate averages
-        emotion_averages = {}
-        for emotion, scores in all_emotions.items():
-            if scores:
-                emotion_averages[emotion] = sum(scores) / len(scores)
-        
-        return {
-            'dominant_emotion_distribution': Counter(dominant_emotions),
-            'emotion_averages': emotion_averages,
-            'most_prevalent_emotion': max(emotion_averages.items(), key=lambda x: x[1]) if emotion_averages else ('neutral', 0)
-        }
-    
-    def _analyze_aspects(self, results: List[Dict]) -> Dict:
-        """Analyze aspect-based sentiment patterns"""
-        aspect_sentiments = defaultdict(list)
-        
-        for result in results:
-            aspects = result['sentiment']['aspect_sentiment']
-            for aspect, details in aspects.items():
-                aspect_sentiments[aspect].append(details)
-        
-        aspect_analysis = {}
-        for aspect, sentiments in aspect_sentiments.items():
-            if sentiments:
-                sentiment_counts = Counter([s['sentiment'] for s in sentiments])
-                avg_polarity = sum([s['polarity'] for s in sentiments]) / len(sentiments)
-                
-                aspect_analysis[aspect] = {
-                    'total_mentions': len(sentiments),
-                    'sentiment_distribution': sentiment_counts,
-                    'average_polarity': avg_polarity,
-                    'overall_sentiment': 'Positive' if avg_polarity > 0.1 else 'Negative' if avg_polarity < -0.1 else 'Neutral'
-                }
-        
-        return aspect_analysis
-    
-    def _analyze_languages(self, results: List[Dict]) -> Dict:
-        """Analyze language distribution"""
-        languages = [r['sentiment']['language'] for r in results]
-        return {
-            'distribution': Counter(languages),
-            'total_languages': len(set(languages))
-        }
-    
-    def _calculate_quality_metrics(self, results: List[Dict]) -> Dict:
-        """Calculate quality metrics for the analysis"""
-        confidences = [r['sentiment']['overall_confidence'] for r in results]
-        intensities = [r['sentiment']['intensity']['intensity'] for r in results]
-        
-        return {
-            'data_quality_score': sum(confidences) / len(confidences) if confidences else 0,
-            'analysis_reliability': len([c for c in confidences if c > 0.7]) / len(confidences) if confidences else 0,
-            'signal_strength': sum(intensities) / len(intensities) if intensities else 0
-        }
-    
-    def _extract_key_insights(self, results: List[Dict]) -> List[str]:
-        """Extract key insights from the analysis"""
-        insights = []
-        
-        # Sentiment insights
-        sentiments = [r['sentiment']['basic_sentiment']['classification'] for r in results]
-        sentiment_counter = Counter(sentiments)
-        most_common_sentiment = sentiment_counter.most_common(1)[0] if sentiments else None
-        
-        if most_common_sentiment:
-            percentage = (most_common_sentiment[1] / len(sentiments)) * 100
-            insights.append(f"Dominant sentiment is {most_common_sentiment[0]} ({percentage:.1f}% of texts)")
-        
-        # Emotion insights
-        emotions = [r['sentiment']['emotions']['dominant_emotion'] for r in results]
-        emotion_counter = Counter(emotions)
-        most_common_emotion = emotion_counter.most_common(1)[0] if emotions else None
-        
-        if most_common_emotion and most_common_emotion[0] != 'neutral':
-            insights.append(f"Primary emotion detected: {most_common_emotion[0]}")
-        
-        # Confidence insights
-        confidences = [r['sentiment']['overall_confidence'] for r in results]
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-        
-        if avg_confidence > 0.8:
-            insights.append("High confidence in analysis results")
-        elif avg_confidence < 0.5:
-            insights.append("Analysis confidence is below average - consider reviewing data quality")
-        
-        return insights
-    
-    def _generate_recommendations(self, results: List[Dict]) -> List[str]:
-        """Generate actionable recommendations"""
-        recommendations = []
-        
-        # Analyze negative sentiment patterns
-        negative_results = [r for r in results if r['sentiment']['basic_sentiment']['classification'] == 'Negative']
-        if len(negative_results) > len(results) * 0.3:  # More than 30% negative
-            recommendations.append("High negative sentiment detected - investigate root causes and implement improvement measures")
-        
-        # Analyze aspect-based issues
-        aspect_issues = []
-        for result in results:
-            for aspect, details in result['sentiment']['aspect_sentiment'].items():
-                if details['sentiment'] == 'Negative':
-                    aspect_issues.append(aspect)
-        
-        if aspect_issues:
-            common_issues = Counter(aspect_issues).most_common(3)
-            for issue, count in common_issues:
-                recommendations.append(f"Address {issue}-related concerns (mentioned negatively {count} times)")
-        
-        return recommendations
+        return builder.analyst_context()
     
     def _classify_results(self, results: List[Dict]) -> Dict:
         """Classify filtered results into categories"""
@@ -554,206 +808,6 @@ class SentimentAnalysisReport:
         
         return classifications
     
-    def _generate_priority_alerts(self, results: List[Dict]) -> Dict:
-        """Generate priority alerts for analysts"""
-        alerts = {
-            'high_priority': [],
-            'medium_priority': [],
-            'opportunities': []
-        }
-        
-        # High priority: High confidence negative sentiments
-        for result in results:
-            sentiment = result['sentiment']['basic_sentiment']
-            if sentiment['classification'] == 'Negative' and result['sentiment']['overall_confidence'] > 0.8:
-                alerts['high_priority'].append({
-                    'text': result['text'][:100] + '...' if len(result['text']) > 100 else result['text'],
-                    'reason': 'High confidence negative sentiment',
-                    'confidence': result['sentiment']['overall_confidence'],
-                    'polarity': sentiment['polarity']
-                })
-        
-        # Opportunities: High confidence positive sentiments
-        for result in results:
-            sentiment = result['sentiment']['basic_sentiment']
-            if sentiment['classification'] == 'Positive' and result['sentiment']['overall_confidence'] > 0.8:
-                alerts['opportunities'].append({
-                    'text': result['text'][:100] + '...' if len(result['text']) > 100 else result['text'],
-                    'reason': 'Strong positive feedback opportunity',
-                    'confidence': result['sentiment']['overall_confidence'],
-                    'polarity': sentiment['polarity']
-                })
-        
-        return alerts
-    
-    def _analyze_trends(self, results: List[Dict]) -> Dict:
-        """Analyze trends in the data"""
-        # This is a simplified trend analysis
-        # In a real implementation, you'd want temporal data
-        
-        sentiments = [r['sentiment']['basic_sentiment']['polarity'] for r in results]
-        confidences = [r['sentiment']['overall_confidence'] for r in results]
-        
-        return {
-            'sentiment_trend': 'stable',  # Would need temporal data for real trends
-            'confidence_trend': 'stable',
-            'average_sentiment_polarity': sum(sentiments) / len(sentiments) if sentiments else 0,
-            'average_confidence': sum(confidences) / len(confidences) if confidences else 0
-        }
-    
-    def _detect_outliers(self, results: List[Dict]) -> List[Dict]:
-        """Detect outlier results that need attention"""
-        outliers = []
-        
-        # Calculate thresholds
-        confidences = [r['sentiment']['overall_confidence'] for r in results]
-        intensities = [r['sentiment']['intensity']['intensity'] for r in results]
-        
-        if confidences and intensities:
-            avg_confidence = sum(confidences) / len(confidences)
-            avg_intensity = sum(intensities) / len(intensities)
-            
-            for result in results:
-                confidence = result['sentiment']['overall_confidence']
-                intensity = result['sentiment']['intensity']['intensity']
-                
-                # Low confidence with high intensity (conflicting signals)
-                if confidence < avg_confidence * 0.5 and intensity > avg_intensity * 1.5:
-                    outliers.append({
-                        'text': result['text'][:100] + '...' if len(result['text']) > 100 else result['text'],
-                        'reason': 'Low confidence with high intensity - conflicting signals',
-                        'confidence': confidence,
-                        'intensity': intensity
-                    })
-        
-        return outliers
-    
-    def _generate_comparative_analysis(self, results: List[Dict]) -> Dict:
-        """Generate comparative analysis between different segments"""
-        return {
-            'positive_vs_negative': {
-                'positive_count': len([r for r in results if r['sentiment']['basic_sentiment']['classification'] == 'Positive']),
-                'negative_count': len([r for r in results if r['sentiment']['basic_sentiment']['classification'] == 'Negative']),
-                'sentiment_ratio': 'positive_dominant' if len([r for r in results if r['sentiment']['basic_sentiment']['classification'] == 'Positive']) > len([r for r in results if r['sentiment']['basic_sentiment']['classification'] == 'Negative']) else 'negative_dominant'
-            }
-        }
-    
-    def _generate_action_items(self, results: List[Dict], alerts: Dict) -> List[str]:
-        """Generate specific action items for analysts"""
-        action_items = []
-        
-        if alerts['high_priority']:
-            action_items.append(f"Address {len(alerts['high_priority'])} high-priority negative sentiment items immediately")
-        
-        if alerts['opportunities']:
-            action_items.append(f"Leverage {len(alerts['opportunities'])} positive feedback opportunities for improvement")
-        
-        # Analyze aspects for action items
-        aspect_issues = defaultdict(int)
-        for result in results:
-            for aspect, details in result['sentiment']['aspect_sentiment'].items():
-                if details['sentiment'] == 'Negative':
-                    aspect_issues[aspect] += 1
-        
-        for aspect, count in aspect_issues.items():
-            if count > 1:
-                action_items.append(f"Investigate and improve {aspect} (negative mentions: {count})")
-        
-        return action_items
-    
-    def _calculate_sentiment_health(self, summary: Dict) -> str:
-        """Calculate overall sentiment health score"""
-        if not summary:
-            return "unknown"
-        
-        sentiment_counts = summary.get('sentiment_counts', {})
-        total = sum(sentiment_counts.values())
-        
-        if total == 0:
-            return "unknown"
-        
-        positive_ratio = sentiment_counts.get('Positive', 0) / total
-        negative_ratio = sentiment_counts.get('Negative', 0) / total
-        
-        if positive_ratio > 0.6:
-            return "excellent"
-        elif positive_ratio > 0.4:
-            return "good"
-        elif negative_ratio > 0.4:
-            return "concerning"
-        else:
-            return "neutral"
-    
-    def _identify_sentiment_patterns(self, results: List[Dict]) -> List[str]:
-        """Identify patterns in sentiment data"""
-        patterns = []
-        
-        # Analyze emotion patterns
-        emotions = [r['sentiment']['emotions']['dominant_emotion'] for r in results]
-        emotion_counter = Counter(emotions)
-        
-        if len(emotion_counter) > 0:
-            most_common = emotion_counter.most_common(1)[0]
-            if most_common[1] > len(results) * 0.4:
-                patterns.append(f"Dominant emotion pattern: {most_common[0]} appears in {most_common[1]} texts")
-        
-        return patterns
-    
-    def _identify_emotional_drivers(self, results: List[Dict]) -> List[str]:
-        """Identify what drives different emotions"""
-        drivers = []
-        
-        # Analyze aspect-emotion relationships
-        aspect_emotion_map = defaultdict(list)
-        
-        for result in results:
-            dominant_emotion = result['sentiment']['emotions']['dominant_emotion']
-            for aspect in result['sentiment']['aspect_sentiment'].keys():
-                aspect_emotion_map[aspect].append(dominant_emotion)
-        
-        for aspect, emotions in aspect_emotion_map.items():
-            emotion_counter = Counter(emotions)
-            if emotion_counter:
-                most_common = emotion_counter.most_common(1)[0]
-                drivers.append(f"{aspect} primarily drives {most_common[0]} emotion")
-        
-        return drivers
-    
-    def _analyze_aspect_performance(self, results: List[Dict]) -> Dict:
-        """Analyze performance of different aspects"""
-        aspect_performance = {}
-        
-        all_aspects = set()
-        for result in results:
-            all_aspects.update(result['sentiment']['aspect_sentiment'].keys())
-        
-        for aspect in all_aspects:
-            sentiments = []
-            for result in results:
-                if aspect in result['sentiment']['aspect_sentiment']:
-                    sentiments.append(result['sentiment']['aspect_sentiment'][aspect]['sentiment'])
-            
-            if sentiments:
-                sentiment_counter = Counter(sentiments)
-                positive_ratio = sentiment_counter.get('Positive', 0) / len(sentiments)
-                
-                if positive_ratio > 0.6:
-                    performance = "excellent"
-                elif positive_ratio > 0.4:
-                    performance = "good"
-                elif sentiment_counter.get('Negative', 0) / len(sentiments) > 0.4:
-                    performance = "poor"
-                else:
-                    performance = "neutral"
-                
-                aspect_performance[aspect] = {
-                    'performance': performance,
-                    'sentiment_distribution': dict(sentiment_counter),
-                    'total_mentions': len(sentiments)
-                }
-        
-        return aspect_performance
-    
     def _empty_report(self) -> Dict:
         """Return empty report structure"""
         return {
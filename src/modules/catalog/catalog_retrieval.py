@@ -35,8 +35,10 @@ def save(catalog: Catalog, content: str = "") -> bool:
             return True
 
         keys = relevant_words(content)
-        meta = {"hash": hash_id, "path": catalog.path, "title": catalog.title, "name": catalog.name, "page": catalog.page,
-                "source":  f"{catalog.name}, pg. {catalog.page}", "content": content, "keys": keys}
+        # um item do catálogo representa o documento inteiro e não tem página própria
+        page = getattr(catalog, 'page', 1)
+        meta = {"hash": hash_id, "path": catalog.path, "title": catalog.title, "name": catalog.name, "page": page,
+                "source":  f"{catalog.name}, pg. {page}", "content": content, "keys": keys}
         collection.add(ids=[hash_id], documents=[content], metadatas=[meta])
         return True
     except Exception as e:
@@ -62,3 +64,24 @@ def query(query: str = "", results: int = 5, threshold: float = 0.5) -> List[dic
     except Exception as e:
         logging.error(f"{e}\n{traceback.format_exc()}")
         return []
+
+
+def delete_by_path(path: str = "") -> bool:
+    """
+    Remove do catálogo as entradas de um documento.
+    Os IDs são o hash do conteúdo, então um documento alterado precisa ter a entrada antiga
+    removida antes de ser salvo de novo, ou o catálogo passa a ter as duas versões.
+
+    Args:
+        path (str): Caminho do documento.
+
+    Returns:
+        bool: True se a remoção foi executada, False em caso de erro.
+    """
+    try:
+        collection = chromadbvector.collection(COLLECTION)
+        collection.delete(where={"path": path})
+        return True
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return False
@@ -9,6 +9,7 @@ from src.modules.document import service as DocService
 from src.modules.document.document_info import DocumentInfo
 from src.modules.analysis import legislation as Legislation
 from src.modules.catalog import catalog_retrieval as CatalogRetrieval
+from src.modules.catalog import ingestion as Ingestion
 
 
 """ Deve catalogar todo o conteúdo dentro do corpus de documentos. """
@@ -68,10 +69,10 @@ def register_info_by_path(path: str = "") -> DocumentInfo | None:
         Captura e registra qualquer exceção que ocorra durante o processo de registro.
     """
     try:
-        doc = DocService.info(path)
-        if DocService.info_save(doc) != True:
+        # `info` registra o documento; um documento já registrado não é registrado de novo
+        if DocService.info_exists(path):
             return None
-        return doc
+        return DocService.info(path)
     except Exception as e:
         logging.error(f"{e}\n{traceback.format_exc()}")
         return None
@@ -109,22 +110,19 @@ def register_info_in_bath(directory: str = "") -> List[DocumentInfo]:
         return []
 
 
-def register_content_in_bath(directory: str):
-
-    docs = register_info_in_bath(directory)
-
-    saveds = []
-    for dc in docs:
-        d = dc.dict()
-        # Use document service to read content instead of direct file reading
-        content = DocService.document_content(d["path"])
-        if not content:
-            continue
-        if CatalogRetrieval.save(d["path"], d["name"], d["pages"], content) is None:
-            continue
-        saveds.append(d["name"])
-
-    return saveds
+def register_content_in_bath(directory: str, workers: int = 0) -> List[str]:
+    """
+    Registra as informações e o conteúdo dos documentos de um diretório no catálogo.
+    Usa o motor de ingestão em lote, que processa os documentos num pool de processos e
+    pula os arquivos já ingeridos (mesmo caminho, mtime e tamanho).
+    Args:
+        directory (str): O caminho do diretório contendo os documentos.
+        workers (int): Quantidade de processos. 0 usa todos os núcleos disponíveis. Padrão é 0.
+    Returns:
+        List[str]: Os nomes dos documentos ingeridos nesta execução.
+    """
+    report = Ingestion.ingest(directory, workers)
+    return report.saveds
 
 
 def register_legislation_in_bath(directory: str):
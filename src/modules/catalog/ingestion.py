@@ -0,0 +1,263 @@
+# flake8: noqa: E501
+"""
+Ingestion Module
+Motor de ingestão em lote de uma biblioteca de documentos.
+
+Os documentos de um diretório são distribuídos num pool de processos que fazem a parte pesada
+(leitura/conversão e extração do texto); o processo principal grava as informações e o conteúdo
+no catálogo e registra cada arquivo concluído no manifesto (`ingestion_repository`), identificado
+por caminho, mtime e tamanho. Uma execução interrompida retoma a partir dos arquivos que faltam.
+
+Funções:
+    - extract(path: str) -> dict: Lê um documento e extrai as informações e o conteúdo (executa nos workers).
+    - ingest(directory: str, workers: int = 0, in_flight: int = 0, force: bool = False) -> IngestionReport: Ingere um diretório.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+import traceback
+import logging
+import time
+import os
+
+from src.modules.catalog import ingestion_repository as IngestionRepository
+from src.modules.catalog import catalog_retrieval as CatalogRetrieval
+from src.modules.catalog.catalog import Catalog
+from src.modules.document import document_info_repository as DocInfoRepository
+from src.modules.document import service as DocService
+from src.modules.document import change_index as ChangeIndex
+from src.modules.document import text_layer as TextLayer
+from src.modules.document.document_info import DocumentInfo
+from src.utils.log import log_info
+
+
+@dataclass
+class IngestionReport:
+    def __init__(self, directory: str = ""):
+        """
+        Inicializa o relatório de uma execução de ingestão.
+
+        Parâmetros:
+            directory (str): Diretório ingerido.
+        """
+        self.directory: str = directory
+        self.total: int = 0             # arquivos encontrados
+        self.skipped: int = 0           # arquivos já ingeridos (manifesto)
+        self.documents: int = 0         # arquivos ingeridos nesta execução
+        self.failed: int = 0            # arquivos com erro
+        self.pages: int = 0             # páginas ingeridas nesta execução
+        self.letters: int = 0           # caracteres ingeridos nesta execução
+        self.text_pages: int = 0        # páginas lidas da camada de texto
+        self.ocr_pages: int = 0         # páginas digitalizadas, lidas por OCR
+        self.seconds: float = 0.0       # tempo total de parede
+        self.saveds: List[str] = []     # nomes dos documentos ingeridos
+        self.errors: List[str] = []     # caminhos dos documentos com erro
+
+    @property
+    def documents_per_second(self) -> float:
+        """documentos ingeridos por segundo"""
+        return self.documents / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def pages_per_second(self) -> float:
+        """páginas ingeridas por segundo"""
+        return self.pages / self.seconds if self.seconds > 0 else 0.0
+
+    def dict(self):
+        """
+        Retorna um dicionário com os contadores e a vazão da execução.
+
+        Returns:
+            dict: Um dicionário contendo os atributos do relatório e as taxas de documentos/s e páginas/s.
+        """
+        return {
+            **self.__dict__,
+            'documents_per_second': round(self.documents_per_second, 3),
+            'pages_per_second': round(self.pages_per_second, 3),
+        }
+
+
+def extract(path: str) -> dict:
+    """
+    Lê um documento uma única vez e extrai as informações e o conteúdo.
+    É a unidade de trabalho executada nos processos do pool, por isso retorna apenas dados simples;
+    as páginas contabilizadas por `text_layer` no worker voltam em `recorded`, para que o processo
+    principal, que serve as estatísticas, as some aos seus contadores.
+
+    Args:
+        path (str): Caminho do documento.
+
+    Returns:
+        dict: Informações do documento (path, name, size, pages, mimetype, mtime), conteúdo, páginas por origem do texto, páginas contabilizadas na conversão e tempo gasto.
+
+    Raises:
+        ValueError: Se o documento não puder ser lido.
+    """
+    start = time.perf_counter()
+    before = TextLayer.stats()
+    mtime = os.path.getmtime(path)
+
+    parsed = DocService.document_parse(path)
+    if parsed is None:
+        raise ValueError(f"Não foi possível ler o arquivo {path}.")
+
+    after = TextLayer.stats()
+
+    contents = [(num, parsed.page_content(i)) for i, (num, _, _) in enumerate(parsed.page_spans)]
+    ocr_pages = sum(1 for num, _ in contents if parsed.page_source(num) == TextLayer.SOURCE_OCR)
+    return {
+        'path': parsed.path,
+        'name': parsed.name,
+        'size': parsed.size,
+        'pages': parsed.total,
+        'mimetype': parsed.mimetype,
+        'mtime': mtime,
+        # o conteúdo do catálogo tem o mesmo formato da ingestão antiga, para que o ID (hash do conteúdo) de um
+        # documento inalterado continue o mesmo; ele é montado das páginas já lidas, sem uma nova conversão
+        'content': DocService.document_content(path, parsed=parsed),
+        'hashes': ChangeIndex.page_hashes(contents),
+        'text_pages': len(contents) - ocr_pages,
+        'ocr_pages': ocr_pages,
+        'recorded': (after['text_pages'] - before['text_pages'], after['ocr_pages'] - before['ocr_pages']),
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def save(extracted: dict) -> bool:
+    """
+    Grava as informações e o conteúdo extraídos de um documento no catálogo.
+    As informações são atualizadas em documents_info (com o mtime do arquivo) e a entrada antiga do
+    documento no catálogo é removida antes de o conteúdo ser salvo de novo.
+
+    Args:
+        extracted (dict): Resultado de `extract`.
+
+    Returns:
+        bool: True se o conteúdo foi salvo, False caso contrário.
+    """
+    if not extracted['content']:
+        return False
+
+    info = DocumentInfo(path=extracted['path'], name=extracted['name'], size=extracted['size'], pages=extracted['pages'], mimetype=extracted['mimetype'], mtime=extracted.get('mtime', 0.0))
+    DocInfoRepository.upsert(info)
+
+    if not CatalogRetrieval.delete_by_path(info.path):
+        return False
+
+    catalog = Catalog(path=info.path, name=info.name, size=info.size, pages=info.pages, mimetype=info.mimetype)
+    return CatalogRetrieval.save(catalog, extracted['content'])
+
+
+def pending(directory: str, force: bool = False) -> tuple:
+    """
+    Lista os arquivos de um diretório e separa os que ainda precisam ser ingeridos.
+    Um arquivo é pulado se o manifesto já o registra com o mesmo mtime e tamanho, ou se o
+    índice de mudanças indica que o seu conteúdo não mudou (apenas o mtime foi alterado).
+
+    Args:
+        directory (str): Diretório da biblioteca.
+        force (bool): Se deve ignorar o manifesto e ingerir todos os arquivos. Padrão é False.
+
+    Returns:
+        tuple: (todos os caminhos, caminhos pendentes).
+    """
+    paths = DocService.dir(directory)
+    if force:
+        return paths, paths
+    return paths, [path for path in paths if not IngestionRepository.is_done(path) and ChangeIndex.file_changed(path, ChangeIndex.PIPELINE_CATALOG)]
+
+
+def ingest(
+    directory: str,
+    workers: int = 0,
+    in_flight: int = 0,
+    force: bool = False,
+    extractor: Callable[[str], dict] = extract,
+    saver: Callable[[dict], bool] = save,
+) -> IngestionReport:
+    """
+    Ingere todos os documentos de um diretório com concorrência limitada e progresso retomável.
+
+    Os arquivos são agendados num `ProcessPoolExecutor`, com no máximo `in_flight` documentos
+    em processamento ao mesmo tempo. Cada documento concluído é gravado pelo processo principal
+    e registrado no manifesto imediatamente, de modo que uma execução interrompida retoma
+    apenas os arquivos que faltam (ou que mudaram de mtime/tamanho).
+
+    Args:
+        directory (str): Diretório da biblioteca.
+        workers (int): Quantidade de processos. 0 usa todos os núcleos disponíveis. Padrão é 0.
+        in_flight (int): Máximo de documentos agendados ao mesmo tempo. 0 usa o dobro de `workers`. Padrão é 0.
+        force (bool): Se deve ignorar o manifesto e ingerir todos os arquivos. Padrão é False.
+        extractor (Callable): Função de extração executada nos workers. Padrão é `extract`.
+        saver (Callable): Função de gravação executada no processo principal. Padrão é `save`.
+
+    Returns:
+        IngestionReport: Relatório com contadores e vazão (documentos/s e páginas/s).
+    """
+    report = IngestionReport(directory)
+    start = time.perf_counter()
+
+    try:
+        IngestionRepository.table_ingestion_manifest()
+
+        paths, queue = pending(directory, force)
+        report.total = len(paths)
+        report.skipped = len(paths) - len(queue)
+
+        if not queue:
+            return report
+
+        workers = min(workers or os.cpu_count() or 1, len(queue))
+        in_flight = max(in_flight or workers * 2, workers)
+        queue.reverse()
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            running: Dict[Future, tuple] = {}
+
+            while queue or running:
+                # mantém no máximo `in_flight` documentos agendados
+                while queue and len(running) < in_flight:
+                    path = queue.pop()
+                    running[executor.submit(extractor, path)] = IngestionRepository.fingerprint(path)
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path, mtime, size = running.pop(future)
+                    _collect(report, future, path, mtime, size, saver)
+
+                elapsed = time.perf_counter() - start
+                log_info(f"{report.documents + report.failed:04}", f"Ingestão: {report.documents / elapsed:.2f} docs/s, {report.pages / elapsed:.2f} pgs/s", elapsed)
+
+        return report
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return report
+    finally:
+        report.seconds = time.perf_counter() - start
+
+
+def _collect(report: IngestionReport, future: Future, path: str, mtime: float, size: int, saver: Callable[[dict], bool]):
+    """grava o resultado de um documento e atualiza o manifesto e o relatório"""
+    try:
+        extracted = future.result()
+        if not saver(extracted):
+            raise ValueError(f"Não foi possível salvar o conteúdo de {path}.")
+
+        pages = int(extracted.get('pages', 0))
+        letters = len(extracted.get('content', ""))
+        IngestionRepository.save(path, mtime, size, pages, letters, IngestionRepository.STATUS_DONE, extracted.get('seconds', 0.0))
+        ChangeIndex.commit(path, ChangeIndex.PIPELINE_CATALOG, extracted.get('hashes'), replace=True)
+
+        report.documents += 1
+        report.pages += pages
+        report.letters += letters
+        report.text_pages += extracted.get('text_pages', 0)
+        report.ocr_pages += extracted.get('ocr_pages', 0)
+        TextLayer.add(*extracted.get('recorded', (0, 0)))
+        report.saveds.append(extracted.get('name', os.path.basename(path)))
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        IngestionRepository.save(path, mtime, size, status=IngestionRepository.STATUS_FAILED)
+        report.failed += 1
+        report.errors.append(path)
@@ -0,0 +1,163 @@
+# flake8: noqa: E501
+
+import os
+import logging
+import traceback
+from typing import List, Optional
+
+from src.modules.database import sqlitedb
+
+#################################################################
+# TABLE INGESTION MANIFEST
+#################################################################
+
+TABLE = "ingestion_manifest"
+
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+def table_ingestion_manifest() -> bool:
+    """
+    Cria a tabela do manifesto de ingestão no banco de dados SQLite.
+    Cada linha registra um arquivo já processado pela ingestão em lote, identificado pelo
+    caminho, data de modificação (mtime) e tamanho, para que uma execução interrompida
+    possa ser retomada de onde parou.
+    - path: Caminho do arquivo (chave primária).
+    - mtime: Data de modificação do arquivo no momento da ingestão.
+    - size: Tamanho do arquivo em bytes.
+    - pages: Número de páginas processadas.
+    - letters: Total de caracteres extraídos.
+    - status: Situação da ingestão ('done' ou 'failed').
+    - seconds: Tempo gasto na ingestão do arquivo.
+    - updated_at: Data da última ingestão.
+    Retorna:
+        bool: True se a tabela for criada com sucesso, False caso ocorra algum erro.
+    """
+    try:
+        conn = sqlitedb.client()
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {TABLE} (
+                path TEXT PRIMARY KEY,
+                mtime REAL,
+                size INTEGER,
+                pages INTEGER,
+                letters INTEGER,
+                status TEXT,
+                seconds REAL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.commit()
+        return True
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return False
+
+
+def fingerprint(path: str) -> tuple:
+    """
+    Identifica a versão de um arquivo em disco.
+
+    Args:
+        path (str): Caminho do arquivo.
+
+    Returns:
+        tuple: (path normalizado, mtime, size).
+    """
+    path = os.path.normpath(path)
+    stat = os.stat(path)
+    return (path, stat.st_mtime, stat.st_size)
+
+
+def save(path: str, mtime: float, size: int, pages: int = 0, letters: int = 0, status: str = STATUS_DONE, seconds: float = 0.0) -> bool:
+    """
+    Registra (ou atualiza) a ingestão de um arquivo no manifesto.
+
+    Args:
+        path (str): Caminho do arquivo.
+        mtime (float): Data de modificação do arquivo.
+        size (int): Tamanho do arquivo em bytes.
+        pages (int): Número de páginas processadas.
+        letters (int): Total de caracteres extraídos.
+        status (str): Situação da ingestão. Padrão é 'done'.
+        seconds (float): Tempo gasto na ingestão.
+
+    Returns:
+        bool: True se o registro foi salvo, False caso contrário.
+    """
+    try:
+        conn = sqlitedb.client()
+        conn.execute(
+            f"insert or replace into {TABLE} (path, mtime, size, pages, letters, status, seconds, updated_at) values (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)",
+            (os.path.normpath(path), mtime, size, pages, letters, status, seconds)
+        )
+        conn.commit()
+        return True
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return False
+
+
+def show_by_path(path: str = "") -> Optional[dict]:
+    """
+    Busca o registro de um arquivo no manifesto.
+
+    Args:
+        path (str): Caminho do arquivo.
+
+    Returns:
+        Optional[dict]: O registro encontrado ou None.
+    """
+    try:
+        conn = sqlitedb.client()
+        conn.row_factory = sqlitedb.db().Row
+        row = conn.execute(f"select * from {TABLE} where path=?", (os.path.normpath(path),)).fetchone()
+        return dict(row) if row is not None else None
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return None
+
+
+def is_done(path: str) -> bool:
+    """
+    Verifica se a versão atual de um arquivo já foi ingerida com sucesso.
+
+    Args:
+        path (str): Caminho do arquivo.
+
+    Returns:
+        bool: True se o manifesto tem o mesmo caminho, mtime e tamanho com status 'done'.
+    """
+    try:
+        entry = show_by_path(path)
+        if entry is None or entry['status'] != STATUS_DONE:
+            return False
+        _, mtime, size = fingerprint(path)
+        return entry['mtime'] == mtime and entry['size'] == size
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return False
+
+
+def list() -> List[dict]:
+    """lista todos os registros do manifesto"""
+    try:
+        conn = sqlitedb.client()
+        conn.row_factory = sqlitedb.db().Row
+        return [dict(row) for row in conn.execute(f"select * from {TABLE} order by path")]
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return []
+
+
+def remove(path: str = "") -> bool:
+    """remove um arquivo do manifesto, forçando uma nova ingestão"""
+    try:
+        conn = sqlitedb.client()
+        conn.execute(f"delete from {TABLE} where path=?", (os.path.normpath(path),))
+        conn.commit()
+        return True
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return False
@@ -0,0 +1,111 @@
+# flake8: noqa: E501
+"""
+Corpus Annotation Cache Module
+Guarda em disco o último resultado da geração de corpus de cada documento, por caminho e opções da requisição.
+
+As anotações são feitas por artigo, e um artigo pode atravessar páginas; por isso o reaproveitamento
+é por artigo: numa nova geração do mesmo documento com as mesmas opções, os artigos cujo texto não
+mudou recebem a anotação guardada e apenas os artigos novos ou alterados são anotados de novo.
+O índice de mudanças (`change_index`) usa `pipeline` para saber se o arquivo mudou desde a última geração.
+
+Funções:
+    - options_key(options: dict) -> str: Hash das opções da requisição.
+    - pipeline(options: dict) -> str: Pipeline do índice de mudanças para as opções.
+    - get(path: str, options: dict) -> Optional[dict]: Recupera o resultado guardado.
+    - put(path: str, options: dict, result: dict) -> bool: Guarda um resultado.
+    - annotations_by_text(result: dict) -> Dict[str, dict]: Indexa as anotações de um resultado pelo hash do texto do artigo.
+"""
+
+from typing import Dict, Optional
+import traceback
+import threading
+import logging
+import json
+import os
+
+from src.modules.document import change_index as ChangeIndex
+from src.utils import string as String
+
+# diretório onde os resultados são persistidos
+directory = './data/.cache/corpus'
+
+extension = '.json'
+
+
+def options_key(options: dict) -> str:
+    """hash curto das opções da requisição (intervalo de páginas, filtros e componentes)"""
+    return String.hash(json.dumps(options, sort_keys=True, default=str))[:16]
+
+
+def pipeline(options: dict) -> str:
+    """pipeline do índice de mudanças para as opções: cada combinação de opções tem o seu estado"""
+    return f"{ChangeIndex.PIPELINE_CORPUS}:{options_key(options)}"
+
+
+def _entry_path(path: str, options: dict) -> str:
+    return os.path.join(directory, f"{String.hash(os.path.normpath(path))}.{options_key(options)}{extension}")
+
+
+def get(path: str, options: dict) -> Optional[dict]:
+    """
+    Recupera o resultado guardado da geração de corpus de um documento.
+
+    Args:
+        path (str): Caminho do documento.
+        options (dict): Opções da requisição.
+
+    Returns:
+        Optional[dict]: O resultado (com `annotations`), ou None se não houver entrada válida.
+    """
+    entry = _entry_path(path, options)
+    try:
+        if not os.path.exists(entry):
+            return None
+
+        with open(entry, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return None
+
+
+def put(path: str, options: dict, result: dict) -> bool:
+    """
+    Guarda, de forma atômica, o resultado da geração de corpus de um documento.
+
+    Args:
+        path (str): Caminho do documento.
+        options (dict): Opções da requisição.
+        result (dict): Resultado da geração, com as anotações de todos os artigos.
+
+    Returns:
+        bool: True se o resultado foi gravado, False caso contrário.
+    """
+    try:
+        os.makedirs(directory, exist_ok=True)
+        entry = _entry_path(path, options)
+        tmp = f"{entry}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        with open(tmp, 'w', encoding='utf-8') as file:
+            json.dump(result, file, ensure_ascii=False, separators=(',', ':'))
+
+        os.replace(tmp, entry)
+        return True
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return False
+
+
+def annotations_by_text(result: Optional[dict]) -> Dict[str, dict]:
+    """
+    Indexa as anotações de um resultado guardado pelo hash do texto do artigo anotado.
+
+    Args:
+        result (Optional[dict]): Resultado guardado (ou None).
+
+    Returns:
+        Dict[str, dict]: Anotação por hash do texto do artigo.
+    """
+    if not result:
+        return {}
+    return {String.hash(annotation.get('text', "")): annotation for annotation in result.get('annotations', [])}
@@ -3,7 +3,7 @@
 import logging
 import traceback
 from datetime import datetime
-from typing import List
+from typing import Iterator, List
 
 
 from src.modules.analysis import legislation as Legislation
@@ -57,20 +57,21 @@ def doc_with_articles(path: str, page_init: int = 1, page_final: int = -1, use_e
         return None
 
 
-def annotate_the_article(text: str, extract_components: bool = False):
+def annotate_the_article(text: str, extract_components: bool = False, structure: dict = None):
     """
     Anota um artigo com metadados e análise.
     
     Args:
         text (str): Texto do artigo.
         extract_components (bool): Se deve extrair componentes estruturais do artigo.
+        structure (dict, opcional): Análise estrutural já calculada em lote para o artigo.
     
     Returns:
         dict: Dicionário com anotações do artigo.
     """
     annotation = {
         "text": text,
-        "subject": Legislation.set_a_title(text),
+        "subject": Legislation.set_a_title(text, structure),
         # "sumamry": Legislation.summarize(text),
         # "entities": Legislation.extract_entities(text),
         # "categories": Legislation.define_categories(text),
@@ -92,6 +93,31 @@ def annotate_the_article(text: str, extract_components: bool = False):
     return annotation
 
 
+def iter_notes(articles: List[str], extract_components: bool = False, batch_size: int = 16) -> Iterator[dict]:
+    """
+    Anota os artigos um a um, produzindo cada anotação assim que fica pronta.
+    A análise sintática é feita em lotes de `batch_size` artigos, para que a primeira anotação
+    não espere a análise do documento inteiro.
+    
+    Args:
+        articles (List[str]): Lista de artigos para anotar.
+        extract_components (bool): Se deve extrair componentes estruturais.
+        batch_size (int): Quantidade de artigos por passada do spaCy. Padrão é 16.
+    
+    Yields:
+        dict: A anotação de cada artigo, na ordem dos artigos.
+    """
+    for start in range(0, len(articles), batch_size):
+        batch = articles[start:start + batch_size]
+        structures = Legislation.analyze_text_structure_many(batch)
+
+        for i, (article, structure) in enumerate(zip(batch, structures), start):
+            time_article_init = datetime.now()
+            annotation = annotate_the_article(article, extract_components, structure)
+            log_info(f"{i:04}", f"{article[0:48]}...", delta_time(time_article_init))
+            yield annotation
+
+
 def take_notes(articles: List[str], extract_components: bool = False):
     """
     Processa uma lista de artigos e gera anotações.
@@ -103,12 +129,8 @@ def take_notes(articles: List[str], extract_components: bool = False):
     Returns:
         List[dict]: Lista de anotações dos artigos.
     """
-    annotations = []
-    for i, article in enumerate(articles):
-        time_article_init = datetime.now()
-        annotations.append(annotate_the_article(article, extract_components))
-        log_info(f"{i:04}", f"{article[0:48]}...", delta_time(time_article_init))
-    return annotations
+    # análise sintática de todos os artigos numa única passada do spaCy
+    return list(iter_notes(articles, extract_components, batch_size=max(len(articles), 1)))
 
 
 def doc_with_articles_filtered(path: str, page_init: int = 1, page_final: int = -1, 
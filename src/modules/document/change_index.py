@@ -0,0 +1,244 @@
+# flake8: noqa: E501
+"""
+Change Index Module
+Índice de detecção de mudanças usado para reindexação incremental.
+
+Para cada pipeline (corpus, catálogo, parágrafos) o índice guarda, por arquivo, o caminho, o tamanho,
+a data de modificação (mtime) e o hash sha3 do conteúdo, além do hash do texto de cada página.
+Os pipelines consultam o índice antes de processar um documento e só reextraem, reanotam e
+reembutem as páginas novas ou modificadas; ao terminar, registram o novo estado com `commit`.
+
+Funções:
+    - file_changed(path: str, pipeline: str) -> bool: Verifica se o conteúdo do arquivo mudou desde o último processamento.
+    - page_hashes(contents) -> Dict[int, str]: Calcula o hash do texto de cada página.
+    - changed_pages(path: str, pipeline: str, hashes: Dict[int, str]) -> List[int]: Lista as páginas novas, modificadas ou removidas.
+    - commit(path: str, pipeline: str, hashes: Dict[int, str] = None, replace: bool = False) -> bool: Registra o estado processado.
+    - forget(path: str, pipeline: str = None) -> bool: Remove um arquivo do índice.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+import traceback
+import logging
+import os
+
+from src.modules.database import sqlitedb
+from src.modules.document import docling_cache as DoclingCache
+from src.utils import string as String
+
+#################################################################
+# TABLES DOCUMENTS INDEX / PAGES INDEX
+#################################################################
+
+TABLE_DOCUMENTS = "documents_index"
+TABLE_PAGES = "pages_index"
+
+PIPELINE_CORPUS = "corpus"
+PIPELINE_CATALOG = "catalog"
+# versionado com a coleção de embeddings (`/api/embed`): os documentos indexados com o endpoint
+# antigo não têm estado neste pipeline e são reembutidos por inteiro na próxima indexação
+PIPELINE_PARAGRAPHS = "paragraphs_embed"
+
+
+def table_change_index() -> bool:
+    """
+    Cria as tabelas do índice de mudanças no banco de dados SQLite.
+    - documents_index: estado de cada arquivo por pipeline (path, size, mtime, hash do conteúdo).
+    - pages_index: hash do texto de cada página de um arquivo por pipeline.
+    Retorna:
+        bool: True se as tabelas forem criadas com sucesso, False caso ocorra algum erro.
+    """
+    try:
+        conn = sqlitedb.client()
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {TABLE_DOCUMENTS} (
+                pipeline TEXT,
+                path TEXT,
+                size INTEGER,
+                mtime REAL,
+                hash TEXT,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (pipeline, path)
+            )
+        """)
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {TABLE_PAGES} (
+                pipeline TEXT,
+                path TEXT,
+                page INTEGER,
+                hash TEXT,
+                PRIMARY KEY (pipeline, path, page)
+            )
+        """)
+        conn.commit()
+        return True
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return False
+
+
+def show(path: str, pipeline: str) -> Optional[dict]:
+    """
+    Busca o estado registrado de um arquivo num pipeline.
+
+    Args:
+        path (str): Caminho do arquivo.
+        pipeline (str): Nome do pipeline.
+
+    Returns:
+        Optional[dict]: O registro (path, size, mtime, hash) ou None se o arquivo nunca foi processado.
+    """
+    try:
+        table_change_index()
+        conn = sqlitedb.client()
+        conn.row_factory = sqlitedb.db().Row
+        row = conn.execute(f"select * from {TABLE_DOCUMENTS} where pipeline=? and path=?", (pipeline, os.path.normpath(path))).fetchone()
+        return dict(row) if row is not None else None
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return None
+
+
+def file_changed(path: str, pipeline: str) -> bool:
+    """
+    Verifica se o conteúdo de um arquivo mudou desde o último processamento no pipeline.
+    Tamanho e mtime iguais dispensam a leitura do arquivo; se só o mtime mudou, o hash do
+    conteúdo decide e o registro é atualizado com o novo mtime.
+
+    Args:
+        path (str): Caminho do arquivo.
+        pipeline (str): Nome do pipeline.
+
+    Returns:
+        bool: True se o arquivo é novo ou o seu conteúdo mudou, False caso contrário.
+    """
+    try:
+        entry = show(path, pipeline)
+        if entry is None:
+            return True
+
+        stat = os.stat(path)
+        if entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime:
+            return False
+
+        if entry['hash'] != DoclingCache.file_hash(path):
+            return True
+
+        conn = sqlitedb.client()
+        conn.execute(f"update {TABLE_DOCUMENTS} set mtime=?, updated_at=CURRENT_TIMESTAMP where pipeline=? and path=?", (stat.st_mtime, pipeline, os.path.normpath(path)))
+        conn.commit()
+        return False
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return True
+
+
+def page_hashes(contents: Iterable[Tuple[int, str]]) -> Dict[int, str]:
+    """
+    Calcula o hash do texto de cada página.
+
+    Args:
+        contents (Iterable[Tuple[int, str]]): Pares (número da página, texto da página).
+
+    Returns:
+        Dict[int, str]: Hash do texto indexado pelo número da página.
+    """
+    return {num: String.hash(content or "") for num, content in contents}
+
+
+def stored_hashes(path: str, pipeline: str) -> Dict[int, str]:
+    """retorna os hashes de páginas registrados para um arquivo num pipeline"""
+    try:
+        table_change_index()
+        conn = sqlitedb.client()
+        cursor = conn.execute(f"select page, hash from {TABLE_PAGES} where pipeline=? and path=?", (pipeline, os.path.normpath(path)))
+        return {page: digest for page, digest in cursor}
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return {}
+
+
+def changed_pages(path: str, pipeline: str, hashes: Dict[int, str], removed: bool = False) -> List[int]:
+    """
+    Compara os hashes atuais das páginas com os registrados e lista as páginas a reprocessar.
+
+    Args:
+        path (str): Caminho do arquivo.
+        pipeline (str): Nome do pipeline.
+        hashes (Dict[int, str]): Hashes atuais, de `page_hashes`.
+        removed (bool): Se deve incluir as páginas registradas que não existem mais em `hashes`. Padrão é False.
+
+    Returns:
+        List[int]: Números das páginas novas ou modificadas (e removidas, se solicitado), em ordem.
+    """
+    stored = stored_hashes(path, pipeline)
+    pages = {num for num, digest in hashes.items() if stored.get(num) != digest}
+    if removed:
+        pages.update(num for num in stored if num not in hashes)
+    return sorted(pages)
+
+
+def commit(path: str, pipeline: str, hashes: Optional[Dict[int, str]] = None, replace: bool = False) -> bool:
+    """
+    Registra o estado de um arquivo depois de processado com sucesso no pipeline.
+
+    Args:
+        path (str): Caminho do arquivo.
+        pipeline (str): Nome do pipeline.
+        hashes (Optional[Dict[int, str]]): Hashes das páginas processadas. Padrão é None (apenas o arquivo).
+        replace (bool): Se deve descartar os hashes das páginas que não estão em `hashes`. Padrão é False.
+
+    Returns:
+        bool: True se o estado foi registrado, False caso contrário.
+    """
+    try:
+        table_change_index()
+        path = os.path.normpath(path)
+        stat = os.stat(path)
+
+        conn = sqlitedb.client()
+        conn.execute(
+            f"insert or replace into {TABLE_DOCUMENTS} (pipeline, path, size, mtime, hash, updated_at) values (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)",
+            (pipeline, path, stat.st_size, stat.st_mtime, DoclingCache.file_hash(path))
+        )
+
+        if replace:
+            conn.execute(f"delete from {TABLE_PAGES} where pipeline=? and path=?", (pipeline, path))
+
+        if hashes:
+            conn.executemany(
+                f"insert or replace into {TABLE_PAGES} (pipeline, path, page, hash) values (?, ?, ?, ?)",
+                [(pipeline, path, num, digest) for num, digest in hashes.items()]
+            )
+
+        conn.commit()
+        return True
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return False
+
+
+def forget(path: str, pipeline: Optional[str] = None) -> bool:
+    """
+    Remove um arquivo do índice, forçando o reprocessamento completo.
+
+    Args:
+        path (str): Caminho do arquivo.
+        pipeline (Optional[str]): Nome do pipeline. Padrão é None (todos os pipelines).
+
+    Returns:
+        bool: True se o arquivo foi removido, False caso contrário.
+    """
+    try:
+        table_change_index()
+        path = os.path.normpath(path)
+        conn = sqlitedb.client()
+        for table in (TABLE_DOCUMENTS, TABLE_PAGES):
+            if pipeline is None:
+                conn.execute(f"delete from {table} where path=?", (path,))
+            else:
+                conn.execute(f"delete from {table} where pipeline=? and path=?", (pipeline, path))
+        conn.commit()
+        return True
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return False
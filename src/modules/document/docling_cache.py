@@ -0,0 +1,397 @@
+# flake8: noqa: E501
+"""
+Docling Conversion Cache Module
+Este módulo mantém um cache em disco, endereçado por conteúdo, dos documentos convertidos pelo Docling.
+A chave de cada entrada combina o hash sha3 dos bytes do arquivo com o hash das opções do pipeline,
+de modo que o mesmo PDF convertido com as mesmas opções nunca passa duas vezes pelo OCR/TableFormer.
+
+As entradas são gravadas como JSON comprimido (gzip) e o tamanho total do diretório é limitado
+por uma política LRU baseada no horário de último acesso de cada entrada.
+
+Funções:
+    - key(path: str, options: object = None) -> str: Gera a chave de cache de um arquivo e suas opções.
+    - get(path: str, options: object = None) -> Optional[CachedConversion]: Recupera uma conversão do cache.
+    - put(path: str, options: object, document: object) -> bool: Grava uma conversão no cache.
+    - invalidate(path: str) -> int: Remove as entradas de um arquivo.
+    - clear() -> int: Remove todas as entradas.
+    - evict(max_bytes: int = None) -> int: Aplica a política LRU de tamanho.
+    - stats() -> dict: Retorna estatísticas do cache.
+"""
+
+from collections import OrderedDict
+from typing import List, Optional
+import threading
+import traceback
+import logging
+import json
+import gzip
+import os
+
+try:
+    from docling_core.types.doc import DoclingDocument
+except ImportError:
+    DoclingDocument = None
+
+from src.utils import string as String
+
+# diretório onde as conversões são persistidas
+directory = './data/.cache/docling'
+
+# tamanho máximo do diretório de cache em bytes (LRU)
+max_bytes = 1024 * 1024 * 1024
+
+# quantidade de documentos mantidos já desserializados em memória
+memory_items = 4
+
+# quantidade de hashes de arquivos memorizados (LRU)
+max_file_hashes = 1024
+
+extension = '.json.gz'
+
+_lock = threading.Lock()
+_memory: "OrderedDict[str, object]" = OrderedDict()
+_file_hashes: "OrderedDict[tuple, str]" = OrderedDict()
+_counters = {'hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0}
+
+
+class CachedConversion:
+    """
+    Resultado de uma conversão, restaurado do cache ou recém-convertido.
+    Expõe o atributo `document`, da mesma forma que o `ConversionResult` do Docling;
+    `converted` indica se o documento passou pelo conversor nesta leitura.
+    """
+
+    def __init__(self, document: object, key: str = "", converted: bool = False):
+        self.document = document
+        self.key = key
+        self.converted = converted
+
+
+def file_hash(path: str) -> str:
+    """
+    Calcula o hash sha3 dos bytes de um arquivo.
+    O resultado é memorizado por (path, mtime, size), numa LRU de até `max_file_hashes` arquivos,
+    para evitar reler o arquivo a cada chamada.
+
+    Args:
+        path (str): Caminho do arquivo.
+
+    Returns:
+        str: Hash hexadecimal do conteúdo do arquivo.
+    """
+    path = os.path.normpath(path)
+    stat = os.stat(path)
+    signature = (path, stat.st_mtime_ns, stat.st_size)
+
+    with _lock:
+        digest = _file_hashes.get(signature)
+        if digest is not None:
+            _file_hashes.move_to_end(signature)
+            return digest
+
+    with open(path, 'rb') as file:
+        digest = String.hash(file.read())
+
+    with _lock:
+        _file_hashes[signature] = digest
+        while len(_file_hashes) > max_file_hashes:
+            _file_hashes.popitem(last=False)
+    return digest
+
+
+def options_hash(options: object = None) -> str:
+    """
+    Calcula o hash das opções do pipeline de conversão.
+
+    Args:
+        options (object): Opções do pipeline (modelo pydantic, dicionário ou qualquer objeto representável).
+
+    Returns:
+        str: Hash hexadecimal das opções.
+    """
+    if options is None:
+        serialized = ""
+    elif hasattr(options, 'model_dump_json'):
+        serialized = options.model_dump_json()
+    elif isinstance(options, dict):
+        serialized = json.dumps(options, sort_keys=True, default=str)
+    else:
+        serialized = repr(options)
+    return String.hash(serialized)
+
+
+def key(path: str, options: object = None, pages: Optional[List[int]] = None) -> str:
+    """
+    Gera a chave de cache de um arquivo convertido com determinadas opções.
+
+    Args:
+        path (str): Caminho do arquivo.
+        options (object): Opções do pipeline de conversão.
+        pages (Optional[List[int]]): Páginas convertidas à parte (num PDF temporário com só essas páginas). Padrão é None (o arquivo inteiro).
+
+    Returns:
+        str: Chave no formato `<hash do arquivo>.<hash das opções>`, seguida de `.<hash das páginas>` se houver páginas.
+    """
+    entry_key = f"{file_hash(path)}.{options_hash(options)[:16]}"
+    if pages:
+        # o PDF temporário muda de bytes a cada gravação (/ID, /CreationDate); a chave é a do arquivo de origem
+        entry_key += f".{String.hash(','.join(str(num) for num in sorted(pages)))[:16]}"
+    return entry_key
+
+
+def _entry_path(entry_key: str) -> str:
+    return os.path.join(directory, f"{entry_key}{extension}")
+
+
+def _entries() -> list:
+    """lista as entradas do cache como tuplas (path, size, atime)"""
+    if not os.path.isdir(directory):
+        return []
+
+    entries = []
+    for name in os.listdir(directory):
+        if not name.endswith(extension):
+            continue
+        entry = os.path.join(directory, name)
+        try:
+            stat = os.stat(entry)
+        except OSError:
+            continue
+        entries.append((entry, stat.st_size, stat.st_mtime))
+    return entries
+
+
+def _count(name: str, amount: int = 1):
+    """incrementa um contador sob o lock (o cache é usado por várias threads)"""
+    with _lock:
+        _counters[name] += amount
+
+
+def _remember(entry_key: str, document: object):
+    with _lock:
+        _memory[entry_key] = document
+        _memory.move_to_end(entry_key)
+        while len(_memory) > memory_items:
+            _memory.popitem(last=False)
+
+
+def read(entry_key: str) -> Optional[dict]:
+    """
+    Lê uma entrada bruta do cache.
+
+    Args:
+        entry_key (str): Chave da entrada.
+
+    Returns:
+        Optional[dict]: O documento serializado, ou None se a entrada não existir ou estiver corrompida.
+    """
+    entry = _entry_path(entry_key)
+    try:
+        if not os.path.exists(entry):
+            return None
+
+        with gzip.open(entry, 'rt', encoding='utf-8') as file:
+            payload = json.load(file)
+
+        # marca o acesso para a política LRU
+        os.utime(entry, None)
+        return payload
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        _remove(entry)
+        return None
+
+
+def write(entry_key: str, payload: dict) -> bool:
+    """
+    Grava uma entrada bruta no cache de forma atômica e aplica a política de tamanho.
+
+    Args:
+        entry_key (str): Chave da entrada.
+        payload (dict): Documento serializado.
+
+    Returns:
+        bool: True se a entrada foi gravada, False caso contrário.
+    """
+    try:
+        os.makedirs(directory, exist_ok=True)
+        entry = _entry_path(entry_key)
+        tmp = f"{entry}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        with gzip.open(tmp, 'wt', encoding='utf-8', compresslevel=6) as file:
+            json.dump(payload, file, ensure_ascii=False, separators=(',', ':'))
+
+        os.replace(tmp, entry)
+        _count('writes')
+        evict()
+        return True
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return False
+
+
+def get(path: str, options: object = None, pages: Optional[List[int]] = None) -> Optional[CachedConversion]:
+    """
+    Recupera a conversão de um arquivo do cache.
+
+    Args:
+        path (str): Caminho do arquivo.
+        options (object): Opções do pipeline usadas na conversão.
+        pages (Optional[List[int]]): Páginas convertidas à parte. Padrão é None (o arquivo inteiro).
+
+    Returns:
+        Optional[CachedConversion]: A conversão restaurada, ou None se não houver entrada válida.
+    """
+    try:
+        if DoclingDocument is None:
+            return None
+
+        entry_key = key(path, options, pages)
+
+        with _lock:
+            document = _memory.get(entry_key)
+            if document is not None:
+                _memory.move_to_end(entry_key)
+
+        if document is None:
+            payload = read(entry_key)
+            if payload is None:
+                _count('misses')
+                return None
+            document = DoclingDocument.model_validate(payload)
+            _remember(entry_key, document)
+
+        _count('hits')
+        return CachedConversion(document, entry_key)
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        _count('misses')
+        return None
+
+
+def put(path: str, options: object, document: object, pages: Optional[List[int]] = None) -> bool:
+    """
+    Grava no cache o documento convertido de um arquivo.
+
+    Args:
+        path (str): Caminho do arquivo.
+        options (object): Opções do pipeline usadas na conversão.
+        document (object): O `DoclingDocument` resultante da conversão.
+        pages (Optional[List[int]]): Páginas convertidas à parte. Padrão é None (o arquivo inteiro).
+
+    Returns:
+        bool: True se o documento foi gravado, False caso contrário.
+    """
+    try:
+        if document is None or not hasattr(document, 'export_to_dict'):
+            return False
+
+        entry_key = key(path, options, pages)
+        if not write(entry_key, document.export_to_dict()):
+            return False
+
+        _remember(entry_key, document)
+        return True
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return False
+
+
+def _remove(entry: str) -> bool:
+    try:
+        os.remove(entry)
+        return True
+    except OSError:
+        return False
+
+
+def invalidate(path: str) -> int:
+    """
+    Remove do cache todas as entradas do conteúdo atual de um arquivo, para quaisquer opções de pipeline.
+
+    Args:
+        path (str): Caminho do arquivo.
+
+    Returns:
+        int: Quantidade de entradas removidas.
+    """
+    try:
+        prefix = f"{file_hash(path)}."
+
+        with _lock:
+            for entry_key in [k for k in _memory if k.startswith(prefix)]:
+                del _memory[entry_key]
+
+        removed = 0
+        for entry, _, _ in _entries():
+            if os.path.basename(entry).startswith(prefix) and _remove(entry):
+                removed += 1
+        return removed
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return 0
+
+
+def clear() -> int:
+    """
+    Remove todas as entradas do cache.
+
+    Returns:
+        int: Quantidade de entradas removidas.
+    """
+    with _lock:
+        _memory.clear()
+        _file_hashes.clear()
+
+    removed = 0
+    for entry, _, _ in _entries():
+        if _remove(entry):
+            removed += 1
+    return removed
+
+
+def evict(limit: Optional[int] = None) -> int:
+    """
+    Remove as entradas usadas há mais tempo até que o cache caiba no limite de tamanho.
+
+    Args:
+        limit (Optional[int]): Limite em bytes. Padrão é `max_bytes`.
+
+    Returns:
+        int: Quantidade de entradas removidas.
+    """
+    limit = max_bytes if limit is None else limit
+    entries = _entries()
+    total = sum(size for _, size, _ in entries)
+
+    removed = 0
+    for entry, size, _ in sorted(entries, key=lambda e: e[2]):
+        if total <= limit:
+            break
+        if _remove(entry):
+            total -= size
+            removed += 1
+
+    _count('evictions', removed)
+    return removed
+
+
+def stats() -> dict:
+    """
+    Retorna estatísticas do cache.
+
+    Returns:
+        dict: Quantidade de entradas, tamanho ocupado, limite e contadores de acertos/falhas.
+    """
+    entries = _entries()
+    size = sum(size for _, size, _ in entries)
+    with _lock:
+        counters = dict(_counters)
+    return {
+        'directory': directory,
+        'entries': len(entries),
+        'size': size,
+        'sizeLabel': String.size_to_label(size),
+        'max_bytes': max_bytes,
+        **counters,
+    }
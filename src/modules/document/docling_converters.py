@@ -0,0 +1,217 @@
+# flake8: noqa: E501
+"""
+Docling Converters Module
+Registro de conversores do Docling compartilhado por todo o processo.
+
+Criar um `DocumentConverter` carrega os modelos de layout, OCR e TableFormer, o que custa
+segundos e centenas de MB a cada leitura. Os conversores são criados uma única vez por
+perfil de pipeline e reaproveitados: cada perfil mantém um pool limitado (`pool_size`) para
+atender requisições concorrentes sem que duas conversões usem o mesmo conversor ao mesmo tempo.
+
+Perfis:
+    - PROFILE_LEGAL: OCR e estrutura de tabelas com casamento de células (padrão da análise jurídica).
+    - PROFILE_FAST: apenas CPU, sem OCR e sem casamento de células, para PDFs que já têm camada de texto.
+
+Funções:
+    - pipeline_options(profile: str = PROFILE_LEGAL) -> object: Monta as opções do pipeline de um perfil.
+    - acquire(profile: str = PROFILE_LEGAL): Empresta um conversor do pool do perfil (gerenciador de contexto).
+    - warmup(profiles: tuple = PROFILES, background: bool = True): Carrega os modelos antes da primeira requisição.
+    - stats() -> dict: Conversores criados, ociosos e em uso por perfil.
+    - clear(): Descarta todos os conversores.
+"""
+
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+import traceback
+import threading
+import logging
+import queue
+
+try:
+    from docling.document_converter import DocumentConverter, PdfFormatOption
+    from docling.datamodel.base_models import InputFormat
+    from docling.datamodel.pipeline_options import PdfPipelineOptions
+except ImportError:
+    DocumentConverter = None
+    PdfFormatOption = None
+    InputFormat = None
+    PdfPipelineOptions = None
+
+try:
+    from docling.datamodel.pipeline_options import AcceleratorDevice, AcceleratorOptions
+except ImportError:
+    # versões antigas do Docling não expõem a escolha do dispositivo
+    AcceleratorDevice = None
+    AcceleratorOptions = None
+
+PROFILE_LEGAL = "legal"
+PROFILE_FAST = "fast"
+PROFILES = (PROFILE_LEGAL, PROFILE_FAST)
+
+pool_size = 2        # conversores por perfil
+timeout = 600.0      # segundos de espera por um conversor livre
+
+_lock = threading.Lock()
+_pools: Dict[str, Tuple[queue.LifoQueue, list]] = {}
+
+
+def pipeline_options(profile: str = PROFILE_LEGAL) -> Optional[object]:
+    """
+    Monta as opções do pipeline de PDF de um perfil.
+    Args:
+        profile (str): PROFILE_LEGAL ou PROFILE_FAST. Padrão é PROFILE_LEGAL.
+    Returns:
+        object: Instância de `PdfPipelineOptions`, ou None se o Docling não estiver disponível.
+    Raises:
+        ValueError: Se o perfil for desconhecido.
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Perfil de conversão desconhecido: {profile}.")
+
+    if PdfPipelineOptions is None:
+        return None
+
+    options = PdfPipelineOptions()
+    if profile == PROFILE_FAST:
+        options.do_ocr = False  # a camada de texto do PDF já é suficiente
+        options.do_table_structure = True
+        options.table_structure_options.do_cell_matching = False
+        if AcceleratorOptions is not None:
+            options.accelerator_options = AcceleratorOptions(device=AcceleratorDevice.CPU)
+    else:
+        options.do_ocr = True  # OCR para documentos escaneados
+        options.do_table_structure = True  # Detectar estrutura de tabelas
+        options.table_structure_options.do_cell_matching = True
+    return options
+
+
+def _create(profile: str) -> object:
+    """cria um conversor do perfil e inicializa o pipeline de PDF (carrega os modelos)"""
+    converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options(profile))
+        }
+    )
+    if hasattr(converter, 'initialize_pipeline'):
+        converter.initialize_pipeline(InputFormat.PDF)
+    return converter
+
+
+def _pool(profile: str) -> Tuple[queue.LifoQueue, list]:
+    """retorna (conversores ociosos, todos os conversores) do perfil"""
+    with _lock:
+        if profile not in _pools:
+            _pools[profile] = (queue.LifoQueue(), [])
+        return _pools[profile]
+
+
+def _checkout(profile: str) -> object:
+    """retira um conversor ocioso, cria um novo se o pool não estiver cheio, ou espera um livre"""
+    idle, created = _pool(profile)
+    try:
+        return idle.get_nowait()
+    except queue.Empty:
+        pass
+
+    with _lock:
+        reserved = len(created) < max(pool_size, 1)
+        if reserved:
+            created.append(None)  # reserva a vaga enquanto os modelos carregam
+
+    if not reserved:
+        return idle.get(timeout=timeout)
+
+    try:
+        converter = _create(profile)
+    except Exception:
+        with _lock:
+            created.remove(None)
+        raise
+
+    with _lock:
+        created[created.index(None)] = converter
+    return converter
+
+
+@contextmanager
+def acquire(profile: str = PROFILE_LEGAL) -> Iterator[object]:
+    """
+    Empresta um conversor do pool do perfil pelo tempo de uma conversão.
+
+    Uso:
+        with DoclingConverters.acquire(DoclingConverters.PROFILE_FAST) as converter:
+            result = converter.convert(path)
+
+    Args:
+        profile (str): PROFILE_LEGAL ou PROFILE_FAST. Padrão é PROFILE_LEGAL.
+    Yields:
+        object: Um `DocumentConverter` com os modelos já carregados.
+    Raises:
+        ValueError: Se o perfil for desconhecido ou o Docling não estiver disponível.
+        queue.Empty: Se nenhum conversor ficar livre dentro de `timeout` segundos.
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Perfil de conversão desconhecido: {profile}.")
+
+    if DocumentConverter is None:
+        raise ValueError("Docling não está disponível.")
+
+    idle, _ = _pool(profile)
+    converter = _checkout(profile)
+    try:
+        yield converter
+    finally:
+        idle.put(converter)
+
+
+def warmup(profiles: tuple = PROFILES, background: bool = True) -> Optional[threading.Thread]:
+    """
+    Carrega um conversor de cada perfil antes da primeira requisição.
+    Args:
+        profiles (tuple): Perfis a aquecer. Padrão são todos.
+        background (bool): Se deve carregar numa thread, sem atrasar a subida do servidor. Padrão é True.
+    Returns:
+        Optional[threading.Thread]: A thread de aquecimento, ou None se executado em primeiro plano.
+    """
+    def run():
+        for profile in profiles:
+            try:
+                with acquire(profile):
+                    logging.info(f"Conversor Docling '{profile}' carregado.")
+            except Exception as e:
+                logging.error(f"{e}\n{traceback.format_exc()}")
+
+    if DocumentConverter is None:
+        return None
+
+    if not background:
+        run()
+        return None
+
+    thread = threading.Thread(target=run, name="docling-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def stats() -> dict:
+    """
+    Retorna o estado dos pools.
+    Returns:
+        dict: Para cada perfil, os conversores criados, ociosos e em uso.
+    """
+    with _lock:
+        pools = dict(_pools)
+    return {
+        profile: {
+            'created': len(created),
+            'idle': idle.qsize(),
+            'in_use': len(created) - idle.qsize(),
+        }
+        for profile, (idle, created) in pools.items()
+    }
+
+
+def clear():
+    """descarta todos os conversores (os em uso são liberados ao final da conversão)"""
+    with _lock:
+        _pools.clear()
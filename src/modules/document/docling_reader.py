@@ -5,21 +5,27 @@ Este módulo contém funções para ler documentos usando Docling e extrair text
 O Docling é especialmente otimizado para análise de documentos jurídicos e oferece melhor extração de texto e estrutura.
 
 Funções:
-    - reader(path: str = "") -> DoclingDocument: Faz a leitura de um documento e retorna o objeto Docling.
+    - reader(path: str = "", use_cache: bool = True, profile: str = None) -> CachedConversion: Faz a leitura de um documento (com cache em disco) e retorna a conversão, com o `DoclingDocument` em `document`.
     - reader_pages(path: str = "", init: int = 1, final: int = 0) -> List[str]: Faz a leitura de um trecho de um arquivo e retorna as páginas em texto puro.
-    - reader_content(path: str, init: int = 1, final: int = -1) -> str: Lê um arquivo e extrai todo o texto numa variável.
+    - reader_content(path: str, init: int = 1, final: int = -1, profile: str = None) -> str: Lê um arquivo e extrai todo o texto numa variável.
+    - iter_pages(path: str = "", init: int = 1, final: int = -1, profile: str = None) -> Iterator[Tuple[int, str]]: Percorre as páginas uma a uma.
+    - iter_page_items(path: str = "", init: int = 1, final: int = -1, profile: str = None) -> Iterator[Tuple[int, list]]: Percorre os itens de texto das páginas, com os títulos.
+
+Os conversores do Docling vêm do registro `docling_converters`, que mantém os modelos carregados
+entre as leituras; o perfil PROFILE_FAST (sem OCR) pode ser usado em PDFs que já têm camada de texto.
+Sem perfil explícito, a triagem de `text_layer` escolhe o perfil e, em `iter_pages`, apenas as páginas
+digitalizadas passam pelo OCR.
 """
 
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 import traceback
+import tempfile
 import logging
 import csv
 import os
 
 try:
-    from docling.document_converter import DocumentConverter, PdfFormatOption
-    from docling.datamodel.base_models import InputFormat
-    from docling.datamodel.pipeline_options import PdfPipelineOptions
+    from docling.document_converter import DocumentConverter
     from docling.datamodel.document import ConversionResult
     from docling_core.types.doc import DoclingDocument, TableItem, TextItem
     DOCLING_AVAILABLE = True
@@ -31,11 +37,12 @@ except ImportError:
     ConversionResult = None
     TableItem = None
     TextItem = None
-    InputFormat = None
-    PdfFormatOption = None
-    PdfPipelineOptions = None
     DOCLING_AVAILABLE = False
 
+from src.modules.document import docling_converters as DoclingConverters
+from src.modules.document.docling_converters import PROFILE_FAST, PROFILE_LEGAL
+from src.modules.document import docling_cache as DoclingCache
+from src.modules.document import text_layer as TextLayer
 from src.utils import archive as Archive
 
 
@@ -61,13 +68,38 @@ def page_limit_mechanics(init: int = 1, final: int = -1, total: int = 1):
     return init, final
 
 
-def reader(path: str = "") -> Optional[object]:
+def pipeline_options(profile: str = PROFILE_LEGAL) -> Optional[object]:
+    """
+    Monta as opções do pipeline de PDF do perfil (por padrão, o usado na análise jurídica).
+    Returns:
+        object: Instância de `PdfPipelineOptions`, ou None se o Docling não estiver disponível.
+    """
+    return DoclingConverters.pipeline_options(profile)
+
+
+def profile_for(path: str) -> str:
+    """
+    Escolhe o perfil do conversor pela camada de texto do arquivo.
+    Returns:
+        str: PROFILE_FAST se todas as páginas têm camada de texto legível, PROFILE_LEGAL caso contrário.
+    """
+    sources = TextLayer.triage(path)
+    if sources and not TextLayer.ocr_pages(sources):
+        return PROFILE_FAST
+    return PROFILE_LEGAL
+
+
+def reader(path: str = "", use_cache: bool = True, profile: Optional[str] = None) -> Optional[DoclingCache.CachedConversion]:
     """
     Faz a leitura de um documento usando Docling.
+    As conversões são guardadas no cache em disco (`docling_cache`), endereçado pelo hash do arquivo
+    e das opções do pipeline, de modo que leituras repetidas do mesmo documento não refazem o OCR.
     Args:
         path (str): O caminho para o arquivo do documento.
+        use_cache (bool): Se deve consultar e alimentar o cache de conversões. Padrão é True.
+        profile (Optional[str]): Perfil do conversor: PROFILE_LEGAL (OCR e tabelas) ou PROFILE_FAST (sem OCR). Padrão é None (escolhido por `profile_for`).
     Returns:
-        object: Resultado da conversão do Docling se a leitura for bem-sucedida, caso contrário, retorna None.
+        Optional[CachedConversion]: A conversão, com o `DoclingDocument` em `document`, seja ela restaurada do cache ou recém-feita; None se a leitura falhar.
     Raises:
         ValueError: Se o caminho fornecido for inválido.
     """
@@ -79,20 +111,23 @@ def reader(path: str = "") -> Optional[object]:
             logging.warning("Docling não está disponível.")
             return None
 
-        # Configurar o conversor com opções específicas para análise jurídica
-        pipeline_options = PdfPipelineOptions()
-        pipeline_options.do_ocr = True  # OCR para documentos escaneados
-        pipeline_options.do_table_structure = True  # Detectar estrutura de tabelas
-        pipeline_options.table_structure_options.do_cell_matching = True
-        
-        converter = DocumentConverter(
-            format_options={
-                InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
-            }
-        )
-        
-        result = converter.convert(path)
-        return result
+        profile = profile or profile_for(path)
+        options = pipeline_options(profile)
+
+        if use_cache:
+            cached = DoclingCache.get(path, options)
+            if cached is not None:
+                return cached
+
+        # o conversor do perfil é reaproveitado, com os modelos já carregados
+        with DoclingConverters.acquire(profile) as converter:
+            result = converter.convert(path)
+
+        if use_cache:
+            DoclingCache.put(path, options, result.document)
+
+        # o mesmo tipo de retorno com ou sem acerto no cache
+        return DoclingCache.CachedConversion(result.document, DoclingCache.key(path, options) if use_cache else "", converted=True)
     except Exception as e:
         logging.error(f"{e}\n{traceback.format_exc()}")
         return None
@@ -153,13 +188,152 @@ def reader_pages(path: str = "", init: int = 1, final: int = -1) -> List[str]:
         return []
 
 
-def reader_content(path: str, init: int = 1, final: int = -1) -> str:
+# rótulos de itens tratados como títulos (fora do corpo das páginas)
+TITLE_LABELS = ['title', 'section_header']
+
+
+def item_page(item: object) -> int:
+    """
+    Retorna a primeira página (1-indexada) em que um item do documento aparece.
+    O Docling registra a página em `prov[].page_no`; `page` é aceito por compatibilidade.
+    """
+    for prov_item in getattr(item, 'prov', None) or []:
+        page_num = getattr(prov_item, 'page_no', None) or getattr(prov_item, 'page', None)
+        if page_num:
+            return page_num
+    return 1
+
+
+def is_title(item: object) -> bool:
+    """indica se um item do documento é um título (fora do corpo das páginas)"""
+    return getattr(item, 'label', 'text') in TITLE_LABELS
+
+
+def page_text(items: list) -> str:
+    """monta o texto do corpo de uma página a partir dos seus itens, sem os títulos"""
+    return "\n".join(item.text for item in items if not is_title(item))
+
+
+def _page_items(result: object, pages: Optional[List[int]] = None) -> Dict[int, list]:
+    """
+    Indexa os itens de texto (inclusive os títulos) pela primeira página em que aparecem, na ordem do documento.
+    `pages` renumera as páginas de um documento parcial para as páginas do documento original.
+    """
+    pages_items = {}
+    for item in result.document.texts:
+        page_num = item_page(item)
+        if pages is not None:
+            page_num = pages[page_num - 1] if page_num <= len(pages) else pages[-1]
+        pages_items.setdefault(page_num, []).append(item)
+    return pages_items
+
+
+def _ocr_page_items(path: str, pages: List[int]) -> Optional[Dict[int, list]]:
+    """
+    Converte com OCR apenas as páginas indicadas, extraídas para um PDF temporário.
+    A conversão é guardada no cache sob o arquivo de origem e as páginas, pois os bytes do PDF
+    temporário mudam a cada gravação.
+    """
+    options = pipeline_options(PROFILE_LEGAL)
+    cached = DoclingCache.get(path, options, pages)
+    if cached is not None:
+        return _page_items(cached, pages)
+
+    handle, target = tempfile.mkstemp(suffix=".pdf")
+    os.close(handle)
+    try:
+        if not TextLayer.subset(path, pages, target):
+            return None
+
+        result = reader(target, use_cache=False, profile=PROFILE_LEGAL)
+        if result is None:
+            return None
+        DoclingCache.put(path, options, result.document, pages)
+        return _page_items(result, pages)
+    finally:
+        os.remove(target)
+
+
+def iter_pages(path: str = "", init: int = 1, final: int = -1, profile: Optional[str] = None) -> Iterator[Tuple[int, str]]:
+    """
+    Percorre as páginas de um documento uma a uma, entregando o texto do corpo de cada página.
+    Os itens de título são deixados de fora, como em `extract_structured_content`, e o texto de cada
+    página só é montado quando a página é consumida.
+    Args:
+        path (str): Caminho para o arquivo.
+        init (int): Número da página inicial (1-indexado). Padrão é 1.
+        final (int): Número da página final (1-indexado). Padrão é -1, que indica a última página.
+        profile (Optional[str]): Perfil do conversor. Padrão é None (triagem por página).
+    Yields:
+        Tuple[int, str]: O número da página (1-indexado) e o seu texto.
+    Raises:
+        ValueError: Se não for possível ler o arquivo.
+    """
+    for page_num, items in iter_page_items(path, init, final, profile):
+        yield page_num, page_text(items)
+
+
+def iter_page_items(path: str = "", init: int = 1, final: int = -1, profile: Optional[str] = None) -> Iterator[Tuple[int, list]]:
+    """
+    Percorre as páginas de um documento uma a uma, entregando os itens de texto de cada página
+    (inclusive os títulos), na ordem do documento.
+
+    Sem perfil explícito, as páginas são triadas pela camada de texto: o documento é convertido sem
+    OCR e apenas as páginas digitalizadas são convertidas de novo, com OCR, num PDF à parte.
+    A triagem entra nos contadores de `text_layer` uma vez por conversão: leituras restauradas do
+    cache não são contabilizadas de novo.
+    Args:
+        path (str): Caminho para o arquivo.
+        init (int): Número da página inicial (1-indexado). Padrão é 1.
+        final (int): Número da página final (1-indexado). Padrão é -1, que indica a última página.
+        profile (Optional[str]): Perfil do conversor. Padrão é None (triagem por página).
+    Yields:
+        Tuple[int, list]: O número da página (1-indexado) e os seus itens de texto.
+    Raises:
+        ValueError: Se não for possível ler o arquivo.
+    """
+    scanned, sources = [], {}
+    if profile is None:
+        sources = TextLayer.triage(path)
+        scanned = TextLayer.ocr_pages(sources)
+        profile = PROFILE_FAST if sources and len(scanned) < len(sources) else PROFILE_LEGAL
+
+    result = reader(path, profile=profile)
+    if result is None:
+        raise ValueError("Não foi possível ler o arquivo.")
+
+    if sources and result.converted:
+        TextLayer.record(sources)
+
+    pages_items = _page_items(result)
+
+    if profile == PROFILE_FAST and scanned:
+        ocr_items = _ocr_page_items(path, scanned)
+        if ocr_items is None:
+            # sem como separar as páginas, o documento inteiro passa pelo OCR
+            result = reader(path, profile=PROFILE_LEGAL)
+            if result is None:
+                raise ValueError("Não foi possível ler o arquivo.")
+            pages_items = _page_items(result)
+        else:
+            for page_num in scanned:
+                pages_items[page_num] = ocr_items.get(page_num, [])
+
+    total = max(pages_items.keys()) if pages_items else 1
+    init, final = page_limit_mechanics(init, final, total)
+
+    for page_num in range(init, final + 1):
+        yield page_num, pages_items.pop(page_num, [])
+
+
+def reader_content(path: str, init: int = 1, final: int = -1, profile: Optional[str] = None) -> str:
     """
     Lê um arquivo e extrai o texto de suas páginas numa variável só.
     Args:
         path (str): O caminho para o arquivo.
         init (int): Página inicial (1-indexado). Padrão é 1.
         final (int): Página final (1-indexado). Padrão é -1 (última página).
+        profile (Optional[str]): Perfil do conversor; PROFILE_FAST dispensa o OCR em PDFs com camada de texto. Padrão é None (escolhido por `profile_for`).
     Returns:
         str: O conteúdo extraído do documento como uma string. 
     """
@@ -168,7 +342,7 @@ def reader_content(path: str, init: int = 1, final: int = -1) -> str:
             logging.warning("Docling não disponível. Retornando string vazia.")
             return ""
             
-        result = reader(path)
+        result = reader(path, profile=profile)
         if result is None:
             return ""
 
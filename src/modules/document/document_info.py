@@ -5,19 +5,13 @@ import traceback
 import logging
 import os
 
-try:
-    from src.modules.document.docling_reader import get_document_info
-    DOCLING_AVAILABLE = True
-except ImportError:
-    DOCLING_AVAILABLE = False
-    from src.modules.document.reader import reader
-
+from src.modules.document import probe as Probe
 from src.utils import archive as Archive
 from src.utils import string as String
 
 @dataclass
 class DocumentInfo:
-    def __init__(self, id: int = 0 , path: str = "", name: str = "", size: int = 0, pages: int = 1, mimetype: str = ""):
+    def __init__(self, id: int = 0 , path: str = "", name: str = "", size: int = 0, pages: int = 1, mimetype: str = "", mtime: float = 0.0):
         """
         Inicializa uma nova instância da classe.
 
@@ -28,6 +22,7 @@ class DocumentInfo:
             size (int): Tamanho do documento em bytes. Valor padrão é 0.
             pages (int): Número de páginas do documento. Valor padrão é 1.
             mimetype (str): Tipo MIME do documento. Valor padrão é uma string vazia.
+            mtime (float): Data de modificação do arquivo quando as informações foram extraídas. Valor padrão é 0.0.
         """
         self.id: int = id
         self.path: str = os.path.normpath(path)
@@ -35,6 +30,7 @@ class DocumentInfo:
         self.size: int = size
         self.pages: int = pages
         self.mimetype: str = mimetype
+        self.mtime: float = mtime or 0.0
         self.sizeLabel: str = String.size_to_label(size)
 
     def dict(self):
@@ -71,7 +67,9 @@ class DocumentInfo:
 
     def extract(self, path):
         """
-        Extrai informações de um documento no caminho especificado usando Docling ou PDF.
+        Extrai informações de um documento no caminho especificado.
+        O número de páginas é lido da estrutura do arquivo (trailer e árvore de páginas),
+        sem converter o documento.
         Args:
             path (str): O caminho do arquivo do documento.
         Returns:
@@ -83,33 +81,18 @@ class DocumentInfo:
             if not Archive.exists(path):
                 raise ValueError("O path está inválido.")
 
-            # Obter metadados do arquivo
-            self.path = os.path.normpath(path)
-            self.name = os.path.basename(path)
-            self.size = os.path.getsize(path)
+            info = Probe.probe(path)
+            if info is None:
+                return None
+
+            self.path = info['path']
+            self.name = info['name']
+            self.size = info['size']
+            self.pages = info['pages']
+            self.mimetype = info['mimetype']
+            self.mtime = info['mtime']
             self.sizeLabel: str = String.size_to_label(self.size)
-            
-            _, ext = os.path.splitext(path)
-            self.mimetype = ext.replace(".", "")
 
-            if DOCLING_AVAILABLE:
-                # Usar Docling para obter informações do documento
-                doc_info = get_document_info(path)
-                if doc_info:
-                    self.pages = doc_info.get('pages', 1)
-                    if 'document_type' in doc_info:
-                        self.mimetype = doc_info['document_type']
-                else:
-                    self.pages = 1
-            elif "pdf" in self.mimetype.lower():
-                # Fallback para PDF
-                pdf = reader(path)
-                if pdf is None:
-                    return None
-                self.pages = int(len(pdf.pages))
-            else:
-                self.pages = 1
-                
             # Retorna um dicionário com as informações extraídas
             return self.dict()
         except Exception as e:
@@ -12,6 +12,8 @@ from src.modules.document.document_info import DocumentInfo
 # TABLE INFO
 #################################################################
 
+COLUMNS = "id, path, name, size, pages, mimetype, mtime"
+
 
 def table_documents_info() -> bool:
     """
@@ -25,6 +27,7 @@ def table_documents_info() -> bool:
     - size: Tamanho do documento em bytes.
     - pages: Número de páginas do documento.
     - mimetype: Tipo MIME do documento.
+    - mtime: Data de modificação do arquivo quando as informações foram extraídas.
 
     Returns:
         bool: Retorna True se a tabela for criada com sucesso, caso contrário, False.
@@ -38,9 +41,14 @@ def table_documents_info() -> bool:
                 name TEXT,
                 size INTEGER,
                 pages INTEGER,
-                mimetype TEXT
+                mimetype TEXT,
+                mtime REAL
             )
         """)
+        columns = [column[1] for column in conn.execute("PRAGMA table_info(documents_info)")]
+        if "mtime" not in columns:
+            conn.execute("ALTER TABLE documents_info ADD COLUMN mtime REAL")
+            conn.commit()
         return True
     except Exception as e:
         logging.error(f"{e}\n{traceback.format_exc()}")
@@ -67,11 +75,37 @@ def save(document: DocumentInfo) -> bool:
         if doc_data is not None:
             return False
 
-        # extra o id da tupla
-        _, *info = document.tuple()
         conn = sqlitedb.client()
         conn.execute(
-            "insert into documents_info (path, name, size, pages, mimetype) values (?, ?, ?, ?, ?)", info)
+            "insert into documents_info (path, name, size, pages, mimetype, mtime) values (?, ?, ?, ?, ?, ?)",
+            (document.path, document.name, document.size, document.pages, document.mimetype, document.mtime))
+        conn.commit()
+        return True
+
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return False
+
+
+def upsert(document: DocumentInfo) -> bool:
+    """
+    Salva informações do documento na tabela, atualizando o registro existente do mesmo path.
+    Args:
+        document (DocumentInfo): Objeto contendo as informações do documento.
+    Returns:
+        bool: Retorna True se o documento foi salvo ou atualizado, caso contrário, retorna False.
+    """
+    try:
+        if document is None:
+            return False
+
+        if show_by_path(document.path) is None:
+            return save(document)
+
+        conn = sqlitedb.client()
+        conn.execute(
+            "update documents_info set name=?, size=?, pages=?, mimetype=?, mtime=? where path=?",
+            (document.name, document.size, document.pages, document.mimetype, document.mtime, document.path))
         conn.commit()
         return True
 
@@ -99,7 +133,7 @@ def list_by_path(path: str = "") -> List[DocumentInfo]:
         path = os.path.normpath(path)
         conn = sqlitedb.client()
         cursor = conn.execute(
-            "select * from documents_info where path=? LIMIT 1000", (path,))
+            f"select {COLUMNS} from documents_info where path=? LIMIT 1000", (path,))
         docs: List[DocumentInfo] = []
         for doc in cursor:
             docs.append(DocumentInfo(*doc))
@@ -113,7 +147,7 @@ def list() -> List[DocumentInfo]:
     """lista todos os docuemntos"""
     try:
         conn = sqlitedb.client()
-        cursor = conn.execute("select * from documents_info")
+        cursor = conn.execute(f"select {COLUMNS} from documents_info")
         docs: List[DocumentInfo] = []
         for doc in cursor:
             docs.append(DocumentInfo(*doc))
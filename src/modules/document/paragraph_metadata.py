@@ -1,6 +1,6 @@
 # flake8: noqa: E501
 
-from typing import List, Mapping
+from typing import Dict, List, Mapping, Optional
 from dataclasses import dataclass
 import json
 import uuid
@@ -66,7 +66,7 @@ class ParagraphMetadata:
         return tuple(self.__dict__.values())
     
     def data_retrieval(self):
-        return { "uuid": self.uuid, "path": self.path, "name": self.name, "source": self.source, "mimetype": self.mimetype, "content": self.content }
+        return { "uuid": self.uuid, "path": self.path, "page": self.page, "name": self.name, "source": self.source, "mimetype": self.mimetype, "content": self.content }
     
     def from_retrieval(self, data: Mapping[str, str]):
         self.uuid = data['uuid']
@@ -80,18 +80,10 @@ class ParagraphMetadata:
         self.phrases = len(self.phrase)
         return self.phrase
     
-    def generate_lines(self) -> List[str]:
-        """quebra o conteúdo em linhas removendo linhas vazias"""
-        lines_clean: List[str] = []
-        lines = String.split_to_lines(self.content)
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            lines_clean.append(String.clean_lines(line))
-            
-        self.line = lines_clean
+    def generate_lines(self, memo: Optional[Dict[str, str]] = None) -> List[str]:
+        """quebra o conteúdo em linhas removendo linhas vazias (`memo` reaproveita linhas já limpas)"""
+        lines = [line for line in String.split_to_lines(self.content) if line]
+        self.line = String.clean_lines_many(lines, memo)
         self.lines = len(self.line)
         return self.line
     
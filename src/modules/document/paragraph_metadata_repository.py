@@ -2,7 +2,7 @@
 
 import logging
 import traceback
-from typing import List
+from typing import Iterator, List
 
 from src.modules.database import sqlitedb
 from src.modules.document.paragraph_metadata import ParagraphMetadata
@@ -44,7 +44,8 @@ def table_paragraphs_metadatas() -> bool:
 def save(paragraph: ParagraphMetadata) -> bool:
     """salva um paragrafo com metadados"""
     try:
-        paragraph_list = list(paragraph.tuple())
+        # `list` é a função de listagem deste módulo
+        paragraph_list = [*paragraph.tuple()]
         rm_positions = [10, 12, 14]
         for pos in sorted(rm_positions, reverse=True):
             del paragraph_list[pos]
@@ -63,6 +64,29 @@ def save(paragraph: ParagraphMetadata) -> bool:
         return False
 
 
+def delete_by_page(path: str = "", page: int = 0) -> bool:
+    """remove os paragrafos de uma página de um documento"""
+    try:
+        conn = sqlitedb.client()
+        conn.execute("delete from paragraphs_metadatas where path=? and page=?", (path, page))
+        conn.commit()
+        return True
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return False
+
+
+def contents_by_page(path: str = "", page: int = 0) -> List[str]:
+    """lista o conteúdo dos paragrafos de uma página de um documento"""
+    try:
+        conn = sqlitedb.client()
+        cursor = conn.execute("select content from paragraphs_metadatas where path=? and page=? and content is not null", (path, page))
+        return [content for (content,) in cursor]
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return []
+
+
 def list() -> List[ParagraphMetadata]:
     """lista paragrafos com metadados"""
     try:
@@ -83,6 +107,16 @@ def list() -> List[ParagraphMetadata]:
         return []
 
 
+def contents() -> Iterator[str]:
+    """percorre o conteúdo de todos os paragrafos, sem montar os metadados"""
+    try:
+        conn = sqlitedb.client()
+        for (content,) in conn.execute("select content from paragraphs_metadatas where content is not null"):
+            yield content
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+
+
 def query(term: str = "", results: int = 10) -> List[ParagraphMetadata]:
     """consulta um termo na lista de paragrafos com metadados"""
     try:
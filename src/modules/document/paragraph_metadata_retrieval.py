@@ -6,11 +6,20 @@ import traceback
 from typing import List
 
 from src.modules.document.paragraph_metadata import ParagraphMetadata
+from src.modules.document import paragraph_metadata_repository as ParagraphRepository
+from src.modules.document import change_index as ChangeIndex
+from src.modules.document import service as DocService
 from src.modules.database import chromadbvector
+from src.modules.nlp import tfidf as Tfidf
+from src.models import ollama as Ollama
 from src.models.ollama import ModelOllama
 
 COLLECTION = "paragraphs"
 
+# coleção dos vetores gerados pelo Ollama, versionada pelo endpoint: os vetores normalizados do
+# `/api/embed` não são comparáveis com os da antiga coleção `paragraphs` (`/api/embeddings`)
+EMBEDDINGS_COLLECTION = f"{COLLECTION}_{Ollama.EMBEDDING_ENDPOINT}"
+
 #################################################################
 # TABLE PARAGRAPHS EMBEDDINGS
 #################################################################
@@ -48,7 +57,7 @@ def save_with_embedings(metadata: ParagraphMetadata) -> bool:
         embeddings = model.make(chunks)
         paragraph_dict = metadata.data_retrieval()
         ids = [str(uuid.uuid4()) for _ in chunks]
-        collection = chromadbvector.collection(COLLECTION)
+        collection = chromadbvector.collection(EMBEDDINGS_COLLECTION)
         collection.add(embeddings=embeddings, documents=chunks, metadatas=paragraph_dict, ids=ids)
         return True
     except Exception as e:
@@ -61,7 +70,7 @@ def query_with_embeddings(consult: str = "", results: int = 5) -> List[Paragraph
     try:
         model = ModelOllama()
         embeddings = model.embed(consult)
-        collection = chromadbvector.collection(COLLECTION)
+        collection = chromadbvector.collection(EMBEDDINGS_COLLECTION)
         result = collection.query(
             query_embeddings=[embeddings], n_results=results)
         return retrieval_to_paragraphs(result)
@@ -70,6 +79,79 @@ def query_with_embeddings(consult: str = "", results: int = 5) -> List[Paragraph
         return []
 
 
+def delete_by_page(path: str = "", page: int = 0) -> bool:
+    """ remove das collections os paragrafos de uma página. """
+    try:
+        for name in (COLLECTION, EMBEDDINGS_COLLECTION):
+            collection = chromadbvector.collection(name)
+            collection.delete(where={"$and": [{"path": path}, {"page": page}]})
+        return True
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return False
+
+
+def index(path: str = "") -> int:
+    """
+    Indexa os parágrafos de um documento de forma incremental.
+    Consulta o índice de mudanças e só reextrai, regrava e reembute os parágrafos das páginas
+    novas ou modificadas; os parágrafos das páginas alteradas ou removidas são apagados antes.
+    Os parágrafos novos também atualizam o IDF do modelo TF-IDF do corpus (`Tfidf.update`), do qual
+    os parágrafos apagados são descontados.
+
+    Se a indexação parar no meio, o que já foi apagado ou gravado entra no IDF mesmo assim, e o
+    documento não é registrado no índice de mudanças: a próxima execução apaga e desconta os
+    parágrafos gravados pela metade antes de regravá-los.
+
+    Args:
+        path (str): Caminho do documento.
+
+    Returns:
+        int: Quantidade de parágrafos indexados (0 se nada mudou ou em caso de erro).
+    """
+    try:
+        if not ChangeIndex.file_changed(path, ChangeIndex.PIPELINE_PARAGRAPHS):
+            return 0
+
+        parsed = DocService.document_parse(path)
+        if parsed is None:
+            return 0
+
+        contents = [(num, parsed.page_content(i)) for i, (num, _, _) in enumerate(parsed.page_spans)]
+        hashes = ChangeIndex.page_hashes(contents)
+        changed = set(ChangeIndex.changed_pages(path, ChangeIndex.PIPELINE_PARAGRAPHS, hashes, removed=True))
+
+        removed, indexed = [], []
+        try:
+            for page in sorted(changed):
+                previous = ParagraphRepository.contents_by_page(parsed.path, page)
+                if not ParagraphRepository.delete_by_page(parsed.path, page):
+                    raise ValueError(f"Não foi possível apagar os parágrafos da página {page} de {parsed.path}.")
+                removed.extend(previous)
+                if not delete_by_page(parsed.path, page):
+                    raise ValueError(f"Não foi possível apagar os embeddings da página {page} de {parsed.path}.")
+
+            for paragraph in parsed.paragraphs():
+                if paragraph.page not in changed:
+                    continue
+                if not ParagraphRepository.save(paragraph):
+                    raise ValueError(f"Não foi possível salvar um parágrafo da página {paragraph.page} de {parsed.path}.")
+                # gravado no SQLite, o parágrafo será descontado do IDF na próxima remoção da página
+                indexed.append(paragraph.content)
+                if not save_with_embedings(paragraph):
+                    raise ValueError(f"Não foi possível salvar os embeddings da página {paragraph.page} de {parsed.path}.")
+        finally:
+            # atualiza o IDF do corpus com os parágrafos novos e sem os apagados, sem reconstruir o modelo
+            if indexed or removed:
+                Tfidf.update(indexed, removed)
+
+        ChangeIndex.commit(path, ChangeIndex.PIPELINE_PARAGRAPHS, hashes, replace=True)
+        return len(indexed)
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return 0
+
+
 def retrieval_to_paragraphs(retrieval) -> List[ParagraphMetadata]:
     """ transforma uma resultados do banco numa metadata. """  # noqa: E501
 
@@ -0,0 +1,330 @@
+# flake8: noqa: E501
+"""
+Parsed Document Module
+Este módulo contém o modelo `ParsedDocument`, que guarda o texto de um documento lido uma única vez
+num buffer contínuo e materializa, sob demanda, as visões de páginas, parágrafos, frases, linhas e chunks.
+
+Todas as visões compartilham os mesmos intervalos (início, fim) no buffer: os parágrafos são localizados
+uma vez por página e reaproveitados pelas páginas, pelos parágrafos, pelas frases e pelas linhas,
+de modo que pedir todas as granularidades de um documento custa uma única leitura.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import uuid
+
+from src.modules.document.paragraph_metadata import ParagraphMetadata
+from src.modules.document.phrase_metadata import PharseMetadata
+from src.modules.document.page_metadata import PageMetadata
+from src.modules.document import text_layer as TextLayer
+from src.utils import string as String
+
+# separador de páginas dentro do buffer (também é uma quebra de parágrafo)
+PAGE_SEPARATOR = "\n\x0c\n"
+
+
+class ParsedDocument:
+    def __init__(self, path: str = "", name: str = "", size: int = 0, pages: int = 0, mimetype: str = "", contents: Optional[List[Tuple[int, str]]] = None, sources: Optional[Dict[int, str]] = None, items: Optional[Dict[int, List[str]]] = None):
+        """
+        Inicializa o documento a partir do texto já extraído de cada página.
+
+        Parâmetros:
+            path (str): Caminho do arquivo.
+            name (str): Nome do arquivo.
+            size (int): Tamanho do arquivo em bytes.
+            pages (int): Total de páginas do arquivo.
+            mimetype (str): Extensão do arquivo.
+            contents (Optional[List[Tuple[int, str]]]): Pares (número da página, texto da página) lidos do arquivo. Padrão é None (nenhuma página).
+            sources (Optional[Dict[int, str]]): Origem do texto de cada página ('text' ou 'ocr'), da triagem de `text_layer`.
+            items (Optional[Dict[int, List[str]]]): Textos de todos os itens de cada página, inclusive os títulos, na ordem do documento (leitura pelo Docling).
+        """
+        self.path: str = path
+        self.name: str = name
+        self.size: int = size
+        self.total: int = pages
+        self.mimetype: str = mimetype
+        self.sources: Dict[int, str] = sources or {}
+        self.items: Dict[int, List[str]] = items or {}
+
+        # buffer único com o texto de todas as páginas e o intervalo de cada página nele
+        self.text: str = ""
+        self.page_spans: List[Tuple[int, int, int]] = []
+
+        parts: List[str] = []
+        cursor = 0
+        for num, content in contents or []:
+            content = content or ""
+            if parts:
+                parts.append(PAGE_SEPARATOR)
+                cursor += len(PAGE_SEPARATOR)
+            parts.append(content)
+            self.page_spans.append((num, cursor, cursor + len(content)))
+            cursor += len(content)
+        self.text = "".join(parts)
+
+        # intervalos dos parágrafos como (índice da página, início, fim)
+        self._paragraph_spans: Optional[List[Tuple[int, int, int]]] = None
+        self._paragraph_content: Dict[int, str] = {}
+        self._paragraph_lines: Dict[int, List[str]] = {}
+        self._paragraph_chunks: Dict[int, List[str]] = {}
+        # linhas já limpas, compartilhadas por todas as páginas (cabeçalhos e rodapés se repetem)
+        self._clean_memo: Dict[str, str] = {}
+
+        self._pages: Optional[List[PageMetadata]] = None
+        self._paragraphs: Optional[List[ParagraphMetadata]] = None
+        self._phrases: Optional[List[PharseMetadata]] = None
+        self._lines: Optional[List[dict]] = None
+
+    @classmethod
+    def from_info(cls, info: object, contents: List[Tuple[int, str]], sources: Optional[Dict[int, str]] = None, items: Optional[Dict[int, List[str]]] = None) -> "ParsedDocument":
+        """
+        Cria o documento a partir de um `DocumentInfo` e do texto das páginas.
+
+        Parâmetros:
+            info (DocumentInfo): Informações do arquivo.
+            contents (List[Tuple[int, str]]): Pares (número da página, texto da página).
+            sources (Optional[Dict[int, str]]): Origem do texto de cada página.
+            items (Optional[Dict[int, List[str]]]): Textos de todos os itens de cada página, inclusive os títulos.
+
+        Retorna:
+            ParsedDocument: O documento criado.
+        """
+        return cls(
+            path=info.path,
+            name=info.name,
+            size=info.size,
+            pages=info.pages,
+            mimetype=getattr(info, 'mimetype', "pdf") or "pdf",
+            contents=contents,
+            sources=sources,
+            items=items,
+        )
+
+    def page_source(self, num: int) -> str:
+        """retorna a origem do texto de uma página pelo número da página ('text' se não houve triagem)"""
+        return self.sources.get(num, TextLayer.SOURCE_TEXT)
+
+    def page_content(self, index: int) -> str:
+        """retorna o texto de uma página pelo índice da página no documento"""
+        _, start, end = self.page_spans[index]
+        return self.text[start:end]
+
+    def content(self) -> str:
+        """
+        Monta o texto de todo o documento numa variável só, no formato de `document_content`.
+        Com os itens do Docling, são os textos de todos os itens (inclusive os títulos) separados por quebras de linha;
+        sem eles, o texto de cada página aparado e terminado por uma quebra de linha, como no leitor de PDF.
+        """
+        if self.items:
+            return "\n".join(text for num, _, _ in self.page_spans for text in self.items.get(num, []))
+        return "".join(self.page_content(index).strip() + "\n" for index in range(len(self.page_spans)))
+
+    def paragraph_spans(self) -> List[Tuple[int, int, int]]:
+        """localiza (uma única vez) os parágrafos de todas as páginas no buffer"""
+        if self._paragraph_spans is None:
+            spans = []
+            for index, (_, start, end) in enumerate(self.page_spans):
+                for span in String.split_to_pargraphs_spans(self.text, start, end):
+                    spans.append((index, *span))
+            self._paragraph_spans = spans
+        return self._paragraph_spans
+
+    def paragraph_content(self, index: int) -> str:
+        """materializa o texto de um parágrafo"""
+        content = self._paragraph_content.get(index)
+        if content is None:
+            _, start, end = self.paragraph_spans()[index]
+            content = String.pargraph_from_span(self.text, (start, end))
+            self._paragraph_content[index] = content
+        return content
+
+    def paragraph_lines(self, index: int) -> List[str]:
+        """quebra um parágrafo em linhas limpas, removendo linhas vazias"""
+        lines = self._paragraph_lines.get(index)
+        if lines is None:
+            lines = [line for line in String.split_to_lines(self.paragraph_content(index)) if line]
+            lines = String.clean_lines_many(lines, self._clean_memo)
+            self._paragraph_lines[index] = lines
+        return lines
+
+    def paragraph_chunks(self, index: int) -> List[str]:
+        """quebra um parágrafo em pedaços de 2000 caracteres"""
+        chunks = self._paragraph_chunks.get(index)
+        if chunks is None:
+            chunks = String.split_to_chunks(self.paragraph_content(index), 2000)
+            self._paragraph_chunks[index] = chunks
+        return chunks
+
+    def _page_paragraphs(self) -> List[List[int]]:
+        """agrupa os índices dos parágrafos por página"""
+        groups: List[List[int]] = [[] for _ in self.page_spans]
+        for index, (page_index, _, _) in enumerate(self.paragraph_spans()):
+            groups[page_index].append(index)
+        return groups
+
+    def pages(self) -> List[PageMetadata]:
+        """
+        Materializa a visão de páginas com parágrafos, frases, linhas e chunks.
+
+        Retorna:
+            List[PageMetadata]: Lista de páginas do documento.
+        """
+        if self._pages is not None:
+            return self._pages
+
+        pages: List[PageMetadata] = []
+        for page_index, indexes in enumerate(self._page_paragraphs()):
+            num = self.page_spans[page_index][0]
+            content = self.page_content(page_index)
+
+            page = PageMetadata()
+
+            page.uuid = str(uuid.uuid4())
+            page.path = self.path
+            page.page = num
+            page.name = self.name
+            page.source = f"{page.name}, pg. {page.page}"
+            page.letters = len(content)
+            page.content = content
+            page.extraction = self.page_source(num)
+
+            page.size = self.size
+            page.distance = 0
+            page.mimetype = self.mimetype
+            page.pages = self.total
+
+            page.paragraph = [self.paragraph_content(i) for i in indexes]
+            page.paragraphs = len(page.paragraph)
+            page.generate_phrases()
+            page.generate_lines(self._clean_memo)
+
+            # os chunks da página são os chunks dos seus parágrafos
+            page.chunk = [chunk for i in indexes for chunk in self.paragraph_chunks(i)]
+            page.chunks = len(page.chunk)
+
+            pages.append(page)
+
+        self._pages = pages
+        return pages
+
+    def paragraphs(self) -> List[ParagraphMetadata]:
+        """
+        Materializa a visão de parágrafos com frases, linhas e chunks.
+
+        Retorna:
+            List[ParagraphMetadata]: Lista de parágrafos do documento.
+        """
+        if self._paragraphs is not None:
+            return self._paragraphs
+
+        paragraphs: List[ParagraphMetadata] = []
+        for index, (page_index, _, _) in enumerate(self.paragraph_spans()):
+            num = self.page_spans[page_index][0]
+            content = self.paragraph_content(index)
+
+            paragraph = ParagraphMetadata()
+
+            paragraph.uuid = str(uuid.uuid4())
+            paragraph.path = self.path
+            paragraph.page = num
+            paragraph.name = self.name
+            paragraph.source = f"{self.name}, pg. {num}"
+            paragraph.letters = len(content)
+            paragraph.content = content
+
+            paragraph.distance = 0
+            paragraph.mimetype = self.mimetype
+            paragraph.size = self.size
+
+            paragraph.generate_phrases()
+            paragraph.line = self.paragraph_lines(index)
+            paragraph.lines = len(paragraph.line)
+            paragraph.chunk = self.paragraph_chunks(index)
+            paragraph.chunks = len(paragraph.chunk)
+
+            paragraphs.append(paragraph)
+
+        self._paragraphs = paragraphs
+        return paragraphs
+
+    def phrases(self) -> List[PharseMetadata]:
+        """
+        Materializa a visão de frases (uma por parágrafo) com linhas e chunks.
+
+        Retorna:
+            List[PharseMetadata]: Lista de frases do documento.
+        """
+        if self._phrases is not None:
+            return self._phrases
+
+        phrases: List[PharseMetadata] = []
+        for index, (page_index, _, _) in enumerate(self.paragraph_spans()):
+            num = self.page_spans[page_index][0]
+            content = self.paragraph_content(index)
+
+            phrase = PharseMetadata()
+
+            phrase.uuid = str(uuid.uuid4())
+            phrase.path = self.path
+            phrase.page = num
+            phrase.name = self.name
+            phrase.source = f"{self.name}, pg. {num}"
+            phrase.letters = len(content)
+            phrase.content = content
+
+            phrase.distance = 0
+            phrase.mimetype = self.mimetype
+            phrase.size = self.size
+
+            phrase.line = self.paragraph_lines(index)
+            phrase.lines = len(phrase.line)
+            phrase.chunk = self.paragraph_chunks(index)
+            phrase.chunks = len(phrase.chunk)
+
+            phrases.append(phrase)
+
+        self._phrases = phrases
+        return phrases
+
+    def lines(self) -> List[dict]:
+        """
+        Materializa a visão de linhas, cada uma com os seus chunks.
+
+        Retorna:
+            List[dict]: Lista de dicionários com os detalhes de cada linha.
+        """
+        if self._lines is not None:
+            return self._lines
+
+        lines: List[dict] = []
+        for index, (page_index, _, _) in enumerate(self.paragraph_spans()):
+            num = self.page_spans[page_index][0]
+            lns = self.paragraph_lines(index)
+            for i, content in enumerate(lns):
+                chunks = String.split_to_chunks(content)
+                lines.append({
+                    'path': self.path,
+                    'page': num,
+                    'content': content,
+                    'name': self.name,
+                    'letters': len(content),
+                    'uuid': str(uuid.uuid4()),
+                    'source': f"{self.name}, pg. {num}, ln {i+1}",
+                    'num': i+1,
+                    'chunk': chunks,
+                    'lines': len(lns),
+                    'chunks': len(chunks),
+                    'size': self.size,
+                    'mimetype': self.mimetype,
+                })
+
+        self._lines = lines
+        return lines
+
+    def chunks(self) -> List[str]:
+        """
+        Materializa a visão de chunks de todo o documento, na ordem dos parágrafos.
+
+        Retorna:
+            List[str]: Lista de chunks do documento.
+        """
+        return [chunk for index in range(len(self.paragraph_spans())) for chunk in self.paragraph_chunks(index)]
@@ -1,7 +1,7 @@
 # flake8: noqa: E501
 
 from dataclasses import dataclass, asdict, astuple
-from typing import List
+from typing import Dict, List, Optional
 
 from src.utils import string as String
 
@@ -53,17 +53,10 @@ class PharseMetadata:
     def to_tuple(self):
         return astuple(self)
     
-    def generate_lines(self) -> List[str]:
-        """quebra o conteúdo em linhas removendo linhas vazias"""
-        lines_clean: List[str] = []
-        lines = String.split_to_lines(self.content)
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            lines_clean.append(String.clean_lines(line))
-        self.line = lines_clean
+    def generate_lines(self, memo: Optional[Dict[str, str]] = None) -> List[str]:
+        """quebra o conteúdo em linhas removendo linhas vazias (`memo` reaproveita linhas já limpas)"""
+        lines = [line for line in String.split_to_lines(self.content) if line]
+        self.line = String.clean_lines_many(lines, memo)
         self.lines = len(self.line)
         return self.line
     
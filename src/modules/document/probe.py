@@ -0,0 +1,123 @@
+# flake8: noqa: E501
+"""
+Document Probe Module
+Sonda leve de metadados de documentos: lê apenas o trailer e a árvore de páginas do PDF
+(sem OCR, sem análise de layout) para obter o número de páginas, o tamanho e o tipo do arquivo
+em milissegundos.
+
+Funções:
+    - page_count(path: str) -> int: Conta as páginas de um PDF pela árvore de páginas.
+    - probe(path: str) -> dict: Retorna path, name, size, mtime, pages e mimetype de um arquivo.
+"""
+
+from typing import Optional
+import traceback
+import logging
+import re
+import os
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+try:
+    from PyPDF2 import PdfReader
+except ImportError:
+    PdfReader = None
+
+# objetos de página (/Type /Page, sem casar com /Type /Pages)
+_PAGE_OBJECT = re.compile(rb'/Type\s*/Page(?![A-Za-z])')
+# dicionário de linearização (/N é o número de páginas), no início de PDFs otimizados para a web
+_LINEARIZED = re.compile(rb'/Linearized\s[^>]*?/N\s+(\d+)', re.DOTALL)
+# contador da raiz da árvore de páginas
+_PAGES_COUNT = re.compile(rb'/Type\s*/Pages\b[^>]*?/Count\s+(\d+)|/Count\s+(\d+)[^>]*?/Type\s*/Pages\b', re.DOTALL)
+
+
+def _count_pdfium(path: str) -> Optional[int]:
+    """conta as páginas com o pdfium (apenas o trailer e a árvore de páginas são lidos)"""
+    if pdfium is None:
+        return None
+    pdf = pdfium.PdfDocument(path)
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
+
+
+def _count_pypdf(path: str) -> Optional[int]:
+    """conta as páginas com o PyPDF2, que lê o /Count da raiz da árvore de páginas"""
+    if PdfReader is None:
+        return None
+    with open(path, 'rb') as file:
+        return len(PdfReader(file, strict=False).pages)
+
+
+def _count_raw(path: str) -> Optional[int]:
+    """conta as páginas varrendo os bytes do arquivo, para PDFs sem streams de objetos"""
+    with open(path, 'rb') as file:
+        data = file.read()
+
+    linearized = _LINEARIZED.search(data, 0, 4096)
+    if linearized:
+        return int(linearized.group(1))
+
+    counts = [int(a or b) for a, b in _PAGES_COUNT.findall(data)]
+    if counts:
+        return max(counts)
+
+    pages = len(_PAGE_OBJECT.findall(data))
+    return pages or None
+
+
+def page_count(path: str) -> int:
+    """
+    Conta as páginas de um PDF lendo apenas a estrutura do arquivo, sem converter o conteúdo.
+    Tenta o pdfium, o PyPDF2 e, por fim, uma varredura dos bytes do arquivo.
+
+    Args:
+        path (str): Caminho do arquivo PDF.
+
+    Returns:
+        int: Número de páginas (1 se não for possível determinar).
+    """
+    for counter in (_count_pdfium, _count_pypdf, _count_raw):
+        try:
+            pages = counter(path)
+            if pages:
+                return int(pages)
+        except Exception as e:
+            logging.warning(f"{counter.__name__}: {e}")
+    return 1
+
+
+def probe(path: str) -> Optional[dict]:
+    """
+    Extrai os metadados básicos de um arquivo sem convertê-lo.
+
+    Args:
+        path (str): Caminho do arquivo.
+
+    Returns:
+        Optional[dict]: path, name, size, mtime, pages e mimetype do arquivo, ou None em caso de erro.
+    """
+    try:
+        path = os.path.normpath(path)
+        stat = os.stat(path)
+
+        _, ext = os.path.splitext(path)
+        mimetype = ext.replace(".", "")
+
+        pages = page_count(path) if mimetype.lower() == "pdf" else 1
+
+        return {
+            'path': path,
+            'name': os.path.basename(path),
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'pages': pages,
+            'mimetype': mimetype,
+        }
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return None
@@ -5,9 +5,12 @@ Este módulo contém funções para ler documentos PDF e extrair texto puro das
 Funções:
     - reader(path: str = "") -> pdfplumber.PDF: Faz a leitura de um documento PDF e retorna o objeto PDF.
     - reader_pages(path: str = "", init: int = 1, final: int = 0) -> List[str]: Faz a leitura de um trecho de um arquivo PDF e retorna as páginas em texto puro.
+    - iter_pages(path: str = "", init: int = 1, final: int = -1) -> Iterator[Tuple[int, str]]: Lê as páginas uma a uma, liberando cada página após a extração.
+    - iter_pages_parallel(path: str = "", init: int = 1, final: int = -1, workers: int = 0, chunk_size: int = 16) -> Iterator[Tuple[int, str]]: Extrai as páginas em paralelo num pool de processos, mantendo a ordem.
 """
 
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Tuple
 import traceback
 import logging
 import csv
@@ -59,13 +62,15 @@ def reader(path: str = "") -> pdfplumber.PDF:
         return None
 
 
-def reader_pages(path: str = "", init: int = 1, final: int = -1) -> List[str]:
+def reader_pages(path: str = "", init: int = 1, final: int = -1, workers: int = 1, chunk_size: int = 16) -> List[str]:
     """
     Faz a leitura de um trecho de um arquivo PDF e retorna as páginas em texto puro.
     Parâmetros:
         path (str): Caminho para o arquivo PDF.
         init (int): Número da página inicial (1-indexado). Padrão é 1.
         final (int): Número da página final (1-indexado). Padrão é -1, que indica a última página do PDF.
+        workers (int): Quantidade de processos de extração. 1 extrai no processo atual; 0 usa todos os núcleos. Padrão é 1.
+        chunk_size (int): Quantidade de páginas por tarefa no modo paralelo. Padrão é 16.
     Retorna:
         List[str]: Lista de strings contendo o texto das páginas especificadas.
     Exceções:
@@ -75,42 +80,157 @@ def reader_pages(path: str = "", init: int = 1, final: int = -1) -> List[str]:
         if not Archive.exists(path):
             raise ValueError("O path está inválido.")
 
-        pdf = reader(path)
-        if pdf is None:
-            raise ValueError("Não foi possível ler o arquivo pdf.")
+        if workers != 1:
+            return [content for _, content in iter_pages_parallel(path, init, final, workers, chunk_size)]
 
-        init, final = page_limit_mechanics(init, final, len(pdf.pages))
         # Carrega apenas as páginas especificadas na memória
-        pages = []
-        for num in range(init - 1, final):
-            page = pdf.pages[num].extract_text()
-            pages.append(page)
-
-        return pages
+        return [content for _, content in iter_pages(path, init, final)]
     except Exception as e:
         logging.error(f"{e}\n{traceback.format_exc()}")
         return []
 
 
+def release_page(page: object) -> None:
+    """
+    Libera os objetos em cache de uma página do pdfplumber (caracteres, layout e mapa de texto).
+    Args:
+        page (pdfplumber.page.Page): A página já processada.
+    """
+    if hasattr(page, 'close'):
+        page.close()
+    elif hasattr(page, 'flush_cache'):
+        page.flush_cache()
+
+
+def iter_pages(path: str = "", init: int = 1, final: int = -1) -> Iterator[Tuple[int, str]]:
+    """
+    Lê as páginas de um arquivo PDF uma a uma, liberando os objetos de cada página após a extração do texto.
+    Dessa forma o consumo de memória permanece constante mesmo em documentos com milhares de páginas.
+    Args:
+        path (str): Caminho para o arquivo PDF.
+        init (int): Número da página inicial (1-indexado). Padrão é 1.
+        final (int): Número da página final (1-indexado). Padrão é -1, que indica a última página do PDF.
+    Yields:
+        Tuple[int, str]: O número da página (1-indexado) e o seu texto.
+    Raises:
+        ValueError: Se não for possível ler o arquivo PDF.
+    """
+    pdf = reader(path)
+    if pdf is None:
+        raise ValueError("Não foi possível ler o arquivo pdf.")
+
+    try:
+        init, final = page_limit_mechanics(init, final, len(pdf.pages))
+        for num in range(init - 1, final):
+            page = pdf.pages[num]
+            try:
+                content = page.extract_text() or ""
+            finally:
+                release_page(page)
+            yield num + 1, content
+    finally:
+        pdf.close()
+
+
+def extract_range(path: str, init: int, final: int) -> List[str]:
+    """
+    Extrai o texto de um intervalo de páginas com um handle próprio do arquivo PDF.
+    É a unidade de trabalho do modo paralelo: cada processo abre, extrai e fecha o seu handle.
+    Args:
+        path (str): Caminho para o arquivo PDF.
+        init (int): Número da página inicial (1-indexado).
+        final (int): Número da página final (1-indexado, inclusivo).
+    Returns:
+        List[str]: O texto de cada página do intervalo, na ordem.
+    """
+    pdf = reader(path)
+    if pdf is None:
+        raise ValueError("Não foi possível ler o arquivo pdf.")
+
+    try:
+        contents = []
+        for num in range(init - 1, final):
+            page = pdf.pages[num]
+            try:
+                contents.append(page.extract_text() or "")
+            finally:
+                release_page(page)
+        return contents
+    finally:
+        pdf.close()
+
+
+def page_ranges(init: int, final: int, chunk_size: int = 16) -> List[Tuple[int, int]]:
+    """
+    Divide um intervalo de páginas em fatias de no máximo `chunk_size` páginas.
+    Args:
+        init (int): Número da página inicial (1-indexado).
+        final (int): Número da página final (1-indexado, inclusivo).
+        chunk_size (int): Quantidade máxima de páginas por fatia. Padrão é 16.
+    Returns:
+        List[Tuple[int, int]]: Lista de intervalos (início, fim) inclusivos.
+    """
+    chunk_size = max(1, chunk_size)
+    return [(start, min(start + chunk_size - 1, final)) for start in range(init, final + 1, chunk_size)]
+
+
+def iter_pages_parallel(path: str = "", init: int = 1, final: int = -1, workers: int = 0, chunk_size: int = 16) -> Iterator[Tuple[int, str]]:
+    """
+    Extrai as páginas de um arquivo PDF em paralelo, distribuindo fatias de páginas num `ProcessPoolExecutor`.
+    A extração de texto é limitada por CPU e as páginas são independentes; os resultados são entregues
+    na ordem original das páginas, à medida que as fatias terminam.
+    Args:
+        path (str): Caminho para o arquivo PDF.
+        init (int): Número da página inicial (1-indexado). Padrão é 1.
+        final (int): Número da página final (1-indexado). Padrão é -1, que indica a última página do PDF.
+        workers (int): Quantidade de processos. 0 usa todos os núcleos disponíveis. Padrão é 0.
+        chunk_size (int): Quantidade de páginas por tarefa. Padrão é 16.
+    Yields:
+        Tuple[int, str]: O número da página (1-indexado) e o seu texto.
+    Raises:
+        ValueError: Se não for possível ler o arquivo PDF.
+    """
+    pdf = reader(path)
+    if pdf is None:
+        raise ValueError("Não foi possível ler o arquivo pdf.")
+
+    try:
+        init, final = page_limit_mechanics(init, final, len(pdf.pages))
+    finally:
+        pdf.close()
+
+    ranges = page_ranges(init, final, chunk_size)
+    workers = min(workers or os.cpu_count() or 1, len(ranges))
+
+    # um único processo não compensa o custo de iniciar o pool
+    if workers <= 1:
+        yield from iter_pages(path, init, final)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        starts = [start for start, _ in ranges]
+        results = executor.map(extract_range, [path] * len(ranges), starts, [end for _, end in ranges])
+        for start, contents in zip(starts, results):
+            for offset, content in enumerate(contents):
+                yield start + offset, content
+
+
 def reader_content(path: str, init: int = 1, final: int = -1) -> str:
     """
     Lê um arquivo PDF e extrai o texto de suas páginas numa variável só.
     Args:
         path (str): O caminho para o arquivo PDF.
-        max_pages (int, opcional): O número máximo de páginas a serem lidas. 
+        init (int): Página inicial (1-indexado). Padrão é 1.
+        final (int): Página final (1-indexado). Padrão é -1 (última página).
     Returns:
         str: O conteúdo extraído do PDF como uma string. 
     """
-    pdf = reader(path)
-    if pdf is None:
+    try:
+        return "".join(content.strip() + "\n" for _, content in iter_pages(path, init, final))
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
         return ""
 
-    content = ""
-    init, final = page_limit_mechanics(init, final, len(pdf.pages))
-    for num in range(init - 1, final):
-        content += pdf.pages[num].extract_text().strip() + "\n"
-    return content
-
 
 def writer_dictionaries_to_csv(path: str, dictionaries: List[dict], mode: str = 'w') -> bool:
     try:
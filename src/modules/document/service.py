@@ -1,30 +1,26 @@
 # flake8: noqa: E501
 
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 import traceback
 import logging
-import uuid
 import os
 
+# o módulo sempre importa; `DoclingReader.DOCLING_AVAILABLE` indica se o Docling está instalado
+from src.modules.document import docling_reader as DoclingReader
+from src.modules.document.docling_reader import read_csv_to_dictionaries, writer_dictionaries_to_csv
+
 try:
-    # Tentar importar Docling primeiro
-    from src.modules.document import docling_reader as DoclingReader
-    from src.modules.document.docling_reader import read_csv_to_dictionaries, writer_dictionaries_to_csv
-    DOCLING_AVAILABLE = True
-except ImportError:
     # Fallback para PDF se Docling não estiver disponível
-    DOCLING_AVAILABLE = False
-    try:
-        import pdfplumber
-        from src.modules.document.reader import page_limit_mechanics, read_csv_to_dictionaries, reader as PDFReader, reader_content, writer_dictionaries_to_csv
-    except ImportError:
-        # Handle missing PDF dependencies too
-        pdfplumber = None
-        page_limit_mechanics = None
-        read_csv_to_dictionaries = None
-        PDFReader = None
-        reader_content = None
-        writer_dictionaries_to_csv = None
+    import pdfplumber
+    from src.modules.document.reader import page_limit_mechanics, reader as PDFReader, reader_content, iter_pages as iter_pdf_pages, iter_pages_parallel as iter_pdf_pages_parallel
+except ImportError:
+    # Handle missing PDF dependencies too
+    pdfplumber = None
+    page_limit_mechanics = None
+    PDFReader = None
+    reader_content = None
+    iter_pdf_pages = None
+    iter_pdf_pages_parallel = None
 
 try:
     from fpdf import FPDF
@@ -34,10 +30,11 @@ except ImportError:
 from src.modules.document import document_info_repository as DocInfoRepository
 from src.modules.document.paragraph_metadata import ParagraphMetadata
 from src.modules.document.phrase_metadata import PharseMetadata
+from src.modules.document.parsed_document import ParsedDocument
 from src.modules.document.page_metadata import PageMetadata
 from src.modules.document.document_info import DocumentInfo
+from src.modules.document import text_layer as TextLayer
 from src.utils import archive as Archive
-from src.utils import string as String
 
 
 def is_file(path: str):
@@ -82,6 +79,9 @@ def dir(path: str = "") -> List[str]:
 def info(path: str) -> Optional[DocumentInfo]:
     """
     Extraí informações de um arquivo.
+    As informações já registradas em documents_info são reaproveitadas enquanto o tamanho e a
+    data de modificação do arquivo não mudarem; caso contrário, são extraídas novamente e
+    registradas (o registro desatualizado é corrigido e um arquivo novo passa a ter registro).
 
     Args:
         path (str): O caminho para o arquivo.
@@ -94,14 +94,34 @@ def info(path: str) -> Optional[DocumentInfo]:
         Gera um log de erro se ocorrer uma exceção durante a extração das informações do documento.
     """
     try:
+        cached = DocInfoRepository.show_by_path(path) if Archive.exists(path) else None
+        if cached is not None:
+            stat = os.stat(path)
+            if cached.mtime == stat.st_mtime and cached.size == stat.st_size:
+                return cached
+
         doc = DocumentInfo()
-        doc.extract(path)
+        if doc.extract(path) is not None:
+            DocInfoRepository.upsert(doc)
         return doc
     except Exception as e:
         logging.error(f"{e}\n{traceback.format_exc()}")
         return None
 
 
+def info_exists(path: str) -> bool:
+    """
+    Verifica se as informações de um documento já estão registradas.
+
+    Args:
+        path (str): O caminho para o arquivo.
+
+    Returns:
+        bool: True se o documento já tiver registro em documents_info, False caso contrário.
+    """
+    return DocInfoRepository.has_path(path)
+
+
 def info_save(document: DocumentInfo):
     """
     Salva as informações de um documento.
@@ -154,7 +174,7 @@ def document_reader(path: str = ""):
     Returns:
         O resultado da função reader aplicada ao caminho fornecido.
     """
-    if DOCLING_AVAILABLE:
+    if DoclingReader.DOCLING_AVAILABLE:
         return DoclingReader.reader(path)
     elif PDFReader is not None:
         # Fallback para PDF
@@ -164,17 +184,21 @@ def document_reader(path: str = ""):
         return None
 
 
-def document_content(path: str, init: int = 1, final: int = -1) -> str:
+def document_content(path: str, init: int = 1, final: int = -1, parsed: Optional[ParsedDocument] = None) -> str:
     """
     Lê um arquivo e extrai o texto de suas páginas numa variável só.
     Args:
         path (str): O caminho para o arquivo.
         init (int): Página inicial. Padrão é 1.
         final (int): Página final. Padrão é -1 (última página).
+        parsed (Optional[ParsedDocument]): Documento já lido por `document_parse`; o conteúdo é montado das suas páginas, sem uma nova leitura.
     Returns:
         str: O conteúdo extraído do documento como uma string. 
     """
-    if DOCLING_AVAILABLE:
+    if parsed is not None:
+        # o mesmo formato de `reader_content`, do Docling (com os títulos) ou do PDF
+        return parsed.content()
+    elif DoclingReader.DOCLING_AVAILABLE:
         return DoclingReader.reader_content(path, init, final)
     elif reader_content is not None:
         # Fallback para PDF
@@ -184,15 +208,108 @@ def document_content(path: str, init: int = 1, final: int = -1) -> str:
         return ""
 
 
-def document_pages_with_details(path: str = "", init: int = 1, final: int = 0) -> List[PageMetadata]:
+def iter_contents(path: str = "", init: int = 1, final: int = 0, workers: int = 1, chunk_size: int = 16) -> Iterator[Tuple[int, str]]:
     """
-    Lê as páginas de um arquivo e extrai os metadados usando Docling ou PDF como fallback.
+    Percorre o texto das páginas de um arquivo uma a uma, usando Docling ou PDF como fallback.
     Args:
         path (str): Caminho para o arquivo.
         init (int): Número da página inicial (1-indexado). Padrão é 1.
         final (int): Número da página final (1-indexado). Padrão é 0, que indica a última página.
+        workers (int): Processos de extração no fallback PDF. 1 extrai no processo atual; 0 usa todos os núcleos. Padrão é 1.
+        chunk_size (int): Páginas por tarefa no modo paralelo. Padrão é 16.
+    Yields:
+        Tuple[int, str]: O número da página (1-indexado) e o seu texto.
+    Raises:
+        ValueError: Se o caminho for inválido ou nenhuma biblioteca de leitura estiver disponível.
+    """
+    if not Archive.exists(path):
+        raise ValueError("O path está inválido.")
+
+    # 0 é a última página, como -1 nos leitores (em `page_limit_mechanics`, 0 lê só a página inicial)
+    if final == 0:
+        final = -1
+
+    if DoclingReader.DOCLING_AVAILABLE:
+        yield from DoclingReader.iter_pages(path, init, final)
+    elif PDFReader is not None and workers != 1:
+        yield from iter_pdf_pages_parallel(path, init, final, workers, chunk_size)
+    elif PDFReader is not None:
+        yield from iter_pdf_pages(path, init, final)
+    else:
+        raise ValueError("Nenhuma biblioteca de processamento de documentos disponível.")
+
+
+def page_sources(path: str = "") -> dict:
+    """
+    Retorna a origem do texto de cada página ('text' ou 'ocr') conforme a triagem da camada de texto.
+    Sem o Docling não há OCR, e todas as páginas são lidas da camada de texto.
+    Args:
+        path (str): Caminho para o arquivo.
     Returns:
-        List[PageMetadata]: Lista de objetos PageMetadata contendo os metadados das páginas lidas.
+        dict: Origem do texto por número de página.
+    """
+    if not DoclingReader.DOCLING_AVAILABLE:
+        return {}
+    return TextLayer.triage(path)
+
+
+def iter_pages(path: str = "", init: int = 1, final: int = 0) -> Iterator[PageMetadata]:
+    """
+    Entrega as páginas de um arquivo uma a uma, com parágrafos, frases, linhas e chunks.
+    Diferente de `document_pages_with_details`, apenas uma página fica em memória por vez,
+    o que mantém o consumo constante em documentos muito grandes.
+    Args:
+        path (str): Caminho para o arquivo.
+        init (int): Número da página inicial (1-indexado). Padrão é 1.
+        final (int): Número da página final (1-indexado). Padrão é 0, que indica a última página.
+    Yields:
+        PageMetadata: Os metadados de cada página lida.
+    """
+    try:
+        inf = info(path)
+        if inf is None:
+            return
+
+        sources = page_sources(path)
+        for num, content in iter_contents(path, init, final):
+            yield ParsedDocument.from_info(inf, [(num, content)], sources).pages()[0]
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+
+
+def iter_paragraphs(path: str = "", init: int = 1, final: int = 0) -> Iterator[ParagraphMetadata]:
+    """
+    Entrega os parágrafos de um arquivo um a um, lendo uma página por vez.
+    Args:
+        path (str): Caminho para o arquivo.
+        init (int): Número da página inicial (1-indexado). Padrão é 1.
+        final (int): Número da página final (1-indexado). Padrão é 0, que indica a última página.
+    Yields:
+        ParagraphMetadata: Os metadados de cada parágrafo lido.
+    """
+    try:
+        inf = info(path)
+        if inf is None:
+            return
+
+        for num, content in iter_contents(path, init, final):
+            yield from ParsedDocument.from_info(inf, [(num, content)]).paragraphs()
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+
+
+def document_parse(path: str = "", init: int = 1, final: int = 0, workers: int = 1, chunk_size: int = 16) -> Optional[ParsedDocument]:
+    """
+    Lê as páginas de um arquivo uma única vez usando Docling ou PDF como fallback.
+    O resultado é um `ParsedDocument`, do qual páginas, parágrafos, frases, linhas e chunks são projeções baratas.
+    Args:
+        path (str): Caminho para o arquivo.
+        init (int): Número da página inicial (1-indexado). Padrão é 1.
+        final (int): Número da página final (1-indexado). Padrão é 0, que indica a última página.
+        workers (int): Processos de extração no fallback PDF. 1 extrai no processo atual; 0 usa todos os núcleos. Padrão é 1.
+        chunk_size (int): Páginas por tarefa no modo paralelo. Padrão é 16.
+    Returns:
+        Optional[ParsedDocument]: O documento lido, ou None se ocorrer um erro.
     """
     try:
         if not Archive.exists(path):
@@ -200,177 +317,87 @@ def document_pages_with_details(path: str = "", init: int = 1, final: int = 0) -
 
         inf = info(path)
         if inf is None:
-            return []
+            return None
+
+        if not DoclingReader.DOCLING_AVAILABLE:
+            contents = list(iter_contents(path, init, final, workers, chunk_size))
+            return ParsedDocument.from_info(inf, contents, page_sources(path))
+
+        # os títulos ficam fora das páginas, mas entram no conteúdo do documento (`ParsedDocument.content`)
+        contents, items = [], {}
+        for num, page in DoclingReader.iter_page_items(path, init, final or -1):
+            contents.append((num, DoclingReader.page_text(page)))
+            items[num] = [item.text for item in page]
+        return ParsedDocument.from_info(inf, contents, page_sources(path), items)
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return None
 
-        if DOCLING_AVAILABLE:
-            # Usar Docling para análise avançada
-            result = DoclingReader.reader(path)
-            if result is None:
-                raise ValueError("Não foi possível ler o arquivo.")
-
-            doc = result.document
-            structured_content = DoclingReader.extract_structured_content(path)
-            
-            # Organizar conteúdo por página
-            pages_content = {}
-            for text_item in structured_content.get('texts', []):
-                page_num = text_item.get('page', 1) or 1
-                if page_num not in pages_content:
-                    pages_content[page_num] = []
-                pages_content[page_num].append(text_item['text'])
-
-            total = max(pages_content.keys()) if pages_content else inf.pages
-            
-        elif PDFReader is not None:
-            # Fallback para PDF
-            pdf = PDFReader(path)
-            if pdf is None:
-                raise ValueError("Não foi possível ler o arquivo pdf.")
-            total = inf.pages
-        else:
-            # Nenhuma biblioteca disponível
-            logging.error("Nenhuma biblioteca de processamento de documentos disponível.")
-            return []
 
-        if DOCLING_AVAILABLE:
-            init, final = DoclingReader.page_limit_mechanics(init, final, total)
-        elif page_limit_mechanics is not None:
-            init, final = page_limit_mechanics(init, final, total)
-        else:
-            init = max(1, init)
-            final = max(init, final if final > 0 else total)
-
-        # Carrega apenas as páginas especificadas na memória
-        pages: List[PageMetadata] = []
-        for num in range(init - 1, final):
-            page_num = num + 1
-            
-            if DOCLING_AVAILABLE and page_num in pages_content:
-                content = "\n".join(pages_content[page_num])
-            elif not DOCLING_AVAILABLE and PDFReader is not None and 'pdf' in locals():
-                page_raw = pdf.pages[num]
-                content = page_raw.extract_text()
-            else:
-                content = ""
-
-            page = PageMetadata()
-
-            page.uuid = str(uuid.uuid4())
-            page.path = path
-            page.page = page_num
-            page.name = inf.name
-            page.source = f"{page.name}, pg. {page.page}"
-            page.letters = len(content)
-            page.content = content
-
-            page.size = inf.size
-            page.distance = 0
-            page.mimetype = inf.mimetype if hasattr(inf, 'mimetype') else "pdf"
-            page.pages = inf.pages
-
-            page.generate_paragraphs()
-            page.generate_phrases()
-            page.generate_lines()
-            page.generate_chunks()
-
-            pages.append(page)
-
-        if not DOCLING_AVAILABLE and PDFReader is not None and 'pdf' in locals():
-            pdf.close()
-            
-        return pages
+def document_pages_with_details(path: str = "", init: int = 1, final: int = 0, parsed: Optional[ParsedDocument] = None) -> List[PageMetadata]:
+    """
+    Lê as páginas de um arquivo e extrai os metadados usando Docling ou PDF como fallback.
+    Args:
+        path (str): Caminho para o arquivo.
+        init (int): Número da página inicial (1-indexado). Padrão é 1.
+        final (int): Número da página final (1-indexado). Padrão é 0, que indica a última página.
+        parsed (Optional[ParsedDocument]): Documento já lido por `document_parse`, para evitar uma nova leitura.
+    Returns:
+        List[PageMetadata]: Lista de objetos PageMetadata contendo os metadados das páginas lidas.
+    """
+    try:
+        parsed = parsed or document_parse(path, init, final)
+        if parsed is None:
+            return []
+        return parsed.pages()
     except Exception as e:
         logging.error(f"{e}\n{traceback.format_exc()}")
         return []
 
 
-def document_paragraphs_with_details(path: str = "", init: int = 1, final: int = 0) -> List[ParagraphMetadata]:
+def document_paragraphs_with_details(path: str = "", init: int = 1, final: int = 0, parsed: Optional[ParsedDocument] = None) -> List[ParagraphMetadata]:
     """
     Extrai os parágrafos com os detalhes do documento usando Docling ou PDF.
     Args:
         path (str): Caminho para o arquivo do documento. Padrão é uma string vazia.
         init (int): Número da página inicial para leitura. Padrão é 1.
         final (int): Número da página final para leitura. Padrão é 0, que indica leitura até o final do documento.
+        parsed (Optional[ParsedDocument]): Documento já lido por `document_parse`, para evitar uma nova leitura.
     Returns:
         List[ParagraphMetadata]: Lista de objetos ParagraphMetadata contendo os detalhes dos parágrafos extraídos.
     """
     try:
-
-        pages = document_pages_with_details(path, init, final)
-
-        paragraphs: List[ParagraphMetadata] = []
-        for page in pages:
-            for i, content in enumerate(page.paragraph):
-
-                paragraph = ParagraphMetadata()
-
-                paragraph.uuid = str(uuid.uuid4())
-                paragraph.path = page.path
-                paragraph.page = page.page
-                paragraph.name = page.name
-                paragraph.source = page.source
-                paragraph.letters = len(content)
-                paragraph.content = content
-
-                paragraph.distance = 0
-                paragraph.mimetype = page.mimetype
-                paragraph.size = page.size
-
-                paragraph.generate_phrases()
-                paragraph.generate_lines()
-                paragraph.generate_chunks()
-
-                paragraphs.append(paragraph)
-
-        return paragraphs
+        parsed = parsed or document_parse(path, init, final)
+        if parsed is None:
+            return []
+        return parsed.paragraphs()
     except Exception as e:
         logging.error(f"{e}\n{traceback.format_exc()}")
         return []
 
 
-def document_phrases_with_details(path: str = "", init: int = 1, final: int = 0) -> List[PharseMetadata]:
+def document_phrases_with_details(path: str = "", init: int = 1, final: int = 0, parsed: Optional[ParsedDocument] = None) -> List[PharseMetadata]:
     """
     Extrai as frases com os detalhes dos documentos usando Docling ou PDF.
     Args:
         path (str): O caminho para o arquivo de entrada. Padrão é uma string vazia.
         init (int): O número inicial da página para leitura. Padrão é 1.
         final (int): O número final da página para leitura. Padrão é 0, que indica leitura até o final.
+        parsed (Optional[ParsedDocument]): Documento já lido por `document_parse`, para evitar uma nova leitura.
     Returns:
         List[PharseMetadata]: Uma lista de objetos PharseMetadata contendo os detalhes das frases extraídas.
     """
     try:
-
-        paragraphs = document_paragraphs_with_details(path, init, final)
-
-        phrases: List[PharseMetadata] = []
-        for paragraph in paragraphs:
-
-            phrase = PharseMetadata()
-
-            phrase.uuid = str(uuid.uuid4())
-            phrase.path = paragraph.path
-            phrase.page = paragraph.page
-            phrase.name = paragraph.name
-            phrase.source = paragraph.source
-            phrase.letters = len(paragraph.content)
-            phrase.content = paragraph.content
-
-            phrase.distance = 0
-            phrase.mimetype = paragraph.mimetype
-            phrase.size = paragraph.size
-
-            phrase.generate_lines()
-            phrase.generate_chunks()
-
-            phrases.append(phrase)
-
-        return phrases
+        parsed = parsed or document_parse(path, init, final)
+        if parsed is None:
+            return []
+        return parsed.phrases()
     except Exception as e:
         logging.error(f"{e}\n{traceback.format_exc()}")
         return []
 
 
-def read_lines_with_details(path: str = "", init: int = 1, final: int = 0) -> List[object]:
+def read_lines_with_details(path: str = "", init: int = 1, final: int = 0, parsed: Optional[ParsedDocument] = None) -> List[object]:
     """
     Lê linhas de um documento com detalhes adicionais.
 
@@ -378,34 +405,16 @@ def read_lines_with_details(path: str = "", init: int = 1, final: int = 0) -> Li
         path (str): Caminho para o arquivo do documento. Padrão é uma string vazia.
         init (int): Número da linha inicial para leitura. Padrão é 1.
         final (int): Número da linha final para leitura. Padrão é 0, que indica leitura até o final do documento.
+        parsed (Optional[ParsedDocument]): Documento já lido por `document_parse`, para evitar uma nova leitura.
 
     Returns:
         List[object]: Uma lista de dicionários, onde cada dicionário contém detalhes sobre uma linha do documento.
     """
     try:
-        paragraphs = document_paragraphs_with_details(path, init, final)
-        lines = []
-        for paragraph in paragraphs:
-            lns = paragraph.line
-            for i, content in enumerate(lns):
-                chunks = String.split_to_chunks(content)
-                line = {
-                    'path': paragraph.path,
-                    'page': paragraph.page,
-                    'content': content,
-                    'name': paragraph.name,
-                    'letters': len(content),
-                    'uuid': str(uuid.uuid4()),
-                    'source': f"{paragraph.name}, pg. {paragraph.page}, ln {i+1}",
-                    'num': i+1,
-                    'chunk': chunks,
-                    'lines': len(lns),
-                    'chunks': len(chunks),
-                    'size': paragraph.size,
-                    'mimetype': paragraph.mimetype,
-                }
-                lines.append(line)
-        return lines
+        parsed = parsed or document_parse(path, init, final)
+        if parsed is None:
+            return []
+        return parsed.lines()
     except Exception as e:
         logging.error(f"{e}\n{traceback.format_exc()}")
         return []
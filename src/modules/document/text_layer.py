@@ -0,0 +1,286 @@
+# flake8: noqa: E501
+"""
+Text Layer Module
+Triagem por página da camada de texto de um PDF, para enviar ao OCR apenas as páginas digitalizadas.
+
+A maior parte da legislação é gerada digitalmente e já traz o texto embutido; o OCR nessas páginas
+só custa tempo. Para cada página são medidas a densidade de caracteres (por polegada quadrada) e a
+cobertura de glifos (fração dos caracteres com Unicode válido, sem `(cid:N)`, U+FFFD ou área privada);
+páginas com imagens e sem texto legível suficiente são marcadas para OCR.
+
+Funções:
+    - classify(text: str, area: float, images: int) -> str: Decide a origem do texto de uma página.
+    - triage(path: str) -> Dict[int, str]: Classifica todas as páginas de um PDF (memorizado por arquivo e persistido pelo hash do conteúdo).
+    - ocr_pages(sources: Dict[int, str]) -> List[int]: Lista as páginas que precisam de OCR.
+    - subset(path: str, pages: List[int], target: str) -> bool: Grava um PDF só com as páginas indicadas.
+    - record(sources: Dict[int, str]): Contabiliza as páginas de uma conversão por cada caminho.
+    - add(text_pages: int, ocr_pages: int): Soma páginas contabilizadas em outro processo (workers do pool).
+    - stats() -> dict: Contadores de páginas lidas pela camada de texto e por OCR.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import unicodedata
+import traceback
+import threading
+import logging
+import json
+import re
+import os
+
+try:
+    import pypdfium2 as pdfium
+    import pypdfium2.raw as pdfium_c
+except ImportError:
+    pdfium = None
+    pdfium_c = None
+
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None
+
+from src.modules.document import docling_cache as DoclingCache
+
+SOURCE_TEXT = "text"    # texto lido da camada de texto do PDF
+SOURCE_OCR = "ocr"      # página digitalizada, texto reconhecido por OCR
+
+min_density = 0.5       # caracteres legíveis por polegada quadrada (≈ 50 numa página A4)
+min_coverage = 0.9      # fração mínima de glifos com Unicode válido
+
+# diretório onde as triagens são persistidas, pelo hash do conteúdo do arquivo
+directory = './data/.cache/triage'
+
+_CID = re.compile(r'\(cid:\d+\)')
+_POINTS_PER_SQUARE_INCH = 72.0 * 72.0
+
+_lock = threading.Lock()
+_counters: Dict[str, int] = {SOURCE_TEXT: 0, SOURCE_OCR: 0}
+_triages: Dict[str, Tuple[tuple, Dict[int, str]]] = {}
+
+
+def _glyphs(text: str) -> Tuple[int, int]:
+    """retorna (glifos legíveis, glifos sem mapeamento para Unicode) de um texto"""
+    unmapped = len(_CID.findall(text))
+    good = 0
+    for char in _CID.sub("", text):
+        if char.isspace():
+            continue
+        if char == "�" or unicodedata.category(char) in ("Co", "Cc", "Cn"):
+            unmapped += 1
+        else:
+            good += 1
+    return good, unmapped
+
+
+def classify(text: str, area: float, images: int) -> str:
+    """
+    Decide se o texto de uma página vem da camada de texto ou precisa de OCR.
+
+    Args:
+        text (str): Texto embutido na página.
+        area (float): Área da página em pontos quadrados.
+        images (int): Quantidade de imagens na página.
+
+    Returns:
+        str: SOURCE_OCR se a página é uma imagem sem texto legível suficiente, SOURCE_TEXT caso contrário.
+    """
+    # sem imagens não há o que reconhecer (página em branco ou só vetores)
+    if images == 0:
+        return SOURCE_TEXT
+
+    good, unmapped = _glyphs(text or "")
+    total = good + unmapped
+    density = good / max(area / _POINTS_PER_SQUARE_INCH, 1.0)
+    coverage = good / total if total else 0.0
+
+    if density >= min_density and coverage >= min_coverage:
+        return SOURCE_TEXT
+    return SOURCE_OCR
+
+
+def _triage_pdfium(path: str) -> Optional[Dict[int, str]]:
+    """classifica as páginas com o pdfium, que lê a camada de texto sem análise de layout"""
+    if pdfium is None:
+        return None
+
+    sources = {}
+    pdf = pdfium.PdfDocument(path)
+    try:
+        for index in range(len(pdf)):
+            page = pdf[index]
+            try:
+                width, height = page.get_size()
+                textpage = page.get_textpage()
+                text = textpage.get_text_range()
+                textpage.close()
+                images = sum(1 for _ in page.get_objects(filter=(pdfium_c.FPDF_PAGEOBJ_IMAGE,)))
+                sources[index + 1] = classify(text, width * height, images)
+            finally:
+                page.close()
+    finally:
+        pdf.close()
+    return sources
+
+
+def _triage_pdfplumber(path: str) -> Optional[Dict[int, str]]:
+    """classifica as páginas com o pdfplumber, liberando cada página depois de lida"""
+    if pdfplumber is None:
+        return None
+
+    sources = {}
+    with pdfplumber.open(path) as pdf:
+        for index, page in enumerate(pdf.pages):
+            try:
+                text = "".join(char.get('text', "") for char in page.chars)
+                sources[index + 1] = classify(text, float(page.width * page.height), len(page.images))
+            finally:
+                page.close()
+    return sources
+
+
+def _load(digest: str) -> Optional[Dict[int, str]]:
+    """lê a triagem persistida de um arquivo pelo hash do seu conteúdo"""
+    entry = os.path.join(directory, f"{digest}.json")
+    try:
+        if not os.path.exists(entry):
+            return None
+
+        with open(entry, 'r', encoding='utf-8') as file:
+            return {int(num): source for num, source in json.load(file).items()}
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return None
+
+
+def _save(digest: str, sources: Dict[int, str]) -> bool:
+    """persiste, de forma atômica, a triagem de um arquivo"""
+    try:
+        os.makedirs(directory, exist_ok=True)
+        entry = os.path.join(directory, f"{digest}.json")
+        tmp = f"{entry}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        with open(tmp, 'w', encoding='utf-8') as file:
+            json.dump(sources, file, separators=(',', ':'))
+
+        os.replace(tmp, entry)
+        return True
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return False
+
+
+def triage(path: str) -> Dict[int, str]:
+    """
+    Classifica cada página de um PDF pela sua camada de texto.
+    O resultado é memorizado por (path, mtime, size) e persistido em `directory` pelo hash do conteúdo,
+    de modo que a leitura de um arquivo já triado (ou já convertido, com a conversão no cache) não percorre as páginas de novo.
+
+    Args:
+        path (str): Caminho do arquivo PDF.
+
+    Returns:
+        Dict[int, str]: Origem do texto (SOURCE_TEXT ou SOURCE_OCR) por número de página (1-indexado),
+        ou um dicionário vazio se não for possível ler o arquivo.
+    """
+    try:
+        path = os.path.normpath(path)
+        if not path.lower().endswith(".pdf"):
+            return {}
+
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with _lock:
+            cached = _triages.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        digest = DoclingCache.file_hash(path)
+        sources = _load(digest)
+        if sources is None:
+            for reader in (_triage_pdfium, _triage_pdfplumber):
+                sources = reader(path)
+                if sources is not None:
+                    _save(digest, sources)
+                    break
+        if sources is None:
+            return {}
+
+        with _lock:
+            _triages[path] = (signature, sources)
+        return sources
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return {}
+
+
+def ocr_pages(sources: Dict[int, str]) -> List[int]:
+    """lista, em ordem, as páginas classificadas para OCR"""
+    return sorted(num for num, source in sources.items() if source == SOURCE_OCR)
+
+
+def subset(path: str, pages: List[int], target: str) -> bool:
+    """
+    Grava um PDF contendo apenas as páginas indicadas, na ordem dada.
+
+    Args:
+        path (str): Caminho do PDF de origem.
+        pages (List[int]): Números das páginas (1-indexados).
+        target (str): Caminho do PDF a gravar.
+
+    Returns:
+        bool: True se o arquivo foi gravado, False caso contrário.
+    """
+    if pdfium is None:
+        return False
+
+    try:
+        source = pdfium.PdfDocument(path)
+        document = pdfium.PdfDocument.new()
+        try:
+            document.import_pages(source, [num - 1 for num in pages])
+            document.save(target)
+            return True
+        finally:
+            document.close()
+            source.close()
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return False
+
+
+def record(sources: Dict[int, str]):
+    """contabiliza as páginas de uma conversão lidas pela camada de texto e por OCR (uma vez por conversão)"""
+    with _lock:
+        for source in sources.values():
+            _counters[source] = _counters.get(source, 0) + 1
+
+
+def add(text_pages: int = 0, ocr_pages: int = 0):
+    """soma aos contadores as páginas contabilizadas em outro processo (por exemplo, num worker do pool)"""
+    with _lock:
+        _counters[SOURCE_TEXT] = _counters.get(SOURCE_TEXT, 0) + text_pages
+        _counters[SOURCE_OCR] = _counters.get(SOURCE_OCR, 0) + ocr_pages
+
+
+def stats() -> dict:
+    """
+    Retorna os contadores de páginas por origem do texto.
+
+    Returns:
+        dict: Páginas lidas pela camada de texto, por OCR, e a fração de páginas que dispensaram o OCR.
+    """
+    with _lock:
+        text, ocr = _counters.get(SOURCE_TEXT, 0), _counters.get(SOURCE_OCR, 0)
+    total = text + ocr
+    return {
+        'text_pages': text,
+        'ocr_pages': ocr,
+        'skipped_ocr_ratio': round(text / total, 4) if total else 0.0,
+    }
+
+
+def reset():
+    """zera os contadores"""
+    with _lock:
+        for source in _counters:
+            _counters[source] = 0
@@ -1,24 +1,49 @@
 # flake8: noqa: E501
+"""
+Bag of Words Module
+Bag of words (BoW) dos textos jurídicos.
 
-from sklearn.feature_extraction.text import CountVectorizer
+`generate_bow` e `relevant_words` são o caminho rápido para um texto só (consultas curtas e
+gravações avulsas): contam os tokens com um `Counter`, sem construir objetos do sklearn.
+Para lotes, `BagOfWords` transforma uma lista de textos numa matriz esparsa (CSR) numa única chamada,
+com os termos mais frequentes por linha. O vocabulário de uma instância é fixo em `transform` e só
+cresce com `fit`/`fit_transform` explícitos; o vocabulário do corpus, persistido e compartilhado pelo
+processo, é o do modelo TF-IDF (`tfidf.shared`), construído por `tfidf.build`.
+
+Os tokens seguem o padrão do `CountVectorizer` (palavras com 2 ou mais caracteres, em minúsculas),
+depois da remoção das stopwords.
+
+Funções:
+    - analyze(content: str) -> List[str]: Extrai os tokens de um texto.
+    - generate_bow(content: str) -> dict: Frequência de cada palavra de um texto.
+    - relevant_words(content: str, cut: int = 3) -> str: Palavras com frequência >= cut.
+    - relevant_words_many(contents: List[str], cut: int = 3) -> List[str]: `relevant_words` em lote.
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+import threading
+import json
+import os
+import re
+
+import numpy as np
+from scipy import sparse
 
 from src.utils import string as Str
 
-def generate_bow(content: str = "")-> dict:
-    """Gerar Bag of Words"""
-    
-    processed_content = Str.removal_stopwords(content)
-    vectorizer = CountVectorizer()
-    bow = vectorizer.fit_transform([processed_content])
-    
-    freq = [item for b in bow.toarray() for item in b]
-    words = [item for item in vectorizer.get_feature_names_out()]
-    
-    vocabulary: dict = {}
-    for word, weight in zip(words, freq):
-        vocabulary[word] = weight
-    
-    return vocabulary
+# mesmo padrão de tokens do CountVectorizer
+_TOKENS = re.compile(r"(?u)\b\w\w+\b")
+
+
+def analyze(content: str = "") -> List[str]:
+    """remove as stopwords e extrai os tokens em minúsculas"""
+    return _TOKENS.findall(Str.removal_stopwords(content).lower())
+
+
+def generate_bow(content: str = "") -> dict:
+    """Gerar Bag of Words (frequência de cada palavra, em ordem alfabética)"""
+    return dict(sorted(Counter(analyze(content)).items()))
 
 
 def relevant_words(content: str = "", cut: int = 3) -> str:
@@ -39,4 +64,135 @@ def relevant_words(content: str = "", cut: int = 3) -> str:
         if(freq >= cut):
             main_words.append(word)
             
-    return ' '.join(main_words)
\ No newline at end of file
+    return ' '.join(main_words)
+
+
+class BagOfWords:
+    def __init__(self, terms: Optional[List[str]] = None):
+        """
+        Inicializa o vocabulário.
+
+        Parâmetros:
+            terms (Optional[List[str]]): Termos já conhecidos, na ordem das colunas da matriz. Padrão é None.
+        """
+        self.terms: List[str] = []
+        self.vocabulary: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.update_terms(terms or [])
+
+    def update_terms(self, terms: Iterable[str]) -> int:
+        """acrescenta termos novos ao fim do vocabulário (as colunas existentes não mudam) e retorna quantos entraram"""
+        added = 0
+        with self._lock:
+            for term in terms:
+                if term not in self.vocabulary:
+                    self.vocabulary[term] = len(self.terms)
+                    self.terms.append(term)
+                    added += 1
+        return added
+
+    def fit(self, texts: Iterable[str]) -> "BagOfWords":
+        """
+        Ajusta (ou amplia) o vocabulário com os termos de uma lista de textos.
+
+        Parâmetros:
+            texts (Iterable[str]): Os textos.
+
+        Retorna:
+            BagOfWords: A própria instância.
+        """
+        for text in texts:
+            self.update_terms(analyze(text))
+        return self
+
+    def transform(self, texts: List[str], grow: bool = False) -> sparse.csr_matrix:
+        """
+        Transforma uma lista de textos numa matriz esparsa de frequências numa única chamada.
+
+        Parâmetros:
+            texts (List[str]): Os textos, um por linha da matriz.
+            grow (bool): Se deve acrescentar ao vocabulário os termos desconhecidos. Padrão é False (são ignorados).
+
+        Retorna:
+            sparse.csr_matrix: Matriz (textos x termos) com a frequência de cada termo.
+        """
+        indptr = [0]
+        indices: List[int] = []
+        data: List[int] = []
+
+        for text in texts:
+            counts = Counter(analyze(text))
+            if grow:
+                self.update_terms(counts)
+            for term, count in counts.items():
+                index = self.vocabulary.get(term)
+                if index is not None:
+                    indices.append(index)
+                    data.append(count)
+            indptr.append(len(indices))
+
+        return sparse.csr_matrix(
+            (np.asarray(data, dtype=np.int32), np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+            shape=(len(texts), len(self.terms)),
+        )
+
+    def fit_transform(self, texts: List[str]) -> sparse.csr_matrix:
+        """amplia o vocabulário e transforma os textos numa única passada"""
+        return self.transform(texts, grow=True)
+
+    def top_terms(self, matrix: sparse.csr_matrix, k: int = 0, cut: int = 1) -> List[Dict[str, int]]:
+        """
+        Retorna os termos mais frequentes de cada linha da matriz.
+
+        Parâmetros:
+            matrix (sparse.csr_matrix): Matriz de `transform`.
+            k (int): Máximo de termos por linha, do mais para o menos frequente. 0 retorna todos. Padrão é 0.
+            cut (int): Frequência mínima dos termos. Padrão é 1.
+
+        Retorna:
+            List[Dict[str, int]]: Para cada linha, os termos e as suas frequências.
+        """
+        rows = []
+        for row in range(matrix.shape[0]):
+            start, end = matrix.indptr[row], matrix.indptr[row + 1]
+            counts = matrix.data[start:end]
+            columns = matrix.indices[start:end]
+
+            selected = np.flatnonzero(counts >= cut)
+            order = selected[np.argsort(-counts[selected], kind='stable')]
+            if k:
+                order = order[:k]
+            rows.append({self.terms[columns[i]]: int(counts[i]) for i in order})
+        return rows
+
+    def save(self, path: str) -> bool:
+        """grava os termos do vocabulário em JSON"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.terms, file, ensure_ascii=False)
+        return True
+
+    @classmethod
+    def load(cls, path: str) -> "BagOfWords":
+        """carrega o vocabulário gravado por `save` (vazio se o arquivo não existir)"""
+        if not os.path.exists(path):
+            return cls()
+        with open(path, encoding="utf-8") as file:
+            return cls(json.load(file))
+
+
+def relevant_words_many(contents: List[str], cut: int = 3) -> List[str]:
+    """
+    Versão em lote de `relevant_words`: os textos são transformados numa única matriz esparsa
+    sobre um vocabulário do próprio lote.
+
+    Args:
+        contents (List[str]): Conteúdos de origem.
+        cut (int): corte inferior da frequência das palavras selecionadas.
+
+    Returns:
+        List[str]: Para cada conteúdo, as palavras relevantes separadas por espaço, em ordem alfabética.
+    """
+    bow = BagOfWords()
+    matrix = bow.fit_transform(contents)
+    return [' '.join(sorted(terms)) for terms in bow.top_terms(matrix, cut=cut)]
@@ -0,0 +1,181 @@
+# flake8: noqa: E501
+"""
+Co-occurrence Module
+Matriz de co-ocorrência esparsa indexada pelo vocabulário.
+
+Cada par de tokens a uma distância d (1 <= d <= janela) dentro do mesmo grupo (n-grama de contexto
+ou documento) recebe o peso 1/d nos dois sentidos; quanto menor a distância, maior o peso. Os pares
+são gerados com NumPy, um deslocamento d por vez sobre o fluxo inteiro de tokens, e acumulados numa
+matriz CSR (os pares repetidos são somados na conversão de COO para CSR).
+
+O vocabulário é um `BagOfWords`, com colunas estáveis, o que permite somar matrizes de documentos
+diferentes com `merge` e consultar os vizinhos mais fortes de um termo com `neighbors`.
+
+Classes:
+    - CooccurrenceMatrix: Acumula co-ocorrências de janelas, fluxos de tokens e outras matrizes.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from src.modules.nlp.bow import BagOfWords
+
+
+class CooccurrenceMatrix:
+    def __init__(self):
+        """
+        Inicializa uma matriz de co-ocorrência vazia.
+        """
+        self.bow = BagOfWords()
+        self.matrix = sparse.csr_matrix((0, 0), dtype=np.float64)
+
+    @property
+    def terms(self) -> List[str]:
+        """termos do vocabulário, na ordem das linhas e colunas"""
+        return self.bow.terms
+
+    def _ids(self, tokens: List[str]) -> np.ndarray:
+        """índices dos tokens no vocabulário, acrescentando os termos novos"""
+        self.bow.update_terms(tokens)
+        vocabulary = self.bow.vocabulary
+        return np.fromiter((vocabulary[token] for token in tokens), dtype=np.int64, count=len(tokens))
+
+    def _accumulate(self, ids: np.ndarray, groups: np.ndarray, distance: int):
+        """soma 1/d para cada par de tokens a distância d <= `distance` dentro do mesmo grupo"""
+        rows, cols, data = [], [], []
+        for d in range(1, min(distance, len(ids) - 1) + 1):
+            same = groups[:-d] == groups[d:]
+            left, right = ids[:-d][same], ids[d:][same]
+            weight = np.full(len(left), 1.0 / d)
+            rows += [left, right]
+            cols += [right, left]
+            data += [weight, weight]
+
+        self._add(
+            np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64),
+            np.concatenate(cols) if cols else np.zeros(0, dtype=np.int64),
+            np.concatenate(data) if data else np.zeros(0, dtype=np.float64),
+        )
+
+    def _add(self, rows: np.ndarray, cols: np.ndarray, data: np.ndarray):
+        """soma triplas (linha, coluna, peso) à matriz, estendendo-a ao tamanho do vocabulário"""
+        size = len(self.bow.terms)
+        if self.matrix.shape != (size, size):
+            self.matrix.resize((size, size))
+        if len(data):
+            self.matrix = self.matrix + sparse.coo_matrix((data, (rows, cols)), shape=(size, size)).tocsr()
+
+    def add_windows(self, windows: Iterable[List[str]]) -> "CooccurrenceMatrix":
+        """
+        Acumula as co-ocorrências de janelas de contexto (n-gramas): todos os pares de cada janela, sem cruzar janelas.
+
+        Parâmetros:
+            windows (Iterable[List[str]]): As janelas de tokens.
+
+        Retorna:
+            CooccurrenceMatrix: A própria instância.
+        """
+        windows = [list(window) for window in windows if len(window) > 1]
+        if not windows:
+            self._add(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0))
+            return self
+
+        lengths = np.fromiter((len(window) for window in windows), dtype=np.int64, count=len(windows))
+        ids = self._ids([token for window in windows for token in window])
+        groups = np.repeat(np.arange(len(windows)), lengths)
+        self._accumulate(ids, groups, int(lengths.max()) - 1)
+        return self
+
+    def add_tokens(self, tokens: List[str], window_size: int = 2) -> "CooccurrenceMatrix":
+        """
+        Acumula as co-ocorrências de um fluxo de tokens (um documento inteiro) com uma janela deslizante.
+
+        Parâmetros:
+            tokens (List[str]): Os tokens, em ordem.
+            window_size (int): Distância máxima entre dois tokens co-ocorrentes. Padrão é 2.
+
+        Retorna:
+            CooccurrenceMatrix: A própria instância.
+        """
+        return self.add_documents([tokens], window_size)
+
+    def add_documents(self, documents: Iterable[List[str]], window_size: int = 2) -> "CooccurrenceMatrix":
+        """
+        Versão em lote de `add_tokens`: os fluxos são concatenados e processados de uma vez, sem que a janela cruze documentos.
+
+        Parâmetros:
+            documents (Iterable[List[str]]): Os tokens de cada documento.
+            window_size (int): Distância máxima entre dois tokens co-ocorrentes. Padrão é 2.
+
+        Retorna:
+            CooccurrenceMatrix: A própria instância.
+        """
+        documents = [list(tokens) for tokens in documents]
+        lengths = np.fromiter((len(tokens) for tokens in documents), dtype=np.int64, count=len(documents))
+        ids = self._ids([token for tokens in documents for token in tokens])
+        groups = np.repeat(np.arange(len(documents)), lengths)
+        self._accumulate(ids, groups, window_size)
+        return self
+
+    def merge(self, other: "CooccurrenceMatrix") -> "CooccurrenceMatrix":
+        """
+        Soma à matriz as co-ocorrências de outra, alinhando os vocabulários.
+
+        Parâmetros:
+            other (CooccurrenceMatrix): A outra matriz (por exemplo, de outro documento).
+
+        Retorna:
+            CooccurrenceMatrix: A própria instância.
+        """
+        mapping = self._ids(list(other.terms))
+        coo = other.matrix.tocoo()
+        self._add(mapping[coo.row], mapping[coo.col], coo.data)
+        return self
+
+    def weight(self, term: str, neighbor: str) -> float:
+        """peso acumulado do par (0 se algum termo não estiver no vocabulário)"""
+        row, col = self.bow.vocabulary.get(term), self.bow.vocabulary.get(neighbor)
+        if row is None or col is None:
+            return 0.0
+        return float(self.matrix[row, col])
+
+    def neighbors(self, term: str, k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Retorna os `k` termos que mais co-ocorrem com um termo.
+
+        Parâmetros:
+            term (str): O termo.
+            k (int): Quantidade de vizinhos. Padrão é 10.
+
+        Retorna:
+            List[Tuple[str, float]]: Pares (vizinho, peso), do maior para o menor peso.
+        """
+        row = self.bow.vocabulary.get(term)
+        if row is None or k <= 0:
+            return []
+
+        start, end = self.matrix.indptr[row], self.matrix.indptr[row + 1]
+        columns, weights = self.matrix.indices[start:end], self.matrix.data[start:end]
+        if len(weights) > k:
+            top = np.argpartition(-weights, k - 1)[:k]
+            columns, weights = columns[top], weights[top]
+
+        order = np.argsort(-weights, kind='stable')
+        return [(self.terms[columns[i]], float(weights[i])) for i in order]
+
+    def dict(self) -> Dict[str, Dict[str, float]]:
+        """
+        Retorna a matriz como dicionário de dicionários (termo -> vizinho -> peso).
+
+        Returns:
+            Dict[str, Dict[str, float]]: Os pesos de cada par com co-ocorrência.
+        """
+        result = {}
+        for row in range(self.matrix.shape[0]):
+            start, end = self.matrix.indptr[row], self.matrix.indptr[row + 1]
+            if start == end:
+                continue
+            result[self.terms[row]] = {self.terms[col]: float(weight) for col, weight in zip(self.matrix.indices[start:end], self.matrix.data[start:end])}
+        return result
@@ -3,8 +3,9 @@
 import re
 import os
 import logging
+import threading
 import traceback
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, List, Optional, Tuple, Any
 from enum import Enum
 
 from sklearn.feature_extraction.text import TfidfVectorizer
@@ -314,44 +315,84 @@ class LegalDocumentClassifier:
         dump(pipeline, model_file)
 
     def _load_model(self, classification_type: ClassificationType) -> Optional[Pipeline]:
-        """Carrega um modelo salvo"""
+        """
+        Carrega um modelo salvo. Os arrays do modelo são mapeados em memória (somente leitura),
+        de modo que vários processos que carregam o mesmo arquivo compartilham as mesmas páginas
+        """
         try:
             model_file = os.path.join(self.model_path, f"{classification_type.value}.joblib")
             if os.path.exists(model_file):
-                return load(model_file)
+                return load(model_file, mmap_mode='r')
             return None
         except Exception as e:
             logging.error(f"Erro ao carregar modelo {classification_type.value}: {e}")
             return None
 
+    def _model(self, classification_type: ClassificationType) -> Optional[Pipeline]:
+        """Retorna o modelo em memória, carregando-o do disco no primeiro uso (nunca treina)"""
+        pipeline = self.models.get(classification_type.value)
+        if pipeline is None:
+            pipeline = self._load_model(classification_type)
+            if pipeline is not None:
+                self.models[classification_type.value] = pipeline
+        return pipeline
+
+    def preload(self, types: Optional[Iterable[ClassificationType]] = None, train: bool = True) -> Dict[str, bool]:
+        """
+        Carrega os modelos antes da primeira classificação, treinando (uma única vez) os que ainda não foram salvos.
+        Deve ser chamado na inicialização: `classify_text` e `classify_many` não treinam modelos.
+
+        Args:
+            types (Optional[Iterable[ClassificationType]]): Tipos a carregar. Padrão é None (todos).
+            train (bool): Se deve treinar os modelos sem arquivo salvo. Padrão é True.
+
+        Returns:
+            Dict[str, bool]: Para cada tipo, se o modelo está disponível.
+        """
+        availables = {}
+        for classification_type in (types or ClassificationType):
+            pipeline = self._model(classification_type)
+            if pipeline is None and train:
+                self.train_classifier(classification_type)
+                # recarrega do arquivo para usar a versão mapeada em memória
+                self.models.pop(classification_type.value, None)
+                pipeline = self._model(classification_type)
+            availables[classification_type.value] = pipeline is not None
+        return availables
+
+    def classify_many(self, texts: List[str], types: Optional[Iterable[ClassificationType]] = None) -> Dict[str, List[Optional[str]]]:
+        """
+        Classifica um lote de textos com uma única vetorização e predição por tipo de classificação.
+
+        Args:
+            texts (List[str]): Os textos.
+            types (Optional[Iterable[ClassificationType]]): Tipos de classificação. Padrão é None (todos).
+
+        Returns:
+            Dict[str, List[Optional[str]]]: Para cada tipo, a classe de cada texto (None se o modelo não estiver disponível).
+        """
+        results = {}
+        for classification_type in (types or ClassificationType):
+            results[classification_type.value] = [None] * len(texts)
+            if not texts:
+                continue
+
+            try:
+                pipeline = self._model(classification_type)
+                if pipeline is None:
+                    logging.warning(f"Modelo {classification_type.value} não disponível. Execute o preload (ou o treinamento) na inicialização.")
+                    continue
+
+                results[classification_type.value] = [str(label) for label in pipeline.predict(texts)]
+            except Exception as e:
+                logging.error(f"Erro na classificação {classification_type.value}: {e}")
+        return results
+
     def classify_text(self, text: str, classification_type: ClassificationType) -> Optional[str]:
         """
         Classifica um texto usando o tipo de classificação especificado
         """
-        try:
-            # Carregar modelo se não estiver em memória
-            if classification_type.value not in self.models:
-                pipeline = self._load_model(classification_type)
-                if pipeline is None:
-                    # Treinar modelo se não existir
-                    self.train_classifier(classification_type)
-                    pipeline = self.models.get(classification_type.value)
-                
-                if pipeline is not None:
-                    self.models[classification_type.value] = pipeline
-            
-            pipeline = self.models.get(classification_type.value)
-            if pipeline is None:
-                logging.warning(f"Modelo {classification_type.value} não disponível")
-                return None
-            
-            # Fazer predição
-            prediction = pipeline.predict([text])
-            return prediction[0] if prediction else None
-            
-        except Exception as e:
-            logging.error(f"Erro na classificação {classification_type.value}: {e}")
-            return None
+        return self.classify_many([text], [classification_type])[classification_type.value][0]
 
     def classify_subject(self, text: str) -> Optional[str]:
         """Classifica o assunto principal do texto"""
@@ -452,17 +493,19 @@ class LegalDocumentClassifier:
             
             # Analisar artigos individuais se disponível
             if paragraphs:
+                selecteds = [(i, paragraph.content) for i, paragraph in enumerate(paragraphs[:10])  # Limitar a 10 parágrafos
+                             if hasattr(paragraph, 'content') and paragraph.content]
+                classifieds = self.classify_many([content for _, content in selecteds], [ClassificationType.ARTICLE_TYPE, ClassificationType.LEGAL_INTENTION])
+
                 article_analyses = []
-                for i, paragraph in enumerate(paragraphs[:10]):  # Limitar a 10 parágrafos
-                    if hasattr(paragraph, 'content') and paragraph.content:
-                        para_content = paragraph.content
-                        article_analysis = {
-                            'paragraph_index': i,
-                            'article_type': self.classify_article_type(para_content),
-                            'legal_intention': self.classify_legal_intention(para_content),
-                            'content_preview': para_content[:100] + "..." if len(para_content) > 100 else para_content
-                        }
-                        article_analyses.append(article_analysis)
+                for j, (i, para_content) in enumerate(selecteds):
+                    article_analysis = {
+                        'paragraph_index': i,
+                        'article_type': classifieds[ClassificationType.ARTICLE_TYPE.value][j],
+                        'legal_intention': classifieds[ClassificationType.LEGAL_INTENTION.value][j],
+                        'content_preview': para_content[:100] + "..." if len(para_content) > 100 else para_content
+                    }
+                    article_analyses.append(article_analysis)
                 
                 results['article_analyses'] = article_analyses
             
@@ -491,10 +534,15 @@ class LegalDocumentClassifier:
 
 # Instância global do classificador
 _classifier_instance = None
+_classifier_lock = threading.Lock()
 
 def get_classifier() -> LegalDocumentClassifier:
-    """Retorna instância singleton do classificador"""
+    """Retorna instância singleton do classificador, com todos os modelos carregados (ou treinados) na criação"""
     global _classifier_instance
     if _classifier_instance is None:
-        _classifier_instance = LegalDocumentClassifier()
+        with _classifier_lock:
+            if _classifier_instance is None:
+                classifier = LegalDocumentClassifier()
+                classifier.preload()
+                _classifier_instance = classifier
     return _classifier_instance
\ No newline at end of file
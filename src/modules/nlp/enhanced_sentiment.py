@@ -5,9 +5,34 @@
 from textblob import TextBlob
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 from typing import Dict, List, Optional, Tuple
-import re
+import threading
 import nltk
 from collections import defaultdict
+import bisect
+
+from src.modules.nlp.keyword_matcher import Hit, compiled, whole_word
+
+
+_vader = None
+_vader_lock = threading.Lock()
+
+
+def classify(polarity: float) -> str:
+    """Classify a combined (TextBlob + VADER) polarity as Positive, Negative or Neutral"""
+    if polarity > 0.1:
+        return "Positive"
+    elif polarity < -0.1:
+        return "Negative"
+    return "Neutral"
+
+
+def shared_vader() -> SentimentIntensityAnalyzer:
+    """Return the process-wide VADER analyzer (its lexicon is loaded once per process)"""
+    global _vader
+    with _vader_lock:
+        if _vader is None:
+            _vader = SentimentIntensityAnalyzer()
+        return _vader
 
 
 class EnhancedSentimentAnalyzer:
@@ -21,7 +46,9 @@ class EnhancedSentimentAnalyzer:
     """
     
     def __init__(self):
-        self.vader_analyzer = SentimentIntensityAnalyzer()
+        self.vader_analyzer = shared_vader()
+        self._parsed = None  # (text, TextBlob sentiment, VADER scores) of the last text
+        self._matched = None  # (text, lexicon hits) of the last text
         
         # Emotion lexicon for Portuguese and English
         self.emotion_lexicon = {
@@ -41,6 +68,28 @@ class EnhancedSentimentAnalyzer:
             'delivery': ['entrega', 'delivery', 'envio', 'shipping', 'prazo', 'deadline', 'rápido', 'fast', 'lento', 'slow'],
             'product': ['produto', 'product', 'item', 'mercadoria', 'goods', 'artigo', 'article']
         }
+        
+        # Both lexicons share one automaton, built once per instance (and shared by equal lexicons)
+        self._matcher = compiled({
+            **{('emotion', emotion): keywords for emotion, keywords in self.emotion_lexicon.items()},
+            **{('aspect', aspect): keywords for aspect, keywords in self.aspect_keywords.items()},
+        })
+    
+    def _scores(self, text: str) -> Tuple:
+        """TextBlob sentiment and VADER scores of a text, computed once per text"""
+        parsed = self._parsed
+        if parsed is None or parsed[0] != text:
+            parsed = (text, TextBlob(text).sentiment, self.vader_analyzer.polarity_scores(text))
+            self._parsed = parsed
+        return parsed[1], parsed[2]
+    
+    def _hits(self, text: str) -> List[Hit]:
+        """Emotion and aspect keyword hits of a text, found in a single pass and once per text"""
+        matched = self._matched
+        if matched is None or matched[0] != text:
+            matched = (text, self._matcher.find(text.lower()))
+            self._matched = matched
+        return matched[1]
     
     def analyze_comprehensive(self, text: str) -> Dict:
         """
@@ -86,22 +135,13 @@ class EnhancedSentimentAnalyzer:
     
     def _analyze_basic_sentiment(self, text: str) -> Dict:
         """Analyze basic sentiment using both TextBlob and VADER"""
-        # TextBlob analysis
-        blob = TextBlob(text)
-        textblob_polarity = blob.sentiment.polarity
-        
-        # VADER analysis
-        vader_scores = self.vader_analyzer.polarity_scores(text)
+        # TextBlob and VADER analysis (shared with intensity and subjectivity)
+        sentiment, vader_scores = self._scores(text)
+        textblob_polarity = sentiment.polarity
         
         # Combine results
         combined_polarity = (textblob_polarity + vader_scores['compound']) / 2
-        
-        if combined_polarity > 0.1:
-            classification = "Positive"
-        elif combined_polarity < -0.1:
-            classification = "Negative"
-        else:
-            classification = "Neutral"
+        classification = classify(combined_polarity)
         
         return {
             'classification': classification,
@@ -118,13 +158,13 @@ class EnhancedSentimentAnalyzer:
     def _detect_emotions(self, text: str) -> Dict:
         """Detect emotions in text based on emotion lexicon"""
         text_lower = text.lower()
-        emotion_scores = defaultdict(int)
+        emotion_scores = defaultdict(int, {emotion: 0 for emotion in self.emotion_lexicon})
         
-        for emotion, keywords in self.emotion_lexicon.items():
-            for keyword in keywords:
-                # Count occurrences of emotion keywords
-                count = len(re.findall(r'\b' + re.escape(keyword) + r'\b', text_lower))
-                emotion_scores[emotion] += count
+        # Count whole-word occurrences of emotion keywords
+        for hit in self._hits(text):
+            group, emotion = hit.label
+            if group == 'emotion' and whole_word(text_lower, hit):
+                emotion_scores[emotion] += 1
         
         # Normalize scores
         total_words = len(text.split())
@@ -143,18 +183,17 @@ class EnhancedSentimentAnalyzer:
     
     def _analyze_intensity(self, text: str) -> Dict:
         """Analyze sentiment intensity and confidence"""
-        blob = TextBlob(text)
-        vader_scores = self.vader_analyzer.polarity_scores(text)
+        sentiment, vader_scores = self._scores(text)
         
         # Calculate intensity based on polarity magnitude
-        textblob_intensity = abs(blob.sentiment.polarity)
+        textblob_intensity = abs(sentiment.polarity)
         vader_intensity = abs(vader_scores['compound'])
         
         # Average intensity
         avg_intensity = (textblob_intensity + vader_intensity) / 2
         
         # Confidence based on agreement between methods
-        agreement = 1 - abs(blob.sentiment.polarity - vader_scores['compound']) / 2
+        agreement = 1 - abs(sentiment.polarity - vader_scores['compound']) / 2
         
         return {
             'intensity': avg_intensity,
@@ -165,8 +204,8 @@ class EnhancedSentimentAnalyzer:
     
     def _analyze_subjectivity(self, text: str) -> Dict:
         """Analyze subjectivity (objective vs subjective)"""
-        blob = TextBlob(text)
-        subjectivity = blob.sentiment.subjectivity
+        sentiment, _ = self._scores(text)
+        subjectivity = sentiment.subjectivity
         
         if subjectivity > 0.6:
             classification = "Highly Subjective"
@@ -185,18 +224,20 @@ class EnhancedSentimentAnalyzer:
         text_lower = text.lower()
         aspect_sentiments = {}
         
-        for aspect, keywords in self.aspect_keywords.items():
+        # Sentence index of each aspect mention: the number of periods before it
+        periods = [i for i, char in enumerate(text_lower) if char == '.']
+        mentions = defaultdict(set)
+        for hit in self._hits(text):
+            group, aspect = hit.label
+            if group == 'aspect':
+                mentions[aspect].add(bisect.bisect_left(periods, hit.start))
+        
+        for aspect in self.aspect_keywords:
             # Check if aspect is mentioned
-            aspect_mentioned = any(keyword in text_lower for keyword in keywords)
-            
-            if aspect_mentioned:
+            if aspect in mentions:
                 # Extract sentences containing aspect keywords
                 sentences = text.split('.')
-                relevant_sentences = []
-                
-                for sentence in sentences:
-                    if any(keyword in sentence.lower() for keyword in keywords):
-                        relevant_sentences.append(sentence.strip())
+                relevant_sentences = [sentences[i].strip() for i in sorted(mentions[aspect])]
                 
                 if relevant_sentences:
                     # Analyze sentiment of relevant sentences
@@ -1,14 +1,17 @@
 # flake8: noqa: E501
 
-from collections import defaultdict, Counter
 from typing import List
-
-from nltk.tag import pos_tag
-from nltk.chunk import ne_chunk
 
 from src.modules.nlp.preprocessor import PreProcessor
 from src.modules.nlp.bow import generate_bow
-from src.modules.nlp.tfidf import generate_tfidf
+from src.modules.nlp.cooccurrence import CooccurrenceMatrix
+from src.modules.nlp.tfidf import generate_tfidf, generate_tfidf_many
+from src.utils.stop_words import stopwords_pt
+
+# componentes do spaCy usados pela análise sintática (o parser de dependências fica desligado)
+PIPE_COMPONENTS = ("tok2vec", "morphologizer", "tagger", "attribute_ruler", "lemmatizer", "ner")
+
+_STOP_WORDS = frozenset(word.lower() for word in stopwords_pt)
 
 
 class FeatureExtractor:
@@ -27,22 +30,52 @@ class FeatureExtractor:
 
     def syntax_analisys(self, text: str = ""):
         """ aplica análise sintática para retira do texto plavras chaves, tags e entidades. """  # noqa: E501
-
-        digest = self.preprocessor.digest(text)
-
-        # descobre as tags e entidades do texto
-        self.tags = pos_tag(digest['tokens'])
-        self.entities = ne_chunk(self.tags)
-        self.tag = [tag for tag, mark in self.tags]
-        self.entity = [entity for entity, tag in self.entities]
-
-        # popula o digest
-        digest['entities'] = self.entities
-        digest['entity'] = self.entity
-        digest['tags'] = self.tags
-        digest['tag'] = self.tag
-
-        return digest
+        return self.syntax_analysis_many([text])[0]
+
+    def syntax_analysis_many(self, texts: List[str], batch_size: int = 64, n_process: int = 1) -> List[dict]:
+        """
+        Análise sintática em lote: os textos passam pelo `nlp.pipe` do spaCy numa única passada,
+        apenas com os componentes de PIPE_COMPONENTS habilitados.
+
+        Parâmetros:
+            texts (List[str]): Os textos.
+            batch_size (int): Textos por lote do spaCy. Padrão é 64.
+            n_process (int): Processos do spaCy. Padrão é 1.
+
+        Retorna:
+            List[dict]: Um digest por texto (tokens, lemma, stems, tags, tag, entities, entity), na ordem de entrada.
+        """
+        nlp = self.preprocessor.nlp
+        disable = [name for name in nlp.pipe_names if name not in PIPE_COMPONENTS]
+
+        digests = [self._digest(doc) for doc in nlp.pipe(texts, batch_size=batch_size, n_process=n_process, disable=disable)]
+
+        # mantém o estado do último texto analisado, como na chamada individual
+        if digests:
+            self.tags = digests[-1]['tags']
+            self.entities = digests[-1]['entities']
+            self.tag = digests[-1]['tag']
+            self.entity = digests[-1]['entity']
+
+        return digests
+
+    def _digest(self, doc) -> dict:
+        """ monta o digest de um documento do spaCy """
+        words = [token for token in doc if token.is_alpha and token.lower_ not in _STOP_WORDS]
+
+        tokens = [token.text for token in words]
+        tags = [(token.text, token.tag_ or token.pos_) for token in words]
+        entities = [(ent.text, ent.label_) for ent in doc.ents]
+
+        return {
+            'tokens': tokens,
+            'lemma': [token.lemma_ for token in words if token.pos_ == 'NOUN'],
+            'stems': self.preprocessor.stemming(tokens),
+            'entities': entities,
+            'entity': [entity for entity, tag in entities],
+            'tags': tags,
+            'tag': [tag for tag, mark in tags],
+        }
 
     def window_context(self, text: str = "", window_size=2):
         """ Gera n-gramas em torno de uma palavra-alvo com um tamanho de janela específico. """
@@ -102,17 +135,8 @@ class FeatureExtractor:
 
     def cooccurrence_matrix(self, ngrams_ctx):
         """ Constrói uma matriz de co-ocorrência a partir de uma lista de n-gramas. """  # noqa: E501
-        cooccurrence_counts = defaultdict(Counter)
-
-        for ngram_ctx in ngrams_ctx:
-            for i in range(len(ngram_ctx)):
-                for j in range(len(ngram_ctx)):
-                    if i != j:
-                        distance = abs(i - j)
-                        weight = 1.0 / distance  # Quanto menor a distância, maior o peso  # noqa: E501
-                        cooccurrence_counts[ngram_ctx[i]][ngram_ctx[j]] += weight  # noqa: E501
-
-        return dict(cooccurrence_counts)
+        # peso 1/distância entre os tokens de cada n-grama: quanto menor a distância, maior o peso
+        return CooccurrenceMatrix().add_windows(ngrams_ctx).dict()
 
     def bow(self, text: str = "") -> List[str]:
         """ extrai a bag words. """
@@ -125,6 +149,10 @@ class FeatureExtractor:
         self.vocabulary = generate_tfidf(text)
         return self.vocabulary
 
+    def tfidf_many(self, texts: List[str]) -> List[dict]:
+        """ matrix TF-IDF de uma lista de artigos numa única transformação sobre o corpus """
+        return generate_tfidf_many(texts)
+
     def min(self, vocabulary: dict = {}, size: int = 5):
         """ Extrai os items de menor valor """
         return dict(sorted(vocabulary.items(), key=lambda item: item[1])[:size])
@@ -0,0 +1,157 @@
+# flake8: noqa: E501
+"""
+Keyword Matcher Module
+Casamento de muitas palavras-chave de uma só vez com um autômato de Aho–Corasick.
+
+Os léxicos (emoções, aspectos, padrões de assunto, tipo de artigo e intenção) são compilados uma vez
+num autômato; cada texto é percorrido uma única vez, caractere a caractere, e todas as ocorrências
+de todas as palavras-chave são encontradas com a sua posição. O custo por texto depende do tamanho
+do texto e do número de ocorrências, e não mais do tamanho dos léxicos.
+
+Classes:
+    - Hit: Uma ocorrência (início, fim, palavra-chave, rótulo).
+    - KeywordMatcher: Autômato construído a partir de léxicos rotulados.
+
+Funções:
+    - whole_word(text: str, hit: Hit) -> bool: Verifica se uma ocorrência é delimitada como palavra (`\\b`).
+    - compiled(lexicons: Dict[Hashable, Iterable[str]]) -> KeywordMatcher: Autômato compartilhado para um conjunto de léxicos.
+"""
+
+from collections import deque
+from typing import Dict, Hashable, Iterable, List, NamedTuple, Set, Tuple
+import threading
+
+
+class Hit(NamedTuple):
+    start: int       # posição do primeiro caractere no texto
+    end: int         # posição depois do último caractere
+    keyword: str     # palavra-chave encontrada (em minúsculas)
+    label: Hashable  # rótulo do léxico, por exemplo ('emotion', 'joy')
+
+
+def _is_word(char: str) -> bool:
+    """mesmo critério de caractere de palavra do `\\b` das expressões regulares"""
+    return char.isalnum() or char == "_"
+
+
+def _boundary(text: str, position: int) -> bool:
+    """verifica se há fronteira de palavra (`\\b`) antes de `position`"""
+    before = position > 0 and _is_word(text[position - 1])
+    after = position < len(text) and _is_word(text[position])
+    return before != after
+
+
+def whole_word(text: str, hit: Hit) -> bool:
+    """verifica se uma ocorrência é delimitada como palavra, como `\\bpalavra\\b` numa expressão regular"""
+    return _boundary(text, hit.start) and _boundary(text, hit.end)
+
+
+class KeywordMatcher:
+    def __init__(self, lexicons: Dict[Hashable, Iterable[str]] = None):
+        """
+        Compila o autômato a partir de léxicos rotulados.
+
+        Parâmetros:
+            lexicons (Dict[Hashable, Iterable[str]]): Palavras-chave por rótulo. As palavras-chave são
+                casadas sem diferenciar maiúsculas; repetições dentro de um rótulo contam em dobro,
+                como nas contagens por léxico. Padrão é None (autômato vazio).
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[str, Hashable]]] = [[]]
+        self.keywords: Set[str] = set()
+
+        for label, keywords in (lexicons or {}).items():
+            for keyword in keywords:
+                self._add(keyword.lower(), label)
+        self._link()
+
+    def _add(self, keyword: str, label: Hashable):
+        """insere uma palavra-chave na trie"""
+        if not keyword:
+            return
+        state = 0
+        for char in keyword:
+            following = self._goto[state].get(char)
+            if following is None:
+                following = len(self._goto)
+                self._goto[state][char] = following
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = following
+        self._out[state].append((keyword, label))
+        self.keywords.add(keyword)
+
+    def _link(self):
+        """calcula os links de falha em largura e propaga as saídas dos sufixos"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, following in self._goto[state].items():
+                queue.append(following)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                # os filhos da raiz falham para a raiz
+                self._fail[following] = fail if fail != following else 0
+                self._out[following] = self._out[following] + self._out[self._fail[following]]
+
+    def find(self, text: str, whole_words: bool = False) -> List[Hit]:
+        """
+        Encontra todas as ocorrências das palavras-chave numa única passada pelo texto.
+
+        Parâmetros:
+            text (str): O texto (já em minúsculas, ou será comparado como está).
+            whole_words (bool): Se deve aceitar apenas ocorrências delimitadas como palavras (`\\b`). Padrão é False.
+
+        Retorna:
+            List[Hit]: As ocorrências, em ordem de término no texto.
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        hits = []
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not out[state]:
+                continue
+
+            end = position + 1
+            for keyword, label in out[state]:
+                hit = Hit(end - len(keyword), end, keyword, label)
+                if whole_words and not whole_word(text, hit):
+                    continue
+                hits.append(hit)
+        return hits
+
+    def counts(self, text: str, whole_words: bool = False) -> Dict[Hashable, int]:
+        """conta as ocorrências por rótulo"""
+        result: Dict[Hashable, int] = {}
+        for hit in self.find(text, whole_words):
+            result[hit.label] = result.get(hit.label, 0) + 1
+        return result
+
+
+_compiled: Dict[tuple, KeywordMatcher] = {}
+_lock = threading.Lock()
+
+
+def compiled(lexicons: Dict[Hashable, Iterable[str]]) -> KeywordMatcher:
+    """
+    Retorna o autômato compartilhado pelo processo para um conjunto de léxicos, compilando-o na primeira vez.
+
+    Args:
+        lexicons (Dict[Hashable, Iterable[str]]): Palavras-chave por rótulo.
+
+    Returns:
+        KeywordMatcher: O autômato (o mesmo objeto para léxicos com o mesmo conteúdo).
+    """
+    key = tuple((label, tuple(keywords)) for label, keywords in lexicons.items())
+    with _lock:
+        matcher = _compiled.get(key)
+        if matcher is None:
+            matcher = _compiled[key] = KeywordMatcher(dict(key))
+        return matcher
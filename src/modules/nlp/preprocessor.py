@@ -2,30 +2,14 @@
 
 from typing import List
 
-import spacy
-
-import nltk
-from nltk.corpus import stopwords
-
-from spellchecker import SpellChecker
-
+from src.modules.nlp import resources as Resources
 from src.utils import string as Str
 
 
 class PreProcessor:
     def __init__(self, text: str = ""):
-
-        nltk.download('averaged_perceptron_tagger')
-        nltk.download('punkt')
-        
-        nltk.download('stopwords')
-        nltk.download('words')
-        nltk.download('rslp')
-
-        self.stop_words = set(stopwords.words('portuguese'))
-        self.spell = SpellChecker(language='pt')
-        self.stemmer = nltk.stem.RSLPStemmer()
-        self.nlp = spacy.load('pt_core_news_sm')
+        # os modelos (spaCy, corretor, stemmer, stopwords) são compartilhados pelo processo
+        # e carregados no primeiro uso, ver `resources`
 
         self.text = text
 
@@ -36,6 +20,26 @@ class PreProcessor:
         self.stemmed_text: List[str] = []
         self.clean_text = ""
 
+    @property
+    def stop_words(self) -> set:
+        """stopwords em português (compartilhado)"""
+        return Resources.get(Resources.STOP_WORDS)
+
+    @property
+    def spell(self):
+        """corretor ortográfico em português (compartilhado)"""
+        return Resources.get(Resources.SPELL)
+
+    @property
+    def stemmer(self):
+        """stemmer RSLP (compartilhado)"""
+        return Resources.get(Resources.STEMMER)
+
+    @property
+    def nlp(self):
+        """modelo do spaCy em português (compartilhado)"""
+        return Resources.get(Resources.SPACY)
+
     def text_cleaning(self, text: str = "") -> str:
         """Limpa o texyo para processamento"""
         self.clean_text = Str.clean(text)
@@ -0,0 +1,230 @@
+# flake8: noqa: E501
+"""
+NLP Resources Module
+Registro dos recursos pesados de NLP (modelo do spaCy, corretor ortográfico, stemmer e stopwords)
+compartilhado por todo o processo.
+
+Cada recurso é carregado uma única vez, no primeiro uso, e reaproveitado por todos os `PreProcessor`,
+`FeatureExtractor` e agentes. Nada é baixado em tempo de execução: se um dado do NLTK ou o modelo do
+spaCy não estiver instalado, o erro indica o comando de instalação (`download` para o NLTK).
+
+Os recursos já carregados são herdados pelos processos filhos (fork) sem recarga; o lock do registro
+é recriado no filho para que um fork feito durante um carregamento não deixe o filho bloqueado.
+Use `preload` antes de criar um pool de processos para que os workers já nasçam com os modelos.
+
+Recursos:
+    - STOP_WORDS: stopwords em português do NLTK (ou a lista do projeto, se o corpus não estiver instalado).
+    - SPELL: `SpellChecker` em português.
+    - STEMMER: `RSLPStemmer` do NLTK.
+    - SPACY: modelo `pt_core_news_sm` do spaCy.
+
+Funções:
+    - register(name: str, loader: Callable[[], object]): Registra (ou substitui) o carregador de um recurso.
+    - get(name: str) -> object: Retorna o recurso, carregando-o no primeiro uso.
+    - preload(names: Iterable[str] = None) -> List[str]: Carrega recursos antecipadamente.
+    - loaded() -> List[str]: Recursos já carregados.
+    - clear(): Descarta os recursos carregados.
+    - missing(packages: Iterable[str] = NLTK_PACKAGES) -> List[str]: Dados do NLTK ainda não instalados.
+    - download(packages: Iterable[str] = NLTK_PACKAGES) -> bool: Instala os dados do NLTK (passo de instalação, não de execução).
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional
+import traceback
+import threading
+import logging
+import time
+import os
+
+STOP_WORDS = "stop_words"
+SPELL = "spell"
+STEMMER = "stemmer"
+SPACY = "spacy"
+
+SPACY_MODEL = "pt_core_news_sm"
+NLTK_PACKAGES = ("averaged_perceptron_tagger", "punkt", "punkt_tab", "stopwords", "words", "rslp", "wordnet", "omw-1.4")
+
+# caminho de cada pacote em nltk.data, para verificar a instalação sem consultar o índice de downloads
+_NLTK_PATHS = {
+    "averaged_perceptron_tagger": "taggers/averaged_perceptron_tagger",
+    "punkt": "tokenizers/punkt",
+    "punkt_tab": "tokenizers/punkt_tab",
+    "stopwords": "corpora/stopwords",
+    "words": "corpora/words",
+    "rslp": "stemmers/rslp",
+    "wordnet": "corpora/wordnet",
+    "omw-1.4": "corpora/omw-1.4",
+}
+
+_lock = threading.RLock()
+_loaders: Dict[str, Callable[[], object]] = {}
+_resources: Dict[str, object] = {}
+
+
+def _require_nltk(resource: str):
+    """verifica se um dado do NLTK está instalado, sem tentar baixá-lo"""
+    import nltk
+    try:
+        nltk.data.find(resource)
+    except LookupError:
+        raise LookupError(f"Dado do NLTK '{resource}' não encontrado. Instale com: python -c \"from src.modules.nlp import resources; resources.download()\"") from None
+
+
+def _load_stop_words() -> set:
+    """stopwords em português do NLTK, ou a lista do projeto se o corpus não estiver instalado"""
+    try:
+        _require_nltk("corpora/stopwords")
+        from nltk.corpus import stopwords
+        return set(stopwords.words('portuguese'))
+    except LookupError as e:
+        logging.warning(f"{e} Usando a lista de stopwords do projeto.")
+        from src.utils.stop_words import stopwords_pt
+        return set(stopwords_pt)
+
+
+def _load_spell() -> object:
+    """corretor ortográfico em português (o dicionário acompanha o pacote)"""
+    from spellchecker import SpellChecker
+    return SpellChecker(language='pt')
+
+
+def _load_stemmer() -> object:
+    """stemmer RSLP do NLTK"""
+    _require_nltk("stemmers/rslp")
+    from nltk.stem import RSLPStemmer
+    return RSLPStemmer()
+
+
+def _load_spacy() -> object:
+    """modelo do spaCy em português"""
+    import spacy
+    try:
+        return spacy.load(SPACY_MODEL)
+    except OSError:
+        raise OSError(f"Modelo do spaCy '{SPACY_MODEL}' não encontrado. Instale com: python -m spacy download {SPACY_MODEL}") from None
+
+
+def register(name: str, loader: Callable[[], object]):
+    """
+    Registra (ou substitui) o carregador de um recurso. Um recurso já carregado com o nome é descartado.
+
+    Args:
+        name (str): Nome do recurso.
+        loader (Callable[[], object]): Função que carrega o recurso.
+    """
+    with _lock:
+        _loaders[name] = loader
+        _resources.pop(name, None)
+
+
+def get(name: str) -> object:
+    """
+    Retorna um recurso, carregando-o no primeiro uso.
+
+    Args:
+        name (str): Nome do recurso (STOP_WORDS, SPELL, STEMMER, SPACY ou um nome registrado).
+
+    Returns:
+        object: O recurso compartilhado.
+
+    Raises:
+        KeyError: Se o recurso não estiver registrado.
+        LookupError, OSError: Se os dados do recurso não estiverem instalados.
+    """
+    resource = _resources.get(name)
+    if resource is not None:
+        return resource
+
+    with _lock:
+        if name not in _resources:
+            loader = _loaders.get(name)
+            if loader is None:
+                raise KeyError(f"Recurso de NLP desconhecido: {name}.")
+
+            start = time.perf_counter()
+            _resources[name] = loader()
+            logging.info(f"Recurso de NLP '{name}' carregado em {time.perf_counter() - start:.2f}s.")
+        return _resources[name]
+
+
+def preload(names: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    Carrega recursos antecipadamente (por exemplo, antes de criar um pool de processos).
+
+    Args:
+        names (Optional[Iterable[str]]): Recursos a carregar. Padrão é None (todos os registrados).
+
+    Returns:
+        List[str]: Os recursos carregados com sucesso.
+    """
+    with _lock:
+        names = list(names if names is not None else _loaders)
+
+    loadeds = []
+    for name in names:
+        try:
+            get(name)
+            loadeds.append(name)
+        except Exception as e:
+            logging.error(f"{e}\n{traceback.format_exc()}")
+    return loadeds
+
+
+def loaded() -> List[str]:
+    """lista os recursos já carregados"""
+    with _lock:
+        return list(_resources)
+
+
+def clear():
+    """descarta os recursos carregados (serão recarregados no próximo uso)"""
+    with _lock:
+        _resources.clear()
+
+
+def missing(packages: Iterable[str] = NLTK_PACKAGES) -> List[str]:
+    """
+    Lista os dados do NLTK que ainda não estão instalados (nada é baixado).
+
+    Args:
+        packages (Iterable[str]): Pacotes do NLTK. Padrão é NLTK_PACKAGES.
+
+    Returns:
+        List[str]: Os pacotes ausentes.
+    """
+    import nltk
+    absents = []
+    for package in packages:
+        try:
+            nltk.data.find(_NLTK_PATHS.get(package, package))
+        except LookupError:
+            absents.append(package)
+    return absents
+
+
+def download(packages: Iterable[str] = NLTK_PACKAGES) -> bool:
+    """
+    Instala os dados do NLTK. É um passo de instalação: `get` nunca baixa nada.
+
+    Args:
+        packages (Iterable[str]): Pacotes do NLTK. Padrão é NLTK_PACKAGES.
+
+    Returns:
+        bool: True se todos os pacotes foram instalados, False caso contrário.
+    """
+    import nltk
+    return all([nltk.download(package, quiet=True) for package in packages])
+
+
+def _after_fork_in_child():
+    """recria o lock no processo filho; os recursos já carregados são herdados"""
+    global _lock
+    _lock = threading.RLock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+register(STOP_WORDS, _load_stop_words)
+register(SPELL, _load_spell)
+register(STEMMER, _load_stemmer)
+register(SPACY, _load_spacy)
@@ -4,37 +4,31 @@ Módulo de análise de sentimento utilizando TextBlob.
 
 Este módulo fornece funcionalidades básicas para análise de sentimento
 e processamento de texto natural.
+
+`analyze` lê o texto uma única vez (um `TextBlob` e o VADER compartilhado pelo processo) e retorna
+o sentimento, a polaridade, as tags e as frases nominais juntos; `analyze_many` faz o mesmo para
+uma lista de artigos, distribuindo-os num pool de processos.
 """
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+import multiprocessing
+import os
+
 from textblob import TextBlob
 from textblob import Word
-from .enhanced_sentiment import EnhancedSentimentAnalyzer, SentimentFilter, sentiment_analysis_enhanced, sentiment_classification_only
+from .enhanced_sentiment import EnhancedSentimentAnalyzer, SentimentFilter, sentiment_analysis_enhanced, sentiment_classification_only, classify, shared_vader
 
 
 
 def sentiment_analysis(text: str = "") -> str:
     """
-    Analisa o sentimento de um texto.
-    
-    Args:
-        text (str): O texto para análise de sentimento.
-        
-    Returns:
-        str: Classificação do sentimento ("Positivo", "Negativo", "Neutro") ou None se texto vazio.
+    Basic sentiment analysis (backward compatibility)
+    For enhanced analysis, use sentiment_analysis_enhanced()
     """
-
     if text == "":
         return None
 
-    blob = TextBlob(text)
-    polarity = blob.sentiment.polarity
-
-    if polarity > 0:
-        return "Positivo"
-
-    if polarity < 0:
-        return "Negativo"
-
-    return "Neutro"
+    return sentiment_classification_only(text)
 
 
 def sentiment_tags(text: str = ""):
@@ -178,14 +172,7 @@ def sentiment_verb(text: str = ""):
         str: Verbo lematizado.
     """
     w = Word(text)
-
-    Basic sentiment analysis (backward compatibility)
-    For enhanced analysis, use sentiment_analysis_enhanced()
-    """
-    if text == "":
-        return None
-
-    return sentiment_classification_only(text)
+    return w.lemmatize("v")
 
 
 def sentiment_analysis_comprehensive(text: str = "") -> dict:
@@ -199,73 +186,62 @@ def sentiment_analysis_comprehensive(text: str = "") -> dict:
     return sentiment_analysis_enhanced(text)
 
 
-def sentiment_tags(text: str = ""):
-
-    if text == "":
-        return None
-
-    blob = TextBlob(text)
-    return blob.tags
-
-
-def sentiment_noun_phrases(text: str = ""):
-
-    if text == "":
-        return None
-
-    blob = TextBlob(text)
-    return blob.noun_phrases
-
-
-def sentiment_sentenses(text: str = ""):
-
-    if text == "":
-        return None
-
-    blob = TextBlob(text)
-    return blob.sentences
-
-
-def sentiment_words(text: str = ""):
-
-    if text == "":
-        return None
-
-    blob = TextBlob(text)
-    return blob.words
-
-
-def sentiment_words_sigularize(text: str = ""):
-
-    if text == "":
-        return None
-
-    blob = TextBlob(text)
-
-    words = []
-    for word in blob.words:
-        words.append(word.singularize())
-    return words
-
-
-def sentiment_words_pluralize(text: str = ""):
+def analyze(text: str = "") -> Optional[dict]:
+    """
+    Analisa um texto com uma única leitura: o texto é tokenizado e etiquetado uma vez só.
+    
+    Args:
+        text (str): O texto para análise.
+        
+    Returns:
+        dict: sentiment (o mesmo de `sentiment_analysis`), polarity (TextBlob e VADER combinados),
+        subjectivity, vader_compound, tags e noun_phrases, ou None se texto vazio.
+    """
 
     if text == "":
         return None
 
     blob = TextBlob(text)
+    sentiment = blob.sentiment
+    compound = shared_vader().polarity_scores(text)['compound']
+    polarity = (sentiment.polarity + compound) / 2
+    return {
+        'sentiment': classify(polarity),
+        'polarity': polarity,
+        'subjectivity': sentiment.subjectivity,
+        'vader_compound': compound,
+        'tags': [(str(word), tag) for word, tag in blob.tags],
+        'noun_phrases': [str(phrase) for phrase in blob.noun_phrases],
+    }
+
+
+def _warmup():
+    """carrega o VADER uma vez em cada processo do pool"""
+    shared_vader()
+
+
+def analyze_many(texts: List[str], workers: int = 1, chunksize: int = 16) -> List[Optional[dict]]:
+    """
+    Versão em lote de `analyze` para uma lista de artigos.
+    Por padrão analisa no próprio processo, como convém às requisições do servidor: abrir um pool
+    custa mais que o TextBlob e o VADER em algumas centenas de artigos. Rotinas em lote podem pedir
+    um pool, cujos processos são iniciados por `forkserver` (ou `spawn`), e não por `fork` de um
+    processo que já tem threads.
+    
+    Args:
+        texts (List[str]): Os textos para análise.
+        workers (int): Processos do pool. 1 analisa no próprio processo; 0 usa todos os núcleos. Padrão é 1.
+        chunksize (int): Textos enviados de uma vez a cada processo. Padrão é 16.
+        
+    Returns:
+        List[dict]: O resultado de `analyze` para cada texto, na ordem de entrada.
+    """
 
-    words = []
-    for word in blob.words:
-        words.append(word.pluralize())
-    return words
-
-
-def sentiment_lemmarize(text: str = ""):
-    w = Word(text)
-    return w.lemmatize()
-
+    workers = min(workers or os.cpu_count() or 1, max(len(texts) // max(chunksize, 1), 1))
+    if workers <= 1:
+        return [analyze(text) for text in texts]
 
-def sentiment_verb(text: str = ""):
-    w = Word(text)
-    return w.lemmatize("v")
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_warmup) as executor:
+        return list(executor.map(analyze, texts, chunksize=max(chunksize, 1)))
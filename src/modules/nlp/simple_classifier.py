@@ -8,6 +8,8 @@ from typing import Dict, List, Optional, Tuple, Any
 from enum import Enum
 from collections import Counter
 
+from src.modules.nlp.keyword_matcher import compiled
+
 # Importações condicionais do módulo de análise
 try:
     from src.modules.analysis.legislation import (
@@ -48,6 +50,8 @@ class SimpleLegalClassifier:
     """
     
     def __init__(self):
+        self._matched = None  # (texto, palavras-chave, padrões encontrados) do último texto
+
         # Categorias padrão para classificação de assunto
         self.subject_patterns = {
             "Direitos Fundamentais": [
@@ -196,6 +200,13 @@ class SimpleLegalClassifier:
             ]
         }
 
+        # autômato único para os três léxicos, montado uma vez por instância
+        self._matcher = compiled({
+            **{('subject', name): patterns for name, patterns in self.subject_patterns.items()},
+            **{('article_type', name): patterns for name, patterns in self.article_patterns.items()},
+            **{('intention', name): patterns for name, patterns in self.intention_patterns.items()},
+        })
+
     def _extract_keywords(self, text: str) -> List[str]:
         """Extrai palavras-chave do texto"""
         # Converter para minúsculas e extrair palavras
@@ -209,6 +220,14 @@ class SimpleLegalClassifier:
         keywords = [word for word in words if len(word) > 2 and word not in stopwords]
         return keywords
 
+    def _matched_patterns(self, text: str) -> Tuple:
+        """Encontra, numa única passada e uma vez por texto, os padrões de assunto, tipo de artigo e intenção presentes no texto"""
+        matched = self._matched
+        if matched is None or matched[0] != text:
+            matched = (text, self._matcher.keywords, {hit.keyword for hit in self._matcher.find(text.lower())})
+            self._matched = matched
+        return matched[1], matched[2]
+
     def _calculate_pattern_score(self, text: str, patterns: List[str]) -> float:
         """Calcula pontuação baseada na presença de padrões no texto"""
         text_lower = text.lower()
@@ -218,8 +237,11 @@ class SimpleLegalClassifier:
         if total_patterns == 0:
             return 0.0
         
+        keywords, found = self._matched_patterns(text)
         for pattern in patterns:
-            if pattern.lower() in text_lower:
+            pattern = pattern.lower()
+            # padrões fora dos léxicos da instância são procurados diretamente no texto
+            if (pattern in found) if pattern in keywords else (pattern in text_lower):
                 score += 1.0
         
         return score / total_patterns
@@ -1,22 +1,381 @@
 # flake8: noqa: E501
+"""
+TF-IDF Module
+Modelo TF-IDF (Term Frequency-Inverse Document Frequency) do corpus jurídico.
 
-from sklearn.feature_extraction.text import TfidfVectorizer
+O IDF só tem sentido sobre uma coleção: ajustar um `TfidfVectorizer` sobre um único texto deixa o IDF
+constante e o peso vira apenas a frequência normalizada. `TfidfModel` guarda a frequência de documentos
+de cada termo sobre todo o corpus (artigos de `dataset/corpus/*.csv` e parágrafos do catálogo),
+é construído uma vez com `build` e atualizado de forma incremental com `update` (`partial_fit`) quando
+documentos são ingeridos ou substituídos. O vocabulário é o de `BagOfWords`, com colunas estáveis.
 
-def generate_tfidf(text: str = "") -> dict:
-    """ matrix de características TF-IDF(Term Frequency-Inverse Document Frequency)""" 
-    
-    tfidf_vectorizer = TfidfVectorizer()
+A matriz TF-IDF do corpus é gravada como arrays `.npy` (data, indices, indptr) e reaberta com
+`mmap_mode`, de modo que os workers compartilham as mesmas páginas do arquivo sem copiá-lo.
+
+Os pesos seguem o `TfidfVectorizer` (smooth_idf, sublinear_tf=False, norma l2):
+    idf(t) = ln((1 + n) / (1 + df(t))) + 1
+
+Funções:
+    - generate_tfidf(text: str) -> dict: Pesos TF-IDF das palavras de um texto sobre o corpus.
+    - generate_tfidf_many(texts: List[str]) -> List[dict]: `generate_tfidf` em lote (IDF calculado uma vez).
+    - corpus_texts(directory: str, paragraphs: bool) -> Iterator[str]: Textos do corpus.
+    - build(directory: str, paragraphs: bool, target: str) -> TfidfModel: Constrói e grava o modelo e a matriz do corpus.
+    - save_matrix(matrix, directory: str) / load_matrix(directory: str, mmap: bool): Matriz esparsa em disco.
+    - shared() -> TfidfModel: Modelo compartilhado pelo processo.
+    - update(texts: Iterable[str], removed: Iterable[str]) -> TfidfModel: Atualiza e grava o modelo compartilhado.
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional
+import traceback
+import threading
+import logging
+import glob
+import json
+import math
+import csv
+import os
+
+import numpy as np
+from scipy import sparse
+
+from src.modules.nlp.bow import BagOfWords, analyze
+
+CORPUS_DIRECTORY = "./dataset/corpus"
+TFIDF_DIRECTORY = "./data/.tfidf"
+
+_MATRIX_ARRAYS = ("data", "indices", "indptr")
+
+
+class TfidfModel:
+    def __init__(self, terms: Optional[List[str]] = None, df: Optional[Iterable[int]] = None, documents: int = 0):
+        """
+        Inicializa o modelo TF-IDF.
+
+        Parâmetros:
+            terms (Optional[List[str]]): Termos do vocabulário, na ordem das colunas. Padrão é None.
+            df (Optional[Iterable[int]]): Frequência de documentos de cada termo, na mesma ordem. Padrão é None.
+            documents (int): Quantidade de documentos já vistos. Padrão é 0.
+        """
+        self.bow = BagOfWords(terms)
+        self.df = np.zeros(len(self.bow.terms), dtype=np.int64) if df is None else np.asarray(df, dtype=np.int64).copy()
+        self.documents = documents
+        self._lock = threading.Lock()
+
+    @property
+    def terms(self) -> List[str]:
+        """termos do vocabulário, na ordem das colunas"""
+        return self.bow.terms
+
+    def _grow(self, size: int):
+        """estende a frequência de documentos até `size` termos"""
+        if len(self.df) < size:
+            self.df = np.concatenate([self.df, np.zeros(size - len(self.df), dtype=np.int64)])
+
+    def partial_fit(self, texts: Iterable[str], removed: Iterable[str] = ()) -> "TfidfModel":
+        """
+        Atualiza o vocabulário e a frequência de documentos com novos textos, sem rever os anteriores.
+        Os documentos substituídos (`removed`) saem da contagem, para que o IDF não se desvie a cada edição.
+
+        Parâmetros:
+            texts (Iterable[str]): Os novos documentos.
+            removed (Iterable[str]): Os documentos removidos do corpus, já contados antes. Padrão é nenhum.
+
+        Retorna:
+            TfidfModel: A própria instância.
+        """
+        texts = [text for text in texts if text]
+        removed = [text for text in removed if text]
+        if not texts and not removed:
+            return self
+
+        counts = self.bow.transform(texts, grow=True)
+        gone = self.bow.transform(removed)
+        with self._lock:
+            self._grow(len(self.bow.terms))
+            # cada par (linha, coluna) da matriz CSR é um documento que contém o termo
+            self.df += np.bincount(counts.indices, minlength=len(self.df))[:len(self.df)]
+            self.df -= np.bincount(gone.indices, minlength=len(self.df))[:len(self.df)]
+            np.maximum(self.df, 0, out=self.df)
+            self.documents = max(self.documents + len(texts) - len(removed), 0)
+        return self
+
+    def fit(self, texts: Iterable[str]) -> "TfidfModel":
+        """ajusta o modelo do zero sobre uma coleção de textos"""
+        with self._lock:
+            self.bow = BagOfWords()
+            self.df = np.zeros(0, dtype=np.int64)
+            self.documents = 0
+        return self.partial_fit(texts)
+
+    def idf(self) -> np.ndarray:
+        """IDF suavizado de cada termo do vocabulário"""
+        return self._snapshot()[1]
+
+    def _snapshot(self) -> tuple:
+        """
+        Lê juntos o vocabulário, o IDF e a contagem de documentos.
+        O vocabulário só cresce no fim (`partial_fit`), então índices além do IDF lido são termos
+        acrescentados depois do instantâneo e são tratados como desconhecidos.
+        """
+        with self._lock:
+            self._grow(len(self.bow.terms))
+            idf = np.log((1.0 + self.documents) / (1.0 + self.df)) + 1.0
+            return self.bow, idf, self.documents
+
+    def transform(self, texts: List[str]) -> sparse.csr_matrix:
+        """
+        Transforma uma lista de textos numa matriz TF-IDF numa única chamada.
+        Termos fora do vocabulário são ignorados, como no `TfidfVectorizer.transform`.
+
+        Parâmetros:
+            texts (List[str]): Os textos, um por linha da matriz.
+
+        Retorna:
+            sparse.csr_matrix: Matriz (textos x termos) com os pesos TF-IDF normalizados (l2) por linha.
+        """
+        bow, idf, _ = self._snapshot()
+        matrix = bow.transform(texts).astype(np.float64)
+        if matrix.shape[1] > len(idf):
+            # termos acrescentados ao vocabulário depois do instantâneo
+            matrix = matrix[:, :len(idf)].tocsr()
+        matrix.data *= idf[matrix.indices]
+
+        norms = np.sqrt(np.bincount(np.repeat(np.arange(matrix.shape[0]), np.diff(matrix.indptr)), weights=matrix.data ** 2, minlength=matrix.shape[0]))
+        norms[norms == 0.0] = 1.0
+        matrix.data /= np.repeat(norms, np.diff(matrix.indptr))
+        return matrix
+
+    def weights(self, text: str = "") -> Dict[str, float]:
+        """
+        Pesos TF-IDF de um texto só, sem montar a matriz.
+        Termos que o corpus ainda não viu recebem o maior IDF possível (df = 0).
+
+        Parâmetros:
+            text (str): O texto.
+
+        Retorna:
+            Dict[str, float]: Peso de cada palavra do texto, em ordem alfabética.
+        """
+        return self.weights_many([text])[0]
+
+    def weights_many(self, texts: List[str]) -> List[Dict[str, float]]:
+        """
+        Versão em lote de `weights`: o IDF é calculado uma vez para todos os textos e os termos fora
+        do vocabulário recebem o maior IDF possível (df = 0), como em `weights`. O vocabulário não muda.
+
+        Parâmetros:
+            texts (List[str]): Os textos.
+
+        Retorna:
+            List[Dict[str, float]]: Para cada texto, o peso de cada palavra, em ordem alfabética.
+        """
+        bow, idf, documents = self._snapshot()
+        unseen = math.log(1.0 + documents) + 1.0
+        vocabulary = bow.vocabulary
+
+        rows = []
+        for text in texts:
+            weights = {}
+            for term, count in Counter(analyze(text)).items():
+                index = vocabulary.get(term)
+                weights[term] = count * (idf[index] if index is not None and index < len(idf) else unseen)
+
+            norm = math.sqrt(sum(weight * weight for weight in weights.values())) or 1.0
+            rows.append({term: weights[term] / norm for term in sorted(weights)})
+        return rows
+
+    def rows(self, matrix: sparse.csr_matrix) -> List[Dict[str, float]]:
+        """converte cada linha da matriz num dicionário termo -> peso, em ordem alfabética"""
+        rows = []
+        for row in range(matrix.shape[0]):
+            start, end = matrix.indptr[row], matrix.indptr[row + 1]
+            pairs = ((self.terms[column], float(weight)) for column, weight in zip(matrix.indices[start:end], matrix.data[start:end]))
+            rows.append(dict(sorted(pairs)))
+        return rows
+
+    def save(self, directory: str = TFIDF_DIRECTORY) -> bool:
+        """grava o vocabulário, a frequência de documentos e a contagem de documentos"""
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with self._lock:
+                self._grow(len(self.bow.terms))
+                self.bow.save(os.path.join(directory, "vocabulary.json"))
+                np.save(os.path.join(directory, "df.npy"), self.df[:len(self.bow.terms)])
+                with open(os.path.join(directory, "model.json"), "w", encoding="utf-8") as file:
+                    json.dump({'documents': self.documents, 'terms': len(self.bow.terms)}, file)
+            return True
+        except Exception as e:
+            logging.error(f"{e}\n{traceback.format_exc()}")
+            return False
 
-    # Transformação dos documentos em uma matriz TF-IDF
-    tfidf = tfidf_vectorizer.fit_transform([text])
-    tfidf_matrix = tfidf.toarray()
+    @classmethod
+    def load(cls, directory: str = TFIDF_DIRECTORY) -> "TfidfModel":
+        """carrega o modelo gravado por `save` (vazio se não existir)"""
+        path = os.path.join(directory, "model.json")
+        if not os.path.exists(path):
+            return cls()
 
-    # Vocabulário com índices
-    vocabulary_tfidf_list = tfidf_vectorizer.get_feature_names_out()
+        with open(path, encoding="utf-8") as file:
+            meta = json.load(file)
+        bow = BagOfWords.load(os.path.join(directory, "vocabulary.json"))
+        df = np.load(os.path.join(directory, "df.npy"))
+        return cls(bow.terms, df, meta.get('documents', 0))
+
+
+def save_matrix(matrix: sparse.csr_matrix, directory: str = TFIDF_DIRECTORY) -> bool:
+    """
+    Grava uma matriz CSR como arrays `.npy`, que podem ser abertos com mmap por vários processos.
+
+    Args:
+        matrix (sparse.csr_matrix): A matriz.
+        directory (str): Diretório de destino.
+
+    Returns:
+        bool: True se a matriz foi gravada, False caso contrário.
+    """
+    try:
+        os.makedirs(directory, exist_ok=True)
+        for name in _MATRIX_ARRAYS:
+            np.save(os.path.join(directory, f"matrix.{name}.npy"), getattr(matrix, name))
+        with open(os.path.join(directory, "matrix.json"), "w", encoding="utf-8") as file:
+            json.dump({'shape': list(matrix.shape)}, file)
+        return True
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return False
+
+
+def load_matrix(directory: str = TFIDF_DIRECTORY, mmap: bool = True) -> Optional[sparse.csr_matrix]:
+    """
+    Abre a matriz gravada por `save_matrix`.
+
+    Args:
+        directory (str): Diretório da matriz.
+        mmap (bool): Se deve mapear os arrays em memória (somente leitura) em vez de copiá-los. Padrão é True.
+
+    Returns:
+        Optional[sparse.csr_matrix]: A matriz, ou None se não existir.
+    """
+    path = os.path.join(directory, "matrix.json")
+    if not os.path.exists(path):
+        return None
+
+    with open(path, encoding="utf-8") as file:
+        shape = tuple(json.load(file)['shape'])
+    data, indices, indptr = (np.load(os.path.join(directory, f"matrix.{name}.npy"), mmap_mode="r" if mmap else None) for name in _MATRIX_ARRAYS)
+    return sparse.csr_matrix((data, indices, indptr), shape=shape, copy=False)
+
+
+def corpus_texts(directory: str = CORPUS_DIRECTORY, paragraphs: bool = True) -> Iterator[str]:
+    """
+    Percorre os textos do corpus: a coluna `text` de cada CSV do diretório e, opcionalmente,
+    o conteúdo da tabela de parágrafos.
+
+    Args:
+        directory (str): Diretório dos CSVs de artigos.
+        paragraphs (bool): Se deve incluir os parágrafos do catálogo. Padrão é True.
+
+    Yields:
+        str: O texto de cada artigo ou parágrafo.
+    """
+    for path in sorted(glob.glob(os.path.join(directory, "*.csv"))):
+        with open(path, newline="", encoding="utf-8") as file:
+            for row in csv.DictReader(file):
+                if row.get('text'):
+                    yield row['text']
+
+    if paragraphs:
+        from src.modules.document import paragraph_metadata_repository as ParagraphRepository
+        yield from ParagraphRepository.contents()
+
+
+def build(directory: str = CORPUS_DIRECTORY, paragraphs: bool = True, target: str = TFIDF_DIRECTORY) -> TfidfModel:
+    """
+    Constrói o modelo sobre todo o corpus e grava o modelo e a matriz TF-IDF do corpus em `target`.
+
+    Args:
+        directory (str): Diretório dos CSVs de artigos.
+        paragraphs (bool): Se deve incluir os parágrafos do catálogo. Padrão é True.
+        target (str): Diretório de destino. Padrão é TFIDF_DIRECTORY.
+
+    Returns:
+        TfidfModel: O modelo construído (também passa a ser o modelo compartilhado se `target` for o padrão).
+    """
+    global _shared, _pending
+
+    if target != TFIDF_DIRECTORY:
+        texts = list(corpus_texts(directory, paragraphs))
+        model = TfidfModel().fit(texts)
+        model.save(target)
+        save_matrix(model.transform(texts), target)
+        return model
+
+    with _shared_lock:
+        _pending = []
+    try:
+        texts = list(corpus_texts(directory, paragraphs))
+        model = TfidfModel().fit(texts)
+        matrix = model.transform(texts)
+
+        with _shared_lock:
+            # as atualizações feitas durante a construção são reaplicadas, para não se perderem na troca
+            for added, removed in _pending:
+                model.partial_fit(added, removed)
+            model.save(target)
+            save_matrix(matrix, target)
+            _shared = model
+        return model
+    finally:
+        with _shared_lock:
+            _pending = None
+
+
+_shared: Optional[TfidfModel] = None
+_shared_lock = threading.Lock()
+
+# atualizações recebidas durante um `build` do modelo compartilhado (None fora de um build)
+_pending: Optional[List[tuple]] = None
+
+
+def shared() -> TfidfModel:
+    """retorna o modelo compartilhado pelo processo, carregado de TFIDF_DIRECTORY na primeira chamada"""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = TfidfModel.load(TFIDF_DIRECTORY)
+        return _shared
+
+
+def update(texts: Iterable[str], removed: Iterable[str] = ()) -> TfidfModel:
+    """
+    Atualiza o modelo compartilhado com documentos novos e removidos e o grava em TFIDF_DIRECTORY.
+
+    Args:
+        texts (Iterable[str]): Os novos documentos.
+        removed (Iterable[str]): Os documentos substituídos ou removidos do corpus. Padrão é nenhum.
+
+    Returns:
+        TfidfModel: O modelo compartilhado.
+    """
+    global _shared
+
+    texts, removed = list(texts), list(removed)
+    with _shared_lock:
+        if _shared is None:
+            _shared = TfidfModel.load(TFIDF_DIRECTORY)
+        _shared.partial_fit(texts, removed)
+        _shared.save(TFIDF_DIRECTORY)
+        if _pending is not None:
+            _pending.append((texts, removed))
+        return _shared
+
+
+def generate_tfidf(text: str = "") -> dict:
+    """ pesos TF-IDF(Term Frequency-Inverse Document Frequency) das palavras de um texto sobre o corpus """
+    return shared().weights(text)
 
-    # Monta um vocabulario de frequencia
-    vocabulary = {}
-    for word, weight in zip(vocabulary_tfidf_list, tfidf_matrix[0]):
-        vocabulary[word] = weight
 
-    return vocabulary
\ No newline at end of file
+def generate_tfidf_many(texts: List[str]) -> List[dict]:
+    """ versão em lote de `generate_tfidf` (mesmo tratamento dos termos fora do vocabulário) """
+    return shared().weights_many(texts)
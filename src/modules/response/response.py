@@ -1,9 +1,10 @@
 # pylint: disable=line-too-long
 # flake8: noqa: E501
 
-from typing import Any
+import json
+from typing import Any, Iterable, Tuple
 
-from flask import jsonify
+from flask import Response as HttpResponse, jsonify, stream_with_context
 
 
 class Response:
@@ -111,3 +112,56 @@ class Response:
             Response: Objeto de resposta contendo o status e os dados fornecidos.
         """
         return Response(status, None, None, data)
+
+    @staticmethod
+    def wants_stream(request) -> bool:
+        """
+        Verifica se o cliente pediu a resposta em fluxo, pelo parâmetro `stream` (na query string ou
+        no corpo JSON) ou pelo cabeçalho `Accept: text/event-stream`.
+
+        Args:
+            request (flask.Request): A requisição.
+
+        Returns:
+            bool: True se a resposta deve ser enviada como Server-Sent Events.
+        """
+        flag = request.args.get('stream', default='', type=str)
+        if not flag and request.is_json:
+            flag = str((request.get_json(silent=True) or {}).get('stream', ''))
+        return flag.lower() in ('1', 'true', 'yes') or request.accept_mimetypes.best == "text/event-stream"
+
+    @staticmethod
+    def event(name: str, data: Any) -> str:
+        """
+        Formata um evento Server-Sent Events.
+
+        Args:
+            name (str): Nome do evento (campo `event`).
+            data (Any): Dados do evento, serializados em JSON numa única linha (campo `data`).
+
+        Returns:
+            str: O evento, terminado pela linha em branco.
+        """
+        return f"event: {name}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+    @staticmethod
+    def stream(events: Iterable[Tuple[str, Any]], status: int = 200):
+        """
+        Método estático que cria uma resposta em fluxo (Server-Sent Events).
+        Cada evento é enviado ao cliente assim que é produzido pelo iterador.
+
+        Args:
+            events (Iterable[Tuple[str, Any]]): Pares (nome do evento, dados).
+            status (int): Código de status HTTP da resposta. Padrão é 200.
+
+        Returns:
+            flask.Response: A resposta com o tipo `text/event-stream`.
+        """
+        body = (Response.event(name, data) for name, data in events)
+        return HttpResponse(
+            stream_with_context(body),
+            status=status,
+            mimetype="text/event-stream",
+            # desativa o cache e o buffer de proxies (nginx) para que cada evento chegue imediatamente
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
@@ -1,9 +1,16 @@
 # flake8: noqa: E501
 
+import asyncio
+import logging
+import traceback
+
 from flask import request
 
 
-from src.models.ollama import ModelOllama
+from src.models import embedding_cache as EmbeddingCache
+from src.models import ollama as Ollama
+from src.models import response_cache as ResponseCache
+from src.models.ollama import AsyncModelOllama, ModelOllama
 from src.modules.response.response import Response
 from src.modules.catalog import handles as Catolog
 
@@ -19,18 +26,46 @@ async def completions():
     if not question:
         return Response.error(400, "COM002", "Campo 'question' é obrigatório").result()
 
-    docs = Catolog.search(question, 5, 0.3)
+    docs = await asyncio.to_thread(Catolog.search, question, 5, 0.3)
+
+    if Response.wants_stream(request):
+        # o fluxo é consumido pelo servidor WSGI depois que a view termina, fora do laço de eventos da requisição
+        return Response.stream(_completion_events(Catolog.prompt_search_in_docs(prompt, docs), question))
 
-    llm = ModelOllama()
-    response = llm.question(
+    # o Flask cria um laço de eventos por requisição: a chamada roda no laço compartilhado,
+    # cujo cliente mantém as conexões abertas entre requisições
+    llm = AsyncModelOllama()
+    response = await Ollama.run_shared(llm.aquestion(
         prompt=Catolog.prompt_search_in_docs(prompt, docs),
         question=question
-    )
+    ))
 
     # Resposta de sucesso
     return Response.success(200, f"{response}").result()
 
 
+def _completion_events(prompt: str, question: str):
+    """
+    Eventos do fluxo de resposta: um `token` para cada pedaço gerado pelo modelo e, ao fim,
+    `done` com a resposta completa.
+    """
+    parts = []
+    try:
+        for content in ModelOllama().stream(prompt=prompt, question=question):
+            parts.append(content)
+            yield 'token', {"content": content}
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        yield 'error', {"code": "COM003", "message": "Falha ao gerar a resposta."}
+        return
+
+    yield 'done', {"response": "".join(parts)}
+
+
 async def completions_history():
     history = ModelOllama.history()
     return Response.success(200, {"history": history}).result()
+
+
+async def completions_cache_stats():
+    return Response.success(200, {"responses": ResponseCache.stats(), "embeddings": EmbeddingCache.stats()}).result()
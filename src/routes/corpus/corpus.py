@@ -2,7 +2,9 @@
 
 from datetime import datetime
 from flask import request
+import logging
 import os
+import traceback
 
 from src.utils.log import log_info
 from src.utils.clock import delta_time
@@ -10,6 +12,8 @@ from src.utils import string as String
 from src.modules.corpus import corpus as Corpus
 from src.modules.response.response import Response
 from src.modules.document import service as DocService
+from src.modules.document import change_index as ChangeIndex
+from src.modules.corpus import annotation_cache as AnnotationCache
 
 
 def corpus_list():
@@ -38,6 +42,9 @@ def corpus_list():
 async def corpus_generate():
     """
     Gera um corpus a partir de um documento com opções de filtragem aprimoradas.
+    Uma nova geração do mesmo documento com as mesmas opções reaproveita o resultado guardado:
+    se o arquivo não mudou, nada é relido nem reanotado; se mudou, só os artigos novos ou
+    alterados são anotados de novo.
     """
 
     path: str = request.args.get('path', default='', type=str)
@@ -46,6 +53,7 @@ async def corpus_generate():
     use_filters: bool = request.args.get('use_filters', default=True, type=bool)
     min_length: int = request.args.get('min_length', default=50, type=int)
     extract_components: bool = request.args.get('extract_components', default=False, type=bool)
+    stream: bool = Response.wants_stream(request)
 
     if not path or path == '':
         return Response.error(400, 'COR000', 'O caminho do arquivo não foi informado.').result()
@@ -57,10 +65,19 @@ async def corpus_generate():
     
     paths_corpus = DocService.dir(Corpus.directory_soruce)
     for path_corpus in paths_corpus:
-        print("-> ", path_corpus, path)
         if String.path_name(path_corpus) == String.path_name(path):
             return Response.error(409, 'COR002', 'O documento já foi transformado numa corpus.').result()
-    
+
+    # o resultado guardado e o índice de mudanças são por documento e opções da requisição
+    options = {"page_start": page_start, "page_end": page_end, "use_filters": use_filters, "min_length": min_length, "extract_components": extract_components}
+    pipeline = AnnotationCache.pipeline(options)
+    stored = AnnotationCache.get(path, options)
+
+    if stored is not None and not ChangeIndex.file_changed(path, pipeline):
+        if stream:
+            return Response.stream(_stored_events(stored), 201)
+        return Response.success(201, stored).result()
+
     time_init = datetime.now()
 
     log_info("", "Documento: iniciando loading....", delta_time(time_init))
@@ -75,14 +92,11 @@ async def corpus_generate():
     
     if doc is None or doc['total_articles'] == 0:
         return Response.error(400, 'COR001', 'O documento não possui artigos.').result()
-    
-    time_init = datetime.now()
-    log_info("", "Anotação iniciada", delta_time(time_init))
 
-    annotations = Corpus.take_notes(doc['articles'], extract_components)
+    # anotações guardadas dos artigos cujo texto não mudou
+    reusable = AnnotationCache.annotations_by_text(stored)
+    reused = sum(1 for article in doc['articles'] if String.hash(article) in reusable)
     
-    log_info("", "Anotação finalizada", delta_time(time_init))
-
     # Adicionar informações de processamento à resposta
     result = {
         "document_info": {
@@ -96,9 +110,79 @@ async def corpus_generate():
             "components_extracted": extract_components,
             "min_length_filter": min_length if use_filters else None,
             "filtered": doc.get('filtered', False),
-            "original_count": doc.get('original_count') if use_filters else None
+            "original_count": doc.get('original_count') if use_filters else None,
+            "incremental": stored is not None,
+            "reused_annotations": reused
         },
-        "annotations": annotations
     }
 
-    return Response.success(201, result).result()
+    if stream:
+        return Response.stream(_annotation_events(path, options, doc['articles'], reusable, extract_components, result), 201)
+
+    time_init = datetime.now()
+    log_info("", "Anotação iniciada", delta_time(time_init))
+
+    # sem fluxo, a análise sintática de todos os artigos pendentes é feita numa única passada do spaCy
+    result["annotations"] = list(_notes(doc['articles'], reusable, extract_components, batch_size=max(len(doc['articles']), 1)))
+    
+    log_info("", "Anotação finalizada", delta_time(time_init))
+
+    _store(path, options, result)
+
+    return Response.success(201, result).result()
+
+
+def _notes(articles: list, reusable: dict, extract_components: bool, batch_size: int = 16):
+    """
+    Anotações dos artigos, na ordem dos artigos: os artigos com anotação guardada a reaproveitam
+    e os demais são anotados por `Corpus.iter_notes`, em lotes de `batch_size` artigos (lotes
+    pequenos no fluxo, para que a primeira anotação não espere a análise do documento inteiro).
+    """
+    pending = [article for article in articles if String.hash(article) not in reusable]
+    notes = Corpus.iter_notes(pending, extract_components, batch_size)
+    for article in articles:
+        annotation = reusable.get(String.hash(article))
+        yield annotation if annotation is not None else next(notes)
+
+
+def _store(path: str, options: dict, result: dict):
+    """guarda o resultado completo e registra o estado do arquivo no índice de mudanças"""
+    if AnnotationCache.put(path, options, result):
+        ChangeIndex.commit(path, AnnotationCache.pipeline(options))
+
+
+def _stored_events(stored: dict):
+    """eventos de um resultado guardado: `document`, um `annotation` por artigo e `done`"""
+    annotations = stored.get('annotations', [])
+    yield 'document', {key: value for key, value in stored.items() if key != 'annotations'}
+    for index, annotation in enumerate(annotations):
+        yield 'annotation', {"index": index, **annotation}
+    yield 'done', {"total_annotations": len(annotations)}
+
+
+def _annotation_events(path: str, options: dict, articles: list, reusable: dict, extract_components: bool, result: dict):
+    """
+    Eventos do fluxo de anotação: `document` (informações do documento e do processamento),
+    um `annotation` para cada artigo assim que ele é anotado e, ao fim, `done`.
+    O resultado só é guardado depois que todas as anotações foram enviadas.
+    """
+    yield 'document', result
+
+    time_init = datetime.now()
+    log_info("", "Anotação iniciada", delta_time(time_init))
+
+    annotations = []
+    try:
+        for annotation in _notes(articles, reusable, extract_components):
+            yield 'annotation', {"index": len(annotations), **annotation}
+            annotations.append(annotation)
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        yield 'error', {"code": 'COR003', "message": 'Falha ao anotar o documento.'}
+        return
+
+    log_info("", "Anotação finalizada", delta_time(time_init))
+
+    _store(path, options, {**result, "annotations": annotations})
+
+    yield 'done', {"total_annotations": len(annotations)}
@@ -1,6 +1,7 @@
 from flask import request
 
 from src.modules.document import service as DocService
+from src.modules.document import text_layer as TextLayer
 from src.modules.response.response import Response
 
 
@@ -15,3 +16,7 @@ async def document_pages_details():
     pages = DocService.document_pages_with_details(path, init, final)
     pages_data = [page.dict() for page in pages]
     return Response.success(200, pages_data).result()
+
+
+async def document_extraction_stats():
+    return Response.success(200, TextLayer.stats()).result()
@@ -3,8 +3,10 @@
 from flask import Blueprint
 
 
+from src.routes.completions.completions import completions, completions_cache_stats, completions_history
 from src.routes.corpus.corpus import corpus_generate, corpus_list
 from src.routes.dataset.dataset import dataset_dir_list
+from src.routes.document.document import document_extraction_stats
 from src.routes.health import health
 
 
@@ -16,6 +18,11 @@ async def api_v1_health():
     return await health()
 
 
+@app.route('/api/v1/document/extraction/stats', methods=['GET'])
+async def api_v1_document_extraction_stats():
+    return await document_extraction_stats()
+
+
 @app.route('/api/v1/dataset', methods=['GET'])
 async def api_v1_dataset():
     return dataset_dir_list()
@@ -44,14 +51,19 @@ async def api_v1_corpus_generate():
 #     return catalog_list()
 
 
-# @app.route('/api/v1/completions', methods=['POST'])
-# async def api_v1_completions():
-#     return await completions()
+@app.route('/api/v1/completions', methods=['POST'])
+async def api_v1_completions():
+    return await completions()
+
+
+@app.route('/api/v1/completions/history', methods=['GET'])
+async def api_v1_completions_history():
+    return await completions_history()
 
 
-# @app.route('/api/v1/completions/history', methods=['GET'])
-# async def api_v1_completions_history():
-#     return await completions_history()
+@app.route('/api/v1/completions/cache/stats', methods=['GET'])
+async def api_v1_completions_cache_stats():
+    return await completions_cache_stats()
 
 
 
@@ -0,0 +1,70 @@
+# flake8: noqa: E501
+"""
+Rotina do modelo TF-IDF do corpus.
+
+Constrói o modelo (frequência de documentos de cada termo) e a matriz TF-IDF do corpus com `Tfidf.build`
+e os grava em `Tfidf.TFIDF_DIRECTORY`. Na inicialização da aplicação o modelo só é construído se ainda
+não existir; depois disso ele é mantido de forma incremental (`Tfidf.update`) pela indexação de parágrafos.
+
+Uso:
+    python -m src.routines.tfidf    # reconstrói o modelo e a matriz do corpus
+"""
+
+import logging
+import os
+import sys
+import threading
+import traceback
+from typing import Optional
+
+from src.modules.nlp import tfidf as Tfidf
+
+
+def built() -> bool:
+    """verifica se o modelo e a matriz do corpus já foram gravados"""
+    target = Tfidf.TFIDF_DIRECTORY
+    return os.path.exists(os.path.join(target, "model.json")) and Tfidf.load_matrix(target) is not None
+
+
+def build() -> bool:
+    """
+    Reconstrói o modelo TF-IDF e a matriz do corpus.
+
+    Returns:
+        bool: True se o modelo foi construído, False caso contrário.
+    """
+    try:
+        model = Tfidf.build(Tfidf.CORPUS_DIRECTORY, paragraphs=True, target=Tfidf.TFIDF_DIRECTORY)
+        logging.info(f"✓ Modelo TF-IDF construído: {model.documents} documentos, {len(model.terms)} termos")
+        return True
+    except Exception as e:
+        logging.error(f"{e}\n{traceback.format_exc()}")
+        return False
+
+
+def build_on_startup(background: bool = True) -> Optional[threading.Thread]:
+    """
+    Constrói o modelo TF-IDF na inicialização, se ainda não existir; caso contrário, carrega o modelo compartilhado.
+
+    Args:
+        background (bool): Se deve construir numa thread, sem atrasar a subida do servidor. Padrão é True.
+
+    Returns:
+        Optional[threading.Thread]: A thread de construção, ou None se nada foi construído em segundo plano.
+    """
+    if built():
+        Tfidf.shared()
+        return None
+
+    if not background:
+        build()
+        return None
+
+    thread = threading.Thread(target=build, name="tfidf-build", daemon=True)
+    thread.start()
+    return thread
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    sys.exit(0 if build() else 1)
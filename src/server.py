@@ -1,9 +1,15 @@
 # flake8: noqa: E501
 
+import atexit
+
 from flask import Flask
+from src.models import ollama as Ollama
 from src.routes.routes import app as Routes
 
 
 app = Flask(__name__)
 app.register_blueprint(Routes)
 
+# fecha os clientes do Ollama (e as conexões mantidas entre requisições) no encerramento da aplicação
+atexit.register(Ollama.close)
+
@@ -5,7 +5,7 @@ import re
 import string
 import hashlib
 import unicodedata
-from typing import List
+from typing import Dict, Iterable, List, Optional, Tuple
 
 try:
     from nltk.tokenize import word_tokenize
@@ -88,6 +88,189 @@ def split_to_pargraphs(content: str = "") -> List[str]:
     return paragraphs
 
 
+# quebras de linha e de parágrafo reconhecidas por `split_to_pargraphs`
+_LINE_BREAKS = re.compile(r'(?:\r\n|\n|\r|\x0b|\x0c|\u0085|\u2028|\u2029)')
+_PARAGRAPH_BREAKS = re.compile(r'(?:\r\n|\n|\r|\x0b|\x0c|\u0085|\u2028|\u2029){2,}')
+
+
+def split_to_pargraphs_spans(content: str = "", start: int = 0, end: int | None = None) -> List[Tuple[int, int]]:
+    """
+    Localiza os parágrafos de um trecho do texto sem copiá-lo, retornando os intervalos (início, fim) de cada um.
+
+    Os intervalos seguem exatamente a mesma separação de `split_to_pargraphs`: o trecho é aparado
+    e dividido em duas ou mais quebras de linha, e cada parágrafo é aparado (inclusive o recuo da
+    primeira linha). O texto de cada parágrafo é obtido com `pargraph_from_span`.
+
+    Parâmetros:
+        content (str): O texto completo.
+        start (int): Posição inicial do trecho. Padrão é 0.
+        end (int | None): Posição final (exclusiva) do trecho. Padrão é o fim do texto.
+
+    Retorna:
+        List[Tuple[int, int]]: Lista de intervalos dos parágrafos no texto original.
+    """
+    start, end = _strip_span(content, start, len(content) if end is None else end)
+
+    spans: List[Tuple[int, int]] = []
+    cursor = start
+    for match in _PARAGRAPH_BREAKS.finditer(content, start, end):
+        spans.append(_strip_span(content, cursor, match.start()))
+        cursor = match.end()
+    spans.append(_strip_span(content, cursor, end))
+
+    return spans
+
+
+def _strip_span(content: str, start: int, end: int) -> Tuple[int, int]:
+    """equivalente a content[start:end].strip() sem copiar o trecho"""
+    while start < end and content[start].isspace():
+        start += 1
+    while end > start and content[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def pargraph_from_span(content: str, span: Tuple[int, int]) -> str:
+    """
+    Materializa o texto de um parágrafo a partir do seu intervalo, substituindo as quebras de linha internas por espaço.
+
+    Parâmetros:
+        content (str): O texto completo.
+        span (Tuple[int, int]): Intervalo (início, fim) do parágrafo.
+
+    Retorna:
+        str: O parágrafo, igual ao produzido por `split_to_pargraphs`.
+    """
+    start, end = span
+    return _LINE_BREAKS.sub(' ', content[start:end]).strip()
+
+
+# fronteiras de corte dos chunks
+BOUNDARY_PERIOD = "period"        # último ponto final da janela (comportamento original)
+BOUNDARY_SENTENCE = "sentence"    # último fim de frase (. ! ? ;) seguido de espaço; sem ele, o último espaço entre palavras
+BOUNDARY_NONE = "none"            # corte seco no tamanho da janela
+
+# fim de frase e abreviações comuns em textos legais (Art., Arts., Inc., n.) que não encerram a frase
+_SENTENCE_ENDS = re.compile(r'[.!?;](?=\s|$)')
+_ABBREVIATIONS = re.compile(r'(?<!\w)(?:[Aa]rts?|[Ii]nc|n)$')
+_WORDS = re.compile(r'\S+')
+
+# abaixo deste valor a sobreposição é descartada
+_CUT_OVERLAP = 10
+
+
+def split_to_chunks_spans(content: str = "", size: int = 1000, overlap: int = 0, start: int = 0, end: int | None = None, boundary: str = BOUNDARY_PERIOD, tokens: int = 0) -> List[Tuple[int, int]]:
+    """
+    Divide um trecho do texto em pedaços (chunks) numa única passada, retornando os intervalos (início, fim) de cada um.
+
+    A janela de cada chunk só avança: o último ponto final é procurado com `str.rfind` da direita para a
+    esquerda (cada caractere é examinado no máximo duas vezes), e os fins de frase e as palavras são
+    localizados uma única vez, com ponteiros que só avançam, o que garante tempo O(n). O início do
+    próximo chunk nunca recua para antes do início do anterior: se a sobreposição o faria recuar,
+    o próximo chunk começa no fim do atual.
+
+    Parâmetros:
+        content (str): O texto completo.
+        size (int): Máximo de caracteres por chunk. Padrão é 1000.
+        overlap (int): Caracteres de sobreposição entre chunks consecutivos. Padrão é 0.
+        start (int): Posição inicial do trecho. Padrão é 0.
+        end (int | None): Posição final (exclusiva) do trecho. Padrão é o fim do texto.
+        boundary (str): Fronteira de corte: BOUNDARY_PERIOD, BOUNDARY_SENTENCE ou BOUNDARY_NONE. Padrão é BOUNDARY_PERIOD.
+        tokens (int): Máximo de palavras (tokens separados por espaço) por chunk. 0 não limita. Padrão é 0.
+
+    Retorna:
+        List[Tuple[int, int]]: Intervalos dos chunks no texto original, sem espaços nas pontas.
+    """
+    end = len(content) if end is None else end
+    size = max(int(size), 1)
+
+    if size <= overlap:
+        overlap = int(size * 0.4)
+    if overlap <= _CUT_OVERLAP:
+        overlap = 0
+
+    # posições logo após cada fim de frase
+    cuts = []
+    if boundary == BOUNDARY_SENTENCE:
+        for match in _SENTENCE_ENDS.finditer(content, start, end):
+            if match.group() != '.' or not _ABBREVIATIONS.search(content, max(start, match.start() - 4), match.start()):
+                cuts.append(match.end())
+
+    words = [match.start() for match in _WORDS.finditer(content, start, end)] if tokens else []
+
+    spans: List[Tuple[int, int]] = []
+    cut = first_word = 0
+    while start < end:
+        stop = min(start + size, end)
+
+        # limite de palavras: o chunk termina antes da palavra de número `tokens + 1`
+        if tokens:
+            while first_word < len(words) and words[first_word] < start:
+                first_word += 1
+            if first_word + tokens < len(words):
+                stop = min(stop, words[first_word + tokens])
+
+        if boundary == BOUNDARY_PERIOD:
+            # último ponto final da janela, também na última janela, como a versão original
+            last_period = content.rfind('.', start, stop)
+            if last_period != -1:
+                stop = last_period + 1
+        elif boundary == BOUNDARY_SENTENCE:
+            # último fim de frase da janela (start, stop]; sem ele, o último espaço entre palavras
+            while cut < len(cuts) and cuts[cut] <= stop:
+                cut += 1
+            if stop < end and cut and cuts[cut - 1] > start:
+                stop = cuts[cut - 1]
+            elif stop < end:
+                space = max(content.rfind(' ', start + 1, stop + 1), content.rfind('\n', start + 1, stop + 1))
+                if space != -1:
+                    stop = space
+
+        # remove espaços em branco no início e no fim sem copiar o trecho
+        left, right = start, stop
+        while left < right and content[left].isspace():
+            left += 1
+        while right > left and content[right - 1].isspace():
+            right -= 1
+        if left < right:
+            spans.append((left, right))
+
+        if stop >= end:
+            break
+
+        # avança o início levando em conta a sobreposição, sem nunca recuar
+        start = stop - overlap if stop - overlap > start else stop
+
+    return spans
+
+
+def chunk_spans(content: str = "", size: int = 1000, overlap: int = 0, boundary: str = BOUNDARY_PERIOD, tokens: int = 0) -> List[Tuple[int, int]]:
+    """
+    Localiza os chunks de cada parágrafo do texto, retornando os intervalos (início, fim) no texto original.
+    É a versão sem cópias de `split_to_chunks`; o texto de cada chunk é obtido com `chunk_from_span`.
+
+    Parâmetros:
+        content (str): O texto completo.
+        size (int): Máximo de caracteres por chunk. Padrão é 1000.
+        overlap (int): Caracteres de sobreposição entre chunks consecutivos. Padrão é 0.
+        boundary (str): Fronteira de corte. Padrão é BOUNDARY_PERIOD.
+        tokens (int): Máximo de palavras por chunk. 0 não limita. Padrão é 0.
+
+    Retorna:
+        List[Tuple[int, int]]: Intervalos dos chunks no texto original.
+    """
+    spans: List[Tuple[int, int]] = []
+    for start, end in split_to_pargraphs_spans(content):
+        spans.extend(split_to_chunks_spans(content, size, overlap, start, end, boundary, tokens))
+    return spans
+
+
+def chunk_from_span(content: str, span: Tuple[int, int]) -> str:
+    """materializa o texto de um chunk, substituindo as quebras de linha internas por espaço (como nos parágrafos)"""
+    start, end = span
+    return _LINE_BREAKS.sub(' ', content[start:end])
+
+
 def split_to_chunks(content: str = "", size: int = 1000, overlap: int = 0) -> List[str]:
     """
     Divide o conteúdo de um texto em pedaços (chunks) baseado em texto, com um tamanho máximo especificado e sobreposição opcional.
@@ -95,26 +278,16 @@ def split_to_chunks(content: str = "", size: int = 1000, overlap: int = 0) -> Li
     Args:
         content (str): O conteúdo a ser dividido em pedaços, representado como uma string. Por padrão, está vazio.
         size (int): O tamanho máximo de cada chunk (pedaço de texto) em caracteres. O valor padrão é 1000.
-        overlap (int): A quantidade de caracteres que cada chunk deve sobrepor o próximo. O valor padrão é 200.
+        overlap (int): A quantidade de caracteres que cada chunk deve sobrepor o próximo. O valor padrão é 0.
 
     Returns:
         List[str]: Uma lista contendo os chunks (pedaços de texto) gerados.
 
     Descrição:
-        A função primeiro divide o conteúdo em chunks de acordo com o tamanho especificado; 
-        Cada chunk pode ter uma sobreposição com o próximo, definida pelo parâmetro `overlap`.
+        O conteúdo é dividido em parágrafos e cada parágrafo em chunks de até `size` caracteres, terminando
+        no último ponto final da janela; os intervalos vêm de `chunk_spans` e só então o texto é copiado.
     """
-
-    paragraphs = split_to_pargraphs(content)
-    chunks = []
-
-    for paragraph in paragraphs:
-        # transforma um parágrafo em chunks (pedaços de texto)
-        cks = split_to_chunks_raw(paragraph.encode(
-            'utf-8').decode('utf-8'), size, overlap)
-        chunks.extend(cks)
-
-    return chunks
+    return [chunk_from_span(content, span) for span in chunk_spans(content, size, overlap)]
 
 
 def split_to_chunks_raw(content: str = "", size: int = 1000, overlap: int = 0) -> List[str]:
@@ -124,63 +297,36 @@ def split_to_chunks_raw(content: str = "", size: int = 1000, overlap: int = 0) -
     Args:
         content (str): O texto a ser dividido em chunks. Por padrão, está vazio.
         size (int): O número máximo de caracteres por chunk (pedaço de texto). O valor padrão é 1000.
-        overlap (int): A quantidade de caracteres de sobreposição entre os chunks. O valor padrão é 200.
+        overlap (int): A quantidade de caracteres de sobreposição entre os chunks. O valor padrão é 0.
 
     Returns:
         List[str]: Uma lista contendo os chunks (pedaços de texto) gerados.
 
     Descrição:
-        A função utiliza uma expressão regular para dividir o conteúdo em pedaços de tamanho máximo `size`. A expressão regular 
-        é configurada para capturar blocos de texto de até `size` caracteres, sem considerar a sobreposição.
-        O conteúdo é primeiro codificado e decodificado como 'utf-8' para garantir que caracteres especiais sejam corretamente processados.
+        Cada chunk termina no último ponto final dentro da janela de `size` caracteres (ou no fim da janela,
+        se não houver ponto) e o próximo começa `overlap` caracteres antes desse fim. Os intervalos vêm de
+        `split_to_chunks_spans`, que percorre o texto uma única vez.
     """
+    return [content[start:end] for start, end in split_to_chunks_spans(content, size, overlap)]
 
-    # valor limit de onde overlap começa a valer
-    cut_overlap = 10
-
-    if size <= overlap:
-        overlap = int(size * 0.4)
-
-    if overlap <= cut_overlap:
-        overlap = 0
-
-    chunks = []
-    start = 0
-    content_length = len(content)
-
-    while start < content_length:
-
-        # Define o fim do chunk com base no size e no overlap
-        end = min(start + size, content_length)
-
-        # Busca o último ponto final antes de tamnaho (size) do chunk
-        last_period = content.rfind('.', start, end)
 
-        # Se houver um ponto final, ajusta o final do chunk para ele
-        if last_period != -1:
-            end = last_period + 1
-
-        # Remove espaços em branco no início e no fim
-        chunk = content[start:end].strip()
-        chunks.append(chunk)
-
-        # Avança o início para o próximo chunk, levando em conta o overlap
-        new_start = end - overlap
-
-        # Se não houver parágrafo, usa o início calculado normalmente
-        start = new_start
+class _ControlCharacters(dict):
+    """
+    Tabela de `str.translate` que remove os caracteres de controle e não imprimíveis (categoria Unicode C*).
+    A categoria de cada caractere é consultada uma única vez e guardada na própria tabela.
+    """
 
-        if overlap <= cut_overlap:
-            # Busca o primeiro início de parágrafo (\n\n) antes de 200 caracteres no overlap
-            first_paragraph_start = content.rfind(
-                '\n\n', max(0, new_start - overlap), new_start)
+    def __missing__(self, code: int):
+        value = None if unicodedata.category(chr(code))[0] == 'C' else code
+        self[code] = value
+        return value
 
-            # Se houver um início de parágrafo, ajusta o novo início para ele
-            if first_paragraph_start != -1:
-                # Pula os dois caracteres de nova linha
-                start = first_paragraph_start + 2
 
-    return chunks
+# pipeline de normalização de `clean_lines`, compilado uma única vez
+_CONTROL_CHARACTERS = _ControlCharacters()
+_WHITESPACES = re.compile(r'\s+')
+_SPACE_BEFORE_PUNCTUATION = re.compile(r'\s+([{}])'.format(re.escape(string.punctuation)))
+_REPEATED_PUNCTUATION = re.compile(r'([{}])\1+'.format(re.escape(string.punctuation)))
 
 
 def clean_lines(line: str = "") -> str:
@@ -198,28 +344,47 @@ def clean_lines(line: str = "") -> str:
     """
 
     # Normaliza caracteres unicode para decompor caracteres compostos
-    line = unicodedata.normalize('NFKC', line)
+    if not line.isascii():
+        line = unicodedata.normalize('NFKC', line)
 
     # Remove caracteres de controle e não imprimíveis
-    line = ''.join(ch for ch in line if unicodedata.category(ch)[0] != 'C')
+    line = line.translate(_CONTROL_CHARACTERS)
 
     # Substitui todos os tipos de espaços em branco por um único espaço
-    line = re.sub(r'\s+', ' ', line).strip()
+    line = _WHITESPACES.sub(' ', line).strip()
 
     # Remove espaços antes de pontuação
-    line = re.sub(
-        r'\s+([{}])'.format(re.escape(string.punctuation)), r'\1', line)
+    line = _SPACE_BEFORE_PUNCTUATION.sub(r'\1', line)
 
     # Remove pontuações duplicadas
-    line = re.sub(
-        r'([{}])\1+'.format(re.escape(string.punctuation)), r'\1', line)
-
-    line = re.sub(r' +|\n+', ' ', line.encode('utf-8').decode('utf-8')).strip()
+    line = _REPEATED_PUNCTUATION.sub(r'\1', line)
 
     # Remove pontuações no início e fim da linha
-    line = line.strip(string.punctuation)
+    return line.strip(string.punctuation)
+
+
+def clean_lines_many(lines: Iterable[str], memo: Optional[Dict[str, str]] = None) -> List[str]:
+    """
+    Limpa uma sequência de linhas com `clean_lines`, reaproveitando o resultado de linhas repetidas.
+
+    Cabeçalhos e rodapés se repetem em todas as páginas de um documento; passar o mesmo `memo`
+    nas chamadas de um documento faz com que cada linha distinta seja limpa uma única vez.
 
-    return line
+    Parâmetros:
+        lines (Iterable[str]): As linhas a serem limpas.
+        memo (Optional[Dict[str, str]]): Dicionário de linhas já limpas. Padrão é None (um memo por chamada).
+
+    Retorna:
+        List[str]: As linhas limpas, na mesma ordem.
+    """
+    memo = {} if memo is None else memo
+    cleaned = []
+    for line in lines:
+        result = memo.get(line)
+        if result is None:
+            result = memo[line] = clean_lines(line)
+        cleaned.append(result)
+    return cleaned
 
 
 def clean(text: str = "") -> str:
@@ -335,8 +500,17 @@ def unique(contents: List[str] = []) -> List[str]:
     return results
 
 
-def hash(text: str = "") -> str:
-    text_bytes = text.encode('utf-8')
+def hash(text: str | bytes = "") -> str:
+    """
+    Calcula o hash sha3-256 de um texto ou de uma sequência de bytes.
+
+    Parâmetros:
+        text (str | bytes): O texto (codificado em UTF-8) ou os bytes a serem resumidos.
+
+    Retorna:
+        str: O hash em hexadecimal.
+    """
+    text_bytes = text if isinstance(text, (bytes, bytearray)) else text.encode('utf-8')
     hash_obj = hashlib.sha3_256()
     hash_obj.update(text_bytes)
     return hash_obj.hexdigest()
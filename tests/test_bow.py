@@ -0,0 +1,63 @@
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("scipy")
+
+from src.modules.nlp import bow as Bow
+
+TEXTS = [
+    "Tributo tributo tributo imposto imposto contribuição",
+    "Imposto sobre a renda: imposto imposto imposto",
+    "",
+]
+
+
+@pytest.fixture(autouse=True)
+def tokenizer(monkeypatch):
+    """sem os dados do NLTK (punkt), tokeniza por expressão regular em vez de pular os testes"""
+    try:
+        Bow.Str.tokenize("teste")
+    except LookupError:
+        monkeypatch.setattr(Bow.Str, "word_tokenize", lambda text, language=None: re.findall(r"\w+|[^\w\s]", text))
+
+
+def test_generate_bow_matches_count_vectorizer():
+    sklearn_text = pytest.importorskip("sklearn.feature_extraction.text")
+    processed = Bow.Str.removal_stopwords(TEXTS[0])
+    vectorizer = sklearn_text.CountVectorizer()
+    counts = vectorizer.fit_transform([processed]).toarray()[0]
+    assert Bow.generate_bow(TEXTS[0]) == dict(zip(vectorizer.get_feature_names_out(), counts))
+
+
+def test_batch_matches_single_text_path():
+    bow = Bow.BagOfWords()
+    matrix = bow.fit_transform(TEXTS)
+    assert matrix.shape == (3, len(bow.terms))
+    assert bow.top_terms(matrix, k=1) == [{"tributo": 3}, {"imposto": 4}, {}]
+    assert Bow.relevant_words_many(TEXTS) == [Bow.relevant_words(text) for text in TEXTS]
+
+
+def test_transform_keeps_the_vocabulary_fixed():
+    bow = Bow.BagOfWords(["tributo"])
+
+    matrix = bow.transform(TEXTS)
+    assert bow.terms == ["tributo"] and matrix.shape == (3, 1)
+
+    bow.fit(TEXTS[1:2])
+    assert bow.terms == ["tributo", "imposto", "renda"]
+
+
+def test_vocabulary_is_stable_across_updates(tmp_path):
+    bow = Bow.BagOfWords().fit(TEXTS[:1])
+    columns = dict(bow.vocabulary)
+    bow.fit(TEXTS[1:])
+    assert all(bow.vocabulary[term] == index for term, index in columns.items())
+
+    path = str(tmp_path / "vocabulary.json")
+    bow.save(path)
+    assert Bow.BagOfWords.load(path).terms == bow.terms
@@ -0,0 +1,49 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.modules.document import change_index as ChangeIndex
+
+
+@pytest.fixture
+def pdf(tmp_path, monkeypatch):
+    # o banco SQLite fica em ./data/.sqlite relativo ao diretório atual
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "lei.pdf"
+    path.write_bytes(b"%PDF-1.4 versao 1")
+    return str(path)
+
+
+def test_new_file_is_changed_until_committed(pdf):
+    assert ChangeIndex.file_changed(pdf, ChangeIndex.PIPELINE_CORPUS)
+    assert ChangeIndex.commit(pdf, ChangeIndex.PIPELINE_CORPUS)
+    assert not ChangeIndex.file_changed(pdf, ChangeIndex.PIPELINE_CORPUS)
+    # cada pipeline tem o seu próprio estado
+    assert ChangeIndex.file_changed(pdf, ChangeIndex.PIPELINE_CATALOG)
+
+
+def test_touch_without_content_change_is_not_a_change(pdf):
+    ChangeIndex.commit(pdf, ChangeIndex.PIPELINE_CORPUS)
+    stat = os.stat(pdf)
+    os.utime(pdf, (stat.st_atime + 10, stat.st_mtime + 10))
+    assert not ChangeIndex.file_changed(pdf, ChangeIndex.PIPELINE_CORPUS)
+
+    Path(pdf).write_bytes(b"%PDF-1.4 versao 2")
+    assert ChangeIndex.file_changed(pdf, ChangeIndex.PIPELINE_CORPUS)
+
+
+def test_changed_pages(pdf):
+    hashes = ChangeIndex.page_hashes([(1, "Art. 1º"), (2, "Art. 2º"), (3, "Art. 3º")])
+    assert ChangeIndex.changed_pages(pdf, ChangeIndex.PIPELINE_PARAGRAPHS, hashes) == [1, 2, 3]
+    ChangeIndex.commit(pdf, ChangeIndex.PIPELINE_PARAGRAPHS, hashes, replace=True)
+
+    hashes = ChangeIndex.page_hashes([(1, "Art. 1º"), (2, "Art. 2º alterado")])
+    assert ChangeIndex.changed_pages(pdf, ChangeIndex.PIPELINE_PARAGRAPHS, hashes) == [2]
+    assert ChangeIndex.changed_pages(pdf, ChangeIndex.PIPELINE_PARAGRAPHS, hashes, removed=True) == [2, 3]
+
+    ChangeIndex.forget(pdf)
+    assert ChangeIndex.stored_hashes(pdf, ChangeIndex.PIPELINE_PARAGRAPHS) == {}
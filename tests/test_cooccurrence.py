@@ -0,0 +1,67 @@
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("scipy")
+
+from src.modules.nlp.cooccurrence import CooccurrenceMatrix
+
+WINDOWS = [
+    ["direito", "civil", "contrato", "civil"],
+    ["contrato", "trabalho"],
+    ["único"],
+    [],
+]
+
+
+def _loop(windows):
+    """implementação de referência (laço duplo por janela)"""
+    counts = defaultdict(Counter)
+    for window in windows:
+        for i in range(len(window)):
+            for j in range(len(window)):
+                if i != j:
+                    counts[window[i]][window[j]] += 1.0 / abs(i - j)
+    return {term: dict(neighbors) for term, neighbors in counts.items()}
+
+
+def _assert_same(result, expected):
+    assert result.keys() == expected.keys()
+    for term in expected:
+        assert result[term] == pytest.approx(expected[term])
+
+
+def test_windows_match_reference_loop():
+    _assert_same(CooccurrenceMatrix().add_windows(WINDOWS).dict(), _loop(WINDOWS))
+
+
+def test_token_stream_uses_sliding_window():
+    tokens = ["a", "b", "c", "a", "b"]
+    matrix = CooccurrenceMatrix().add_tokens(tokens, window_size=2)
+    assert matrix.weight("a", "b") == pytest.approx(1.0 + 0.5 + 1.0)
+    assert matrix.weight("a", "c") == pytest.approx(0.5 + 1.0)
+    assert matrix.weight("a", "a") == 0.0
+
+
+def test_documents_do_not_cross_boundaries():
+    matrix = CooccurrenceMatrix().add_documents([["a", "b"], ["c", "d"]], window_size=3)
+    assert matrix.weight("b", "c") == 0.0
+    assert matrix.weight("a", "b") == pytest.approx(1.0)
+
+
+def test_merge_aligns_vocabularies():
+    first = CooccurrenceMatrix().add_windows(WINDOWS[:1])
+    second = CooccurrenceMatrix().add_windows(WINDOWS[1:])
+    _assert_same(first.merge(second).dict(), _loop(WINDOWS))
+
+
+def test_neighbors_are_sorted_by_weight():
+    matrix = CooccurrenceMatrix().add_windows(WINDOWS)
+    neighbors = matrix.neighbors("civil", k=2)
+    assert [term for term, _ in neighbors] == ["contrato", "direito"]
+    assert neighbors[0][1] == pytest.approx(1.0 + 1.0)
+    assert matrix.neighbors("ausente") == []
@@ -0,0 +1,114 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+flask = pytest.importorskip("flask")
+
+from src.modules.database import sqlitedb
+from src.modules.document import change_index as ChangeIndex
+from src.modules.corpus import annotation_cache as AnnotationCache
+from src.routes.corpus import corpus as CorpusRoute
+
+app = flask.Flask(__name__)
+
+
+@pytest.fixture
+def document(tmp_path, monkeypatch):
+    connect = sqlitedb.client
+    monkeypatch.setattr(sqlitedb, "client", lambda path=None: connect(str(tmp_path / "sqlite")))
+    monkeypatch.setattr(AnnotationCache, "directory", str(tmp_path / "cache"))
+    (tmp_path / "corpus").mkdir()
+    monkeypatch.setattr(CorpusRoute.Corpus, "directory_soruce", str(tmp_path / "corpus"))
+
+    path = tmp_path / "lei.pdf"
+    path.write_text("Art. 1º\nArt. 2º")
+    state = {"reads": 0, "annotated": []}
+
+    def doc_with_articles_filtered(path, page_start, page_end, min_length, filter_empty):
+        state["reads"] += 1
+        articles = Path(path).read_text().split("\n")
+        return {"path": path, "name": "lei.pdf", "pages": 1, "articles": articles, "total_articles": len(articles)}
+
+    def iter_notes(articles, extract_components=False, batch_size=16):
+        for article in articles:
+            state["annotated"].append(article)
+            yield {"text": article, "subject": article.upper()}
+
+    monkeypatch.setattr(CorpusRoute.Corpus, "doc_with_articles_filtered", doc_with_articles_filtered)
+    monkeypatch.setattr(CorpusRoute.Corpus, "iter_notes", iter_notes)
+    return path, state
+
+
+def generate(path, **args):
+    query = "&".join(f"{key}={value}" for key, value in {"path": path, **args}.items())
+    with app.test_request_context(f"/?{query}"):
+        body, status = asyncio.run(CorpusRoute.corpus_generate())
+        return status, body.get_json()
+
+
+def test_existing_corpus_file_still_conflicts(document, tmp_path):
+    path, state = document
+    (tmp_path / "corpus" / "lei.csv").write_text("")
+
+    status, body = generate(path)
+    assert status == 409 and body["code"] == 'COR002'
+    assert state["reads"] == 0
+
+
+def test_unchanged_document_reuses_the_stored_result(document):
+    path, state = document
+
+    status, first = generate(path)
+    assert status == 201 and state["annotated"] == ["Art. 1º", "Art. 2º"]
+
+    status, again = generate(path)
+    assert status == 201 and again == first
+    assert state["reads"] == 1 and len(state["annotated"]) == 2
+
+
+def test_changed_document_annotates_only_changed_articles(document):
+    path, state = document
+    generate(path)
+
+    path.write_text("Art. 1º\nArt. 2º alterado\nArt. 3º")
+    status, body = generate(path)
+
+    assert status == 201
+    assert state["annotated"][2:] == ["Art. 2º alterado", "Art. 3º"]
+    assert [note["text"] for note in body["data"]["annotations"]] == ["Art. 1º", "Art. 2º alterado", "Art. 3º"]
+    assert body["data"]["processing_info"]["reused_annotations"] == 1
+    assert not ChangeIndex.file_changed(str(path), AnnotationCache.pipeline({"page_start": 1, "page_end": -1, "use_filters": True, "min_length": 50, "extract_components": False}))
+
+
+def test_other_options_do_not_share_the_result(document):
+    path, state = document
+    generate(path)
+
+    status, _ = generate(path, min_length=10)
+    assert status == 201
+    assert state["reads"] == 2 and len(state["annotated"]) == 4
+
+
+def test_streaming_annotates_in_small_batches(document, monkeypatch):
+    path, state = document
+    path.write_text("\n".join(f"Art. {n}º" for n in range(1, 41)))
+    sizes = []
+
+    def iter_notes(articles, extract_components=False, batch_size=16):
+        sizes.append(batch_size)
+        for article in articles:
+            yield {"text": article, "subject": article.upper()}
+
+    monkeypatch.setattr(CorpusRoute.Corpus, "iter_notes", iter_notes)
+    with app.test_request_context(f"/?path={path}&stream=true"):
+        response = asyncio.run(CorpusRoute.corpus_generate())
+        assert response.status_code == 201
+        assert "event: done" in response.get_data(as_text=True)
+    assert sizes == [16]
+
+    generate(path, min_length=10)
+    assert sizes == [16, 40]
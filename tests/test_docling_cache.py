@@ -0,0 +1,173 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.modules.document import docling_cache as DoclingCache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "cache"
+    monkeypatch.setattr(DoclingCache, "directory", str(directory))
+    DoclingCache.clear()
+    return directory
+
+
+@pytest.fixture
+def pdf(tmp_path):
+    path = tmp_path / "lei.pdf"
+    path.write_bytes(b"%PDF-1.4 conteudo de teste")
+    return str(path)
+
+
+def test_key_depends_on_content_and_options(pdf):
+    key = DoclingCache.key(pdf, {"do_ocr": True})
+    assert key == DoclingCache.key(pdf, {"do_ocr": True})
+    assert key != DoclingCache.key(pdf, {"do_ocr": False})
+
+    time.sleep(0.01)
+    Path(pdf).write_bytes(b"%PDF-1.4 outro conteudo")
+    assert key.split(".")[0] != DoclingCache.key(pdf, {"do_ocr": True}).split(".")[0]
+
+
+def test_write_and_read_roundtrip(cache_dir, pdf):
+    key = DoclingCache.key(pdf)
+    assert DoclingCache.read(key) is None
+    assert DoclingCache.write(key, {"texts": ["Art. 1º"]})
+    assert DoclingCache.read(key) == {"texts": ["Art. 1º"]}
+    assert DoclingCache.stats()["entries"] == 1
+
+
+def test_invalidate_removes_every_option_variant(cache_dir, pdf):
+    DoclingCache.write(DoclingCache.key(pdf, {"do_ocr": True}), {"a": 1})
+    DoclingCache.write(DoclingCache.key(pdf, {"do_ocr": False}), {"a": 2})
+    DoclingCache.write("outro.arquivo", {"a": 3})
+
+    assert DoclingCache.invalidate(pdf) == 2
+    assert DoclingCache.stats()["entries"] == 1
+
+
+def test_evict_removes_least_recently_used(cache_dir):
+    for i in range(3):
+        DoclingCache.write(f"entrada{i}.x", {"texto": "x" * 1000 + str(i)})
+        entry = os.path.join(DoclingCache.directory, f"entrada{i}.x{DoclingCache.extension}")
+        os.utime(entry, (1000 + i, 1000 + i))
+
+    # o acesso renova a entrada mais antiga
+    DoclingCache.read("entrada0.x")
+
+    size = os.path.getsize(os.path.join(DoclingCache.directory, f"entrada0.x{DoclingCache.extension}"))
+    assert DoclingCache.evict(size * 2) == 1
+    assert DoclingCache.read("entrada1.x") is None
+    assert DoclingCache.read("entrada0.x") is not None
+
+
+def test_file_hashes_are_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(DoclingCache, "max_file_hashes", 2)
+    DoclingCache.clear()
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"lei{i}.pdf"
+        path.write_bytes(f"%PDF-1.4 {i}".encode())
+        paths.append(str(path))
+        DoclingCache.file_hash(paths[-1])
+
+    assert len(DoclingCache._file_hashes) == 2
+    assert DoclingCache.file_hash(paths[0]) == DoclingCache.file_hash(paths[0])
+
+
+def test_counters_are_exact_under_threads(cache_dir):
+    import threading
+
+    writes = DoclingCache.stats()["writes"]
+    threads = [threading.Thread(target=lambda i=i: [DoclingCache.write(f"t{i}.{j}", {"j": j}) for j in range(20)]) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert DoclingCache.stats()["writes"] - writes == 160
+
+
+def test_reader_returns_the_same_type_on_miss_and_hit(cache_dir, pdf, monkeypatch):
+    from contextlib import contextmanager
+    from types import SimpleNamespace
+    from src.modules.document import docling_reader as DoclingReader
+
+    document = SimpleNamespace(export_to_dict=lambda: {"texts": []})
+
+    @contextmanager
+    def acquire(profile):
+        yield SimpleNamespace(convert=lambda path: SimpleNamespace(document=document, status="success"))
+
+    stored = {}
+    monkeypatch.setattr(DoclingReader, "DocumentConverter", object)
+    monkeypatch.setattr(DoclingReader, "profile_for", lambda path: "legal")
+    monkeypatch.setattr(DoclingReader, "pipeline_options", lambda profile: {"profile": profile})
+    monkeypatch.setattr(DoclingReader.DoclingConverters, "acquire", acquire)
+    monkeypatch.setattr(DoclingCache, "get", lambda path, options=None: stored.get("hit"))
+    monkeypatch.setattr(DoclingCache, "put", lambda path, options, doc: stored.setdefault("hit", DoclingCache.CachedConversion(doc)) is not None)
+
+    miss = DoclingReader.reader(pdf)
+    hit = DoclingReader.reader(pdf)
+    assert type(miss) is type(hit) is DoclingCache.CachedConversion
+    assert miss.document is hit.document is document
+    assert miss.key == DoclingCache.key(pdf, {"profile": "legal"})
+
+
+def test_mixed_pdf_is_converted_once(cache_dir, pdf, monkeypatch):
+    from contextlib import contextmanager
+    from types import SimpleNamespace
+    from src.modules.document import docling_reader as DoclingReader
+
+    def item(text, page):
+        return SimpleNamespace(text=text, label="text", prov=[SimpleNamespace(page_no=page)])
+
+    class Document:
+        """documento dos testes, serializado no cache como o `DoclingDocument`"""
+
+        def __init__(self, texts):
+            self.texts = texts
+
+        def export_to_dict(self):
+            return {"texts": [[text.text, text.prov[0].page_no] for text in self.texts]}
+
+        @classmethod
+        def model_validate(cls, payload):
+            return cls([item(text, page) for text, page in payload["texts"]])
+
+    conversions = []
+
+    @contextmanager
+    def acquire(profile):
+        def convert(path):
+            conversions.append(profile)
+            texts = [item("Art. 1º", 1)] if path == pdf else [item("Art. 2º", 1)]
+            return SimpleNamespace(document=Document(texts))
+        yield SimpleNamespace(convert=convert)
+
+    def subset(path, pages, target):
+        # como o pdfium, cada gravação tem um /ID novo
+        Path(target).write_bytes(b"%PDF-1.4 " + os.urandom(16))
+        return True
+
+    monkeypatch.setattr(DoclingCache, "DoclingDocument", Document)
+    monkeypatch.setattr(DoclingReader, "DocumentConverter", object)
+    monkeypatch.setattr(DoclingReader, "pipeline_options", lambda profile: {"profile": profile})
+    monkeypatch.setattr(DoclingReader.DoclingConverters, "acquire", acquire)
+    monkeypatch.setattr(DoclingReader.TextLayer, "triage", lambda path: {1: "text", 2: "ocr"})
+    monkeypatch.setattr(DoclingReader.TextLayer, "subset", subset)
+
+    first = list(DoclingReader.iter_pages(pdf))
+    assert conversions == ["fast", "legal"]
+
+    # a segunda leitura (outro processo, sem a memória) vem inteira do cache em disco
+    DoclingCache._memory.clear()
+    assert list(DoclingReader.iter_pages(pdf)) == first == [(1, "Art. 1º"), (2, "Art. 2º")]
+    assert conversions == ["fast", "legal"]
+    assert DoclingCache.stats()["entries"] == 2
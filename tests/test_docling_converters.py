@@ -0,0 +1,70 @@
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.modules.document import docling_converters as DoclingConverters
+
+
+@pytest.fixture
+def converters(monkeypatch):
+    created = []
+
+    def create(profile):
+        created.append(profile)
+        return object()
+
+    # o carregamento real dos modelos é substituído por um objeto qualquer
+    monkeypatch.setattr(DoclingConverters, "DocumentConverter", object)
+    monkeypatch.setattr(DoclingConverters, "_create", create)
+    monkeypatch.setattr(DoclingConverters, "pool_size", 2)
+    DoclingConverters.clear()
+    yield created
+    DoclingConverters.clear()
+
+
+def test_converter_is_reused(converters):
+    with DoclingConverters.acquire() as first:
+        pass
+    with DoclingConverters.acquire() as second:
+        pass
+    assert first is second
+    assert converters == [DoclingConverters.PROFILE_LEGAL]
+
+    with DoclingConverters.acquire(DoclingConverters.PROFILE_FAST):
+        pass
+    assert converters == [DoclingConverters.PROFILE_LEGAL, DoclingConverters.PROFILE_FAST]
+
+
+def test_pool_is_bounded(converters):
+    release = threading.Event()
+    holding = threading.Barrier(3)
+
+    def hold():
+        with DoclingConverters.acquire():
+            holding.wait()
+            release.wait()
+
+    threads = [threading.Thread(target=hold) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    holding.wait()
+    assert DoclingConverters.stats()[DoclingConverters.PROFILE_LEGAL] == {'created': 2, 'idle': 0, 'in_use': 2}
+
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    # um terceiro empréstimo reaproveita um dos conversores liberados
+    with DoclingConverters.acquire():
+        pass
+    assert len(converters) == 2
+
+
+def test_unknown_profile(converters):
+    with pytest.raises(ValueError):
+        with DoclingConverters.acquire("gpu"):
+            pass
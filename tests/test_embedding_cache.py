@@ -0,0 +1,80 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+np = pytest.importorskip("numpy")
+
+from src.models import embedding_cache as EmbeddingCache
+from src.models import handle
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(EmbeddingCache, "directory", str(tmp_path / "embeddings"))
+    monkeypatch.setattr(EmbeddingCache, "_counters", {'hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0})
+
+
+class _Model:
+    """modelo falso que conta os textos enviados para embutir"""
+
+    def __init__(self, model="falso"):
+        self.model = model
+        self.chunks = []
+        self.sent = []
+
+    def embed_many(self, inputs):
+        self.sent += inputs
+        return [[float(len(text)), 1.0] for text in inputs]
+
+
+def test_roundtrip_is_keyed_by_model_and_text():
+    assert EmbeddingCache.get("a", "texto") is None
+    assert EmbeddingCache.put("a", "texto", [0.5, 1.5])
+
+    np.testing.assert_array_equal(EmbeddingCache.get("a", "texto"), np.asarray([0.5, 1.5], dtype=np.float32))
+    assert EmbeddingCache.get("b", "texto") is None
+    assert EmbeddingCache.get("a", "outro") is None
+
+    stats = EmbeddingCache.stats()
+    assert (stats['entries'], stats['hits'], stats['misses'], stats['writes']) == (1, 1, 3, 1)
+
+
+def test_evict_removes_least_recently_used(monkeypatch):
+    for i in range(3):
+        EmbeddingCache.put("a", f"texto {i}", [float(i)])
+    EmbeddingCache.get("a", "texto 0")
+
+    monkeypatch.setattr(EmbeddingCache, "max_entries", 2)
+    EmbeddingCache.put("a", "texto 3", [3.0])
+
+    assert [EmbeddingCache.get("a", f"texto {i}") is not None for i in range(4)] == [True, False, False, True]
+    assert EmbeddingCache.stats()['evictions'] == 2
+
+
+def test_generate_embeddings_embeds_each_text_once():
+    model = _Model()
+    chunks = ["art. 1º", "art. 2º", "art. 1º"]
+
+    first = handle.generate_embeddings(model, chunks)
+    assert model.sent == ["art. 1º", "art. 2º"]
+
+    second = handle.generate_embeddings(model, chunks + ["art. 3º"])
+    assert model.sent == ["art. 1º", "art. 2º", "art. 3º"]
+    np.testing.assert_array_equal(second[:3], first)
+    assert second.dtype == np.float32 and second.shape == (4, 2)
+
+    assert handle.generate_embeddings(_Model("outro"), chunks).shape == (3, 2)
+
+
+def test_disabled_cache(monkeypatch):
+    monkeypatch.setattr(EmbeddingCache, "enabled", False)
+    model = _Model()
+
+    handle.generate_embeddings(model, ["art. 1º"])
+    handle.generate_embeddings(model, ["art. 1º"])
+
+    assert model.sent == ["art. 1º", "art. 1º"]
+    assert EmbeddingCache.stats()['entries'] == 0
@@ -151,6 +151,40 @@ class TestLegalDocumentClassifier:
         for classification_type in ClassificationType:
             assert classification_type.value in results
             assert results[classification_type.value] >= 0.0
+    
+    def test_classify_does_not_train(self):
+        """Testa que a classificação não treina modelos ausentes"""
+        assert self.classifier.classify_subject("Art. 1º É livre a manifestação do pensamento") is None
+        assert not os.listdir(self.temp_dir)
+    
+    def test_preload_and_classify_many(self):
+        """Testa o preload (modelos mapeados em memória) e a classificação em lote"""
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.linear_model import LogisticRegression
+        from sklearn.pipeline import Pipeline
+        
+        types = [ClassificationType.SUBJECT, ClassificationType.ARTICLE_TYPE]
+        for classification_type in types:
+            texts, labels = self.classifier._prepare_training_data(classification_type)
+            pipeline = Pipeline([('tfidf', TfidfVectorizer()), ('classifier', LogisticRegression(max_iter=1000))]).fit(texts, labels)
+            self.classifier._save_model(classification_type, pipeline)
+        
+        # Um novo classificador apenas carrega os modelos salvos, com os arrays mapeados em memória
+        classifier = LegalDocumentClassifier(model_path=self.temp_dir)
+        assert classifier.preload(types, train=False) == {'subject': True, 'article_type': True}
+        coef = classifier.models['subject'].named_steps['classifier'].coef_
+        assert type(coef).__name__ == 'memmap'
+        
+        texts = [
+            "Art. 1º É livre a manifestação do pensamento",
+            "É vedado o uso de trabalho infantil",
+            "Compete aos Municípios instituir impostos",
+        ]
+        results = classifier.classify_many(texts, types)
+        
+        assert results['subject'] == [classifier.classify_subject(text) for text in texts]
+        assert results['article_type'] == [classifier.classify_article_type(text) for text in texts]
+        assert classifier.classify_many(texts, [ClassificationType.LEGAL_INTENTION]) == {'legal_intention': [None, None, None]}
 
 
 def test_compatibility_functions():
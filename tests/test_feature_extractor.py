@@ -0,0 +1,47 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+spacy = pytest.importorskip("spacy")
+pytest.importorskip("scipy")
+
+from src.modules.nlp import resources as Resources
+from src.modules.nlp.featureextractor import FeatureExtractor
+
+ARTICLES = [
+    "Art. 1º A República Federativa do Brasil constitui-se em Estado Democrático de Direito.",
+    "Art. 2º São Poderes da União, independentes e harmônicos entre si, o Legislativo, o Executivo e o Judiciário.",
+    "",
+]
+
+
+class _Stemmer:
+    def stem(self, word):
+        return word[:4]
+
+
+@pytest.fixture
+def extractor():
+    # pipeline vazio do spaCy: o teste não depende do download do modelo treinado
+    Resources.register(Resources.SPACY, lambda: spacy.blank("pt"))
+    Resources.register(Resources.STEMMER, _Stemmer)
+    yield FeatureExtractor()
+    Resources.register(Resources.SPACY, Resources._load_spacy)
+    Resources.register(Resources.STEMMER, Resources._load_stemmer)
+
+
+def test_batch_matches_single_calls(extractor):
+    batch = extractor.syntax_analysis_many(ARTICLES, batch_size=2)
+    assert batch == [extractor.syntax_analisys(text) for text in ARTICLES]
+
+
+def test_digest_keys_and_stopwords(extractor):
+    digest = extractor.syntax_analisys(ARTICLES[0])
+    assert set(digest) == {'tokens', 'lemma', 'stems', 'entities', 'entity', 'tags', 'tag'}
+    assert "República" in digest['tokens']
+    assert "do" not in digest['tokens'] and "1º" not in digest['tokens']
+    assert digest['stems'] == [token[:4] for token in digest['tokens']]
+    assert digest['tag'] == digest['tokens']
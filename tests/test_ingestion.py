@@ -0,0 +1,161 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("chromadb")
+
+from src.modules.database import sqlitedb
+from src.modules.catalog import ingestion as Ingestion
+from src.modules.catalog import ingestion_repository as IngestionRepository
+from src.modules.document import change_index as ChangeIndex
+
+
+def extract(path):
+    """extrator dos testes: executa nos workers, por isso fica no nível do módulo"""
+    if "ruim" in os.path.basename(path):
+        raise ValueError(f"Não foi possível ler o arquivo {path}.")
+    content = Path(path).read_text()
+    return {'path': path, 'name': os.path.basename(path), 'pages': 1, 'content': content, 'hashes': {1: content}}
+
+
+@pytest.fixture
+def library(tmp_path, monkeypatch):
+    connect = sqlitedb.client
+    database = tmp_path / "sqlite"
+    monkeypatch.setattr(sqlitedb, "client", lambda path=None: connect(str(database)))
+    ChangeIndex.table_change_index()
+
+    directory = tmp_path / "biblioteca"
+    directory.mkdir()
+    for name in ("a.pdf", "b.pdf", "c.pdf"):
+        (directory / name).write_text(f"Lei {name}")
+    return directory
+
+
+def run(directory, saver=lambda extracted: True, extractor=extract):
+    return Ingestion.ingest(str(directory), workers=1, in_flight=1, extractor=extractor, saver=saver)
+
+
+def test_interrupted_run_resumes_with_the_missing_files(library):
+    saveds = []
+
+    def interrupted(extracted):
+        if saveds:
+            raise KeyboardInterrupt
+        saveds.append(extracted['name'])
+        return True
+
+    with pytest.raises(KeyboardInterrupt):
+        run(library, interrupted)
+
+    report = run(library)
+    assert report.skipped == 1
+    assert sorted(report.saveds + saveds) == ["a.pdf", "b.pdf", "c.pdf"]
+
+
+def test_skip_decision_uses_manifest_and_change_index(library):
+    run(library)
+    touched, edited = str(library / "a.pdf"), str(library / "b.pdf")
+
+    # só o mtime mudou: o manifesto não reconhece a versão, mas o índice de mudanças vê o mesmo conteúdo
+    stat = os.stat(touched)
+    os.utime(touched, (stat.st_atime, stat.st_mtime + 10))
+    Path(edited).write_text("Lei b.pdf, alterada")
+
+    paths, queue = Ingestion.pending(str(library))
+    assert len(paths) == 3
+    assert queue == [edited]
+    assert Ingestion.pending(str(library), force=True)[1] == paths
+
+
+def test_failure_is_recorded_and_retried(library):
+    (library / "ruim.pdf").write_text("ilegível")
+    failed = str(library / "ruim.pdf")
+
+    report = run(library)
+    assert (report.documents, report.failed, report.errors) == (3, 1, [failed])
+    assert IngestionRepository.show_by_path(failed)['status'] == IngestionRepository.STATUS_FAILED
+
+    report = run(library)
+    assert (report.skipped, report.failed) == (3, 1)
+
+
+def test_save_replaces_the_catalog_entry_of_the_path(monkeypatch):
+    calls = []
+    monkeypatch.setattr(Ingestion.DocInfoRepository, "upsert", lambda info: calls.append(("upsert", info.path, info.mtime)) or True)
+    monkeypatch.setattr(Ingestion.CatalogRetrieval, "delete_by_path", lambda path: calls.append(("delete", path)) or True)
+    monkeypatch.setattr(Ingestion.CatalogRetrieval, "save", lambda catalog, content: calls.append(("save", catalog.path)) or True)
+
+    extracted = {'path': "lei.pdf", 'name': "lei.pdf", 'size': 10, 'pages': 1, 'mimetype': "pdf", 'mtime': 123.0, 'content': "Art. 1º"}
+    assert Ingestion.save(extracted)
+    assert calls == [("upsert", "lei.pdf", 123.0), ("delete", "lei.pdf"), ("save", "lei.pdf")]
+
+
+def test_extract_builds_the_content_from_the_parsed_pages(tmp_path, monkeypatch):
+    from src.modules.document.parsed_document import ParsedDocument
+
+    path = tmp_path / "lei.pdf"
+    path.write_text("Art. 1º")
+    parsed = ParsedDocument(path=str(path), name="lei.pdf", size=7, pages=2, mimetype="pdf", contents=[(1, " Art. 1º \n"), (2, "Art. 2º")])
+
+    monkeypatch.setattr(Ingestion.DocService.DoclingReader, "DOCLING_AVAILABLE", False)
+    monkeypatch.setattr(Ingestion.DocService, "document_parse", lambda path: parsed)
+    monkeypatch.setattr(Ingestion.DocService, "reader_content", lambda *args: pytest.fail("o documento foi lido de novo"), raising=False)
+
+    # o mesmo formato de `reader_content` do PDF, sem uma segunda leitura do arquivo
+    assert Ingestion.extract(str(path))['content'] == "Art. 1º\nArt. 2º\n"
+
+
+def test_extract_converts_a_mixed_pdf_once_per_profile(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+    from src.modules.document import docling_cache as DoclingCache
+    from src.modules.document import docling_converters as DoclingConverters
+    from src.modules.document import docling_reader as DoclingReader
+    from src.modules.document.document_info import DocumentInfo
+
+    path = tmp_path / "lei.pdf"
+    path.write_bytes(b"%PDF-1.4 conteudo de teste")
+    conversions = []
+
+    def item(text, page, label="text"):
+        return SimpleNamespace(text=text, label=label, prov=[SimpleNamespace(page_no=page)])
+
+    class Converter:
+        def __init__(self, profile):
+            self.profile = profile
+
+        def convert(self, source):
+            conversions.append((self.profile, source == str(path)))
+            if source == str(path):
+                # sem OCR, a página digitalizada (2) não tem texto
+                return SimpleNamespace(document=SimpleNamespace(texts=[item("Lei 1", 1, "title"), item("Art. 1º", 1)]))
+            # o PDF temporário só tem a página 2, renumerada como 1
+            return SimpleNamespace(document=SimpleNamespace(texts=[item("Art. 2º", 1)]))
+
+    def subset(source, pages, target):
+        Path(target).write_bytes(b"%PDF-1.4 paginas digitalizadas")
+        return True
+
+    monkeypatch.setattr(DoclingCache, "directory", str(tmp_path / "cache"))
+    monkeypatch.setattr(DoclingReader, "DocumentConverter", object)
+    monkeypatch.setattr(DoclingReader, "DOCLING_AVAILABLE", True)
+    monkeypatch.setattr(DoclingConverters, "DocumentConverter", object)
+    monkeypatch.setattr(DoclingConverters, "_create", Converter)
+    monkeypatch.setattr(DoclingReader.TextLayer, "triage", lambda source: {1: "text", 2: "ocr"})
+    monkeypatch.setattr(DoclingReader.TextLayer, "subset", subset)
+    monkeypatch.setattr(Ingestion.DocService, "info", lambda source: DocumentInfo(path=source, name="lei.pdf", size=26, pages=2, mimetype="pdf"))
+    DoclingConverters.clear()
+
+    try:
+        extracted = Ingestion.extract(str(path))
+    finally:
+        DoclingConverters.clear()
+
+    # o documento sem OCR e só a página digitalizada com OCR; o conteúdo não converte o documento de novo
+    assert conversions == [(DoclingConverters.PROFILE_FAST, True), (DoclingConverters.PROFILE_LEGAL, False)]
+    assert extracted['content'] == "Lei 1\nArt. 1º\nArt. 2º"
+    assert (extracted['text_pages'], extracted['ocr_pages']) == (1, 1)
@@ -0,0 +1,87 @@
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.modules.nlp.keyword_matcher import KeywordMatcher, compiled
+
+LEXICONS = {
+    'joy': ['feliz', 'alegre', 'happy'],
+    'sadness': ['triste', 'abatido', 'triste'],
+    'quality': ['bom', 'ruim', 'qualidade'],
+    'law': ['lei', 'lei complementar', 'ab-roga', 'passa a vigorar'],
+}
+
+TEXTS = [
+    "",
+    "Estou feliz, muito FELIZ e alegre; o produto é bom.",
+    "Ela ficou triste. Tristeza não é triste? Abatido e triste.",
+    "A lei complementar revoga a lei anterior e ab-roga o decreto; o texto passa a vigorar hoje.",
+    "infeliz bombom ruimzinho qualidade_total felizmente",
+]
+
+
+def _regex_counts(text, lexicons):
+    """implementação de referência: uma expressão regular por palavra-chave"""
+    counts = {}
+    for label, keywords in lexicons.items():
+        for keyword in keywords:
+            found = len(re.findall(r'\b' + re.escape(keyword) + r'\b', text.lower()))
+            if found:
+                counts[label] = counts.get(label, 0) + found
+    return counts
+
+
+def _substring_keywords(text, lexicons):
+    """implementação de referência: teste de substring por palavra-chave"""
+    return {keyword for keywords in lexicons.values() for keyword in keywords if keyword in text.lower()}
+
+
+def test_whole_word_counts_match_regex():
+    matcher = KeywordMatcher(LEXICONS)
+    for text in TEXTS:
+        assert matcher.counts(text.lower(), whole_words=True) == _regex_counts(text, LEXICONS)
+
+
+def test_substring_hits_match_in_operator():
+    matcher = KeywordMatcher(LEXICONS)
+    for text in TEXTS:
+        assert {hit.keyword for hit in matcher.find(text.lower())} == _substring_keywords(text, LEXICONS)
+
+
+def test_hits_report_positions_and_overlaps():
+    text = "a lei complementar"
+    hits = KeywordMatcher(LEXICONS).find(text)
+
+    assert [(hit.keyword, text[hit.start:hit.end]) for hit in hits] == [("lei", "lei"), ("lei complementar", "lei complementar")]
+    assert all(hit.label == 'law' for hit in hits)
+
+
+def test_keywords_are_case_insensitive_and_empty_ones_ignored():
+    matcher = KeywordMatcher({'a': ['Feliz', ''], 'b': []})
+
+    assert matcher.keywords == {'feliz'}
+    assert matcher.counts("feliz") == {'a': 1}
+    assert KeywordMatcher().find("qualquer texto") == []
+
+
+def test_compiled_is_shared_by_content():
+    first = compiled({'joy': ['feliz'], 'sadness': ['triste']})
+
+    assert compiled({'joy': ['feliz'], 'sadness': ['triste']}) is first
+    assert compiled({'joy': ['feliz']}) is not first
+
+
+def test_classifier_compiles_its_lexicons_once(monkeypatch):
+    from src.modules.nlp import simple_classifier
+
+    classifier = simple_classifier.SimpleLegalClassifier()
+
+    def fail(lexicons):
+        raise AssertionError("léxicos recompilados por texto")
+
+    monkeypatch.setattr(simple_classifier, "compiled", fail)
+    for text in ["O processo teve recurso e sentença.", "É livre a manifestação do pensamento."]:
+        classifier.classify_subject(text)
+        classifier.classify_article_type(text)
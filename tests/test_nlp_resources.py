@@ -0,0 +1,68 @@
+import multiprocessing
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.modules.nlp import resources as Resources
+
+NAME = "test_resource"
+
+
+@pytest.fixture
+def counter():
+    calls = []
+    Resources.register(NAME, lambda: calls.append(1) or {"calls": len(calls)})
+    yield calls
+    Resources.clear()
+
+
+def test_loads_once_on_first_use(counter):
+    assert NAME not in Resources.loaded()
+    first = Resources.get(NAME)
+    assert Resources.get(NAME) is first
+    assert len(counter) == 1
+
+
+def test_unknown_resource_raises():
+    with pytest.raises(KeyError):
+        Resources.get("missing_resource")
+
+
+def _child_get(queue):
+    queue.put(Resources.get(NAME)["calls"])
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="fork indisponível")
+def test_forked_children_inherit_loaded_resources(counter):
+    Resources.get(NAME)
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    process = context.Process(target=_child_get, args=(queue,))
+    process.start()
+    process.join(10)
+    assert queue.get(timeout=5) == 1
+    assert len(counter) == 1
+
+
+def test_preprocessor_construction_loads_nothing():
+    preprocessor_module = pytest.importorskip("src.modules.nlp.preprocessor")
+    Resources.clear()
+    processors = [preprocessor_module.PreProcessor() for _ in range(10)]
+    assert len(processors) == 10
+    assert Resources.loaded() == []
+
+
+def test_missing_reports_absent_nltk_data(monkeypatch):
+    nltk = pytest.importorskip("nltk")
+    installed = {"tokenizers/punkt", "corpora/stopwords"}
+
+    def find(path):
+        if path not in installed:
+            raise LookupError(path)
+        return path
+
+    monkeypatch.setattr(nltk.data, "find", find)
+    assert Resources.missing(("punkt", "stopwords", "rslp", "wordnet")) == ["rslp", "wordnet"]
@@ -0,0 +1,243 @@
+import asyncio
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("ollama")
+
+from src.models import embedding_cache as EmbeddingCache
+from src.models import handle
+from src.models import ollama as Ollama
+from src.models import response_cache as ResponseCache
+from src.models.ollama import AsyncModelOllama, ModelOllama
+
+
+def _vector(text):
+    """embedding determinístico do servidor falso"""
+    return [float(len(text)), float(sum(map(ord, text)) % 997), 0.5]
+
+
+class _OllamaStub(BaseHTTPRequestHandler):
+    """imita os endpoints `/api/embed` e `/api/chat` do Ollama; as primeiras `failures` requisições respondem 503"""
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        with server.lock:
+            server.requests.append(body.get('input', body.get('messages')))
+            server.running += 1
+            server.peak = max(server.peak, server.running)
+            fail = server.failures > 0
+            server.failures -= 1 if fail else 0
+
+        time.sleep(0.05)
+        with server.lock:
+            server.running -= 1
+
+        if fail:
+            self.send_response(503)
+            self.end_headers()
+            self.wfile.write(b'{"error": "busy"}')
+            return
+
+        if self.path == '/api/chat' and body.get('stream'):
+            # uma linha NDJSON por palavra, como o Ollama faz por token
+            question = body['messages'][-1]['content']
+            words = f"resposta: {question}".split(" ")
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/x-ndjson')
+            self.end_headers()
+            for i, word in enumerate(words):
+                content = word if i == 0 else f" {word}"
+                self.wfile.write(json.dumps({'model': body['model'], 'created_at': "2024-01-01T00:00:00Z", 'message': {'role': 'assistant', 'content': content}, 'done': False}).encode() + b"\n")
+                self.wfile.flush()
+            self.wfile.write(json.dumps({'model': body['model'], 'created_at': "2024-01-01T00:00:00Z", 'message': {'role': 'assistant', 'content': ""}, 'done': True}).encode() + b"\n")
+            return
+
+        if self.path == '/api/chat':
+            question = body['messages'][-1]['content']
+            payload = {'model': body['model'], 'created_at': "2024-01-01T00:00:00Z", 'message': {'role': 'assistant', 'content': f"resposta: {question}"}, 'done': True}
+        else:
+            inputs = body['input'] if isinstance(body['input'], list) else [body['input']]
+            payload = {'model': body['model'], 'embeddings': [_vector(text) for text in inputs]}
+        payload = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(EmbeddingCache, "directory", str(tmp_path / "embeddings"))
+    monkeypatch.setattr(ResponseCache, "directory", str(tmp_path / "responses"))
+
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _OllamaStub)
+    server.lock = threading.Lock()
+    server.requests, server.running, server.peak, server.failures = [], 0, 0, 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _model(server):
+    return ModelOllama(host=f"http://127.0.0.1:{server.server_address[1]}")
+
+
+def test_batches_respect_token_budget():
+    chunks = ["a" * 40, "b" * 40, "c" * 40, "d" * 400, "e"]
+
+    assert handle.batches(chunks, max_tokens=20) == [(0, 2), (2, 3), (3, 4), (4, 5)]
+    assert handle.batches(chunks, max_tokens=1000, max_inputs=2) == [(0, 2), (2, 4), (4, 5)]
+    assert handle.batches([]) == []
+
+
+def test_embeddings_are_batched_concurrent_and_contiguous(stub):
+    chunks = [f"parágrafo {i} " * (i % 7 + 1) for i in range(40)]
+    model = _model(stub)
+
+    embeddings = handle.generate_embeddings(model, chunks, max_tokens=30, in_flight=4)
+    requests = len(stub.requests)
+    model.make(chunks)  # já no cache de embeddings
+
+    assert embeddings.dtype == np.float32 and embeddings.flags['C_CONTIGUOUS']
+    assert embeddings.shape == (len(chunks), 3)
+    np.testing.assert_array_equal(embeddings, np.asarray([_vector(chunk) for chunk in chunks], dtype=np.float32))
+    np.testing.assert_array_equal(model.embeddings, embeddings)
+    assert all(isinstance(inputs, list) for inputs in stub.requests)
+    assert len(stub.requests) == requests < len(chunks)
+    assert stub.peak > 1
+
+
+def test_embeddings_retry_with_backoff(stub):
+    stub.failures = 2
+    chunks = ["direito civil", "direito penal"]
+
+    embeddings = handle.generate_embeddings(_model(stub), chunks, backoff=0.01)
+
+    assert embeddings.shape == (2, 3)
+    assert len(stub.requests) == 3
+
+
+def test_embeddings_give_up_after_retries(stub):
+    stub.failures = 10
+
+    with pytest.raises(Exception):
+        handle.generate_embeddings(_model(stub), ["direito"], retries=1, backoff=0.01)
+    assert len(stub.requests) == 2
+
+
+def test_empty_chunks():
+    assert handle.generate_embeddings(ModelOllama(), []).shape == (0, 0)
+
+
+def test_models_share_the_pooled_client(stub):
+    host = f"http://127.0.0.1:{stub.server_address[1]}"
+
+    assert ModelOllama(host=host).client is ModelOllama(host=host).client is Ollama.client(host)
+    assert ModelOllama(host=host).question("contexto", "pergunta") == "resposta: pergunta"
+
+
+def test_async_questions_run_concurrently(stub):
+    model = AsyncModelOllama(host=f"http://127.0.0.1:{stub.server_address[1]}")
+
+    async def ask():
+        try:
+            assert model.async_client is Ollama.async_client(model.host)
+            return await asyncio.gather(*(model.aquestion("contexto", f"pergunta {i}") for i in range(6)))
+        finally:
+            await Ollama.aclose()
+
+    assert asyncio.run(ask()) == [f"resposta: pergunta {i}" for i in range(6)]
+    assert stub.peak > 1
+    assert set(ModelOllama.history()) <= {f"resposta: pergunta {i}" for i in range(6)}
+
+
+def test_async_embed_uses_cache_and_closes_clients(stub):
+    model = AsyncModelOllama(host=f"http://127.0.0.1:{stub.server_address[1]}")
+
+    async def embed():
+        try:
+            return [await model.aembed("direito civil") for _ in range(2)]
+        finally:
+            await Ollama.aclose()
+            assert asyncio.get_running_loop() not in Ollama._async_clients
+
+    first, second = asyncio.run(embed())
+
+    assert first == pytest.approx(_vector("direito civil"))
+    assert second == pytest.approx(first)
+    assert len(stub.requests) == 1
+
+
+def test_stream_yields_pieces_and_records_history(stub):
+    model = ModelOllama(host=f"http://127.0.0.1:{stub.server_address[1]}")
+
+    pieces = list(model.stream("contexto", "qual é a lei"))
+
+    assert pieces == ["resposta:", " qual", " é", " a", " lei"]
+    assert ModelOllama.history()[-1] == "resposta: qual é a lei"
+
+
+def test_async_stream(stub):
+    model = AsyncModelOllama(host=f"http://127.0.0.1:{stub.server_address[1]}")
+
+    async def collect():
+        try:
+            return [piece async for piece in model.astream("contexto", "prazo")]
+        finally:
+            await Ollama.aclose()
+
+    assert asyncio.run(collect()) == ["resposta:", " prazo"]
+
+
+def test_shared_loop_keeps_the_client_across_request_loops(stub):
+    model = AsyncModelOllama(host=f"http://127.0.0.1:{stub.server_address[1]}")
+
+    async def request(i):
+        # cada requisição Flask roda no seu próprio laço
+        answer = await Ollama.run_shared(model.aquestion("contexto", f"pergunta {i}"))
+        shared = await Ollama.run_shared(_current_client(model))
+        return answer, shared
+
+    first, second = asyncio.run(request(1)), asyncio.run(request(2))
+
+    assert (first[0], second[0]) == ("resposta: pergunta 1", "resposta: pergunta 2")
+    assert first[1] is second[1]
+
+    loop = Ollama.shared_loop()
+    Ollama.close()
+    assert loop not in Ollama._async_clients
+    assert Ollama.shared_loop() is not loop
+    Ollama.close()
+
+
+async def _current_client(model):
+    return model.async_client
+
+
+def test_embedding_cache_is_keyed_by_vector_space(stub):
+    model = _model(stub)
+    handle.generate_embeddings(model, ["direito civil"])
+
+    assert model.embedding_space == "sibila:embed"
+    assert EmbeddingCache.get("sibila:embed", "direito civil") is not None
+    # vetores do antigo `/api/embeddings` (chave só com o modelo) não são reaproveitados
+    assert EmbeddingCache.get("sibila", "direito civil") is None
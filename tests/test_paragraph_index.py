@@ -0,0 +1,106 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("chromadb")
+
+from src.modules.document import paragraph_metadata_retrieval as ParagraphRetrieval
+from src.modules.document import paragraph_metadata_repository as ParagraphRepository
+from src.modules.document import change_index as ChangeIndex
+from src.modules.document.parsed_document import ParsedDocument
+
+
+class Collection:
+    """coleção do ChromaDB dos testes: registra as gravações e remoções"""
+
+    def __init__(self, name, calls):
+        self.name, self.calls = name, calls
+
+    def add(self, **kwargs):
+        self.calls.append(("add", self.name, kwargs['metadatas']['page']))
+
+    def delete(self, where):
+        self.calls.append(("delete", self.name, where["$and"][1]["page"]))
+
+
+class Model:
+    """modelo de embeddings dos testes: falha nos chunks que contêm `falha`"""
+
+    def make(self, chunks):
+        if any("falha" in chunk for chunk in chunks):
+            raise ValueError("Ollama indisponível")
+        return [[0.0, 1.0] for _ in chunks]
+
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    # o banco SQLite fica em ./data/.sqlite relativo ao diretório atual
+    monkeypatch.chdir(tmp_path)
+    ChangeIndex.table_change_index()
+    ParagraphRepository.table_paragraphs_metadatas()
+
+    calls, updates = [], []
+    monkeypatch.setattr(ParagraphRetrieval.chromadbvector, "collection", lambda name: Collection(name, calls))
+    monkeypatch.setattr(ParagraphRetrieval, "ModelOllama", Model)
+    monkeypatch.setattr(ParagraphRetrieval.Tfidf, "update", lambda texts, removed=(): updates.append((list(texts), list(removed))))
+
+    def parse(path):
+        pages = Path(path).read_text(encoding="utf-8").split("\f")
+        return ParsedDocument(path=path, name="lei.pdf", size=os.path.getsize(path), pages=len(pages), mimetype="pdf", contents=list(enumerate(pages, 1)))
+
+    monkeypatch.setattr(ParagraphRetrieval.DocService, "document_parse", parse)
+
+    path = tmp_path / "lei.pdf"
+
+    def write(*pages):
+        path.write_text("\f".join(pages), encoding="utf-8")
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + len(updates) + 1))
+        calls.clear()
+        return ParagraphRetrieval.index(str(path))
+
+    return write, calls, updates
+
+
+def test_only_the_edited_page_is_reindexed(index):
+    write, calls, updates = index
+
+    assert write("Art. 1º Texto.", "Art. 2º Texto.") == 2
+    assert updates == [(["Art. 1º Texto.", "Art. 2º Texto."], [])]
+
+    # arquivo inalterado: nada é apagado, gravado ou contabilizado
+    assert ParagraphRetrieval.index(os.path.abspath("lei.pdf")) == 0
+    assert len(updates) == 1
+
+    assert write("Art. 1º Texto.", "Art. 2º Texto alterado.") == 1
+    assert calls == [
+        ("delete", ParagraphRetrieval.COLLECTION, 2),
+        ("delete", ParagraphRetrieval.EMBEDDINGS_COLLECTION, 2),
+        ("add", ParagraphRetrieval.EMBEDDINGS_COLLECTION, 2),
+    ]
+    assert updates[-1] == (["Art. 2º Texto alterado."], ["Art. 2º Texto."])
+    assert ParagraphRepository.contents_by_page(os.path.abspath("lei.pdf"), 1) == ["Art. 1º Texto."]
+    assert ParagraphRepository.contents_by_page(os.path.abspath("lei.pdf"), 2) == ["Art. 2º Texto alterado."]
+
+
+def test_interrupted_run_is_counted_and_retried(index):
+    write, calls, updates = index
+
+    # o segundo parágrafo é gravado no SQLite, mas os embeddings falham
+    assert write("Art. 1º Texto.", "Art. 2º falha.") == 0
+    assert updates == [(["Art. 1º Texto.", "Art. 2º falha."], [])]
+    assert ChangeIndex.stored_hashes(os.path.abspath("lei.pdf"), ChangeIndex.PIPELINE_PARAGRAPHS) == {}
+
+    # a nova execução apaga e desconta exatamente o que a anterior contabilizou
+    assert write("Art. 1º Texto.", "Art. 2º Texto.") == 2
+    assert updates[-1] == (["Art. 1º Texto.", "Art. 2º Texto."], ["Art. 1º Texto.", "Art. 2º falha."])
+
+    added = [text for texts, _ in updates for text in texts]
+    for _, removed in updates:
+        for text in removed:
+            added.remove(text)
+    assert sorted(added) == ["Art. 1º Texto.", "Art. 2º Texto."]
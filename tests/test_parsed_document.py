@@ -0,0 +1,46 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.modules.document.parsed_document import ParsedDocument
+from src.modules.document import text_layer as TextLayer
+from src.utils import string as String
+
+PAGES = [
+    (1, "LEI Nº 10.406\n\nArt. 1º Toda pessoa é capaz de direitos e deveres na ordem civil.\nParágrafo único. Vide lei.\n\nArt. 2º A personalidade civil começa do nascimento."),
+    (2, "Art. 3º São absolutamente incapazes os menores de 16 anos.\n\n   \n\nArt. 4º São incapazes, relativamente a certos atos."),
+    (3, ""),
+]
+
+
+def parsed() -> ParsedDocument:
+    return ParsedDocument(path="lei.pdf", name="lei.pdf", size=10, pages=3, mimetype="pdf", contents=PAGES, sources={2: TextLayer.SOURCE_OCR})
+
+
+def test_pages_view_matches_splitting_each_page():
+    document = parsed()
+    pages = document.pages()
+
+    assert [page.page for page in pages] == [1, 2, 3]
+    assert [page.content for page in pages] == [content for _, content in PAGES]
+    assert [page.extraction for page in pages] == [TextLayer.SOURCE_TEXT, TextLayer.SOURCE_OCR, TextLayer.SOURCE_TEXT]
+    for page, (_, content) in zip(pages, PAGES):
+        assert page.paragraph == String.split_to_pargraphs(content)
+        assert page.paragraphs == len(page.paragraph)
+    assert document.pages() is pages
+
+
+def test_paragraph_phrase_and_line_views_share_the_same_paragraphs():
+    document = parsed()
+    paragraphs = document.paragraphs()
+    expected = [(num, paragraph) for num, content in PAGES for paragraph in String.split_to_pargraphs(content)]
+
+    assert [(p.page, p.content) for p in paragraphs] == expected
+    assert [(p.page, p.content) for p in document.phrases()] == expected
+    assert [p.line for p in document.phrases()] == [p.line for p in paragraphs]
+
+    lines = document.lines()
+    assert [line['content'] for line in lines] == [line for p in paragraphs for line in p.line]
+    assert lines[0]['source'] == "lei.pdf, pg. 1, ln 1"
+    assert document.chunks() == [chunk for p in paragraphs for chunk in p.chunk]
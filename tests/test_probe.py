@@ -0,0 +1,56 @@
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.modules.document import probe as Probe
+
+
+def minimal_pdf(pages: int) -> bytes:
+    kids = " ".join(f"{3 + i} 0 R" for i in range(pages))
+    objects = [
+        b"1 0 obj << /Type /Catalog /Pages 2 0 R >> endobj",
+        f"2 0 obj << /Type /Pages /Kids [{kids}] /Count {pages} >> endobj".encode(),
+    ]
+    objects += [f"{3 + i} 0 obj << /Type /Page /Parent 2 0 R >> endobj".encode() for i in range(pages)]
+    return b"%PDF-1.4\n" + b"\n".join(objects) + b"\ntrailer << /Root 1 0 R >>\n%%EOF\n"
+
+
+def test_raw_page_count(tmp_path):
+    path = tmp_path / "lei.pdf"
+    path.write_bytes(minimal_pdf(3))
+    assert Probe._count_raw(str(path)) == 3
+
+
+def test_probe_does_not_convert(tmp_path):
+    path = tmp_path / "lei.pdf"
+    path.write_bytes(minimal_pdf(5))
+    info = Probe.probe(str(path))
+    assert info['pages'] == 5
+    assert info['mimetype'] == "pdf"
+    assert info['size'] == path.stat().st_size
+
+    text = tmp_path / "lei.txt"
+    text.write_text("Art. 1º")
+    assert Probe.probe(str(text))['pages'] == 1
+    assert Probe.probe(str(tmp_path / "inexistente.pdf")) is None
+
+
+def test_info_registers_new_and_stale_documents(tmp_path, monkeypatch):
+    from src.modules.document import service as DocService
+
+    path = tmp_path / "lei.pdf"
+    path.write_bytes(minimal_pdf(2))
+    stored = {}
+    monkeypatch.setattr(DocService.DocInfoRepository, "show_by_path", lambda p: stored.get(p))
+    monkeypatch.setattr(DocService.DocInfoRepository, "upsert", lambda doc: stored.__setitem__(doc.path, doc) or True)
+
+    first = DocService.info(str(path))
+    assert first.pages == 2 and stored[first.path] is first
+    assert DocService.info(str(path)) is first
+
+    path.write_bytes(minimal_pdf(3))
+    os.utime(path, (first.mtime + 10, first.mtime + 10))
+    refreshed = DocService.info(str(path))
+    assert refreshed.pages == 3 and stored[first.path] is refreshed
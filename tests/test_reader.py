@@ -0,0 +1,64 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("pdfplumber")
+fpdf = pytest.importorskip("fpdf")
+
+from src.modules.document import reader as Reader
+from src.modules.document import service as DocService
+
+
+@pytest.fixture
+def pdf(tmp_path):
+    document = fpdf.FPDF()
+    document.set_font("Helvetica", size=12)
+    for num in range(1, 6):
+        document.add_page()
+        document.cell(0, 10, f"Art. {num} Texto da pagina {num}.")
+    path = tmp_path / "lei.pdf"
+    document.output(str(path))
+    return str(path)
+
+
+def test_iter_pages_streams_the_requested_range(pdf):
+    pages = list(Reader.iter_pages(pdf, 2, 4))
+    assert [num for num, _ in pages] == [2, 3, 4]
+    assert [content for _, content in pages] == [f"Art. {num} Texto da pagina {num}." for num in (2, 3, 4)]
+    assert Reader.reader_pages(pdf, 2, 4) == [content for _, content in pages]
+
+
+def test_service_iterators_match_the_parsed_document(pdf, monkeypatch):
+    # fallback do pdfplumber, importado pelo serviço mesmo quando o módulo do Docling importa
+    monkeypatch.setattr(DocService.DoclingReader, "DOCLING_AVAILABLE", False)
+    monkeypatch.setattr(DocService.DocInfoRepository, "show_by_path", lambda path: None)
+    monkeypatch.setattr(DocService.DocInfoRepository, "upsert", lambda doc: True)
+
+    parsed = DocService.document_parse(pdf)
+    pages = list(DocService.iter_pages(pdf))
+    assert [page.page for page in pages] == [1, 2, 3, 4, 5]
+    assert [page.content for page in pages] == [page.content for page in parsed.pages()]
+    assert [(p.page, p.content) for p in DocService.iter_paragraphs(pdf, 4)] == [(p.page, p.content) for p in parsed.paragraphs() if p.page >= 4]
+
+    # o pool de processos do fallback entrega as mesmas páginas
+    parallel = DocService.document_parse(pdf, workers=2, chunk_size=2)
+    assert [(page.page, page.content) for page in parallel.pages()] == [(page.page, page.content) for page in parsed.pages()]
+
+
+@pytest.mark.parametrize("init, final, chunk_size, expected", [
+    (1, 5, 2, [(1, 2), (3, 4), (5, 5)]),
+    (3, 4, 16, [(3, 4)]),
+    (2, 2, 0, [(2, 2)]),
+])
+def test_page_ranges_cover_the_range_once(init, final, chunk_size, expected):
+    assert Reader.page_ranges(init, final, chunk_size) == expected
+
+
+def test_parallel_extraction_keeps_page_order(pdf):
+    sequential = list(Reader.iter_pages(pdf))
+    assert list(Reader.iter_pages_parallel(pdf, workers=2, chunk_size=2)) == sequential
+    assert list(Reader.iter_pages_parallel(pdf, 2, 4, workers=2, chunk_size=1)) == sequential[1:4]
+    assert Reader.reader_pages(pdf, workers=2, chunk_size=2) == [content for _, content in sequential]
@@ -0,0 +1,62 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+flask = pytest.importorskip("flask")
+
+from src.modules.response.response import Response
+
+app = flask.Flask(__name__)
+
+
+def _events(body):
+    """decodifica um corpo text/event-stream em pares (evento, dados)"""
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((fields['event'], json.loads(fields['data'])))
+    return events
+
+
+def test_event_format():
+    assert Response.event('token', {"content": "Art. 1º\n"}) == 'event: token\ndata: {"content": "Art. 1º\\n"}\n\n'
+
+
+def test_stream_sends_each_event_as_it_is_produced():
+    produced = []
+
+    def events():
+        for i in range(3):
+            produced.append(i)
+            yield 'annotation', {"index": i}
+        yield 'done', {"total_annotations": 3}
+
+    with app.test_request_context('/'):
+        response = Response.stream(events(), 201)
+        assert response.status_code == 201
+        assert response.mimetype == "text/event-stream"
+        assert response.headers['Cache-Control'] == "no-cache"
+
+        chunks = iter(response.response)
+        first = next(chunks)
+        assert produced == [0]
+        body = first + "".join(chunks)
+
+    assert _events(body) == [('annotation', {"index": 0}), ('annotation', {"index": 1}), ('annotation', {"index": 2}), ('done', {"total_annotations": 3})]
+
+
+@pytest.mark.parametrize("url, kwargs, expected", [
+    ('/', {}, False),
+    ('/?stream=true', {}, True),
+    ('/?stream=0', {}, False),
+    ('/', {'json': {"question": "x", "stream": True}}, True),
+    ('/', {'headers': {"Accept": "text/event-stream"}}, True),
+    ('/', {'headers': {"Accept": "application/json"}}, False),
+])
+def test_wants_stream(url, kwargs, expected):
+    with app.test_request_context(url, method='POST', **kwargs):
+        assert Response.wants_stream(flask.request) is expected
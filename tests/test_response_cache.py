@@ -0,0 +1,130 @@
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("ollama")
+
+from src.models import response_cache as ResponseCache
+from src.models.ollama import AsyncModelOllama, ModelOllama
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(ResponseCache, "directory", str(tmp_path / "responses"))
+    monkeypatch.setattr(ResponseCache, "_counters", {'hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0, 'saved_seconds': 0.0})
+
+
+class _Client:
+    """cliente falso que conta as chamadas de chat"""
+
+    def __init__(self):
+        self.calls = []
+
+    def chat(self, model, messages, options, stream=False):
+        self.calls.append(messages[-1]["content"])
+        time.sleep(0.01)
+        return {"message": {"role": "assistant", "content": f"título de {messages[-1]['content']}"}}
+
+
+def _model(temperature=0.3):
+    model = ModelOllama()
+    model.client = _Client()
+    model.temperature = temperature
+    return model
+
+
+def test_key_depends_on_model_options_and_prompts():
+    base = ResponseCache.key("sibila", {"temperature": 0.3}, "sistema", "usuário")
+
+    assert ResponseCache.key("sibila", {"temperature": 0.3}, "sistema", "usuário") == base
+    assert ResponseCache.key("outro", {"temperature": 0.3}, "sistema", "usuário") != base
+    assert ResponseCache.key("sibila", {"temperature": 0.2}, "sistema", "usuário") != base
+    assert ResponseCache.key("sibila", {"temperature": 0.3}, "outro", "usuário") != base
+    assert ResponseCache.key("sibila", {"temperature": 0.3}, "sistema", "outro") != base
+
+
+def test_question_calls_the_model_once_per_prompt():
+    model = _model()
+
+    assert model.question("sistema", "art. 1º") == "título de art. 1º"
+    assert model.question("sistema", "art. 1º") == "título de art. 1º"
+    assert model.question("sistema", "art. 2º") == "título de art. 2º"
+    assert model.client.calls == ["art. 1º", "art. 2º"]
+    assert ModelOllama.history()[-2:] == ["título de art. 1º", "título de art. 2º"]
+
+    # outras opções de geração não reaproveitam a resposta
+    model.max_tokens = 100
+    model.question("sistema", "art. 1º")
+    assert model.client.calls == ["art. 1º", "art. 2º", "art. 1º"]
+
+    stats = ResponseCache.stats()
+    assert (stats['entries'], stats['hits'], stats['misses'], stats['writes']) == (3, 1, 3, 3)
+    assert stats['hit_rate'] == pytest.approx(0.25)
+    assert stats['saved_seconds'] > 0
+
+
+class _AsyncClient(_Client):
+    async def chat(self, model, messages, options, stream=False):
+        return super().chat(model, messages, options, stream)
+
+
+@pytest.mark.parametrize("temperature", [0.9, 0.5, None])
+def test_default_and_high_temperatures_bypass(temperature):
+    model = _model(temperature=temperature)
+    model.question("sistema", "art. 1º")
+    model.question("sistema", "art. 1º")
+
+    assert len(model.client.calls) == 2
+    assert ResponseCache.stats()['entries'] == 0
+
+
+def test_async_question_shares_the_cache(monkeypatch):
+    model = _model()
+    model.question("sistema", "art. 1º")
+
+    async_model = AsyncModelOllama()
+    async_model.temperature = 0.3
+    fake = _AsyncClient()
+    monkeypatch.setattr(AsyncModelOllama, "async_client", property(lambda self: fake))
+
+    async def ask():
+        return [await async_model.aquestion("sistema", question) for question in ("art. 1º", "art. 2º", "art. 2º")]
+
+    assert asyncio.run(ask()) == ["título de art. 1º", "título de art. 2º", "título de art. 2º"]
+    assert fake.calls == ["art. 2º"]
+
+
+def test_disabled_cache_bypass(monkeypatch):
+    monkeypatch.setattr(ResponseCache, "enabled", False)
+    model = _model()
+    model.question("sistema", "art. 1º")
+    model.question("sistema", "art. 1º")
+    assert len(model.client.calls) == 2
+    assert ResponseCache.stats()['entries'] == 0
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    ResponseCache.put("chave", "sibila", "resposta", 1.0)
+    assert ResponseCache.get("chave") == "resposta"
+
+    monkeypatch.setattr(ResponseCache, "ttl", -1)
+    assert ResponseCache.get("chave") is None
+    assert ResponseCache.evict() == 1
+    assert ResponseCache.stats()['entries'] == 0
+
+
+def test_evict_removes_least_recently_used(monkeypatch):
+    for i in range(3):
+        ResponseCache.put(f"chave {i}", "sibila", f"resposta {i}")
+    ResponseCache.get("chave 0")
+
+    monkeypatch.setattr(ResponseCache, "max_entries", 2)
+    ResponseCache.put("chave 3", "sibila", "resposta 3")
+
+    assert [ResponseCache.get(f"chave {i}") is not None for i in range(4)] == [True, False, False, True]
+    assert ResponseCache.stats()['evictions'] == 2
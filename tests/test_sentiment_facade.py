@@ -0,0 +1,46 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+textblob = pytest.importorskip("textblob")
+pytest.importorskip("vaderSentiment")
+
+from textblob.exceptions import MissingCorpusError
+
+try:
+    textblob.TextBlob("corpora check").noun_phrases
+except (LookupError, MissingCorpusError):
+    pytest.skip("corpora do TextBlob não instalados", allow_module_level=True)
+
+from src.modules.nlp import sentiment as Sentiment
+
+TEXTS = [
+    "I love this product!",
+    "This product is terrible",
+    "The federal law establishes the fundamental rights of citizens.",
+    "",
+]
+
+
+def test_single_parse_matches_separate_calls():
+    for text in TEXTS[:3]:
+        result = Sentiment.analyze(text)
+        assert result['sentiment'] == Sentiment.sentiment_analysis(text)
+        assert result['tags'] == [(str(word), tag) for word, tag in Sentiment.sentiment_tags(text)]
+        assert result['noun_phrases'] == [str(phrase) for phrase in Sentiment.sentiment_noun_phrases(text)]
+    assert Sentiment.analyze("") is None
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_preserves_order(workers):
+    expected = [Sentiment.analyze(text) for text in TEXTS]
+    assert Sentiment.analyze_many(TEXTS, workers=workers, chunksize=1) == expected
+
+
+def test_batch_runs_in_process_by_default(monkeypatch):
+    # nas requisições do servidor não se abre um pool de processos
+    monkeypatch.setattr(Sentiment, "ProcessPoolExecutor", lambda *args, **kwargs: pytest.fail("pool de processos aberto"))
+    assert Sentiment.analyze_many(TEXTS * 20, chunksize=1) == [Sentiment.analyze(text) for text in TEXTS] * 20
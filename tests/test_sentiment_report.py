@@ -0,0 +1,103 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("textblob")
+pytest.importorskip("vaderSentiment")
+
+from src.modules.analysis.sentiment_analysis import SentimentAnalysisReport, SentimentReportBuilder
+
+
+def _sentiment(classification, polarity, confidence, intensity, emotion="neutral", aspects=None):
+    """resultado sintético no formato de EnhancedSentimentAnalyzer.analyze_comprehensive"""
+    return {
+        'language': "portuguese",
+        'basic_sentiment': {'classification': classification, 'polarity': polarity},
+        'emotions': {'scores': {'joy': 0.1 if emotion == "joy" else 0.0, 'anger': 0.2 if emotion == "anger" else 0.0}, 'dominant_emotion': emotion, 'dominant_score': 0.1},
+        'intensity': {'intensity': intensity, 'confidence': confidence},
+        'subjectivity': {'score': 0.5, 'classification': "Subjective"},
+        'aspect_sentiment': {aspect: {'sentiment': sentiment, 'polarity': polarity, 'relevant_text': ""} for aspect, sentiment in (aspects or {}).items()},
+        'overall_confidence': confidence,
+    }
+
+
+RESULTS = {
+    "ótimo": _sentiment('Positive', 0.8, 0.9, 0.8, "joy", {'quality': 'Positive'}),
+    "péssimo": _sentiment('Negative', -0.7, 0.85, 0.7, "anger", {'quality': 'Negative', 'price': 'Negative'}),
+    "caro": _sentiment('Negative', -0.4, 0.6, 0.4, "anger", {'price': 'Negative'}),
+    "regular": _sentiment('Neutral', 0.0, 0.5, 0.1),
+    "confuso": _sentiment('Positive', 0.3, 0.1, 0.9),
+}
+TEXTS = ["ótimo", "péssimo", "caro", "regular", "confuso", "ótimo", "caro"]
+
+
+class _Analyzer:
+    def analyze_comprehensive(self, text):
+        return RESULTS[text]
+
+
+def _without_timestamps(report):
+    return {key: value for key, value in report.items() if key not in ('generated_at', 'individual_results', 'analyst_context')}
+
+
+def test_streaming_builder_matches_retained_results():
+    retained, streaming = SentimentReportBuilder(), SentimentReportBuilder(keep_results=False)
+    for text in TEXTS:
+        retained.add(text, RESULTS[text])
+        streaming.add(text, RESULTS[text])
+
+    assert streaming.individual_results == []
+    assert _without_timestamps(streaming.report()) == _without_timestamps(retained.report())
+    assert streaming.analyst_context() == retained.analyst_context()
+
+    summary = retained.summary()
+    assert summary['total_texts'] == len(TEXTS)
+    assert summary['sentiment_counts'] == {'Positive': 3, 'Negative': 3, 'Neutral': 1}
+    assert summary['average_confidence'] == pytest.approx(sum(RESULTS[t]['overall_confidence'] for t in TEXTS) / len(TEXTS))
+
+
+def test_analyst_context_aggregates():
+    builder = SentimentReportBuilder()
+    for text in TEXTS:
+        builder.add(text, RESULTS[text])
+    context = builder.analyst_context()
+
+    assert len(context['priority_alerts']['high_priority']) == 1
+    assert len(context['priority_alerts']['opportunities']) == 2
+    assert [o['text'] for o in context['outlier_detection']] == ["confuso"]
+    assert "Investigate and improve price (negative mentions: 3)" in context['action_items']
+    assert context['context_enrichment']['aspect_performance']['quality']['sentiment_distribution'] == {'Positive': 2, 'Negative': 1}
+
+
+def test_max_items_limits_examples_but_not_counts():
+    builder = SentimentReportBuilder(keep_results=False, max_items=1)
+    for text in TEXTS:
+        builder.add(text, RESULTS[text])
+    context = builder.analyst_context()
+
+    assert len(context['priority_alerts']['opportunities']) == 1
+    assert "Leverage 2 positive feedback opportunities for improvement" in context['action_items']
+
+
+def test_analyze_text_stream_matches_collection():
+    report = SentimentAnalysisReport()
+    report.sentiment_analyzer = _Analyzer()
+
+    collection = report.analyze_text_collection(TEXTS)
+    stream = report.analyze_text_stream(iter(TEXTS), workers=1, chunksize=2)
+
+    assert stream['individual_results'] == []
+    assert _without_timestamps(stream) == _without_timestamps(collection)
+    assert stream['analyst_context'] == report.generate_analyst_context(collection)
+    assert report.generate_analyst_context(stream) is stream['analyst_context']
+
+
+def test_analyze_text_stream_empty():
+    report = SentimentAnalysisReport()
+    stream = report.analyze_text_stream(iter([]), workers=1)
+
+    assert stream['summary'] == {}
+    assert stream['analyst_context']['analyst_summary']['total_texts_analyzed'] == 0
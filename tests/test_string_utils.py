@@ -20,3 +20,50 @@ def test_split_to_phrases():
 def test_clean():
     text = " Olá, mundo!!!\n"
     assert String.clean(text) == "Ola mundo"
+
+
+def test_split_to_pargraphs_spans_matches_split_to_pargraphs():
+    text = "  Art. 1º Primeiro\nlinha.\r\n\r\nArt. 2º Segundo.\n\n\n\nArt. 3º  "
+    spans = String.split_to_pargraphs_spans(text)
+    assert [String.pargraph_from_span(text, span) for span in spans] == String.split_to_pargraphs(text)
+    assert text[spans[0][0]:spans[0][1]] == "Art. 1º Primeiro\nlinha."
+
+
+def test_split_to_chunks_spans_point_into_original_text():
+    text = "Art. 1º Primeiro artigo. Segundo período aqui! Terceiro? " * 3 + "fim sem ponto"
+    spans = String.split_to_chunks_spans(text, 60)
+    assert [text[start:end] for start, end in spans] == String.split_to_chunks_raw(text, 60)
+    assert all(end - start <= 60 for start, end in spans)
+    assert String.split_to_chunks(text, 60) == String.split_to_chunks_raw(text, 60)
+
+
+def test_split_to_chunks_overlap_never_moves_backwards():
+    text = ("a." + "b" * 500) * 20
+    spans = String.split_to_chunks_spans(text, 100, 40)
+    starts = [start for start, _ in spans]
+    assert starts == sorted(set(starts))
+    assert spans[-1][1] == len(text)
+
+
+def test_split_to_chunks_sentence_and_token_boundaries():
+    text = "Art. 1º Primeiro artigo. Segundo período aqui! Terceiro? fim"
+    chunks = [text[start:end] for start, end in String.split_to_chunks_spans(text, 40, boundary=String.BOUNDARY_SENTENCE)]
+    assert chunks == ["Art. 1º Primeiro artigo.", "Segundo período aqui! Terceiro? fim"]
+
+    chunks = [text[start:end] for start, end in String.split_to_chunks_spans(text, 1000, boundary=String.BOUNDARY_NONE, tokens=4)]
+    assert chunks == ["Art. 1º Primeiro artigo.", "Segundo período aqui! Terceiro?", "fim"]
+
+
+def test_split_to_chunks_trims_indented_paragraphs():
+    text = "Lei\n\n    Bb. Cc dd.\r\n\tAa bb. \r\n  cc dd.  "
+    assert String.split_to_chunks(text, 10) == [chunk for paragraph in String.split_to_pargraphs(text) for chunk in String.split_to_chunks_raw(paragraph, 10)]
+    # o recuo e as quebras "\r\n" nas pontas não ocupam a janela do chunk
+    assert String.split_to_chunks(text, 10) == ["Lei", "Bb. Cc dd.", "Aa bb.", "cc dd."]
+
+
+def test_clean_lines_many_reuses_memo():
+    lines = ["  Diário  Oficial\x00 da União ..", "Art. 1º ,, Texto .", "  Diário  Oficial\x00 da União .."]
+    memo = {}
+    assert String.clean_lines_many(lines, memo) == [String.clean_lines(line) for line in lines]
+    assert String.clean_lines(lines[0]) == "Diário Oficial da União"
+    assert len(memo) == 2
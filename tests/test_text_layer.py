@@ -0,0 +1,74 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.modules.document import text_layer as TextLayer
+
+A4 = 595.0 * 842.0
+ARTICLE = "Art. 1º Toda pessoa é capaz de direitos e deveres na ordem civil. " * 20
+
+
+def test_born_digital_page_uses_text_layer():
+    assert TextLayer.classify(ARTICLE, A4, images=0) == TextLayer.SOURCE_TEXT
+    # um brasão no cabeçalho não transforma a página em digitalizada
+    assert TextLayer.classify(ARTICLE, A4, images=1) == TextLayer.SOURCE_TEXT
+
+
+def test_scanned_page_goes_to_ocr():
+    assert TextLayer.classify("", A4, images=1) == TextLayer.SOURCE_OCR
+    assert TextLayer.classify("12", A4, images=1) == TextLayer.SOURCE_OCR
+
+
+def test_unmapped_glyphs_go_to_ocr():
+    garbage = "(cid:3)(cid:17)(cid:42) " * 200
+    assert TextLayer.classify(garbage, A4, images=1) == TextLayer.SOURCE_OCR
+    assert TextLayer.classify(" " * 500, A4, images=1) == TextLayer.SOURCE_OCR
+
+
+def test_counters():
+    TextLayer.reset()
+    TextLayer.record({1: TextLayer.SOURCE_TEXT, 2: TextLayer.SOURCE_TEXT, 3: TextLayer.SOURCE_OCR, 4: TextLayer.SOURCE_TEXT})
+    assert TextLayer.stats() == {'text_pages': 3, 'ocr_pages': 1, 'skipped_ocr_ratio': 0.75}
+    assert TextLayer.ocr_pages({1: TextLayer.SOURCE_OCR, 2: TextLayer.SOURCE_TEXT, 5: TextLayer.SOURCE_OCR}) == [1, 5]
+    TextLayer.reset()
+
+
+def test_pages_are_counted_once_per_conversion(monkeypatch):
+    from types import SimpleNamespace
+    from src.modules.document import docling_cache as DoclingCache
+    from src.modules.document import docling_reader as DoclingReader
+
+    texts = [SimpleNamespace(text=f"Art. {n}º", label="text", prov=[SimpleNamespace(page_no=n)]) for n in (1, 2)]
+    document = SimpleNamespace(texts=texts)
+    conversions = iter([True, False, False])
+
+    monkeypatch.setattr(DoclingReader.TextLayer, "triage", lambda path: {1: TextLayer.SOURCE_TEXT, 2: TextLayer.SOURCE_TEXT})
+    monkeypatch.setattr(DoclingReader, "reader", lambda path, profile=None: DoclingCache.CachedConversion(document, converted=next(conversions)))
+
+    TextLayer.reset()
+    for _ in range(3):
+        # a primeira leitura converte; as seguintes vêm do cache
+        assert [num for num, _ in DoclingReader.iter_pages("lei.pdf")] == [1, 2]
+    assert TextLayer.stats()['text_pages'] == 2
+
+    # páginas contabilizadas num worker do pool entram pelo processo principal
+    TextLayer.add(3, 1)
+    assert TextLayer.stats() == {'text_pages': 5, 'ocr_pages': 1, 'skipped_ocr_ratio': 0.8333}
+    TextLayer.reset()
+
+
+def test_triage_is_persisted_by_content(tmp_path, monkeypatch):
+    pdf = tmp_path / "lei.pdf"
+    pdf.write_bytes(b"%PDF-1.4 conteudo de teste")
+    scans = []
+
+    monkeypatch.setattr(TextLayer, "directory", str(tmp_path / "triage"))
+    monkeypatch.setattr(TextLayer, "_triage_pdfium", lambda path: scans.append(path) or {1: TextLayer.SOURCE_TEXT, 2: TextLayer.SOURCE_OCR})
+    monkeypatch.setattr(TextLayer, "_triages", {})
+    assert TextLayer.triage(str(pdf)) == {1: TextLayer.SOURCE_TEXT, 2: TextLayer.SOURCE_OCR}
+
+    # outro processo (sem a memória) lê a triagem persistida em vez de percorrer as páginas
+    monkeypatch.setattr(TextLayer, "_triages", {})
+    assert TextLayer.triage(str(pdf)) == {1: TextLayer.SOURCE_TEXT, 2: TextLayer.SOURCE_OCR}
+    assert len(scans) == 1
@@ -0,0 +1,136 @@
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("scipy")
+
+from src.modules.nlp import tfidf as Tfidf
+from src.modules.nlp import bow as Bow
+
+CORPUS = [
+    "Tributo federal sobre a renda e proventos",
+    "Imposto estadual sobre circulação de mercadorias",
+    "Imposto federal sobre produtos industrializados",
+]
+
+
+@pytest.fixture(autouse=True)
+def tokenizer(monkeypatch):
+    """sem os dados do NLTK (punkt), tokeniza por expressão regular em vez de pular os testes"""
+    try:
+        Bow.Str.tokenize("teste")
+    except LookupError:
+        monkeypatch.setattr(Bow.Str, "word_tokenize", lambda text, language=None: re.findall(r"\w+|[^\w\s]", text))
+
+
+def test_matches_tfidf_vectorizer():
+    sklearn_text = pytest.importorskip("sklearn.feature_extraction.text")
+    model = Tfidf.TfidfModel().fit(CORPUS)
+
+    vectorizer = sklearn_text.TfidfVectorizer(analyzer=Bow.analyze)
+    expected = vectorizer.fit_transform(CORPUS).toarray()
+    names = list(vectorizer.get_feature_names_out())
+
+    for row, weights in zip(expected, model.rows(model.transform(CORPUS))):
+        assert weights == pytest.approx({names[i]: w for i, w in enumerate(row) if w})
+
+
+def test_partial_fit_equals_full_fit():
+    full = Tfidf.TfidfModel().fit(CORPUS)
+    partial = Tfidf.TfidfModel().fit(CORPUS[:1]).partial_fit(CORPUS[1:])
+    assert partial.documents == full.documents == 3
+    assert partial.terms == full.terms
+    assert partial.idf() == pytest.approx(full.idf())
+    assert partial.weights(CORPUS[0]) == pytest.approx(full.rows(full.transform(CORPUS[:1]))[0])
+
+
+def test_replaced_documents_leave_the_document_frequency():
+    edited = ["Tributo municipal sobre serviços"] + CORPUS[1:]
+    full = Tfidf.TfidfModel().fit(edited)
+    partial = Tfidf.TfidfModel().fit(CORPUS).partial_fit(edited[:1], removed=CORPUS[:1])
+    assert partial.documents == full.documents == 3
+
+    # termos que só existiam no documento substituído ficam no vocabulário com df = 0
+    df = dict(zip(partial.terms, partial.df))
+    assert {term: df[term] for term in full.terms} == dict(zip(full.terms, full.df))
+    assert not any(df[term] for term in set(partial.terms) - set(full.terms))
+    assert partial.weights(edited[1]) == pytest.approx(full.weights(edited[1]))
+
+
+def test_updates_during_a_build_are_not_lost(tmp_path, monkeypatch):
+    monkeypatch.setattr(Tfidf, "TFIDF_DIRECTORY", str(tmp_path / "tfidf"))
+    monkeypatch.setattr(Tfidf, "_shared", None)
+
+    def corpus_texts(directory, paragraphs):
+        # um documento é indexado enquanto o corpus é lido pelo build
+        Tfidf.update(["Parágrafo indexado durante a construção"])
+        yield from CORPUS
+
+    monkeypatch.setattr(Tfidf, "corpus_texts", corpus_texts)
+    model = Tfidf.build(target=Tfidf.TFIDF_DIRECTORY)
+    assert Tfidf.shared() is model and model.documents == 4
+    assert Tfidf.TfidfModel.load(Tfidf.TFIDF_DIRECTORY).documents == 4
+
+
+def test_build_persists_a_memory_mapped_matrix(tmp_path):
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    (corpus / "artigos.csv").write_text("text,subject\n" + "\n".join(f'"{text}",x' for text in CORPUS), encoding="utf-8")
+
+    target = str(tmp_path / "tfidf")
+    model = Tfidf.build(str(corpus), paragraphs=False, target=target)
+    loaded = Tfidf.TfidfModel.load(target)
+    assert loaded.terms == model.terms and loaded.documents == 3
+
+    matrix = Tfidf.load_matrix(target)
+    assert matrix.shape == (3, len(model.terms))
+    assert (matrix != model.transform(CORPUS)).nnz == 0
+
+
+@pytest.mark.parametrize("fitted", [False, True])
+def test_batch_and_single_paths_weigh_unseen_terms_alike(fitted, monkeypatch):
+    model = Tfidf.TfidfModel().fit(CORPUS) if fitted else Tfidf.TfidfModel()
+    monkeypatch.setattr(Tfidf, "_shared", model)
+    texts = ["constituição federal direitos", "Imposto federal sobre a renda", ""]
+
+    batch = Tfidf.generate_tfidf_many(texts)
+    assert batch == [pytest.approx(Tfidf.generate_tfidf(text)) for text in texts]
+    assert set(batch[0]) == {"constituição", "federal", "direitos"}
+
+
+def test_startup_routine_builds_only_a_missing_model(tmp_path, monkeypatch):
+    from src.routines import tfidf as TfidfRoutine
+    from src.modules.document import paragraph_metadata_repository as ParagraphRepository
+
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    (corpus / "artigos.csv").write_text("text,subject\n" + "\n".join(f'"{text}",x' for text in CORPUS), encoding="utf-8")
+    monkeypatch.setattr(Tfidf, "CORPUS_DIRECTORY", str(corpus))
+    monkeypatch.setattr(Tfidf, "TFIDF_DIRECTORY", str(tmp_path / "tfidf"))
+    monkeypatch.setattr(Tfidf, "_shared", None)
+    monkeypatch.setattr(ParagraphRepository, "contents", lambda: iter([]))
+
+    assert not TfidfRoutine.built()
+    assert TfidfRoutine.build_on_startup(background=False) is None
+    assert TfidfRoutine.built()
+    assert Tfidf.shared().documents == 3
+
+    monkeypatch.setattr(Tfidf, "build", lambda *args, **kwargs: pytest.fail("modelo reconstruído"))
+    TfidfRoutine.build_on_startup(background=False)
+
+
+def test_vocabulary_grown_after_the_idf_snapshot_is_unseen(monkeypatch):
+    model = Tfidf.TfidfModel().fit(CORPUS)
+    snapshot = model._snapshot()
+
+    # outra thread amplia o vocabulário (`Tfidf.update`) entre a leitura do IDF e a dos termos
+    model.partial_fit(["Taxa municipal de iluminação"])
+    monkeypatch.setattr(model, "_snapshot", lambda: snapshot)
+
+    weights = model.weights("imposto taxa")
+    assert weights["taxa"] > weights["imposto"]
+    assert model.transform(["imposto taxa"]).shape[1] == len(snapshot[1])
@@ -81,7 +81,7 @@ pip install requests==2.32.4 chromadb==0.5.20 chroma-hnswlib==0.7.6
 # Phase 4: LLM integration updates (high risk)
 echo "Phase 4: LLM integration updates..."
 print_warning "Installing OpenAI library with major version update - may require code changes"
-pip install ollama==0.5.1 openai==1.97.1
+pip install ollama==0.6.3 openai==1.97.1 pydantic==2.9.2 pydantic_core==2.23.4 typing_extensions==4.12.2
 
 print_status "All dependencies updated successfully"
 
@@ -98,6 +98,15 @@ print('All imports successful!')
 
 print_status "Dependency verification completed"
 
+# Install NLP data (NLP modules never download at runtime)
+echo "📚 Installing NLTK data..."
+if python3 -c "import sys; from src.modules.nlp import resources; sys.exit(0 if resources.download() else 1)"; then
+    print_status "NLTK data installed"
+else
+    print_error "Failed to install NLTK data"
+    exit 1
+fi
+
 # Check for environment file
 echo "⚙️  Checking environment configuration..."
 if [ ! -f ".env" ]; then
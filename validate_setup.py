@@ -57,6 +57,22 @@ def check_environment():
         print("   Execute: cp .env.example .env")
         return False
 
+def check_nlp_data():
+    """Verifica os dados do NLTK usados pelos módulos de NLP"""
+    try:
+        from src.modules.nlp import resources
+        absents = resources.missing()
+    except Exception as e:
+        print(f"❌ Dados do NLTK: não verificados ({e})")
+        return False
+
+    if absents:
+        print(f"❌ Dados do NLTK faltando: {', '.join(absents)}")
+        print("   Execute: python -c \"from src.modules.nlp import resources; resources.download()\"")
+        return False
+    print("✅ Dados do NLTK: OK")
+    return True
+
 def check_ollama_service():
     """Verifica se Ollama está rodando"""
     try:
@@ -111,7 +127,10 @@ def main():
     print("\n4. Verificando dependências Python...")
     deps = check_dependencies()
     
-    print("\n5. Verificando serviços externos...")
+    print("\n5. Verificando dados de NLP...")
+    nlp_ok = check_nlp_data()
+    
+    print("\n6. Verificando serviços externos...")
     ollama_ok = check_ollama_service()
     
     # Resumo
@@ -131,6 +150,10 @@ def main():
     else:
         print("✅ Todas as dependências: OK")
     
+    if not nlp_ok:
+        print("❌ Dados do NLTK faltando")
+        print("   Execute: python -c \"from src.modules.nlp import resources; resources.download()\"")
+    
     if not ollama_ok:
         print("❌ Ollama não está rodando")
         print("   Execute: ollama serve")
@@ -142,9 +165,14 @@ def main():
         if missing_deps:
             print("\n🔧 PRÓXIMOS PASSOS:")
             print("1. pip install -r requirements.txt")
-            print("2. ollama serve")
-            print("3. ollama pull llama3")
-            print("4. python main.py")
+            print("2. python -c \"from src.modules.nlp import resources; resources.download()\"")
+            print("3. ollama serve")
+            print("4. ollama pull llama3")
+            print("5. python main.py")
+        elif not nlp_ok:
+            print("\n🔧 PRÓXIMOS PASSOS:")
+            print("1. python -c \"from src.modules.nlp import resources; resources.download()\"")
+            print("2. python main.py")
         elif not ollama_ok:
             print("\n🔧 PRÓXIMOS PASSOS:")
             print("1. ollama serve")